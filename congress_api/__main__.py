@@ -6,10 +6,7 @@ Usage:
     uvx congressmcp                                     # stdio via uvx
 """
 import argparse
-import os
-import platform
 import sys
-from pathlib import Path
 
 
 def main():
@@ -20,6 +17,13 @@ def main():
     cache_subparsers.add_parser("info", help="Show bill-text cache information")
     clear_parser = cache_subparsers.add_parser("clear", help="Clear the bill-text cache")
     clear_parser.add_argument("--yes", action="store_true", help="Confirm non-interactively")
+    prewarm_parser = cache_subparsers.add_parser(
+        "prewarm", help="Fetch and parse every bill on a watchlist into the bill-text cache"
+    )
+    prewarm_parser.add_argument("watchlist", help="File with one '<congress> <bill_type> <number> [version]' per line")
+    prewarm_parser.add_argument(
+        "--concurrency", type=int, default=None, help="Bills fetched at once (default: CONGRESSMCP_PREWARM_CONCURRENCY or 4)"
+    )
     parser.add_argument(
         "--transport",
         choices=["stdio", "streamable-http"],
@@ -31,6 +35,8 @@ def main():
     args = parser.parse_args()
 
     if args.command == "cache":
+        if args.cache_command == "prewarm":
+            return _prewarm_cli(args)
         return _cache_cli(args)
 
     # Import the server — main.py handles logging setup and feature initialization at import time
@@ -46,52 +52,97 @@ def main():
 
 
 def _cache_cli(args):
-    cache_dir = _cache_dir()
-    packages_dir = cache_dir / "packages"
-    files = sorted(packages_dir.glob("*.db")) if packages_dir.exists() else []
-    total = sum(path.stat().st_size for path in files if path.exists())
-    cap = int(os.getenv("CONGRESSMCP_CACHE_MAX_BYTES", "524288000"))
+    import shutil
+    import sqlite3
+
+    from congress_api.core.local_cache import cache_max_bytes, cache_root, index_db_path, index_file_path
+    from congress_api.features.bill_text.pages import PAGES_SUFFIX, pages_bytes
+    from congress_api.features.bill_text.store import STORE_NAME, STORE_SCHEMA_VERSION
+
+    cache_dir = cache_root()
+    store_path = index_db_path(STORE_NAME, STORE_SCHEMA_VERSION)
+    store_files = [index_file_path(STORE_NAME, STORE_SCHEMA_VERSION, suffix) for suffix in (".db", ".db-wal", ".db-shm")]
+    pages_dir = index_file_path(STORE_NAME, STORE_SCHEMA_VERSION, PAGES_SUFFIX)
+    packages = []
+    if store_path.exists():
+        conn = sqlite3.connect(f"file:{store_path}?mode=ro", uri=True)
+        try:
+            # Bytes a package would free on its own are not meaningful when its
+            # text is shared with other versions; report the text it references.
+            packages = conn.execute(
+                """
+                SELECT p.package_id, COALESCE(SUM(LENGTH(CAST(t.text AS BLOB))), 0)
+                FROM packages p
+                LEFT JOIN segments s ON s.package_id = p.package_id
+                LEFT JOIN texts t ON t.hash = s.hash
+                GROUP BY p.package_id ORDER BY p.package_id
+                """
+            ).fetchall()
+        except sqlite3.Error:
+            packages = []
+        finally:
+            conn.close()
+    total = sum(path.stat().st_size for path in store_files if path.exists())
+    # Page files are derived renderings outside the cap (see bill_text.pages).
+    mapped = pages_bytes(pages_dir)
+    cap = cache_max_bytes()
 
     if args.cache_command == "info":
         print(f"path: {cache_dir}")
-        print(f"schema_version: in-memory-pr1")
+        print(f"store: {store_path}")
+        print(f"schema_version: {STORE_SCHEMA_VERSION}")
         print(f"total_bytes: {total}")
         print(f"cap_bytes: {cap}")
-        if not files:
+        print(f"pages_bytes: {mapped}")
+        if not packages:
             print("packages: []")
         else:
             print("packages:")
-            for path in files:
-                print(f"  - {path.name}\t{path.stat().st_size}")
+            for package_id, text_bytes in packages:
+                print(f"  - {package_id}\t{text_bytes}")
         return 0
 
     if args.cache_command == "clear":
         if not args.yes:
-            print("Bill-text persistent caching is planned for PR 2. Nothing was removed.")
-            print("Re-run with --yes once persistent cache files exist.")
+            print(f"This removes {len(packages)} cached bill-text package(s) and the corpus index under {cache_dir}.")
+            print("Re-run with --yes to confirm.")
             return 1
-        removed = 0
-        for path in files:
-            path.unlink()
-            removed += 1
-        print(f"removed_packages: {removed}")
+        # Packages, their shared text and the corpus index are one database; the
+        # mapped page files beside it are derived from it.
+        for path in store_files:
+            path.unlink(missing_ok=True)
+        shutil.rmtree(pages_dir, ignore_errors=True)
+        print(f"removed_packages: {len(packages)}")
         return 0
 
-    print("Specify `congressmcp cache info` or `congressmcp cache clear --yes`.", file=sys.stderr)
+    print("Specify `congressmcp cache info`, `congressmcp cache clear --yes` or `congressmcp cache prewarm WATCHLIST`.", file=sys.stderr)
     return 2
 
 
-def _cache_dir() -> Path:
-    override = os.getenv("CONGRESSMCP_CACHE_DIR")
-    if override:
-        return Path(override).expanduser()
-    system = platform.system()
-    if system == "Darwin":
-        return Path.home() / "Library" / "Caches" / "congressmcp"
-    if system == "Windows":
-        base = os.getenv("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
-        return Path(base) / "congressmcp" / "Cache"
-    return Path(os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / "congressmcp"
+def _prewarm_cli(args):
+    import asyncio
+
+    from congress_api.core.client_handler import app_lifespan
+    from congress_api.features.bill_text.prewarm import prewarm_bills, read_watchlist
+
+    try:
+        bills = read_watchlist(args.watchlist)
+    except (OSError, ValueError) as exc:
+        print(f"Could not read watchlist: {exc}", file=sys.stderr)
+        return 2
+
+    async def run():
+        # Version resolution goes through the same API client the server uses.
+        async with app_lifespan(None):
+            return await prewarm_bills(bills, args.concurrency)
+
+    results = asyncio.run(run())
+    for result in results:
+        outcome = result.error or f"{result.state}\t{result.package_id}"
+        print(f"{result.bill.label}\t{outcome}\t{result.elapsed_ms:.0f}ms")
+    failed = sum(1 for result in results if result.error)
+    print(f"prewarmed: {len(results) - failed}, failed: {failed}")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+"""On-disk location and SQLite plumbing for the server's local search indexes.
+
+The Congress.gov list endpoints page newest-first and offer no keyword search, so
+several tools mirror catalogue metadata into SQLite FTS5 tables under the user
+cache directory. This module owns the directory layout and the environment
+variables that control it; ``congressmcp cache`` reads the same definitions so the
+CLI and the server can never disagree about where the cache lives.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import platform
+import re
+import sqlite3
+from pathlib import Path
+
+CACHE_DIR_ENV = "CONGRESSMCP_CACHE_DIR"
+CACHE_ENABLED_ENV = "CONGRESSMCP_CACHE_ENABLED"
+CACHE_MAX_BYTES_ENV = "CONGRESSMCP_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES = 524_288_000
+VERSION_TTL_ENV = "CONGRESSMCP_VERSION_TTL"
+DEFAULT_VERSION_TTL = 86_400
+REVALIDATE_DAYS_ENV = "CONGRESSMCP_REVALIDATE_DAYS"
+DEFAULT_REVALIDATE_DAYS = 30
+
+INDEXES_SUBDIR = "indexes"
+
+_FALSEY = {"0", "false", "no", "off"}
+
+
+def cache_root() -> Path:
+    """Platform cache directory for CongressMCP, honouring ``CONGRESSMCP_CACHE_DIR``."""
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    system = platform.system()
+    if system == "Darwin":
+        return Path.home() / "Library" / "Caches" / "congressmcp"
+    if system == "Windows":
+        base = os.getenv("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "congressmcp" / "Cache"
+    return Path(os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / "congressmcp"
+
+
+def cache_enabled() -> bool:
+    """False only when ``CONGRESSMCP_CACHE_ENABLED`` is explicitly set to a falsey value."""
+    return os.getenv(CACHE_ENABLED_ENV, "").strip().lower() not in _FALSEY
+
+
+def cache_max_bytes() -> int:
+    try:
+        return int(os.getenv(CACHE_MAX_BYTES_ENV, str(DEFAULT_CACHE_MAX_BYTES)))
+    except ValueError:
+        return DEFAULT_CACHE_MAX_BYTES
+
+
+def version_ttl_seconds() -> int:
+    """How long a bill's text-version list is reused before congress.gov is asked again."""
+    try:
+        return int(os.getenv(VERSION_TTL_ENV, str(DEFAULT_VERSION_TTL)))
+    except ValueError:
+        return DEFAULT_VERSION_TTL
+
+
+def revalidate_seconds() -> int:
+    """Reuse period for a version list that has reached a terminal stage (enrolled, agreed to)."""
+    try:
+        return int(float(os.getenv(REVALIDATE_DAYS_ENV, str(DEFAULT_REVALIDATE_DAYS))) * 86_400)
+    except ValueError:
+        return DEFAULT_REVALIDATE_DAYS * 86_400
+
+
+def index_file_path(name: str, schema_version: int, suffix: str) -> Path:
+    # The schema version is part of the file name: a release that changes a table
+    # layout starts a fresh file instead of migrating (or misreading) the old one.
+    return cache_root() / INDEXES_SUBDIR / f"{name}.v{schema_version}{suffix}"
+
+
+def index_db_path(name: str, schema_version: int) -> Path:
+    return index_file_path(name, schema_version, ".db")
+
+
+def open_index_db(name: str, schema_version: int) -> tuple[sqlite3.Connection, str]:
+    """Open (creating if needed) the named index database.
+
+    Returns the connection and a description of where it lives. With the cache
+    disabled, or when the cache directory cannot be created, the index is kept in
+    memory for the life of the process -- slower to warm, but never an error.
+    """
+    if cache_enabled():
+        path = index_db_path(name, schema_version)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            return conn, str(path)
+        except (OSError, sqlite3.Error):
+            pass
+    return sqlite3.connect(":memory:", check_same_thread=False), ":memory:"
+
+
+@functools.cache
+def sqlite_supports_fts5() -> bool:
+    # A compile-time property of the linked SQLite; probe once per process.
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE fts_probe USING fts5(text)")
+        conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def fts_terms(text: str) -> list[str]:
+    """Word tokens of a free-text query, in order, without duplicates."""
+    seen: dict[str, None] = {}
+    for token in re.findall(r"\w+", text or ""):
+        seen.setdefault(token.casefold(), None)
+    return list(seen)
+
+
+def fts_match_expression(text: str, *, any_term: bool = False) -> str | None:
+    """FTS5 MATCH expression for free text: every term quoted, ANDed (or ORed).
+
+    Quoting each term keeps user punctuation and FTS5 keywords (AND, NEAR, ...) from
+    being parsed as query syntax. Returns None when the text has no word tokens.
+    """
+    terms = fts_terms(text)
+    if not terms:
+        return None
+    joiner = " OR " if any_term else " "
+    return joiner.join('"' + term.replace('"', '""') + '"' for term in terms)
@@ -0,0 +1,29 @@
+"""Helpers over a member record's ``terms``.
+
+Kept free of network and server imports so both the member tools and the member
+directory snapshot can use them without importing each other.
+"""
+from typing import Any, Dict, Optional
+
+
+def latest_term_of(terms: Any) -> Optional[Dict[str, Any]]:
+    """Return the member's most recent term.
+
+    The API lists terms oldest-first, but don't rely on order: pick the term
+    with the greatest startYear (an open endYear wins ties).
+    """
+    if isinstance(terms, dict) and "item" in terms:
+        terms = terms["item"]
+    if not isinstance(terms, list) or not terms:
+        return None
+    dict_terms = [t for t in terms if isinstance(t, dict)]
+    if not dict_terms:
+        return None
+
+    def _key(t):
+        start = t.get("startYear")
+        start = int(start) if str(start).isdigit() else -1
+        open_ended = 1 if t.get("endYear") in (None, "", "Present") else 0
+        return (start, open_ended)
+
+    return max(dict_terms, key=_key)
@@ -1,5 +1,21 @@
-"""Bill text retrieval and local in-memory search index."""
+"""Bill text retrieval, local search index and cross-bill corpus search."""
 
-from .tools import get_bill_section, get_bill_toc, search_bill_text
+from .tools import (
+    diff_bill_versions,
+    find_amending_sections,
+    get_bill_section,
+    get_bill_sections,
+    get_bill_toc,
+    search_bill_corpus,
+    search_bill_text,
+)
 
-__all__ = ["search_bill_text", "get_bill_section", "get_bill_toc"]
+__all__ = [
+    "search_bill_text",
+    "get_bill_section",
+    "get_bill_sections",
+    "get_bill_toc",
+    "diff_bill_versions",
+    "search_bill_corpus",
+    "find_amending_sections",
+]
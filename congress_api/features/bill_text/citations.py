@@ -0,0 +1,76 @@
+"""Normalised keys for the U.S. Code and Public Law citations in `amends`.
+
+`Unit.amends` writes each target one canonical way ("10 U.S.C. 2302(b)",
+"P.L. 117-263", "136 Stat. 2395"), but callers type them every other way
+("10 USC 2302", "10 U.S.C. § 2302", "Pub. L. No. 117–263", "section 2302 of title
+10, United States Code"). Both sides go through citation_key, so a lookup matches
+on the target rather than on its spelling.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+_DASH = "\\-\u2010-\u2015"
+
+_USC_RE = re.compile(
+    r"^(\d+)\s*U\.?\s*S\.?\s*C\.?\s*(?:A\.?\s*)?(?:§+\s*|sec(?:tion|s)?\.?\s+)?"
+    rf"(\d+[A-Za-z]*(?:[{_DASH}]\d+[A-Za-z]*)?)((?:\s*\([0-9A-Za-z]+\))*)\.?$",
+    re.IGNORECASE,
+)
+_USC_LONG_RE = re.compile(
+    rf"^(?:section|sec\.?|§+)\s*(\d+[A-Za-z]*(?:[{_DASH}]\d+[A-Za-z]*)?)((?:\s*\([0-9A-Za-z]+\))*)"
+    r"\s+of\s+title\s+(\d+)(?:,?\s+United\s+States\s+Code)?\.?$",
+    re.IGNORECASE,
+)
+_PL_RE = re.compile(
+    r"^(?:Public\s+Law|Pub\.?\s*L\.?|P\.?\s*L\.?)\s*(?:No\.?\s*)?"
+    rf"(\d+)\s*[{_DASH}]\s*(\d+)\.?$",
+    re.IGNORECASE,
+)
+_STAT_RE = re.compile(r"^(\d+)\s+Stat\.?\s+(\d+)\.?$", re.IGNORECASE)
+
+
+class Citation(NamedTuple):
+    kind: str
+    # Lookup key: the target section or enactment, ignoring subsection designators,
+    # so "10 U.S.C. 2302" finds a section that amends "10 U.S.C. 2302(b)".
+    key: str
+    # The canonical form, as Unit.amends writes it (designators dropped).
+    cite: str
+
+
+def parse_citation(text: str) -> Citation | None:
+    """The normalised citation `text` names, or None if it is not a USC/P.L./Stat cite."""
+    compact = " ".join(text.split())
+    match = _USC_RE.match(compact)
+    if match:
+        return _usc(match.group(1), match.group(2))
+    match = _USC_LONG_RE.match(compact)
+    if match:
+        return _usc(match.group(3), match.group(1))
+    match = _PL_RE.match(compact)
+    if match:
+        congress, number = int(match.group(1)), int(match.group(2))
+        return Citation("public_law", f"pl:{congress}-{number}", f"P.L. {congress}-{number}")
+    match = _STAT_RE.match(compact)
+    if match:
+        volume, page = int(match.group(1)), int(match.group(2))
+        return Citation("public_law", f"stat:{volume}:{page}", f"{volume} Stat. {page}")
+    return None
+
+
+def require_citation(text: str) -> Citation:
+    citation = parse_citation(text)
+    if citation is None:
+        raise ValueError(
+            f"Not a U.S. Code, Public Law or Statutes at Large citation: {text!r}. "
+            "Write it as '10 U.S.C. 2302', 'P.L. 117-263' or '136 Stat. 2395'."
+        )
+    return citation
+
+
+def _usc(title: str, section: str) -> Citation:
+    section = re.sub(f"[{_DASH}]", "-", section)
+    return Citation("usc", f"usc:{int(title)}:{section.casefold()}", f"{int(title)} U.S.C. {section}")
@@ -10,13 +10,14 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import httpx
 from mcp.server.mcpserver import Context
 
 from ...core.api_config import API_KEY
 from ...core.client_handler import make_api_request
+from ...core.local_cache import revalidate_seconds, version_ttl_seconds
 
 
 logger = logging.getLogger(__name__)
@@ -136,6 +137,14 @@ VERSION_CODES: dict[str, tuple[int, str]] = {
 VERSION_PRECEDENCE = {code: rank for code, (rank, _) in VERSION_CODES.items()}
 VERSION_CATEGORY = {code: category for code, (_, category) in VERSION_CODES.items()}
 
+# Highest listed rank at which a bill has stopped moving: enrolled, or agreed to for
+# a simple/concurrent resolution. Only a rare re-enrollment can follow, so the
+# version list is reused far longer than one that can still advance (see
+# version_list_ttl).
+TERMINAL_PRECEDENCE = 80
+# Passed at least one chamber: the next stage is weeks away, not hours.
+ENGROSSED_PRECEDENCE = 40
+
 VERSION_TYPE_MAP = {
     "introduced in house": "ih",
     "introduced in senate": "is",
@@ -167,6 +176,21 @@ class TextVersion:
     type_label: str
 
 
+@dataclass(frozen=True)
+class VersionResolution:
+    versions: list[TextVersion]
+    # When this list was enumerated upstream, which for a cached list is earlier
+    # than the call serving it.
+    resolved_at: str
+    # "fresh" (enumerated for this call), "cached" (reused within its TTL) or
+    # "cached_offline" (upstream unreachable, served from whatever was cached); the
+    # value BillTextEnvelope.version_resolution reports.
+    state: str = "fresh"
+    # Version issue introduced by the resolution itself, carried into
+    # version_resolution_note.
+    note: str | None = None
+
+
 @dataclass(frozen=True)
 class ResolvedBillText:
     package_id: str
@@ -175,6 +199,7 @@ class ResolvedBillText:
     version_resolution_note: str | None
     last_modified: str | None
     xml_bytes: bytes
+    version_resolution: str = "fresh"
 
 
 class BillTextError(Exception):
@@ -186,17 +211,55 @@ class BillTextError(Exception):
         self.remediation = remediation
 
 
+# Codes meaning upstream could not be reached -- as opposed to an answer (no such
+# bill, no such version) or a configuration problem (key missing or rejected), which
+# the cache must not paper over.
+UPSTREAM_UNAVAILABLE_CODES = frozenset({"congress_unavailable", "govinfo_unavailable"})
+
+
+def is_upstream_outage(exc: BaseException) -> bool:
+    if isinstance(exc, BillTextError):
+        return exc.code in UPSTREAM_UNAVAILABLE_CODES
+    return isinstance(exc, httpx.HTTPError)
+
+
 async def resolve_and_fetch_bill_text(
     ctx: Context,
     congress: int,
     bill_type: str,
     number: int,
     version: str | None,
+    fetch: Callable[[str], Awaitable[tuple[str | None, bytes]]] | None = None,
+    resolve: Callable[[bool], Awaitable[VersionResolution]] | None = None,
 ) -> ResolvedBillText:
+    # `fetch` lets the caller answer a package from its own cache; the default is
+    # looked up at call time so it always means the current GovInfo fetcher.
+    # `resolve` does the same for the version list; its argument forces an upstream
+    # enumeration instead of a cached one.
+    fetch = fetch or fetch_govinfo_package
     bill_type = bill_type.lower()
-    versions = await _resolve_versions(ctx, congress, bill_type, number)
+    if resolve is None:
+        async def resolve(refresh: bool) -> VersionResolution:
+            return await resolve_versions(ctx, congress, bill_type, number)
+    resolution = await resolve(False)
+    versions = resolution.versions
     if version:
         code = version.lower()
+        if code not in {item.code for item in versions} and resolution.state == "cached":
+            # The stored list predates the version asked for; a caller naming a
+            # version is the one signal that the list is stale, so ask upstream.
+            resolution = await resolve(True)
+            versions = resolution.versions
+        if code not in {item.code for item in versions} and resolution.state == "cached_offline":
+            # An offline list holds only the cached versions, so it cannot say this
+            # one does not exist -- only that it cannot be served until upstream is back.
+            raise BillTextError(
+                "congress_unavailable",
+                f"Congress.gov and GovInfo are unreachable, and {bill_type.upper()} {number} "
+                f"version '{code}' is not in the local cache.",
+                {"cached_versions": sorted(item.code for item in versions)},
+                "Retry later, or use one of the cached versions meanwhile.",
+            )
         if code not in {item.code for item in versions}:
             raise BillTextError(
                 "version_not_available",
@@ -205,14 +268,15 @@ async def resolve_and_fetch_bill_text(
                 "Retry with one of the listed versions, or omit version.",
             )
         package_id = package_id_for(congress, bill_type, number, code)
-        fetched = await fetch_govinfo_package(package_id)
+        fetched = await fetch(package_id)
         return ResolvedBillText(
             package_id=package_id,
             version=code,
-            version_resolved_at=utc_now(),
-            version_resolution_note=None,
+            version_resolved_at=resolution.resolved_at,
+            version_resolution_note=resolution.note,
             last_modified=fetched[0],
             xml_bytes=fetched[1],
+            version_resolution=resolution.state,
         )
 
     candidates = order_versions(versions)
@@ -245,8 +309,8 @@ async def resolve_and_fetch_bill_text(
     for candidate in candidates:
         package_id = package_id_for(congress, bill_type, number, candidate.code)
         try:
-            fetched = await fetch_govinfo_package(package_id)
-            parts = [base_note] if base_note else []
+            fetched = await fetch(package_id)
+            parts = [text for text in (resolution.note, base_note) if text]
             if candidate != candidates[0]:
                 parts.append(
                     f"Latest listed version {candidates[0].code} was unavailable from GovInfo; "
@@ -258,7 +322,9 @@ async def resolve_and_fetch_bill_text(
             if category_note:
                 parts.append(category_note)
             note = " ".join(parts) or None
-            return ResolvedBillText(package_id, candidate.code, utc_now(), note, fetched[0], fetched[1])
+            return ResolvedBillText(
+                package_id, candidate.code, resolution.resolved_at, note, fetched[0], fetched[1], resolution.state
+            )
         except BillTextError as exc:
             if exc.code != "govinfo_not_found":
                 raise
@@ -271,6 +337,34 @@ async def resolve_and_fetch_bill_text(
     )
 
 
+async def resolve_versions(ctx: Context, congress: int, bill_type: str, number: int) -> VersionResolution:
+    """Enumerate a bill's text versions upstream now."""
+    versions = await _resolve_versions(ctx, congress, bill_type.lower(), number)
+    return VersionResolution(versions, utc_now())
+
+
+def version_list_ttl(versions: list[TextVersion]) -> int:
+    """Seconds a version list may be reused, by how far the bill has advanced.
+
+    A list topped by a terminal stage (enr, renr, ath/ats) is effectively final
+    and is revalidated only every CONGRESSMCP_REVALIDATE_DAYS. One that has passed
+    a chamber gets CONGRESSMCP_VERSION_TTL. An introduced or reported bill can
+    advance any day, and a list with an unrecognised code cannot be ranked with
+    confidence, so those get a quarter of it. 0 means do not reuse.
+    """
+    ttl = version_ttl_seconds()
+    if ttl <= 0 or not versions:
+        return 0
+    if any(item.code not in VERSION_PRECEDENCE for item in versions):
+        return ttl // 4
+    top = max(VERSION_PRECEDENCE[item.code] for item in versions)
+    if top >= TERMINAL_PRECEDENCE:
+        return max(ttl, revalidate_seconds())
+    if top >= ENGROSSED_PRECEDENCE:
+        return ttl
+    return ttl // 4
+
+
 async def _resolve_versions(ctx: Context, congress: int, bill_type: str, number: int) -> list[TextVersion]:
     """Enumerate text versions from congress.gov, falling back to the GovInfo
     search service only when congress.gov is unreachable (spec §3, secondary
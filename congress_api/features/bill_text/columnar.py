@@ -0,0 +1,245 @@
+"""Compact columnar form of a parsed bill, kept resident between calls.
+
+A ParsedBill is a list of Unit dataclasses, each holding a list of Segment
+dataclasses and a list of AncestorNode models: hundreds of thousands of small
+objects for a large bill. ColumnarBill holds the same content in a handful of
+objects instead:
+
+* each distinct ancestor path once, with one ``array('I')`` index per unit;
+* all segment text in one string, with segment start offsets in an ``array('I')``
+  and each unit's first segment in another;
+* segment contexts as ``array('B')`` codes into a per-bill table, with the
+  inline flag in the high bit.
+
+Units are materialised on demand (``unit(i)``), so a resident bill costs roughly its
+text plus a few bytes per segment, and pickles as a few flat buffers rather than an
+object graph.
+
+The service keeps recently loaded bills resident in this form, most recently used
+first, up to ``CONGRESSMCP_RESIDENT_BYTES`` (default 64 MiB; 0 disables), so a
+warm call reads no SQLite rows.
+
+A warm call is served a view (``view()``): a ParsedBill whose units are a
+ColumnarUnits sequence, building each Unit the first time the call reads it. The
+per-call FTS index reads its rows from the columns (``unit_parts()``) and the
+hierarchy is keyed by the section-id column, so a search or a section read builds
+Units only for the hits and sections it returns. Reading every unit (a diff, a cold
+rendering for get_bill_content) still builds them all, once per call.
+
+A resident bill also keeps its TOC (bill_text.toc) once a get_bill_toc call has
+built it, so later calls serve depths from it instead of rebuilding it.
+
+Of the per-process bill caches, this is the only one holding parsed content. The
+content cache (bill_text.content) holds rendered text for get_bill_content -- for a
+stored package, a view of its mapped page file rather than a heap copy -- and the
+store's open mappings (bill_text.pages) are file-backed pages the OS can drop.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+
+from .models import AncestorNode
+from .parser import ParsedBill, Segment, Unit
+from .toc import BillToc
+
+RESIDENT_BYTES_ENV = "CONGRESSMCP_RESIDENT_BYTES"
+DEFAULT_RESIDENT_BYTES = 64 * 1024 * 1024
+
+_INLINE = 0x80
+
+_resident: OrderedDict[str, ColumnarBill] = OrderedDict()
+
+
+class ColumnarBill:
+    """One parsed package as columns; see the module docstring for the layout."""
+
+    def __init__(self, parsed: ParsedBill):
+        self.package_id = parsed.package_id
+        self.version = parsed.version
+        self.last_modified = parsed.last_modified
+        self.sections_indexed = parsed.sections_indexed
+        self.quotes_seen = frozenset(parsed.quotes_seen)
+        self.struck_sections_excluded = parsed.struck_sections_excluded
+        self.subtree_bytes = dict(parsed.subtree_bytes)
+        self.toc: BillToc | None = None
+
+        self.section_ids: list[str] = []
+        self.headers: list[str | None] = []
+        self.child_ids: list[tuple[str, ...]] = []
+        self.paths: list[tuple[AncestorNode, ...]] = []
+        self.unit_path = array("I")
+        self.unit_segment = array("I", [0])
+        self.contexts: list[str] = []
+        self.segment_context = array("B")
+        self.segment_offset = array("I", [0])
+
+        path_index: dict[tuple, int] = {}
+        context_index: dict[str, int] = {}
+        texts: list[str] = []
+        offset = 0
+        for unit in parsed.units:
+            self.section_ids.append(unit.section_id)
+            self.headers.append(unit.header)
+            self.child_ids.append(tuple(unit.child_ids))
+            key = tuple((node.type, node.enum, node.header) for node in unit.ancestor_path)
+            if key not in path_index:
+                path_index[key] = len(self.paths)
+                self.paths.append(tuple(unit.ancestor_path))
+            self.unit_path.append(path_index[key])
+            for segment in unit.segments:
+                code = context_index.get(segment.context)
+                if code is None:
+                    code = context_index[segment.context] = len(self.contexts)
+                    self.contexts.append(segment.context)
+                self.segment_context.append(code | _INLINE if segment.inline else code)
+                texts.append(segment.text)
+                offset += len(segment.text)
+                self.segment_offset.append(offset)
+            self.unit_segment.append(len(self.segment_context))
+        if len(self.contexts) > _INLINE:
+            raise ValueError(f"{self.package_id}: more segment contexts than a context code can hold")
+        self.text = "".join(texts)
+        self.nbytes = self._measure()
+
+    def __len__(self) -> int:
+        return len(self.section_ids)
+
+    def segments(self, ordinal: int) -> list[Segment]:
+        """The segments of unit ``ordinal``, materialised."""
+        text, offsets, codes, contexts = self.text, self.segment_offset, self.segment_context, self.contexts
+        return [
+            Segment(contexts[codes[i] & ~_INLINE], text[offsets[i]:offsets[i + 1]], bool(codes[i] & _INLINE))
+            for i in range(self.unit_segment[ordinal], self.unit_segment[ordinal + 1])
+        ]
+
+    def unit(self, ordinal: int) -> Unit:
+        """Unit ``ordinal`` as a new Unit; the columns are not changed by editing it."""
+        return Unit(
+            section_id=self.section_ids[ordinal],
+            ancestor_path=list(self.paths[self.unit_path[ordinal]]),
+            header=self.headers[ordinal],
+            segments=self.segments(ordinal),
+            child_ids=list(self.child_ids[ordinal]),
+        )
+
+    def units(self) -> Iterator[Unit]:
+        return (self.unit(ordinal) for ordinal in range(len(self)))
+
+    def unit_parts(self) -> Iterator[tuple[str, tuple[AncestorNode, ...], str | None, list[Segment]]]:
+        """(section_id, ancestor path, header, segments) per unit, without building Units.
+
+        The path is the bill's shared tuple; the segments are built for the caller and
+        not kept.
+        """
+        for ordinal in range(len(self)):
+            yield self.section_ids[ordinal], self.paths[self.unit_path[ordinal]], self.headers[ordinal], self.segments(ordinal)
+
+    def view(self) -> ParsedBill:
+        """The bill as a ParsedBill whose units are built as they are read."""
+        return self.to_parsed(units=ColumnarUnits(self))
+
+    def to_parsed(self, units: Sequence[Unit] | None = None) -> ParsedBill:
+        return ParsedBill(
+            package_id=self.package_id,
+            version=self.version,
+            last_modified=self.last_modified,
+            units=list(self.units()) if units is None else units,
+            sections_indexed=self.sections_indexed,
+            quotes_seen=set(self.quotes_seen),
+            struck_sections_excluded=self.struck_sections_excluded,
+            subtree_bytes=dict(self.subtree_bytes),
+        )
+
+    def keep_toc(self, toc: BillToc) -> BillToc:
+        """Hold the bill's TOC with it; its size counts against the budget from now on."""
+        self.toc = toc
+        self.nbytes += toc.nbytes
+        _fit_budget(resident_max_bytes())
+        return toc
+
+    def _measure(self) -> int:
+        """Approximate resident size: the text and offset buffers plus per-unit strings."""
+        size = sys.getsizeof(self.text)
+        for column in (self.unit_path, self.unit_segment, self.segment_context, self.segment_offset):
+            size += column.itemsize * len(column)
+        size += sum(sys.getsizeof(section_id) for section_id in self.section_ids)
+        size += sum(sys.getsizeof(header) for header in self.headers if header)
+        size += sum(sys.getsizeof(child) for children in self.child_ids for child in children)
+        size += 200 * (len(self.paths) + len(self.subtree_bytes))
+        return size
+
+
+def resident_max_bytes() -> int:
+    try:
+        return max(0, int(os.getenv(RESIDENT_BYTES_ENV, str(DEFAULT_RESIDENT_BYTES))))
+    except ValueError:
+        return DEFAULT_RESIDENT_BYTES
+
+
+def resident_bill(package_id: str) -> ColumnarBill | None:
+    bill = _resident.get(package_id)
+    if bill is not None:
+        _resident.move_to_end(package_id)
+    return bill
+
+
+def keep_resident(parsed: ParsedBill) -> None:
+    """Hold a parsed package in columnar form, evicting least recently used bills.
+
+    A bill larger than the whole budget is not kept.
+    """
+    cap = resident_max_bytes()
+    if cap <= 0:
+        return
+    bill = ColumnarBill(parsed)
+    if bill.nbytes > cap:
+        return
+    _resident[bill.package_id] = bill
+    _resident.move_to_end(bill.package_id)
+    _fit_budget(cap)
+
+
+def _fit_budget(cap: int) -> None:
+    """Evict least recently used bills until the resident set is within ``cap`` bytes."""
+    total = sum(held.nbytes for held in _resident.values())
+    while total > cap and _resident:
+        _, evicted = _resident.popitem(last=False)
+        total -= evicted.nbytes
+
+
+class ColumnarUnits(Sequence[Unit]):
+    """A resident bill's units as a sequence, each built on first read and then kept.
+
+    Kept per view, so one call reads the same Unit objects throughout; the Units die
+    with the call.
+    """
+
+    def __init__(self, bill: ColumnarBill):
+        self.bill = bill
+        self._built: dict[int, Unit] = {}
+
+    @property
+    def section_ids(self) -> list[str]:
+        return self.bill.section_ids
+
+    def __len__(self) -> int:
+        return len(self.bill)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[ordinal] for ordinal in range(*index.indices(len(self)))]
+        ordinal = range(len(self))[index]
+        unit = self._built.get(ordinal)
+        if unit is None:
+            unit = self._built[ordinal] = self.bill.unit(ordinal)
+        return unit
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, ColumnarUnits)):
+            return list(self) == list(other)
+        return NotImplemented
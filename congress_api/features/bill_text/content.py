@@ -0,0 +1,199 @@
+"""A bill's full rendered text, paged in byte-bounded chunks.
+
+``bills(operation="get_bill_content")`` streams a whole bill to a client one chunk at
+a time. The text is rendered once from the parsed units -- each division, title,
+subtitle or part heading where the document enters it, then every unit's segments
+rendered as get_bill_section renders them -- and held as UTF-8 bytes. Chunk start
+offsets are computed once per chunk size, so chunk N is one slice of those bytes no
+matter how far into the bill it is, and the rendered bills of recently paged packages
+are kept in memory so the next chunk does not reload the package from the store. A
+stored package's text is read from its mapped page file (bill_text.pages), which is
+this same layout, so it is not rendered again at all.
+"""
+
+from __future__ import annotations
+
+import mmap
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from .parser import ParsedBill, render_segments
+
+if TYPE_CHECKING:
+    from .pages import BillPages
+
+# Packages whose rendered text stays in memory between chunk requests. A client
+# pages one bill at a time; a few slots cover several clients without holding the
+# text of every bill ever read (an omnibus renders to several megabytes).
+MAX_CACHED_BILLS = 8
+# A cut looks back at most this far for a line or word break before splitting a
+# word; past it, the chunk is cut at the nearest character boundary instead.
+_BREAK_LOOKBACK = 512
+# Chunk sizes whose offsets are memoized per bill. A client pages with one size; a
+# client that varies it per call must not grow the memo without bound.
+_MEMOIZED_SIZES = 2
+
+_rendered: OrderedDict[str, BillContent] = OrderedDict()
+
+
+def render_bill(parsed: ParsedBill) -> tuple[bytes, list[tuple[str, int, int]]]:
+    """The bill's full rendered text as UTF-8, and where each unit sits in it.
+
+    Each unit is preceded by the headings of the containers it enters; a unit under
+    the same division and title as the previous one repeats neither. The spans are
+    ``(section_id, start, end)`` in document order: a unit's block runs from its
+    headings to the end of its render_segments text. A unit that adds neither
+    headings nor text has an empty span.
+    """
+    parts: list[bytes] = []
+    spans: list[tuple[str, int, int]] = []
+    size = 0
+    path: list[tuple[str, str]] = []
+    for unit in parsed.units:
+        headings = []
+        for depth, node in enumerate(unit.ancestor_path):
+            key = (node.type, node.enum)
+            if depth < len(path) and path[depth] == key:
+                continue
+            del path[depth:]
+            path.append(key)
+            if node.header:
+                headings.append(node.header)
+        del path[len(unit.ancestor_path):]
+        rendered = render_segments(unit.segments)
+        block_start = size
+        if headings:
+            prefix = ("\n\n" if size else "") + "\n\n".join(headings)
+            encoded = prefix.encode("utf-8")
+            parts.append(encoded)
+            size += len(encoded)
+        if rendered:
+            if size:
+                parts.append(b"\n\n")
+                size += 2
+            encoded = rendered.encode("utf-8")
+            parts.append(encoded)
+            size += len(encoded)
+        spans.append((unit.section_id, block_start, size))
+    return b"".join(parts), spans
+
+
+class BillContent:
+    """Rendered text of one package with memoized chunk offsets.
+
+    ``data`` is the text as bytes, or a read-only mapping of the package's stored
+    pages (bill_text.pages) whose first ``size`` bytes are the same text.
+    """
+
+    def __init__(
+        self,
+        package_id: str,
+        version: str,
+        last_modified: str | None,
+        data: bytes | mmap.mmap,
+        size: int,
+        spans: list[tuple[str, int, int]],
+    ):
+        self.package_id = package_id
+        self.version = version
+        self.last_modified = last_modified
+        self.data = data
+        self.size = size
+        # Units that contributed text, for naming the sections a chunk spans.
+        shown = [span for span in spans if span[1] != span[2]]
+        self._unit_starts = [span[1] for span in shown]
+        self._section_ids = [span[0] for span in shown]
+        self._offsets: dict[int, list[int]] = {}
+
+    @classmethod
+    def from_parsed(cls, parsed: ParsedBill) -> BillContent:
+        data, spans = render_bill(parsed)
+        return cls(parsed.package_id, parsed.version, parsed.last_modified, data, len(data), spans)
+
+    @classmethod
+    def from_pages(cls, pages: BillPages) -> BillContent:
+        return cls(pages.package_id, pages.version, pages.last_modified, pages.data, pages.size, pages.spans)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.size
+
+    def offsets(self, chunk_size: int) -> list[int]:
+        """Start offset of every chunk of at most ``chunk_size`` bytes, plus the end.
+
+        Each cut prefers the last line break, then the last space, within
+        _BREAK_LOOKBACK bytes of the limit, and never splits a UTF-8 sequence.
+        """
+        cached = self._offsets.pop(chunk_size, None)
+        if cached is not None:
+            self._offsets[chunk_size] = cached   # most recently used last
+            return cached
+        data = self.data
+        offsets = [0]
+        start = 0
+        while self.size - start > chunk_size:
+            limit = start + chunk_size
+            floor = max(start + 1, limit - _BREAK_LOOKBACK)
+            cut = data.rfind(b"\n", floor, limit)
+            if cut < 0:
+                cut = data.rfind(b" ", floor, limit)
+            if cut < 0:
+                cut = limit
+                # Continuation bytes are 0b10xxxxxx; back up to a lead byte.
+                while cut > start + 1 and data[cut] & 0xC0 == 0x80:
+                    cut -= 1
+            else:
+                cut += 1
+            offsets.append(cut)
+            start = cut
+        offsets.append(self.size)
+        self._offsets[chunk_size] = offsets
+        while len(self._offsets) > _MEMOIZED_SIZES:
+            del self._offsets[next(iter(self._offsets))]
+        return offsets
+
+    def total_chunks(self, chunk_size: int) -> int:
+        return len(self.offsets(chunk_size)) - 1
+
+    def chunk_span(self, number: int, chunk_size: int) -> tuple[int, int]:
+        """Byte span of 1-based chunk ``number``; IndexError when out of range."""
+        offsets = self.offsets(chunk_size)
+        if not 1 <= number < len(offsets):
+            raise IndexError(number)
+        return offsets[number - 1], offsets[number]
+
+    def chunk(self, number: int, chunk_size: int) -> str:
+        start, end = self.chunk_span(number, chunk_size)
+        return self.data[start:end].decode("utf-8")
+
+    def sections_in(self, start: int, end: int) -> tuple[str | None, str | None]:
+        """section_id of the units the byte span [start, end) begins and ends in."""
+        if not self._section_ids or end <= start:
+            return None, None
+        first = max(0, bisect_right(self._unit_starts, start) - 1)
+        last = max(0, bisect_right(self._unit_starts, end - 1) - 1)
+        return self._section_ids[first], self._section_ids[last]
+
+
+def cached_content(package_id: str) -> BillContent | None:
+    content = _rendered.get(package_id)
+    if content is not None and isinstance(content.data, mmap.mmap) and content.data.closed:
+        # Its page file was closed by the store (evicted or replaced); map it afresh.
+        del _rendered[package_id]
+        return None
+    if content is not None:
+        _rendered.move_to_end(package_id)
+    return content
+
+
+def remember_content(content: BillContent) -> BillContent:
+    _rendered[content.package_id] = content
+    _rendered.move_to_end(content.package_id)
+    while len(_rendered) > MAX_CACHED_BILLS:
+        _rendered.popitem(last=False)
+    return content
+
+
+def clear_content_cache() -> None:
+    _rendered.clear()
@@ -0,0 +1,116 @@
+"""Short-lived cursors over a search_bill_text ranking.
+
+A search fuses every query's FTS hits into one ranked candidate list (index.rank,
+up to MAX_RANKED sections per query) but returns only the first max_hits of it.
+When more remain, the whole list is kept here under a random id and the caller gets
+an opaque cursor naming that id and the offset of the next page. Following the cursor slices the kept list: no bill load,
+no FTS pass, no RRF fusion, and the pages of one cursor chain never overlap or skip,
+since they are cut from one ranking.
+
+Entries expire CURSOR_TTL_SECONDS after they were last followed, and at most
+MAX_CURSORS are held, least recently followed evicted first. An expired cursor is a
+``cursor_expired`` error; the search is simply re-run without it.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .client import BillTextError
+from .index import RankedUnit
+
+# Long enough to read a page and ask for the next; short enough that a stale ranking
+# of a since-refreshed package does not outlive the conversation that asked for it.
+CURSOR_TTL_SECONDS = 600
+MAX_CURSORS = 64
+# Sections each query may contribute to a ranking cursors page through: far past any
+# page, so paging reaches every match of all but the most common phrases. Past it the
+# response says the ranking is truncated rather than that it ran out.
+MAX_RANKED = 1000
+
+
+@dataclass
+class SearchCursor:
+    package_id: str
+    # The request a cursor continues: its bill, version argument and normalized queries.
+    congress: int
+    bill_type: str
+    number: int
+    version: str | None
+    queries: tuple[str, ...]
+    ranked: list[RankedUnit]
+    # Whether a query matched sections past MAX_RANKED that `ranked` leaves out.
+    truncated: bool
+    # Per ranked unit, the subtree_byte_length its hit reports.
+    subtree_bytes: list[int]
+    display: dict[str, str]
+    # The first page's envelope fields, notes and diagnostics, repeated on every page.
+    envelope: dict[str, Any]
+    version_resolution_note: str | None
+    query_diagnostics: list[Any] | None
+    chunks_searched: int
+    touched: float = 0.0
+
+
+_cursors: OrderedDict[str, SearchCursor] = OrderedDict()
+
+
+def keep_cursor(entry: SearchCursor) -> str:
+    """Hold a ranking for paging; returns the id its cursors carry."""
+    _expire()
+    cursor_id = secrets.token_urlsafe(12)
+    entry.touched = time.monotonic()
+    _cursors[cursor_id] = entry
+    while len(_cursors) > MAX_CURSORS:
+        _cursors.popitem(last=False)
+    return cursor_id
+
+
+def encode_cursor(cursor_id: str, offset: int) -> str:
+    payload = json.dumps({"id": cursor_id, "offset": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def follow_cursor(cursor: str) -> tuple[str, SearchCursor, int]:
+    """The id, kept ranking and next-page offset a cursor names.
+
+    ValueError for a string this server did not issue; BillTextError
+    ``cursor_expired`` for one whose ranking is no longer held.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_id, offset = str(payload["id"]), int(payload["offset"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ValueError("cursor is not a next_cursor returned by search_bill_text.") from None
+    if offset < 0:
+        raise ValueError("cursor is not a next_cursor returned by search_bill_text.")
+    _expire()
+    entry = _cursors.get(cursor_id)
+    if entry is None:
+        raise BillTextError(
+            "cursor_expired",
+            "This search cursor has expired or was evicted.",
+            {"ttl_seconds": CURSOR_TTL_SECONDS},
+            "Re-run search_bill_text with the same queries and no cursor.",
+        )
+    entry.touched = time.monotonic()
+    _cursors.move_to_end(cursor_id)
+    return cursor_id, entry, offset
+
+
+def clear_cursors() -> None:
+    _cursors.clear()
+
+
+def _expire() -> None:
+    cutoff = time.monotonic() - CURSOR_TTL_SECONDS
+    for cursor_id in [key for key, entry in _cursors.items() if entry.touched < cutoff]:
+        del _cursors[cursor_id]
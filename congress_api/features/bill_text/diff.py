@@ -0,0 +1,167 @@
+"""Section- and segment-level diff between two parsed versions of one bill."""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+from dataclasses import dataclass, field
+
+from .parser import Segment, Unit, collapse_ws
+
+# Minimum header similarity for pairing a removed unit with an added one whose
+# section_id differs (a renumbered or re-parented section). Below this, the pair
+# is reported as one removal and one addition.
+HEADER_MATCH_RATIO = 0.85
+
+
+@dataclass
+class SegmentDelta:
+    op: str
+    before: list[Segment]
+    after: list[Segment]
+
+
+@dataclass
+class UnitChange:
+    status: str
+    before: Unit | None
+    after: Unit | None
+    text_changed: bool
+    segments: list[SegmentDelta] = field(default_factory=list)
+
+
+@dataclass
+class BillDiff:
+    compared: int
+    unchanged: int
+    changes: list[UnitChange]
+
+
+def diff_units(
+    before: list[Unit],
+    after: list[Unit],
+    before_hashes: dict[str, str],
+    after_hashes: dict[str, str],
+) -> BillDiff:
+    """Align two versions' units and describe every unit that differs.
+
+    Units pair by section_id first. A unit whose id exists in only one version is
+    then paired by identical content (a renumbered section), and failing that by
+    header similarity. Each pair is compared by content hash, so an unchanged
+    unit costs one lookup and is never diffed; only the changed pairs go through
+    a segment-level diff.
+    """
+    before_by_id = {unit.section_id: unit for unit in before}
+    after_ids = {unit.section_id for unit in after}
+    pairs: dict[str, Unit] = {}
+    added: list[Unit] = []
+    for unit in after:
+        match = before_by_id.get(unit.section_id)
+        if match is None:
+            added.append(unit)
+        else:
+            pairs[unit.section_id] = match
+    removed = [unit for unit in before if unit.section_id not in after_ids]
+
+    renumbered = _pair_unmatched(removed, added, before_hashes, after_hashes)
+    paired_before = {id(unit) for unit in renumbered.values()}
+
+    changes: list[UnitChange] = []
+    unchanged = 0
+    for unit in after:
+        old = pairs.get(unit.section_id) or renumbered.get(unit.section_id)
+        if old is None:
+            changes.append(UnitChange("added", None, unit, True))
+            continue
+        same_text = before_hashes[old.section_id] == after_hashes[unit.section_id]
+        same_header = old.header == unit.header
+        if old.section_id == unit.section_id:
+            if same_text and same_header:
+                unchanged += 1
+                continue
+            status = "modified"
+        else:
+            status = "renumbered"
+        change = UnitChange(status, old, unit, not same_text)
+        if not same_text:
+            change.segments = diff_segments(old.segments, unit.segments)
+        changes.append(change)
+    for unit in removed:
+        if id(unit) not in paired_before:
+            changes.append(UnitChange("removed", unit, None, True))
+    compared = len(after) + sum(1 for unit in removed if id(unit) not in paired_before)
+    return BillDiff(compared=compared, unchanged=unchanged, changes=changes)
+
+
+def diff_segments(before: list[Segment], after: list[Segment]) -> list[SegmentDelta]:
+    """Insert / delete / replace runs between two segment lists, equal runs omitted."""
+    # Compare (context, text) so a passage that moves between operative and quoted
+    # text -- the difference between amending and being inserted -- is a change.
+    matcher = difflib.SequenceMatcher(
+        None,
+        [(segment.context, segment.text) for segment in before],
+        [(segment.context, segment.text) for segment in after],
+        autojunk=False,
+    )
+    return [
+        SegmentDelta(op, before[i1:i2], after[j1:j2])
+        for op, i1, i2, j1, j2 in matcher.get_opcodes()
+        if op != "equal"
+    ]
+
+
+def unit_digest(unit: Unit) -> str:
+    """Digest of a unit's (context, text) segments: equal exactly when diff_segments
+    finds no change, so a passage moving between operative and quoted text is one."""
+    digest = hashlib.blake2b(digest_size=16)
+    for segment in unit.segments:
+        digest.update(segment.context.encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(segment.text.encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def _pair_unmatched(
+    removed: list[Unit],
+    added: list[Unit],
+    before_hashes: dict[str, str],
+    after_hashes: dict[str, str],
+) -> dict[str, Unit]:
+    """Added section_id -> the removed unit it continues, by content then by header."""
+    paired: dict[str, Unit] = {}
+    available = list(removed)
+    by_hash: dict[str, list[Unit]] = {}
+    for unit in available:
+        by_hash.setdefault(before_hashes[unit.section_id], []).append(unit)
+    for unit in added:
+        candidates = by_hash.get(after_hashes[unit.section_id])
+        if candidates:
+            match = candidates.pop(0)
+            paired[unit.section_id] = match
+            available.remove(match)
+    for unit in added:
+        if unit.section_id in paired or not unit.header:
+            continue
+        header = _header_key(unit.header)
+        best, best_ratio = None, HEADER_MATCH_RATIO
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(header)
+        for candidate in available:
+            if not candidate.header:
+                continue
+            matcher.set_seq1(_header_key(candidate.header))
+            # The cheap upper bounds reject most candidates before the full ratio.
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        if best is not None:
+            paired[unit.section_id] = best
+            available.remove(best)
+    return paired
+
+
+def _header_key(header: str) -> str:
+    return collapse_ws(header).casefold()
@@ -0,0 +1,95 @@
+"""Precomputed section-id hierarchy for one parsed bill."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
+
+from .parser import Unit
+
+
+class BillHierarchy:
+    """Id map, parent -> children tree and leaf-enum map over a bill's units.
+
+    get_bill_section used to rediscover all three per call: a `{section_id: unit}`
+    dict rebuilt on every lookup, a linear scan for a bare enum, and a `startswith`
+    scan over every unit for each container -- repeated for each nested child, so
+    expanding a division of a 20,000-chunk NDAA was quadratic. Built once per loaded
+    bill, every lookup below is a dict read and a container's children cost
+    O(children).
+
+    The tree is keyed by id PREFIX, exactly as compute_subtree_bytes is, so a
+    container that is never emitted as a unit (a division, a byte-split section)
+    has children and descendants like any other node. Every list preserves document
+    order, which is the order each call site previously derived by scanning.
+
+    Every map holds unit positions, not Units, and is built from section ids alone, so
+    over a resident bill's lazy units (bill_text.columnar.ColumnarUnits, which list
+    their ids without building Units) a lookup builds only the Units it returns.
+    """
+
+    def __init__(self, units: Sequence[Unit]):
+        self.units = units
+        ids = getattr(units, "section_ids", None)
+        self.section_ids: list[str] = ids if ids is not None else [unit.section_id for unit in units]
+        # Last wins on a repeated id, as the dict comprehension this replaces did.
+        self._by_id: dict[str, int] = {}
+        self._by_leaf: dict[str, list[int]] = defaultdict(list)
+        self._children: dict[str, dict[str, None]] = defaultdict(dict)
+        self._descendants: dict[str, list[int]] = defaultdict(list)
+        self._first: dict[str, int] = {}
+        for position, section_id in enumerate(self.section_ids):
+            self._by_id[section_id] = position
+            components = section_id.split("/")
+            self._by_leaf[components[-1]].append(position)
+            parent = ""
+            for depth in range(1, len(components) + 1):
+                prefix = "/".join(components[:depth])
+                # dict as an insertion-ordered set: first appearance is document order.
+                self._children[parent][prefix] = None
+                self._first.setdefault(prefix, position)
+                if depth < len(components):
+                    self._descendants[prefix].append(position)
+                parent = prefix
+        self.by_id: Mapping[str, Unit] = _UnitsById(self)
+
+    def children(self, section_id: str = "") -> list[str]:
+        """Ids one level below `section_id` (the roots for ""), in document order."""
+        children = self._children.get(section_id)
+        return list(children) if children else []
+
+    def descendants(self, section_id: str) -> list[Unit]:
+        """Units strictly beneath `section_id`, in document order."""
+        return [self.units[position] for position in self._descendants.get(section_id, ())]
+
+    def first_unit(self, section_id: str) -> Unit:
+        """The first unit in document order at or beneath `section_id`."""
+        return self.units[self._first[section_id]]
+
+    def prefixes(self) -> list[str]:
+        """Every id prefix, in the document order of its first unit."""
+        return list(self._first)
+
+    def bare_matches(self, bare: str) -> list[Unit]:
+        """Units whose leaf component is `S:{bare}` or `bare` itself, in document order."""
+        positions = sorted([*self._by_leaf.get(f"S:{bare}", ()), *self._by_leaf.get(bare, ())])
+        return [self.units[position] for position in positions]
+
+
+class _UnitsById(Mapping[str, Unit]):
+    """section_id -> Unit over a hierarchy's positions, building a Unit only when read."""
+
+    def __init__(self, hierarchy: BillHierarchy):
+        self._hierarchy = hierarchy
+
+    def __getitem__(self, section_id: str) -> Unit:
+        return self._hierarchy.units[self._hierarchy._by_id[section_id]]
+
+    def __contains__(self, section_id: object) -> bool:
+        return section_id in self._hierarchy._by_id
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._hierarchy._by_id)
+
+    def __len__(self) -> int:
+        return len(self._hierarchy._by_id)
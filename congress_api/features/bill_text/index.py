@@ -7,11 +7,22 @@ import json
 import re
 import sqlite3
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from typing import Iterable
 
+from .columnar import ColumnarUnits
 from .models import AncestorNode
-from .parser import ParsedBill, Unit, collapse_ws
+from .parser import (
+    ParsedBill,
+    Segment,
+    Unit,
+    collapse_ws,
+    join_segments,
+    segment_amends,
+    segments_are_amendatory,
+)
+from .vocabulary import bill_vocabulary
 
 
 CONTEXT_ORDER = {"operative": 0, "quoted": 1, "header": 2}
@@ -22,6 +33,13 @@ CONTEXT_ORDER = {"operative": 0, "quoted": 1, "header": 2}
 # failure class of the thing it measures.
 FTS_TOKENIZER = "porter unicode61 remove_diacritics 2"
 
+# Words of a query considered when looking for the phrases of it a bill does contain;
+# the run count grows with the square of this.
+MAX_PHRASE_WORDS = 12
+# Splits a query into words to cut runs from; unicode61 separates on anything that
+# is not a letter or digit.
+_WORD = re.compile(r"[^\W_]+")
+
 
 @dataclass(frozen=True)
 class RankedHit:
@@ -32,12 +50,49 @@ class RankedHit:
     snippet: str
 
 
+@dataclass(frozen=True)
+class RankedUnit:
+    """A fused-ranking entry before its snippet is cut: everything RankedHit needs."""
+
+    unit: Unit
+    score: float
+    match_contexts: list[str]
+    matched_queries: list[str]
+    # The unit's matching segment rows, in bm25 order; the snippet is chosen from them.
+    rows: list[sqlite3.Row]
+
+    def hit(self) -> RankedHit:
+        return RankedHit(
+            unit=self.unit,
+            score=self.score,
+            match_contexts=self.match_contexts,
+            matched_queries=self.matched_queries,
+            snippet=snippet_for_unit(self.unit, self.rows),
+        )
+
+
+@dataclass(frozen=True)
+class SearchOutcome:
+    hits: list[RankedHit]
+    # Queries that matched no segment at all -- not merely none in the top max_hits.
+    unmatched: list[str]
+    # The whole fused ranking, hits first; the rest is what a cursor pages through.
+    ranked: list[RankedUnit] = field(default_factory=list)
+    # True when some query matched more sections than its candidate cap admitted, so
+    # `ranked` does not hold every matching section.
+    truncated: bool = False
+
+
 @dataclass(frozen=True)
 class QueryDiagnosis:
     """Why a query found nothing: the terms it became, and which the bill lacks."""
 
     terms: list[str]
     absent: list[str]
+    # Each absent term's nearest terms in the bill's vocabulary (bill_text.vocabulary).
+    near_terms: dict[str, list[str]] = field(default_factory=dict)
+    # The longest runs of the query's own words that the bill does contain as phrases.
+    matching_phrases: list[str] = field(default_factory=list)
 
     @property
     def verdict(self) -> str:
@@ -76,6 +131,17 @@ def has_token(q: str) -> bool:
     return bool(re.search(r"[A-Za-z0-9]", q))
 
 
+def _unit_parts(units: Sequence[Unit]) -> Iterator[tuple[str, Sequence[AncestorNode], str | None, list[Segment]]]:
+    """(section_id, ancestor path, header, segments) per unit, in order.
+
+    A resident bill's units are read straight from its columns, so indexing it builds
+    no Unit (see bill_text.columnar).
+    """
+    if isinstance(units, ColumnarUnits):
+        return units.bill.unit_parts()
+    return ((unit.section_id, unit.ancestor_path, unit.header, unit.segments) for unit in units)
+
+
 class BillTextIndex:
     def __init__(self, parsed: ParsedBill):
         self.parsed = parsed
@@ -84,8 +150,14 @@ class BillTextIndex:
         self._build()
 
     def _build(self) -> None:
+        # A throwaway per-call database: there is nothing to recover after a crash, so
+        # skip the rollback journal and fsyncs entirely.
         self.conn.executescript(
             """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            PRAGMA temp_store = MEMORY;
+
             CREATE TABLE units (
               id INTEGER PRIMARY KEY,
               section_id TEXT NOT NULL UNIQUE,
@@ -129,34 +201,59 @@ class BillTextIndex:
             + FTS_TOKENIZER
             + """'
             );
-            CREATE VIRTUAL TABLE probe_vocab USING fts5vocab(probe_fts, 'row');
+            CREATE VIRTUAL TABLE probe_instance USING fts5vocab(probe_fts, 'instance');
+
+            -- Scratch table of phrase literals: one search statement joins it to
+            -- seg_fts so every query is matched and ranked in a single pass.
+            CREATE TABLE search_queries (
+              id INTEGER PRIMARY KEY,
+              literal TEXT NOT NULL
+            );
             """
         )
+        # Pre-serialise every row, then load each table in one executemany. Row-at-a-time
+        # execute() calls were most of index_ms on an omnibus bill; so was re-encoding
+        # each unit's ancestor path, which units under the same title share verbatim.
+        path_json: dict[tuple, str] = {}
+        unit_rows = []
+        segment_rows = []
         segment_id = 1
-        for unit_id, unit in enumerate(self.parsed.units, start=1):
-            self.conn.execute(
-                """
-                INSERT INTO units(id, section_id, ancestor_path, header, display_text,
-                                  byte_length, is_amendatory, amends)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        for unit_id, (section_id, path, header, segments) in enumerate(_unit_parts(self.parsed.units), start=1):
+            path_key = tuple((node.type, node.enum, node.header) for node in path)
+            ancestor_path = path_json.get(path_key)
+            if ancestor_path is None:
+                ancestor_path = path_json[path_key] = json.dumps([node.model_dump() for node in path])
+            display_text = join_segments(segments, render=False)
+            unit_rows.append(
                 (
                     unit_id,
-                    unit.section_id,
-                    json.dumps([node.model_dump() for node in unit.ancestor_path]),
-                    unit.header,
-                    unit.display_text,
-                    unit.byte_length,
-                    1 if unit.is_amendatory else 0,
-                    json.dumps(unit.amends),
-                ),
-            )
-            for ordinal, segment in enumerate(unit.segments):
-                self.conn.execute(
-                    "INSERT INTO segments(id, unit_id, ordinal, context, text) VALUES (?, ?, ?, ?, ?)",
-                    (segment_id, unit_id, ordinal, segment.context, segment.text),
+                    section_id,
+                    ancestor_path,
+                    header,
+                    display_text,
+                    len(display_text.encode("utf-8")),
+                    1 if segments_are_amendatory(segments) else 0,
+                    json.dumps(segment_amends(segments)),
                 )
+            )
+            for ordinal, segment in enumerate(segments):
+                segment_rows.append((segment_id, unit_id, ordinal, segment.context, segment.text))
                 segment_id += 1
+        self.conn.executemany(
+            """
+            INSERT INTO units(id, section_id, ancestor_path, header, display_text,
+                              byte_length, is_amendatory, amends)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            unit_rows,
+        )
+        self.conn.executemany(
+            "INSERT INTO segments(id, unit_id, ordinal, context, text) VALUES (?, ?, ?, ?, ?)",
+            segment_rows,
+        )
+        # One 'rebuild' pass over the content table, not per-row inserts into seg_fts:
+        # measured on a 1,200-unit / 4,500-segment bill, writing seg_fts directly with
+        # executemany was ~25% slower than letting FTS5 tokenize the table in bulk.
         self.conn.execute("INSERT INTO seg_fts(seg_fts) VALUES('rebuild')")
         self.conn.execute("INSERT INTO seg_fts(seg_fts) VALUES('optimize')")
         self.conn.commit()
@@ -170,23 +267,94 @@ class BillTextIndex:
         surfaces the stemming, which is where a phrase silently stops meaning what the
         caller typed.
         """
+        return self.diagnose_many([query])[query]
+
+    def diagnose_many(self, queries: Iterable[str]) -> dict[str, QueryDiagnosis]:
+        """`diagnose` for several queries in a fixed number of statements.
+
+        Each query is one probe row; the instance vocabulary attributes every stemmed
+        term to the row it came from, and one IN lookup against seg_vocab answers
+        absence for all of them at once. Absent terms are looked up in the bill's
+        cached vocabulary for near misses, and every query's word runs are probed as
+        phrases in one more statement.
+        """
+        query_list = list(dict.fromkeys(queries))
         self.conn.execute("DELETE FROM probe_fts")
-        self.conn.execute("INSERT INTO probe_fts(text) VALUES (?)", (query,))
-        terms = [row[0] for row in self.conn.execute("SELECT term FROM probe_vocab")]
-        # fts5vocab yields terms in index (sorted) order, not query order. Sort by where
-        # each stem first prefixes the query so the list reads left-to-right as typed;
-        # this is display order only and never affects the absence test below.
-        lowered = query.casefold()
-        terms.sort(key=lambda term: (lowered.find(term[:4]), term))
-        absent = [
-            term
-            for term in terms
-            if self.conn.execute(
-                "SELECT 1 FROM seg_vocab WHERE term = ? LIMIT 1", (term,)
-            ).fetchone()
-            is None
+        self.conn.executemany(
+            "INSERT INTO probe_fts(rowid, text) VALUES (?, ?)",
+            list(enumerate(query_list, start=1)),
+        )
+        terms_by_row: dict[int, set[str]] = defaultdict(set)
+        for term, row in self.conn.execute("SELECT term, doc FROM probe_instance"):
+            terms_by_row[row].add(term)
+        all_terms = sorted(set().union(*terms_by_row.values()))
+        present = {
+            row[0]
+            for row in self.conn.execute(
+                f"SELECT term FROM seg_vocab WHERE term IN ({', '.join('?' * len(all_terms))})",
+                all_terms,
+            )
+        } if all_terms else set()
+        absent_terms = [term for term in all_terms if term not in present]
+        near = {}
+        if absent_terms:
+            vocabulary = bill_vocabulary(self.parsed.package_id, self.parsed.last_modified, self.conn)
+            near = {term: vocabulary.near(term) for term in absent_terms}
+        phrases = self._matching_phrases(query_list)
+        diagnoses = {}
+        for row, query in enumerate(query_list, start=1):
+            # fts5vocab yields terms in index (sorted) order, not query order. Sort by
+            # where each stem first prefixes the query so the list reads left-to-right
+            # as typed; this is display order only and never affects the absence test.
+            lowered = query.casefold()
+            terms = sorted(terms_by_row[row], key=lambda term: (lowered.find(term[:4]), term))
+            absent = [term for term in terms if term not in present]
+            diagnoses[query] = QueryDiagnosis(
+                terms=terms,
+                absent=absent,
+                near_terms={term: near[term] for term in absent if near.get(term)},
+                matching_phrases=phrases.get(query, []),
+            )
+        return diagnoses
+
+    def _matching_phrases(self, queries: list[str]) -> dict[str, list[str]]:
+        """Per query, its longest word runs that match as phrases, in query order.
+
+        Every contiguous run of two or more of a query's words is probed in ONE
+        statement, each with the same phrase MATCH the search runs; of the runs that
+        match, the longest are kept, never two that share a word. A query's words are
+        split only to cut runs from it -- the tokenizer that matters is FTS5's, which
+        every probe goes through.
+        """
+        runs: list[tuple[str, int, int, str]] = []
+        for query in queries:
+            words = _WORD.findall(query)[:MAX_PHRASE_WORDS]
+            for start in range(len(words)):
+                for end in range(start + 2, len(words) + 1):
+                    runs.append((query, start, end, " ".join(words[start:end])))
+        self.conn.execute("DELETE FROM search_queries")
+        self.conn.executemany(
+            "INSERT INTO search_queries(id, literal) VALUES (?, ?)",
+            [(position, fts_literal(run[3])) for position, run in enumerate(runs)],
+        )
+        matched = [
+            runs[row[0]]
+            for row in self.conn.execute(
+                """
+                SELECT id FROM search_queries
+                WHERE EXISTS (SELECT 1 FROM seg_fts WHERE seg_fts MATCH search_queries.literal)
+                """
+            )
         ]
-        return QueryDiagnosis(terms=terms, absent=absent)
+        phrases: dict[str, list[str]] = {}
+        taken: dict[str, set[int]] = defaultdict(set)
+        for query, start, end, phrase in sorted(matched, key=lambda run: (run[1] - run[2], run[1])):
+            words = set(range(start, end))
+            if taken[query] & words:
+                continue
+            taken[query] |= words
+            phrases.setdefault(query, []).append((start, phrase))
+        return {query: [phrase for _, phrase in sorted(found)] for query, found in phrases.items()}
 
     def query_matches(self, query: str) -> bool:
         """Whether `query` matches any segment at all, independent of ranking or the
@@ -196,7 +364,7 @@ class BillTextIndex:
         caller-facing falsehood 'every term is present but not phrased this way'
         (verdict `phrasing`) about a query that in fact matched a section. Uses the
         same phrase-literal MATCH the ranked search runs, so 'matched' means here what
-        it means there."""
+        it means there. `rank` reports the same thing for a whole batch as `unmatched`."""
         if not has_token(query):
             return False
         row = self.conn.execute(
@@ -205,94 +373,128 @@ class BillTextIndex:
         return row is not None
 
     def search(self, queries: Iterable[str], max_hits: int) -> list[RankedHit]:
-        query_list = list(queries)
-        limit = min(200, max(50, max_hits * 5))
+        return self.rank(queries, max_hits).hits
+
+    def rank(self, queries: Iterable[str], max_hits: int, depth: int | None = None) -> SearchOutcome:
+        """RRF-fused hits for every query, plus the queries that matched nothing.
+
+        Each query admits at most `depth` distinct sections as candidates; by default
+        a window sized from max_hits, enough for one page. A caller that pages the
+        ranking passes a deeper cap, and `truncated` says whether any query matched
+        more sections than that, so a deeper cap would change its ranks.
+
+        All queries run in ONE statement: they are loaded into a scratch table and
+        joined to seg_fts, so a 10-query search is three round trips rather than ten
+        MATCH passes, ten query_matches probes and a snippet SELECT per hit. bm25() is
+        evaluated per joined query row, so each query is ranked exactly as if it had
+        run alone; snippet context comes from the parsed unit already in memory.
+        """
+        # A repeated query collapses to its first occurrence: keyed by query string,
+        # it would add nothing to the RRF sum anyway.
+        query_list = [query for query in dict.fromkeys(queries) if has_token(query)]
+        limit = depth if depth is not None else min(200, max(50, max_hits * 5))
+        truncated = False
         unit_rank: dict[int, dict[str, int]] = defaultdict(dict)
         unit_contexts: dict[int, set[str]] = defaultdict(set)
         unit_segments: dict[int, list[sqlite3.Row]] = defaultdict(list)
 
-        for query in query_list:
-            # bm25() is an FTS5 auxiliary function usable only in the flat query
-            # that owns the MATCH (in SELECT / ORDER BY -- never inside an
-            # aggregate or a non-flattened subquery), so aggregate to units in
-            # Python instead. Deliberately NO row LIMIT: a flat LIMIT on segment
-            # rows truncated the candidate set before the per-query *unit* limit
-            # could apply -- a common term yields many matching segments inside few
-            # units (spec §7, defect 5e). The row set is one bill's segments.
-            rows = self.conn.execute(
-                """
-                SELECT units.id AS unit_id, units.section_id AS section_id,
-                       segments.id AS segment_id, segments.context, segments.text,
-                       segments.ordinal, bm25(seg_fts) AS rank
-                FROM seg_fts
-                JOIN segments ON segments.id = seg_fts.rowid
-                JOIN units ON units.id = segments.unit_id
-                WHERE seg_fts MATCH ?
-                ORDER BY bm25(seg_fts) ASC, units.section_id ASC
-                """,
-                (fts_literal(query),),
-            ).fetchall()
-            # Rows are bm25-ordered, so a unit's first appearance is its best rank.
-            # Admit the first `limit` distinct units for THIS query as candidates
-            # (1-based ranks); keep collecting segments for units already candidate
-            # for any query, but never admit a brand-new unit past the cap.
-            ranked_this_query = 0
-            for row in rows:
-                unit_id = int(row["unit_id"])
-                existing = unit_rank.get(unit_id)
-                if existing is None or query not in existing:
-                    if ranked_this_query < limit:
-                        ranked_this_query += 1
-                        # Keyed by query string so a duplicate query collapses in
-                        # the RRF sum rather than double-counting.
-                        unit_rank[unit_id][query] = ranked_this_query
-                    elif existing is None:
+        self.conn.execute("DELETE FROM search_queries")
+        self.conn.executemany(
+            "INSERT INTO search_queries(id, literal) VALUES (?, ?)",
+            [(position, fts_literal(query)) for position, query in enumerate(query_list)],
+        )
+        # bm25() is an FTS5 auxiliary function usable only in the flat query that owns
+        # the MATCH (in SELECT / ORDER BY -- never inside an aggregate or a
+        # non-flattened subquery), so aggregate to units in Python instead.
+        # Deliberately NO row LIMIT: a flat LIMIT on segment rows truncated the
+        # candidate set before the per-query *unit* limit could apply -- a common term
+        # yields many matching segments inside few units (spec §7, defect 5e). The row
+        # set is one bill's segments per query. CROSS JOIN pins the query table as the
+        # outer loop so each query row drives its own MATCH.
+        rows = self.conn.execute(
+            """
+            SELECT search_queries.id AS query_id,
+                   units.id AS unit_id, units.section_id AS section_id,
+                   segments.id AS segment_id, segments.context, segments.text,
+                   segments.ordinal, bm25(seg_fts) AS rank
+            FROM search_queries
+            CROSS JOIN seg_fts
+            JOIN segments ON segments.id = seg_fts.rowid
+            JOIN units ON units.id = segments.unit_id
+            WHERE seg_fts MATCH search_queries.literal
+            ORDER BY search_queries.id ASC, bm25(seg_fts) ASC, units.section_id ASC
+            """
+        ).fetchall()
+        matched: set[str] = set()
+        current_query = None
+        ranked_this_query = 0
+        for row in rows:
+            query = query_list[row["query_id"]]
+            if query != current_query:
+                current_query, ranked_this_query = query, 0
+                matched.add(query)
+            # Rows are bm25-ordered within a query, so a unit's first appearance is its
+            # best rank. Admit the first `limit` distinct units for THIS query as
+            # candidates (1-based ranks); keep collecting segments for units already
+            # candidate for any query, but never admit a brand-new unit past the cap.
+            unit_id = int(row["unit_id"])
+            existing = unit_rank.get(unit_id)
+            if existing is None or query not in existing:
+                if ranked_this_query < limit:
+                    ranked_this_query += 1
+                    unit_rank[unit_id][query] = ranked_this_query
+                else:
+                    # This query matched more distinct units than the cap, whether or
+                    # not another query made this one a candidate.
+                    truncated = True
+                    if existing is None:
                         # New unit beyond the candidate cap and not a candidate for
                         # any other query -> drop it entirely.
                         continue
-                unit_contexts[unit_id].add(row["context"])
-                unit_segments[unit_id].append(row)
+            unit_contexts[unit_id].add(row["context"])
+            unit_segments[unit_id].append(row)
 
-        hits: list[RankedHit] = []
-        by_id = {idx: unit for idx, unit in enumerate(self.parsed.units, start=1)}
+        ranked: list[RankedUnit] = []
         for unit_id, ranks in unit_rank.items():
-            score = sum(1 / (60 + rank) for rank in ranks.values())
-            unit = by_id[unit_id]
-            contexts = sorted(unit_contexts[unit_id], key=lambda item: CONTEXT_ORDER[item])
-            snippet = self._snippet_for_unit(unit_id, unit_segments[unit_id])
-            hits.append(
-                RankedHit(
-                    unit=unit,
-                    score=score,
-                    match_contexts=contexts,
+            ranked.append(
+                RankedUnit(
+                    unit=self.parsed.units[unit_id - 1],
+                    score=sum(1 / (60 + rank) for rank in ranks.values()),
+                    match_contexts=sorted(unit_contexts[unit_id], key=lambda item: CONTEXT_ORDER[item]),
                     matched_queries=sorted(ranks.keys()),
-                    snippet=snippet,
+                    rows=unit_segments[unit_id],
                 )
             )
-        hits.sort(key=lambda hit: (-hit.score, hit.unit.section_id))
-        return hits[:max_hits]
-
-    def _snippet_for_unit(self, unit_id: int, rows: list[sqlite3.Row]) -> str:
-        preferred = [row for row in rows if row["context"] == "quoted"] or rows
-        chosen = preferred[0]
-        prefix = ""
-        if chosen["context"] == "quoted":
-            prev = self.conn.execute(
-                """
-                SELECT text FROM segments
-                WHERE unit_id = ? AND context = 'operative'
-                  AND ordinal < (SELECT ordinal FROM segments WHERE id = ?)
-                ORDER BY ordinal DESC
-                LIMIT 1
-                """,
-                (unit_id, chosen["segment_id"]),
-            ).fetchone()
-            if prev:
-                prefix = _window(prev["text"], 90) + " "
-        # Wrap a quoted snippet in delimiters (spec §6) so the caution is visible in
-        # the snippet text itself, not only in match_contexts.
-        chosen_text = f'"{chosen["text"]}"' if chosen["context"] == "quoted" else chosen["text"]
-        return _window(prefix + chosen_text, 320)
+        ranked.sort(key=lambda entry: (-entry.score, entry.unit.section_id))
+        # Snippets are cut only for the hits returned, not for every candidate.
+        return SearchOutcome(
+            hits=[entry.hit() for entry in ranked[:max_hits]],
+            unmatched=[query for query in query_list if query not in matched],
+            ranked=ranked,
+            truncated=truncated,
+        )
+
+def snippet_for_unit(unit: Unit, rows: list[sqlite3.Row]) -> str:
+    preferred = [row for row in rows if row["context"] == "quoted"] or rows
+    chosen = preferred[0]
+    prefix = ""
+    if chosen["context"] == "quoted":
+        # Segment ordinals are positions in unit.segments, so the nearest earlier
+        # operative segment is read from the parsed unit, not queried back.
+        prev = next(
+            (
+                segment
+                for segment in reversed(unit.segments[: chosen["ordinal"]])
+                if segment.context == "operative"
+            ),
+            None,
+        )
+        if prev:
+            prefix = _window(prev.text, 90) + " "
+    # Wrap a quoted snippet in delimiters (spec §6) so the caution is visible in
+    # the snippet text itself, not only in match_contexts.
+    chosen_text = f'"{chosen["text"]}"' if chosen["context"] == "quoted" else chosen["text"]
+    return _window(prefix + chosen_text, 320)
 
 
 def _window(text: str, max_chars: int) -> str:
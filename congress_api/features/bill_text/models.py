@@ -28,9 +28,10 @@ class CacheStatus(BaseModel):
 
 class Timing(BaseModel):
     """Server-measured wall-clock per phase, in milliseconds. fetch_ms covers
-    congress.gov version resolution plus the GovInfo document download; while
-    version_resolution is "fresh" and index_hit is false these run on every call
-    (persistence is PR 2). search_ms is present only for search_bill_text."""
+    congress.gov version resolution plus the GovInfo document download; when
+    version_hit is true the version list came from the local cache, and when
+    index_hit is true so did the document, with parse_ms the read of the stored
+    parse. search_ms is present only for search_bill_text."""
 
     fetch_ms: float
     parse_ms: float
@@ -122,6 +123,13 @@ class QueryDiagnostic(BaseModel):
     # query is answerable, just not in these words. Matching is literal phrase with
     # stemming, so word order and adjacency are load-bearing.
     verdict: Literal["absent_term", "phrasing"]
+    # Each absent term mapped to the bill's nearest terms, stemmed like `terms` -- a
+    # misspelling ("icebrak") or a word the bill only uses longer ("cyber" ->
+    # "cybersecur"). Null when no absent term has one.
+    near_terms: dict[str, list[str]] | None = None
+    # The longest runs of the query's own words that DO occur as phrases in this bill,
+    # in query order: where the query stops matching. Null when none does.
+    matching_phrases: list[str] | None = None
 
 
 class SearchBillTextResponse(BillTextEnvelope):
@@ -136,6 +144,13 @@ class SearchBillTextResponse(BillTextEnvelope):
     # Present only for queries that matched nothing; null when every query hit.
     query_diagnostics: list[QueryDiagnostic] | None = None
     hits: list[SearchHit]
+    # Every section the fused ranking holds, across all pages -- not just these hits.
+    total_hits: int
+    # True when a query matched more sections than the ranking keeps per query; the
+    # last page is then the end of the ranking, not of the matches.
+    ranking_truncated: bool = False
+    # Opaque; pass back as `cursor` for the next page. Null on the last page.
+    next_cursor: str | None = None
 
 
 class SectionChild(BaseModel):
@@ -176,6 +191,41 @@ class BillSectionResponse(BillTextEnvelope):
     children: list[SectionChild] | None = None
 
 
+class BatchSection(BaseModel):
+    """One section of a get_bill_sections response: the section fields of
+    BillSectionResponse, without the per-bill envelope the batch shares."""
+
+    section_id: str
+    node_kind: Literal["structural", "synthetic", "chunk"]
+    ancestor_path: list[AncestorNode]
+    header: str | None
+    text: str
+    is_amendatory: bool
+    amends: list[AmendsTarget]
+    byte_length: int
+    subtree_byte_length: int
+    truncated: bool
+    children: list[SectionChild] | None = None
+
+
+class BatchSectionResult(BaseModel):
+    # The id as the caller passed it; section.section_id is the resolved one.
+    requested_id: str
+    # This id's share of the response max_bytes. A share smaller than the section
+    # means truncated=true, exactly as get_bill_section with that max_bytes.
+    allocated_bytes: int
+    # Exactly one of section and error is set: one bad id does not fail the batch.
+    section: BatchSection | None = None
+    error: ErrorPayload | None = None
+
+
+class BillSectionsResponse(BillTextEnvelope):
+    request_note: str | None = None
+    max_bytes: int
+    bytes_returned: int
+    sections: list[BatchSectionResult]
+
+
 class TocNode(BaseModel):
     section_id: str
     node_kind: Literal["structural", "synthetic", "chunk"]
@@ -205,3 +255,102 @@ class BillTocResponse(BillTextEnvelope):
     toc_truncated: bool = False
     toc_note: str | None = None
     toc: list[TocNode]
+
+
+class CorpusHit(BaseModel):
+    package_id: str
+    congress: int | None
+    bill_type: str | None
+    number: int | None
+    version: str
+    section_id: str
+    header: str | None
+    snippet: str
+    matched_queries: list[str]
+    is_amendatory: bool
+    amends: list[AmendsTarget]
+    score: float
+
+
+class SearchBillCorpusResponse(BaseModel):
+    # The corpus is the set of packages already in the local bill-text cache -- the
+    # bills some earlier call loaded -- not all of Congress. packages_indexed and
+    # coverage_note say so on every response, because an empty hit list over a
+    # handful of cached bills is not evidence that no bill says it.
+    packages_indexed: int
+    coverage_note: str
+    request_note: str | None = None
+    queries_used: list[str]
+    amends: str | None = None
+    hits: list[CorpusHit]
+
+
+class AmendingSection(BaseModel):
+    package_id: str
+    congress: int | None
+    bill_type: str | None
+    number: int | None
+    version: str
+    section_id: str
+    header: str | None
+    is_amendatory: bool
+    # The target as this section cites it -- may name a subsection of `citation`.
+    cite: str
+
+
+class FindAmendingSectionsResponse(BaseModel):
+    citation: str
+    kind: Literal["usc", "public_law"]
+    packages_indexed: int
+    coverage_note: str
+    request_note: str | None = None
+    total_sections: int
+    sections: list[AmendingSection]
+
+
+class SegmentChange(BaseModel):
+    op: Literal["insert", "delete", "replace"]
+    # Rendered like get_bill_section text: quoted spans keep their delimiters, so
+    # language being inserted stays distinguishable from the amending prose.
+    before: str | None = None
+    after: str | None = None
+    contexts: list[Literal["operative", "quoted", "header"]]
+
+
+class SectionDiff(BaseModel):
+    # "renumbered": the unit continues under a different section_id in the newer
+    # version (paired by identical text, else by a near-identical header);
+    # text_changed says whether its text changed as well.
+    status: Literal["added", "removed", "modified", "renumbered"]
+    section_id: str
+    from_section_id: str | None = None
+    node_kind: Literal["structural", "synthetic", "chunk"]
+    header: str | None
+    from_header: str | None = None
+    text_changed: bool
+    # Null once the response's max_bytes budget is spent; the section is still
+    # listed, and get_bill_section on each version returns its text.
+    segments: list[SegmentChange] | None = None
+
+
+class BillVersionSide(BaseModel):
+    package_id: str
+    version: str
+    version_resolution: Literal["fresh", "cached", "cached_offline"] = "fresh"
+    version_resolved_at: str
+    version_resolution_note: str | None = None
+    last_modified: str | None = None
+    govinfo_url: str
+    cache: CacheStatus = Field(default_factory=CacheStatus)
+
+
+class DiffBillVersionsResponse(BaseModel):
+    from_version: BillVersionSide
+    to_version: BillVersionSide
+    request_note: str | None = None
+    sections_compared: int
+    sections_unchanged: int
+    total_changes: int
+    changes_truncated: bool
+    changes: list[SectionDiff]
+    timing: Timing | None = None
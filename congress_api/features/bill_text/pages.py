@@ -0,0 +1,135 @@
+"""Stored bill pages: a package's rendered text in one memory-mapped file.
+
+Beside the store's database, every stored package gets one file under
+``indexes/bill_text_store.v1.pages/``, written when the package is stored:
+
+    [rendered text, UTF-8, document order][JSON table][u64 text length][magic]
+
+The text is the package's full rendered text as bill_text.content.render_bill lays
+it out, and the table holds the package's version, the PAGES_FORMAT it was written
+under and the byte span of every unit's block (its new headings and its text), so a
+chunk can name the sections it covers. get_bill_content chunks are sliced straight
+from the mapping: nothing is read from SQLite and no ParsedBill is built, and
+processes serving the same bill share one copy in the OS page cache. Section and
+container reads are not served from here: their responses carry each unit's
+ancestor path, amendment disclosure and children, which live in the store (or the
+resident bill) anyway.
+
+A page file is a rendering derived from its package, removed with it and rewritten
+from it when missing, so it is not counted against CONGRESSMCP_CACHE_MAX_BYTES: the
+cap bounds the content-addressed store, where one version's text shared with
+another is held once, and counting full per-version renderings against it would
+evict deduplicated packages to pay for a cache of them. The files add roughly each
+stored package's rendered size on top of the cap.
+
+A file is written to a temporary name and renamed into place, so a reader sees the
+old file or the new one, never half of one. A file that does not end in the magic
+number, whose table does not parse, or that was written under another PAGES_FORMAT
+is treated as absent, and is rewritten the next time the whole bill is read.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+from .content import render_bill
+from .parser import ParsedBill
+
+logger = logging.getLogger(__name__)
+
+PAGES_SUFFIX = ".pages"
+# Bump whenever render_bill or render_segments changes what it produces, or the
+# table's layout changes: a file written by the old code then reads as absent
+# instead of serving stale text.
+PAGES_FORMAT = 2
+_MAGIC = b"BTP1"
+_FOOTER = struct.Struct("<Q4s")
+
+
+@dataclass
+class BillPages:
+    package_id: str
+    version: str
+    last_modified: str | None
+    # The whole file mapped read-only; the rendered text is its first `size` bytes.
+    data: mmap.mmap
+    size: int
+    spans: list[tuple[str, int, int]]
+
+
+def pages_path(directory: Path, package_id: str) -> Path:
+    return directory / f"{package_id}{PAGES_SUFFIX}"
+
+
+def write_pages(directory: Path, parsed: ParsedBill) -> Path:
+    data, spans = render_bill(parsed)
+    table = json.dumps(
+        {
+            "package_id": parsed.package_id,
+            "version": parsed.version,
+            "last_modified": parsed.last_modified,
+            "format": PAGES_FORMAT,
+            "spans": spans,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    directory.mkdir(parents=True, exist_ok=True)
+    path = pages_path(directory, parsed.package_id)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(data)
+            handle.write(table)
+            handle.write(_FOOTER.pack(len(data), _MAGIC))
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return path
+
+
+def open_pages(directory: Path, package_id: str) -> BillPages | None:
+    path = pages_path(directory, package_id)
+    try:
+        with open(path, "rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Absent, unreadable, or empty (an empty file cannot be mapped).
+        return None
+    try:
+        size, magic = _FOOTER.unpack(data[-_FOOTER.size:])
+        if magic != _MAGIC or size > len(data) - _FOOTER.size:
+            raise ValueError("bad footer")
+        table = json.loads(data[size:len(data) - _FOOTER.size])
+        if table["package_id"] != package_id:
+            raise ValueError("package_id mismatch")
+        if table.get("format") != PAGES_FORMAT:
+            # Written by another renderer version: expected after an upgrade, not a fault.
+            data.close()
+            return None
+        spans = [(str(sid), int(start), int(end)) for sid, start, end in table["spans"]]
+    except (struct.error, ValueError, KeyError, TypeError) as exc:
+        logger.warning(f"Ignoring unreadable bill pages {path}: {exc}")
+        data.close()
+        return None
+    return BillPages(package_id, table["version"], table["last_modified"], data, size, spans)
+
+
+def remove_pages(directory: Path, package_id: str) -> None:
+    try:
+        pages_path(directory, package_id).unlink(missing_ok=True)
+    except OSError as exc:
+        # Windows refuses to delete a file some process still has mapped.
+        logger.warning(f"Could not remove bill pages for {package_id}: {exc}")
+
+
+def pages_bytes(directory: Path) -> int:
+    try:
+        return sum(entry.stat().st_size for entry in directory.glob(f"*{PAGES_SUFFIX}"))
+    except OSError:
+        return 0
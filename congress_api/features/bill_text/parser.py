@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import os
 import re
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from .client import BillTextError
 from .models import AncestorNode
 
+try:  # optional C parser: pip install "congressmcp[lxml]"
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - exercised only without lxml
+    lxml_etree = None
+
+# "stdlib" forces xml.etree even when lxml is installed (bisecting a parse
+# difference, or measuring one backend against the other).
+XML_BACKEND_ENV = "CONGRESSMCP_XML_BACKEND"
+
 
 MAX_UNIT_BYTES = 8_000
 STRUCTURE_TYPES = {
@@ -140,9 +151,14 @@ _HUG = r"[)\s,;]*" + _AMEND_VERB + r"\b"
 # amendment -- "Paragraph (1) of section 743(d) is to read as follows:" -- that lacked
 # any gated verb), 0 false positives. §6 directs consumers to is_amendatory, so a known
 # false negative there contradicts how the field is sold.
+# The leading class is the alternatives' first letters (is/are/by/redesignate/to):
+# it lets the engine reject most positions on one character instead of trying every
+# alternative there, which nearly halves a scan that finds nothing.
 AMENDATORY_RE = re.compile(
+    r"(?=[abirt])(?:"
     r"\b" + _AMEND_VERB + r"\b|\bby striking\b|\bby inserting\b|\bby adding\b|"
-    r"\bredesignat(?:e|ing|ed)\b|\bto read as follows\b",
+    r"\bredesignat(?:e|ing|ed)\b|\bto read as follows\b"
+    r")",
     re.IGNORECASE,
 )
 # Three accepted citation forms for `amends`, resolving to a U.S. Code or Public
@@ -240,6 +256,33 @@ def _is_provenance_cite(text: str, start: int) -> bool:
     return bool(PROVENANCE_RE.search(window))
 
 
+# Every `amends` citation form, with its verb hug, scanned in ONE pass. Each
+# alternative is a zero-width lookahead, so the scan reports every position where
+# any form matches and a match of one form never hides a match of another; which
+# form fired is read off its named group. The patterns above remain the
+# definitions -- this is built from them, not a copy -- and Unit.amends replays
+# each form's own finditer semantics (non-overlapping per form) from the positions.
+# At any one position at most one form can match: they open on "section", a digit,
+# or P(ublic law), and the two digit-led forms part at "U.S.C." vs "Stat." -- so
+# alternation order loses nothing. The leading class is that same first-character
+# set; without it the engine tries all four lookaheads at every position and the
+# fused scan is slower than the four it replaces.
+_SCAN_FORMS = (
+    ("longhand", AMENDS_RE),
+    ("shorthand", AMENDS_USC_RE),
+    ("public_law", AMENDS_PL_RE),
+    ("stat", AMENDS_STAT_RE),
+)
+_AMENDMENT_SCAN_RE = re.compile(
+    "(?=[0-9PpSs])(?:"
+    + "|".join(f"(?=(?P<{name}>{pattern.pattern}))" for name, pattern in _SCAN_FORMS)
+    + ")",
+    re.IGNORECASE,
+)
+# Index of each form's wrapping group; its own groups follow it.
+_SCAN_GROUP = {name: _AMENDMENT_SCAN_RE.groupindex[name] for name, _ in _SCAN_FORMS}
+
+
 @dataclass
 class Segment:
     context: str
@@ -273,63 +316,81 @@ class Unit:
 
     @property
     def is_amendatory(self) -> bool:
-        # Verb-only (V18). The prior quote branch -- "any quoted segment => amendatory"
-        # -- fired on non-amendatory quotation: appropriations account headings, short
-        # titles, defined terms, report titles, findings-quotes. A hand-coded sample
-        # (n=35, seed=18) over the 18-bill corpus was 35/35 non-amendatory, and the
-        # prediction that the branch caught ungated imperative amendments was falsified
-        # (0/35; ~1% by targeted probe). A structural marker is not evidence of
-        # amendment -- gate on the verb (A5's principle, applied to quotation).
-        return any(AMENDATORY_RE.search(segment.text) for segment in self.segments if segment.context == "operative")
+        return segments_are_amendatory(self.segments)
 
     @property
     def amends(self) -> list[dict[str, str]]:
-        # Scan operative text only: a cite inside a quoted segment is part of the
-        # language being *inserted*, not the target being amended (spec §6 --
-        # exclude quoted material structurally, not by proximity). Returns objects
-        # {kind, cite}: kind is "usc" or "public_law", never a named Act. Sorted by
-        # (kind, cite), de-duplicated on the pair.
-        #
-        # A5 structural post-condition: `amends != [] ⟹ is_amendatory == true`.
-        # Enforced here by construction so no citation form -- present or future --
-        # can populate amends on a unit that amends nothing. (One direction only;
-        # the converse is intentionally NOT guaranteed -- named Acts and the IRC
-        # leave amendatory units empty by design.) All amends forms share the same
-        # verb hug as is_amendatory's superset detector, so this guard never drops a
-        # legitimately-matched cite; it only forecloses drift.
-        if not self.is_amendatory:
-            return []
-        found: set[tuple[str, str]] = set()
-        operative_text = "\n\n".join(
-            segment.text for segment in self.segments if segment.context == "operative"
-        )
-        # Skip any cite reached via an "as ... amended/added by" clause: it is an
-        # intervening amender in a citation chain, not the target (repro S:1106).
-        for match in AMENDS_RE.finditer(operative_text):
-            if _is_provenance_cite(operative_text, match.start()):
-                continue
-            found.add(("usc", f"{match.group(2)} U.S.C. {match.group(1)}"))
-        for match in AMENDS_USC_RE.finditer(operative_text):
-            if _is_provenance_cite(operative_text, match.start()):
-                continue
-            found.add(("usc", f"{match.group(1)} U.S.C. {_normalize_section_dash(match.group(2))}"))
+        return segment_amends(self.segments)
+
+
+def segments_are_amendatory(segments: list[Segment]) -> bool:
+    """Unit.is_amendatory over a unit's segments."""
+    # Verb-only (V18). The prior quote branch -- "any quoted segment => amendatory"
+    # -- fired on non-amendatory quotation: appropriations account headings, short
+    # titles, defined terms, report titles, findings-quotes. A hand-coded sample
+    # (n=35, seed=18) over the 18-bill corpus was 35/35 non-amendatory, and the
+    # prediction that the branch caught ungated imperative amendments was falsified
+    # (0/35; ~1% by targeted probe). A structural marker is not evidence of
+    # amendment -- gate on the verb (A5's principle, applied to quotation).
+    return any(AMENDATORY_RE.search(segment.text) for segment in segments if segment.context == "operative")
+
+
+def segment_amends(segments: list[Segment]) -> list[dict[str, str]]:
+    """Unit.amends over a unit's segments."""
+    # Scan operative text only: a cite inside a quoted segment is part of the
+    # language being *inserted*, not the target being amended (spec §6 --
+    # exclude quoted material structurally, not by proximity). Returns objects
+    # {kind, cite}: kind is "usc" or "public_law", never a named Act. Sorted by
+    # (kind, cite), de-duplicated on the pair.
+    #
+    # A5 structural post-condition: `amends != [] ⟹ is_amendatory == true`.
+    # Enforced here by construction so no citation form -- present or future --
+    # can populate amends on a unit that amends nothing. (One direction only;
+    # the converse is intentionally NOT guaranteed -- named Acts and the IRC
+    # leave amendatory units empty by design.) All amends forms share the same
+    # verb hug as is_amendatory's superset detector, so this guard never drops a
+    # legitimately-matched cite; it only forecloses drift.
+    if not segments_are_amendatory(segments):
+        return []
+    operative_text = "\n\n".join(
+        segment.text for segment in segments if segment.context == "operative"
+    )
+    # One fused pass finds every citation form (see _AMENDMENT_SCAN_RE); the
+    # results are those of running each form's finditer in turn.
+    found: set[tuple[str, str]] = set()
+    # Per-form non-overlap, as each form's own finditer would have it.
+    last_end = dict.fromkeys(_SCAN_GROUP, 0)
+    pl_spans: list[tuple[int, int]] = []
+    for match in _AMENDMENT_SCAN_RE.finditer(operative_text):
+        name = match.lastgroup
+        base = _SCAN_GROUP[name]
+        start, end = match.span(base)
+        if start < last_end[name]:
+            continue
+        last_end[name] = end
         # Public Law targets, preferring the P.L. form. The P.L. pattern absorbs a
         # same-instance Statutes-at-Large cite; a standalone Stat cite is emitted
-        # only where no P.L. match covers its span (so one enactment cited two ways
-        # -- "P.L. 119-38; 139 Stat. 656" -- yields a single target).
-        pl_spans: list[tuple[int, int]] = []
-        for match in AMENDS_PL_RE.finditer(operative_text):
-            if _is_provenance_cite(operative_text, match.start()):
-                continue
-            found.add(("public_law", f"P.L. {match.group(1)}-{match.group(2)}"))
-            pl_spans.append((match.start(), match.end()))
-        for match in AMENDS_STAT_RE.finditer(operative_text):
-            if any(start <= match.start() < end for start, end in pl_spans):
-                continue
-            if _is_provenance_cite(operative_text, match.start()):
-                continue
-            found.add(("public_law", f"{match.group(1)} Stat. {match.group(2)}"))
-        return [{"kind": kind, "cite": cite} for kind, cite in sorted(found)]
+        # only where no P.L. match covers its span (so one enactment cited two
+        # ways -- "P.L. 119-38; 139 Stat. 656" -- yields a single target). A P.L.
+        # match always starts before any Stat cite inside it, so its span is
+        # recorded by the time that Stat cite comes up.
+        if name == "stat" and any(s <= start < e for s, e in pl_spans):
+            continue
+        # Skip any cite reached via an "as ... amended/added by" clause: it is an
+        # intervening amender in a citation chain, not the target (repro S:1106).
+        if _is_provenance_cite(operative_text, start):
+            continue
+        first, second = match.group(base + 1), match.group(base + 2)
+        if name == "longhand":
+            found.add(("usc", f"{second} U.S.C. {first}"))
+        elif name == "shorthand":
+            found.add(("usc", f"{first} U.S.C. {_normalize_section_dash(second)}"))
+        elif name == "public_law":
+            found.add(("public_law", f"P.L. {first}-{second}"))
+            pl_spans.append((start, end))
+        else:
+            found.add(("public_law", f"{first} Stat. {second}"))
+    return [{"kind": kind, "cite": cite} for kind, cite in sorted(found)]
 
 
 @dataclass
@@ -337,7 +398,9 @@ class ParsedBill:
     package_id: str
     version: str
     last_modified: str | None
-    units: list[Unit]
+    # A list for a fresh or stored parse; a resident bill's view serves ColumnarUnits,
+    # which builds each Unit on first read.
+    units: Sequence[Unit]
     sections_indexed: int
     quotes_seen: set[str]
     # Sections dropped because a committee struck them (F4). Drives the caller-facing
@@ -436,7 +499,7 @@ def parse_bill_xml(xml_bytes: bytes, package_id: str, version: str, last_modifie
             {"package_id": package_id},
             "This is not expected for GovInfo Bill DTD XML; report it if it recurs.",
         )
-    root = ET.fromstring(xml_bytes)
+    root = parse_xml_tree(xml_bytes)
     chunker = _Chunker(package_id, version, last_modified)
     chunker.walk(root, [])
     return ParsedBill(
@@ -451,6 +514,34 @@ def parse_bill_xml(xml_bytes: bytes, package_id: str, version: str, last_modifie
     )
 
 
+def xml_backend() -> str:
+    """The tree builder parse_bill_xml uses: "lxml" when installed, else "stdlib"."""
+    if lxml_etree is None or os.getenv(XML_BACKEND_ENV, "").strip().lower() == "stdlib":
+        return "stdlib"
+    return "lxml"
+
+
+def parse_xml_tree(xml_bytes: bytes, backend: str | None = None) -> ET.Element:
+    """Parse bill XML into an ElementTree-API tree with the given (or default) backend.
+
+    Everything downstream reads only the API the two share -- tag, text, tail, get
+    and child iteration -- so either tree yields the same ParsedBill. lxml is told to
+    drop comments and processing instructions, which xml.etree never materialises,
+    and never to resolve entities or touch the network; the <!ENTITY guard in
+    parse_bill_xml runs before either backend.
+    """
+    if (backend or xml_backend()) == "lxml":
+        parser = lxml_etree.XMLParser(
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        return lxml_etree.fromstring(xml_bytes, parser)
+    return ET.fromstring(xml_bytes)
+
+
 class _Chunker:
     def __init__(self, package_id: str, version: str, last_modified: str | None):
         self.package_id = package_id
@@ -1078,6 +1169,12 @@ def element_text(elem: ET.Element, exclude: set[str] | None = None) -> str:
     return normalize_text(text)
 
 
+# Compiled once: these run on every text node of every bill, and re.sub(pattern)
+# pays a pattern-cache lookup per call on top of the substitution itself.
+_SPACE_AFTER_OPEN_RE = re.compile(r"([(\[])[ \t]+")
+_SPACE_BEFORE_CLOSE_RE = re.compile(r"[ \t]+([.,;:)\]])")
+
+
 def collapse_ws(text: str) -> str:
     """THE whitespace collapse (§6 no-drift, F26). Every path that flattens
     whitespace -- stored segment text (normalize_text), FTS query normalization
@@ -1094,8 +1191,8 @@ def _tighten_punct(text: str) -> str:
     # element_text / inline-join space-joining orphaned around brackets and
     # terminators: `( Public Law 118-31 ; )` -> `(Public Law 118-31;)`, `counselor
     # .` -> `counselor.`. Idempotent. Spec §6: punctuation belongs against its word.
-    text = re.sub(r"([(\[])[ \t]+", r"\1", text)
-    return re.sub(r"[ \t]+([.,;:)\]])", r"\1", text)
+    text = _SPACE_AFTER_OPEN_RE.sub(r"\1", text)
+    return _SPACE_BEFORE_CLOSE_RE.sub(r"\1", text)
 
 
 def normalize_text(text: str) -> str:
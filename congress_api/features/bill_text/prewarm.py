@@ -0,0 +1,215 @@
+"""Prewarm the bill-text cache from a watchlist of bills.
+
+A watchlist is a text file with one bill per line -- ``<congress> <bill_type>
+<number> [version]``, e.g. ``118 hr 4366`` -- and ``#`` comments. Prewarming a bill
+does exactly what a tool call does on a cold cache: it resolves the bill's text
+versions, fetches the package from GovInfo and parses it into the persistent store,
+so the next interactive call for that bill is an ``index_hit``. The version list is
+always re-asked of congress.gov, which is how a new text version of a watched bill is
+noticed and fetched before anyone asks for it.
+
+Two ways in:
+
+* ``congressmcp cache prewarm WATCHLIST`` runs one pass and reports each bill;
+* with ``CONGRESSMCP_WATCHLIST`` set, the server runs a pass at startup and then every
+  ``CONGRESSMCP_PREWARM_INTERVAL`` seconds, only within ``CONGRESSMCP_PREWARM_HOURS``
+  (local hours, e.g. ``1-5``) when that is set. Parsing runs on the event loop, so a
+  pass over large bills competes with interactive calls; the window keeps it off-peak.
+
+Both run at most ``CONGRESSMCP_PREWARM_CONCURRENCY`` bills at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import re
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from .client import BillTextError
+from .service import load_bill_text
+
+logger = logging.getLogger(__name__)
+
+WATCHLIST_ENV = "CONGRESSMCP_WATCHLIST"
+PREWARM_INTERVAL_ENV = "CONGRESSMCP_PREWARM_INTERVAL"
+DEFAULT_PREWARM_INTERVAL = 21_600
+PREWARM_CONCURRENCY_ENV = "CONGRESSMCP_PREWARM_CONCURRENCY"
+DEFAULT_PREWARM_CONCURRENCY = 4
+PREWARM_HOURS_ENV = "CONGRESSMCP_PREWARM_HOURS"
+
+# How often the background job wakes to check whether a pass is due.
+_POLL_SECONDS = 300
+
+BILL_TYPES = {"hr", "s", "hjres", "sjres", "hconres", "sconres", "hres", "sres"}
+_HOURS_RE = re.compile(r"^\s*(\d{1,2})\s*-\s*(\d{1,2})\s*$")
+
+
+@dataclass(frozen=True)
+class WatchedBill:
+    congress: int
+    bill_type: str
+    number: int
+    version: str | None = None
+
+    @property
+    def label(self) -> str:
+        label = f"{self.congress} {self.bill_type} {self.number}"
+        return f"{label} {self.version}" if self.version else label
+
+
+@dataclass
+class PrewarmResult:
+    bill: WatchedBill
+    package_id: str | None = None
+    # "cached": already in the store; "fetched": downloaded and parsed by this pass.
+    state: str | None = None
+    version_resolution: str | None = None
+    error: str | None = None
+    elapsed_ms: float = 0.0
+
+
+def parse_watchlist(text: str) -> list[WatchedBill]:
+    """Bills from watchlist text, in file order with duplicates dropped.
+
+    A malformed line raises ValueError naming the line, rather than being skipped:
+    a watchlist that silently loses a bill keeps it cold without anyone noticing.
+    """
+    bills: list[WatchedBill] = []
+    for lineno, raw in enumerate(text.splitlines(), start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = line.split()
+        if len(fields) not in (3, 4) or not fields[0].isdigit() or not fields[2].isdigit():
+            raise ValueError(f"watchlist line {lineno}: expected '<congress> <bill_type> <number> [version]', got {raw.strip()!r}")
+        bill_type = fields[1].lower().replace(".", "")
+        if bill_type not in BILL_TYPES:
+            raise ValueError(f"watchlist line {lineno}: unknown bill type {fields[1]!r}")
+        bill = WatchedBill(
+            int(fields[0]), bill_type, int(fields[2]), fields[3].lower() if len(fields) == 4 else None
+        )
+        if bill not in bills:
+            bills.append(bill)
+    return bills
+
+
+def read_watchlist(path: str | Path) -> list[WatchedBill]:
+    return parse_watchlist(Path(path).read_text(encoding="utf-8"))
+
+
+def prewarm_interval_seconds() -> int:
+    try:
+        return int(os.getenv(PREWARM_INTERVAL_ENV, str(DEFAULT_PREWARM_INTERVAL)))
+    except ValueError:
+        return DEFAULT_PREWARM_INTERVAL
+
+
+def prewarm_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv(PREWARM_CONCURRENCY_ENV, str(DEFAULT_PREWARM_CONCURRENCY))))
+    except ValueError:
+        return DEFAULT_PREWARM_CONCURRENCY
+
+
+def in_prewarm_window(hour: int, spec: str | None) -> bool:
+    """Whether a pass may start at local ``hour`` under a ``start-end`` hours spec.
+
+    The end hour is exclusive and the window may wrap midnight (``22-4``). An unset,
+    empty or malformed spec allows every hour; a malformed one is logged.
+    """
+    if not spec or not spec.strip():
+        return True
+    match = _HOURS_RE.match(spec)
+    if match is None or not all(0 <= int(part) <= 24 for part in match.groups()):
+        logger.warning(f"Ignoring {PREWARM_HOURS_ENV}={spec!r}; expected 'start-end' in hours, e.g. '1-5'")
+        return True
+    start, end = (int(part) % 24 for part in match.groups())
+    if start == end:
+        return True
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+async def prewarm_bill(bill: WatchedBill) -> PrewarmResult:
+    started = time.perf_counter()
+    result = PrewarmResult(bill)
+    try:
+        loaded = await load_bill_text(
+            None, bill.congress, bill.bill_type, bill.number, bill.version, refresh_versions=True
+        )
+    except BillTextError as exc:
+        result.error = f"{exc.code}: {exc.message}"
+    except (httpx.HTTPError, OSError) as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    except Exception as exc:
+        # One bill's parser bug must not end the pass for the rest of the watchlist.
+        logger.exception("Unexpected error prewarming %s", bill.label)
+        result.error = f"internal_error: {type(exc).__name__}: {exc}"
+    else:
+        result.package_id = loaded.resolved.package_id
+        result.state = "cached" if loaded.index_hit else "fetched"
+        result.version_resolution = loaded.resolved.version_resolution
+    result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+async def prewarm_bills(bills: Iterable[WatchedBill], concurrency: int | None = None) -> list[PrewarmResult]:
+    """Prewarm every bill, at most ``concurrency`` at a time; results in input order."""
+    limit = asyncio.Semaphore(concurrency or prewarm_concurrency())
+
+    async def one(bill: WatchedBill) -> PrewarmResult:
+        async with limit:
+            return await prewarm_bill(bill)
+
+    return list(await asyncio.gather(*(one(bill) for bill in bills)))
+
+
+async def _watchlist_loop(path: str) -> None:
+    last_pass = None
+    while True:
+        interval = prewarm_interval_seconds()
+        due = last_pass is None or time.monotonic() - last_pass >= interval
+        if due and in_prewarm_window(datetime.now().hour, os.getenv(PREWARM_HOURS_ENV)):
+            try:
+                bills = read_watchlist(path)
+            except (OSError, ValueError) as exc:
+                logger.error(f"Prewarm skipped: could not read watchlist {path}: {exc}")
+            else:
+                results = await prewarm_bills(bills)
+                fetched = sum(result.state == "fetched" for result in results)
+                failed = [result.bill.label for result in results if result.error]
+                logger.info(
+                    f"Prewarmed {len(results)} watched bill(s): {fetched} fetched, "
+                    f"{len(results) - fetched - len(failed)} already cached, {len(failed)} failed"
+                )
+                if failed:
+                    logger.warning(f"Prewarm failed for: {', '.join(failed)}")
+            last_pass = time.monotonic()
+        await asyncio.sleep(min(_POLL_SECONDS, max(interval, 1)))
+
+
+@contextlib.asynccontextmanager
+async def watchlist_job() -> AsyncIterator[asyncio.Task | None]:
+    """Run the background prewarm job for the server's lifetime when a watchlist is set."""
+    path = os.getenv(WATCHLIST_ENV, "").strip()
+    if not path:
+        yield None
+        return
+    logger.info(f"Prewarming bill text from watchlist {path}")
+    task = asyncio.create_task(_watchlist_loop(path))
+    try:
+        yield task
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
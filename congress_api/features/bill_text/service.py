@@ -1,16 +1,38 @@
-"""Bill text retrieval service that reparses and indexes in memory per call."""
+"""Bill text retrieval service: packages are parsed once, cached, and indexed per call."""
 
 from __future__ import annotations
 
+import functools
+import logging
+import sqlite3
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
+import httpx
 from mcp.server.mcpserver import Context
 
 from . import trace
-from .client import ResolvedBillText, resolve_and_fetch_bill_text
+from . import client
+from .client import (
+    BillTextError,
+    ResolvedBillText,
+    TextVersion,
+    VersionResolution,
+    order_versions,
+    resolve_and_fetch_bill_text,
+)
+from .columnar import keep_resident, resident_bill
+from .content import BillContent, cached_content, remember_content
+from .diff import unit_digest
+from .hierarchy import BillHierarchy
 from .index import BillTextIndex
 from .parser import ParsedBill, parse_bill_xml
+from .store import BillTextStore, get_bill_text_store
+from .toc import BillToc
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -19,16 +41,51 @@ class LoadedBillText:
     parsed: ParsedBill
     index: BillTextIndex
     timing: dict[str, float] = field(default_factory=dict)
+    # True when the parsed package came from the persistent bill-text cache.
+    index_hit: bool = False
+
+    # Derived structures are built on first use and then kept for as long as the
+    # loaded bill is: every section lookup and container expansion reads the
+    # hierarchy, and every get_bill_toc call is a view of the one TOC tree.
+    @functools.cached_property
+    def hierarchy(self) -> BillHierarchy:
+        return BillHierarchy(self.parsed.units)
+
+    @functools.cached_property
+    def toc(self) -> BillToc:
+        # A package's TOC never changes, so it is kept with the resident parse and
+        # outlives this call; a bill too large to keep resident builds its own.
+        resident = resident_bill(self.parsed.package_id)
+        if resident is not None and resident.toc is not None:
+            return resident.toc
+        toc = BillToc(self.hierarchy, self.parsed.subtree_bytes)
+        return resident.keep_toc(toc) if resident is not None else toc
+
+    @functools.cached_property
+    def unit_hashes(self) -> dict[str, str]:
+        """section_id -> digest of the unit's segments, for comparing versions in O(1)."""
+        return {unit.section_id: unit_digest(unit) for unit in self.parsed.units}
 
 
-async def load_bill_text(ctx: Context, congress: int, bill_type: str, number: int, version: str | None) -> LoadedBillText:
+async def load_bill_text(
+    ctx: Context | None,
+    congress: int,
+    bill_type: str,
+    number: int,
+    version: str | None,
+    *,
+    refresh_versions: bool = False,
+) -> LoadedBillText:
+    # refresh_versions asks congress.gov for the version list even while a stored one
+    # is still fresh; the prewarm job uses it to pick up new versions on its schedule.
     t0 = time.perf_counter()
-    resolved = await resolve_and_fetch_bill_text(ctx, congress, bill_type, number, version)
-    # Stamp which exact bytes produced this response for replay (debug tracing only;
-    # the sha256 is computed solely when CONGRESSMCP_TRACE_DIR is set).
-    trace.set_source(resolved.package_id, resolved.version, resolved.xml_bytes)
+    resolved, parsed = await _resolve_package(
+        ctx, congress, bill_type, number, version, refresh_versions=refresh_versions
+    )
     t1 = time.perf_counter()
-    parsed = parse_bill_xml(resolved.xml_bytes, resolved.package_id, resolved.version, resolved.last_modified)
+    index_hit = parsed is not None
+    if parsed is None:
+        parsed = _parse_and_store(resolved)
     t2 = time.perf_counter()
     index = BillTextIndex(parsed)
     t3 = time.perf_counter()
@@ -37,4 +94,154 @@ async def load_bill_text(ctx: Context, congress: int, bill_type: str, number: in
         "parse_ms": round((t2 - t1) * 1000, 1),
         "index_ms": round((t3 - t2) * 1000, 1),
     }
-    return LoadedBillText(resolved=resolved, parsed=parsed, index=index, timing=timing)
+    return LoadedBillText(resolved=resolved, parsed=parsed, index=index, timing=timing, index_hit=index_hit)
+
+
+async def load_bill_content(
+    ctx: Context | None, congress: int, bill_type: str, number: int, version: str | None
+) -> tuple[ResolvedBillText, BillContent]:
+    """Resolve a bill version and return its rendered text for chunked reads.
+
+    Versions are resolved exactly as load_bill_text resolves them, but the text
+    comes from memory or from the package's mapped page file when either has it,
+    so a stored bill is neither rebuilt from the store's rows nor indexed: paging
+    through it costs one version resolution per chunk.
+    """
+    store = get_bill_text_store()
+    held: dict[str, BillContent] = {}
+
+    def claim(package_id: str) -> bool:
+        content = cached_content(package_id)
+        if content is None:
+            pages = store.pages(package_id)
+            if pages is not None:
+                content = remember_content(BillContent.from_pages(pages))
+        if content is not None:
+            store.touch(package_id)
+            held[package_id] = content
+        return content is not None
+
+    resolved, parsed = await _resolve_package(ctx, congress, bill_type, number, version, claim=claim)
+    content = held.get(resolved.package_id)
+    if content is None:
+        if parsed is None:
+            parsed = _parse_and_store(resolved)
+        else:
+            # Stored without a current page file (written before page files existed,
+            # or by an older renderer): this read rendered the whole bill anyway.
+            store.save_pages(parsed)
+        content = remember_content(BillContent.from_parsed(parsed))
+    return resolved, content
+
+
+async def _resolve_package(
+    ctx: Context | None,
+    congress: int,
+    bill_type: str,
+    number: int,
+    version: str | None,
+    *,
+    refresh_versions: bool = False,
+    claim: Callable[[str], bool] | None = None,
+) -> tuple[ResolvedBillText, ParsedBill | None]:
+    """Resolve the version and fetch its package; the stored parse when there is one.
+
+    The parse is None when the package was fetched from GovInfo (its bytes are on
+    the result) or when ``claim`` answered for it, in which case nothing was read.
+    """
+    store = get_bill_text_store()
+    cached: dict[str, ParsedBill] = {}
+
+    async def fetch(package_id: str) -> tuple[str | None, bytes]:
+        if claim is not None and claim(package_id):
+            return None, b""
+        # A package id names one immutable text version, so a resident or stored
+        # parse is served as-is; only a miss goes to GovInfo.
+        resident = resident_bill(package_id)
+        if resident is not None:
+            store.touch(package_id)
+            # A view: the per-call index and hierarchy read the columns, and a Unit is
+            # built only when the call reads it (see bill_text.columnar).
+            cached[package_id] = resident.view()
+            return resident.last_modified, b""
+        parsed = store.load(package_id)
+        if parsed is not None:
+            keep_resident(parsed)
+            cached[package_id] = parsed
+            return parsed.last_modified, b""
+        return await client.fetch_govinfo_package(package_id)
+
+    async def resolve(refresh: bool) -> VersionResolution:
+        # A version list is reused for a TTL set by how far the bill has advanced
+        # (client.version_list_ttl); the envelope reports it as "cached".
+        if not (refresh or refresh_versions):
+            stored = store.stored_resolution(congress, bill_type, number)
+            if stored is not None and stored.expires_at > time.time():
+                return VersionResolution(stored.versions, stored.resolved_at, "cached")
+        try:
+            resolution = await client.resolve_versions(ctx, congress, bill_type, number)
+        except (BillTextError, httpx.HTTPError) as exc:
+            # An outage, and only an outage, falls back to what is cached; "no such
+            # bill" or a rejected key is an answer the cache must not hide.
+            if not client.is_upstream_outage(exc):
+                raise
+            offline = _offline_resolution(store, congress, bill_type, number)
+            if offline is None:
+                raise
+            logger.warning(f"Version resolution for {bill_type}{number} failed ({exc}); serving cached text")
+            return offline
+        ttl = client.version_list_ttl(resolution.versions)
+        if ttl > 0:
+            try:
+                store.save_resolution(congress, bill_type, number, resolution.versions, resolution.resolved_at, ttl)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"Could not cache the version list for {bill_type}{number}: {exc}")
+        return resolution
+
+    resolved = await resolve_and_fetch_bill_text(
+        ctx, congress, bill_type, number, version, fetch=fetch, resolve=resolve
+    )
+    return resolved, cached.get(resolved.package_id)
+
+
+def _parse_and_store(resolved: ResolvedBillText) -> ParsedBill:
+    # Stamp which exact bytes produced this response for replay (debug tracing only;
+    # the sha256 is computed solely when CONGRESSMCP_TRACE_DIR is set).
+    trace.set_source(resolved.package_id, resolved.version, resolved.xml_bytes)
+    parsed = parse_bill_xml(resolved.xml_bytes, resolved.package_id, resolved.version, resolved.last_modified)
+    try:
+        get_bill_text_store().save(parsed)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(f"Could not cache bill-text package {resolved.package_id}: {exc}")
+    keep_resident(parsed)
+    return parsed
+
+
+def _offline_resolution(store: BillTextStore, congress: int, bill_type: str, number: int) -> VersionResolution | None:
+    """The version list to serve while congress.gov and GovInfo are unreachable.
+
+    Only versions whose packages are stored can be served, so the last stored list
+    is narrowed to those (or, with no stored list, rebuilt from the stored packages).
+    None when nothing of the bill is cached, and the outage error stands.
+    """
+    stored_codes = store.stored_versions(congress, bill_type, number)
+    if not stored_codes:
+        return None
+    stored = store.stored_resolution(congress, bill_type, number)
+    if stored is not None and any(item.code in stored_codes for item in stored.versions):
+        listed, resolved_at = stored.versions, stored.resolved_at
+    else:
+        listed = [TextVersion(code=code, date="", type_label=code) for code in stored_codes]
+        resolved_at = (
+            datetime.fromtimestamp(max(stored_codes.values()), timezone.utc)
+            .replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        )
+    versions = [item for item in listed if item.code in stored_codes]
+    note = (
+        f"Congress.gov and GovInfo were unreachable; served from the local cache using the "
+        f"version list as of {resolved_at}, so a newer version may exist."
+    )
+    missing = [item.code for item in order_versions(listed) if item.code not in stored_codes]
+    if missing:
+        note += f" Listed version(s) {missing} are not cached and could not be considered."
+    return VersionResolution(versions, resolved_at, "cached_offline", note)
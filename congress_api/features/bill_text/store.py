@@ -0,0 +1,648 @@
+"""Persistent bill-text cache and the cross-bill corpus index built from it.
+
+Every GovInfo package that is parsed is stored so a later call reads the parsed
+units back instead of downloading and re-parsing the XML. A package id names one
+text version (``BILLS-119hr1234ih``); a new stage is a new package, so a stored
+package is never stale and is reused until evicted under
+``CONGRESSMCP_CACHE_MAX_BYTES``, least recently read first.
+
+Storage is content-addressed. Successive versions of a bill (``ih``, ``rh``,
+``eh``, ``enr``) are mostly the same text, so segment text is kept once per
+distinct string and each package stores only hashes. The corpus FTS index is
+keyed the same way: one document per distinct (header, text) unit, shared by
+every package containing it. A new version of a cached bill therefore stores and
+tokenises only what it changed.
+
+The corpus is searchable across bills, and it has a reverse index from each
+normalised ``amends`` citation to the sections that cite it. That answers
+questions like "which bills mention 'polar security cutter'" or "which bills amend
+10 U.S.C. 2302" without loading any bill.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from ...core.local_cache import cache_enabled, cache_max_bytes, index_db_path, open_index_db
+from .citations import parse_citation, require_citation
+from .client import TextVersion
+from .index import FTS_TOKENIZER, _window, ancestor_from_json, fts_literal
+from .pages import PAGES_SUFFIX, BillPages, open_pages, remove_pages, write_pages
+from .parser import ParsedBill, Segment, Unit, compute_subtree_bytes
+
+logger = logging.getLogger(__name__)
+
+STORE_NAME = "bill_text_store"
+STORE_SCHEMA_VERSION = 1
+# Open page mappings kept per store; reopening one costs a file open and a table parse.
+_OPEN_PAGES = 8
+
+_PACKAGE_ID_RE = re.compile(r"^BILLS-(\d+)([a-z]+?)(\d+)([a-z][a-z0-9]*)$", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    package_id TEXT PRIMARY KEY,
+    congress INTEGER,
+    bill_type TEXT,
+    number INTEGER,
+    version TEXT NOT NULL,
+    last_modified TEXT,
+    sections_indexed INTEGER NOT NULL,
+    struck_sections_excluded INTEGER NOT NULL,
+    quotes_seen TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_read REAL NOT NULL
+);
+-- Segment text, once per distinct string.
+CREATE TABLE IF NOT EXISTS texts (
+    hash BLOB PRIMARY KEY,
+    text TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS units (
+    package_id TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    section_id TEXT NOT NULL,
+    ancestor_path TEXT NOT NULL,
+    header TEXT,
+    child_ids TEXT NOT NULL,
+    is_amendatory INTEGER NOT NULL,
+    doc BLOB NOT NULL,
+    PRIMARY KEY (package_id, ordinal)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS units_doc ON units(doc);
+CREATE TABLE IF NOT EXISTS segments (
+    package_id TEXT NOT NULL,
+    unit_ordinal INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    context TEXT NOT NULL,
+    inline INTEGER NOT NULL,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (package_id, unit_ordinal, ordinal)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS segments_hash ON segments(hash);
+-- One FTS document per distinct (header, display text) unit.
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    hash BLOB NOT NULL UNIQUE,
+    header TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    header, text,
+    content='docs', content_rowid='rowid',
+    tokenize='""" + FTS_TOKENIZER + """'
+);
+CREATE TRIGGER IF NOT EXISTS docs_ai AFTER INSERT ON docs BEGIN
+    INSERT INTO docs_fts(rowid, header, text) VALUES (new.rowid, new.header, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_ad AFTER DELETE ON docs BEGIN
+    INSERT INTO docs_fts(docs_fts, rowid, header, text) VALUES ('delete', old.rowid, old.header, old.text);
+END;
+CREATE TABLE IF NOT EXISTS amends (
+    cite_key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    cite TEXT NOT NULL,
+    package_id TEXT NOT NULL,
+    unit_ordinal INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS amends_cite ON amends(cite_key);
+CREATE INDEX IF NOT EXISTS amends_unit ON amends(package_id, unit_ordinal);
+-- Last text-version list enumerated per bill, reused until expires_at.
+CREATE TABLE IF NOT EXISTS resolutions (
+    congress INTEGER NOT NULL,
+    bill_type TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    versions TEXT NOT NULL,
+    resolved_at TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (congress, bill_type, number)
+) WITHOUT ROWID;
+"""
+
+# bm25 column weights, in FTS column order: header, text.
+_BM25_WEIGHTS = (2.0, 1.0)
+
+
+def parse_package_id(package_id: str) -> tuple[int, str, int, str] | None:
+    """(congress, bill_type, number, version) from a GovInfo BILLS package id."""
+    match = _PACKAGE_ID_RE.match(package_id)
+    if not match:
+        return None
+    return int(match.group(1)), match.group(2).lower(), int(match.group(3)), match.group(4).lower()
+
+
+def citation_key(cite: str) -> str:
+    """Reverse-index key for a citation; raises ValueError if it is not one."""
+    return require_citation(cite).key
+
+
+def content_hash(*parts: str) -> bytes:
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class StoredResolution:
+    versions: list[TextVersion]
+    resolved_at: str
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class CorpusMatch:
+    package_id: str
+    congress: int | None
+    bill_type: str | None
+    number: int | None
+    version: str
+    section_id: str
+    header: str | None
+    snippet: str
+    score: float
+    is_amendatory: bool
+    amends: list[dict[str, str]]
+    matched_queries: list[str]
+
+
+@dataclass(frozen=True)
+class CitationMatch:
+    package_id: str
+    congress: int | None
+    bill_type: str | None
+    number: int | None
+    version: str
+    section_id: str
+    header: str | None
+    is_amendatory: bool
+    kind: str
+    # The target as this section cites it, which may name a subsection.
+    cite: str
+
+
+def _package_filters(congress: int | None, bill_type: str | None, version: str | None) -> tuple[list[str], list]:
+    clauses, params = [], []
+    if congress is not None:
+        clauses.append("p.congress = ?")
+        params.append(congress)
+    if bill_type:
+        clauses.append("p.bill_type = ?")
+        params.append(bill_type.lower())
+    if version:
+        clauses.append("p.version = ?")
+        params.append(version.lower())
+    return clauses, params
+
+
+class BillTextStore:
+    """Stored packages and the corpus index over them, in one SQLite database."""
+
+    def __init__(self, conn: sqlite3.Connection, location: str):
+        self.conn = conn
+        self.location = location
+        # Rendered text of each stored package, memory-mapped on read (bill_text.pages).
+        # An in-memory store has none; its readers render from the parse instead.
+        self.pages_dir = None if location == ":memory:" else Path(location).with_suffix(PAGES_SUFFIX)
+        self._pages: OrderedDict[str, BillPages] = OrderedDict()
+        # Must precede the first table: lets eviction hand freed pages back to the OS.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    # -- packages ---------------------------------------------------------------
+
+    def package_ids(self) -> set[str]:
+        return {row[0] for row in self.conn.execute("SELECT package_id FROM packages")}
+
+    def package_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM packages").fetchone()[0]
+
+    def stored_bytes(self) -> int:
+        """Bytes of database pages in use (freed pages excluded).
+
+        The page files are not counted: they are renderings derived from the stored
+        packages and removed with them (see bill_text.pages).
+        """
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * page_size
+
+    def load(self, package_id: str) -> ParsedBill | None:
+        meta = self.conn.execute(
+            """
+            SELECT version, last_modified, sections_indexed, struck_sections_excluded, quotes_seen
+            FROM packages WHERE package_id = ?
+            """,
+            (package_id,),
+        ).fetchone()
+        if meta is None:
+            return None
+        segments: dict[int, list[Segment]] = {}
+        for unit_ordinal, context, inline, text in self.conn.execute(
+            """
+            SELECT s.unit_ordinal, s.context, s.inline, t.text
+            FROM segments s JOIN texts t ON t.hash = s.hash
+            WHERE s.package_id = ?
+            ORDER BY s.unit_ordinal, s.ordinal
+            """,
+            (package_id,),
+        ):
+            segments.setdefault(unit_ordinal, []).append(Segment(context, text, bool(inline)))
+        nodes: dict[str, list] = {}
+        units = []
+        for ordinal, section_id, ancestor_path, header, child_ids in self.conn.execute(
+            """
+            SELECT ordinal, section_id, ancestor_path, header, child_ids
+            FROM units WHERE package_id = ? ORDER BY ordinal
+            """,
+            (package_id,),
+        ):
+            if ancestor_path not in nodes:
+                nodes[ancestor_path] = ancestor_from_json(ancestor_path)
+            units.append(
+                Unit(
+                    section_id=section_id,
+                    ancestor_path=list(nodes[ancestor_path]),
+                    header=header,
+                    segments=segments.get(ordinal, []),
+                    child_ids=json.loads(child_ids),
+                )
+            )
+        self.touch(package_id)
+        version, last_modified, sections_indexed, struck, quotes_seen = meta
+        return ParsedBill(
+            package_id=package_id,
+            version=version,
+            last_modified=last_modified,
+            units=units,
+            sections_indexed=sections_indexed,
+            quotes_seen=set(json.loads(quotes_seen)),
+            struck_sections_excluded=struck,
+            subtree_bytes=compute_subtree_bytes(units),
+        )
+
+    def pages(self, package_id: str) -> BillPages | None:
+        """The package's rendered text, mapped; None when it has no current page file.
+
+        A few mappings are kept open, least recently used closed first; a caller
+        must not hold one across an await.
+        """
+        if self.pages_dir is None:
+            return None
+        held = self._pages.get(package_id)
+        if held is not None:
+            self._pages.move_to_end(package_id)
+            return held
+        held = open_pages(self.pages_dir, package_id)
+        if held is None:
+            return None
+        self._pages[package_id] = held
+        while len(self._pages) > _OPEN_PAGES:
+            self._pages.popitem(last=False)[1].data.close()
+        return held
+
+    def save_pages(self, parsed: ParsedBill) -> None:
+        """Write the package's page file; readers render from the parse if it fails."""
+        if self.pages_dir is None:
+            return
+        stale = self._pages.pop(parsed.package_id, None)
+        if stale is not None:
+            stale.data.close()
+        try:
+            write_pages(self.pages_dir, parsed)
+        except OSError as exc:
+            logger.warning(f"Could not write bill pages for {parsed.package_id}: {exc}")
+
+    def touch(self, package_id: str) -> None:
+        """Record a read of a package; last_read is the recency eviction goes by."""
+        self.conn.execute("UPDATE packages SET last_read = ? WHERE package_id = ?", (time.time(), package_id))
+        self.conn.commit()
+
+    def save(self, parsed: ParsedBill) -> None:
+        """Store a parsed package, writing only text and documents not already held."""
+        try:
+            self._insert(parsed)
+        except BaseException:
+            # Never leave half a package behind for the next commit to persist.
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self.save_pages(parsed)
+        self.evict(keep=parsed.package_id)
+
+    def _insert(self, parsed: ParsedBill) -> None:
+        package_id = parsed.package_id
+        self._delete(package_id)
+        congress, bill_type, number, version = parse_package_id(package_id) or (None, None, None, parsed.version)
+        now = time.time()
+        self.conn.execute(
+            "INSERT INTO packages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                package_id, congress, bill_type, number, version, parsed.last_modified,
+                parsed.sections_indexed, parsed.struck_sections_excluded,
+                json.dumps(sorted(parsed.quotes_seen)), now, now,
+            ),
+        )
+        path_json: dict[tuple, str] = {}
+        texts: dict[bytes, str] = {}
+        docs: dict[bytes, tuple[str, str]] = {}
+        unit_rows, segment_rows, amends_rows = [], [], []
+        for ordinal, unit in enumerate(parsed.units):
+            key = tuple((node.type, node.enum, node.header) for node in unit.ancestor_path)
+            if key not in path_json:
+                path_json[key] = json.dumps([node.model_dump() for node in unit.ancestor_path])
+            header, text = unit.header or "", unit.display_text
+            doc = content_hash(header, text)
+            docs[doc] = (header, text)
+            unit_rows.append((
+                package_id, ordinal, unit.section_id, path_json[key], unit.header,
+                json.dumps(unit.child_ids), int(unit.is_amendatory), doc,
+            ))
+            for position, segment in enumerate(unit.segments):
+                digest = content_hash(segment.text)
+                texts[digest] = segment.text
+                segment_rows.append((package_id, ordinal, position, segment.context, int(segment.inline), digest))
+            # One row per (target, section): "10 U.S.C. 2302" and "10 U.S.C. 2302(b)"
+            # in the same section are one entry in the reverse index.
+            keys = {}
+            for target in unit.amends:
+                citation = parse_citation(target["cite"])
+                keys.setdefault(citation.key if citation else target["cite"].casefold(), target)
+            amends_rows.extend(
+                (key, target["kind"], target["cite"], package_id, ordinal) for key, target in keys.items()
+            )
+        # INSERT OR IGNORE: text another package already stored is neither written
+        # again nor, for documents, re-tokenised -- the FTS trigger only fires on a
+        # row actually inserted.
+        self.conn.executemany("INSERT OR IGNORE INTO texts(hash, text) VALUES (?, ?)", texts.items())
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO docs(hash, header, text) VALUES (?, ?, ?)",
+            [(digest, header, text) for digest, (header, text) in docs.items()],
+        )
+        self.conn.executemany("INSERT INTO units VALUES (?, ?, ?, ?, ?, ?, ?, ?)", unit_rows)
+        self.conn.executemany("INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?)", segment_rows)
+        self.conn.executemany("INSERT INTO amends VALUES (?, ?, ?, ?, ?)", amends_rows)
+
+    def remove(self, package_ids: list[str]) -> None:
+        for package_id in package_ids:
+            self._delete(package_id)
+        self.conn.commit()
+        self.conn.execute("PRAGMA incremental_vacuum")
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """Drop least-recently-read packages until the store fits its byte cap."""
+        cap = cache_max_bytes()
+        evicted = []
+        while self.stored_bytes() > cap:
+            row = self.conn.execute(
+                "SELECT package_id FROM packages WHERE package_id != ? ORDER BY last_read, package_id LIMIT 1",
+                (keep or "",),
+            ).fetchone()
+            if row is None:
+                break
+            self._delete(row[0])
+            self.conn.commit()
+            evicted.append(row[0])
+        if evicted:
+            self.conn.execute("PRAGMA incremental_vacuum")
+        return evicted
+
+    def _delete(self, package_id: str) -> None:
+        """Remove a package, and the shared text and documents only it referenced."""
+        hashes = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT hash FROM segments WHERE package_id = ?", (package_id,)
+        )]
+        docs = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT doc FROM units WHERE package_id = ?", (package_id,)
+        )]
+        for table in ("amends", "segments", "units", "packages"):
+            self.conn.execute(f"DELETE FROM {table} WHERE package_id = ?", (package_id,))
+        mapped = self._pages.pop(package_id, None)
+        if mapped is not None:
+            mapped.data.close()
+        if self.pages_dir is not None:
+            remove_pages(self.pages_dir, package_id)
+        self.conn.executemany(
+            "DELETE FROM texts WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM segments WHERE hash = texts.hash)",
+            [(digest,) for digest in hashes],
+        )
+        self.conn.executemany(
+            "DELETE FROM docs WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM units WHERE doc = docs.hash)",
+            [(digest,) for digest in docs],
+        )
+
+    # -- version lists ----------------------------------------------------------
+
+    def stored_resolution(self, congress: int, bill_type: str, number: int) -> StoredResolution | None:
+        """The last version list stored for a bill, expired or not."""
+        row = self.conn.execute(
+            "SELECT versions, resolved_at, expires_at FROM resolutions WHERE congress = ? AND bill_type = ? AND number = ?",
+            (congress, bill_type.lower(), number),
+        ).fetchone()
+        if row is None:
+            return None
+        versions = [TextVersion(code=code, date=date, type_label=label) for code, date, label in json.loads(row[0])]
+        return StoredResolution(versions, row[1], row[2])
+
+    def stored_versions(self, congress: int, bill_type: str, number: int) -> dict[str, float]:
+        """Version code -> stored_at for every stored package of a bill."""
+        return dict(self.conn.execute(
+            "SELECT version, stored_at FROM packages WHERE congress = ? AND bill_type = ? AND number = ?",
+            (congress, bill_type.lower(), number),
+        ))
+
+    def save_resolution(
+        self, congress: int, bill_type: str, number: int, versions: list[TextVersion], resolved_at: str, ttl: int
+    ) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                congress, bill_type.lower(), number,
+                json.dumps([[item.code, item.date, item.type_label] for item in versions]),
+                resolved_at, time.time() + ttl,
+            ),
+        )
+        self.conn.commit()
+
+    # -- corpus -----------------------------------------------------------------
+
+    def search(
+        self,
+        queries: list[str],
+        max_hits: int,
+        congress: int | None = None,
+        bill_type: str | None = None,
+        version: str | None = None,
+        amends: str | None = None,
+    ) -> list[CorpusMatch]:
+        """Ranked sections across packages.
+
+        Each query is a phrase literal, exactly as in search_bill_text, and several
+        queries fuse by reciprocal rank. With no queries, every section amending
+        `amends` is returned, newest Congress first.
+        """
+        clauses, params = _package_filters(congress, bill_type, version)
+        if amends:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM amends a WHERE a.cite_key = ? "
+                "AND a.package_id = u.package_id AND a.unit_ordinal = u.ordinal)"
+            )
+            params.append(citation_key(amends))
+        filters = "".join(f" AND {clause}" for clause in clauses)
+
+        if not queries:
+            rows = self.conn.execute(
+                f"""
+                SELECT u.package_id, u.ordinal, u.section_id, u.header, d.text, u.is_amendatory,
+                       p.congress, p.bill_type, p.number, p.version
+                FROM units u
+                JOIN packages p ON p.package_id = u.package_id
+                JOIN docs d ON d.hash = u.doc
+                WHERE 1{filters}
+                ORDER BY p.congress DESC, p.package_id, u.ordinal
+                LIMIT ?
+                """,
+                (*params, max_hits),
+            ).fetchall()
+            return self._hits(
+                [(row[:4] + (_window(row[4], 320),) + row[5:], 0.0, []) for row in rows]
+            )
+
+        limit = min(200, max(50, max_hits * 5))
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        ranks: dict[tuple[str, int], dict[str, int]] = {}
+        best: dict[tuple[str, int], tuple] = {}
+        for query in queries:
+            rows = self.conn.execute(
+                f"""
+                SELECT u.package_id, u.ordinal, u.section_id, u.header,
+                       snippet(docs_fts, 1, '', '', '…', 48), u.is_amendatory,
+                       p.congress, p.bill_type, p.number, p.version
+                FROM docs_fts
+                JOIN docs d ON d.rowid = docs_fts.rowid
+                JOIN units u ON u.doc = d.hash
+                JOIN packages p ON p.package_id = u.package_id
+                WHERE docs_fts MATCH ?{filters}
+                ORDER BY bm25(docs_fts, {weights}), u.package_id, u.ordinal
+                LIMIT ?
+                """,
+                (fts_literal(query), *params, limit),
+            ).fetchall()
+            for rank, row in enumerate(rows, start=1):
+                by_query = ranks.setdefault(row[:2], {})
+                # The snippet shown is from the query that ranks the section best.
+                if not by_query or rank < min(by_query.values()):
+                    best[row[:2]] = row
+                by_query[query] = rank
+        scored = [
+            (best[key], sum(1 / (60 + rank) for rank in by_query.values()), sorted(by_query))
+            for key, by_query in ranks.items()
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0][0], item[0][1]))
+        return self._hits(scored[:max_hits])
+
+    def amending(
+        self,
+        citation: str,
+        max_hits: int,
+        congress: int | None = None,
+        bill_type: str | None = None,
+        version: str | None = None,
+    ) -> tuple[list[CitationMatch], int]:
+        """Sections whose amends name `citation`, newest Congress first, and the total.
+
+        Driven from the cite_key index, so the cost is the number of amending
+        sections, not the size of the corpus.
+        """
+        clauses, params = _package_filters(congress, bill_type, version)
+        filters = "".join(f" AND {clause}" for clause in clauses)
+        query = f"""
+            FROM amends a
+            JOIN units u ON u.package_id = a.package_id AND u.ordinal = a.unit_ordinal
+            JOIN packages p ON p.package_id = a.package_id
+            WHERE a.cite_key = ?{filters}
+        """
+        params = [citation_key(citation), *params]
+        total = self.conn.execute(f"SELECT COUNT(*) {query}", params).fetchone()[0]
+        rows = self.conn.execute(
+            f"""
+            SELECT u.package_id, p.congress, p.bill_type, p.number, p.version,
+                   u.section_id, u.header, u.is_amendatory, a.kind, a.cite
+            {query}
+            ORDER BY p.congress DESC, p.package_id, u.ordinal
+            LIMIT ?
+            """,
+            (*params, max_hits),
+        ).fetchall()
+        return [
+            CitationMatch(
+                package_id=row[0],
+                congress=row[1],
+                bill_type=row[2],
+                number=row[3],
+                version=row[4],
+                section_id=row[5],
+                header=row[6] or None,
+                is_amendatory=bool(row[7]),
+                kind=row[8],
+                cite=row[9],
+            )
+            for row in rows
+        ], total
+
+    def _hits(self, scored: list[tuple]) -> list[CorpusMatch]:
+        amends: dict[tuple[str, int], list[dict[str, str]]] = {row[:2]: [] for row, _, _ in scored}
+        for package_id, ordinal, kind, cite in self.conn.execute(
+            f"""
+            SELECT package_id, unit_ordinal, kind, cite FROM amends
+            WHERE (package_id, unit_ordinal) IN (VALUES {', '.join('(?, ?)' for _ in amends)})
+            ORDER BY package_id, unit_ordinal, kind, cite
+            """,
+            [value for key in amends for value in key],
+        ) if amends else ():
+            amends[(package_id, ordinal)].append({"kind": kind, "cite": cite})
+        return [
+            CorpusMatch(
+                package_id=row[0],
+                congress=row[6],
+                bill_type=row[7],
+                number=row[8],
+                version=row[9],
+                section_id=row[2],
+                header=row[3] or None,
+                snippet=row[4],
+                score=score,
+                is_amendatory=bool(row[5]),
+                amends=amends[row[:2]],
+                matched_queries=matched,
+            )
+            for row, score, matched in scored
+        ]
+
+
+_store: BillTextStore | None = None
+_store_key: str | None = None
+
+
+def get_bill_text_store() -> BillTextStore:
+    """Process-wide store, reopened if the cache location changed (tests, env reload).
+
+    With the cache disabled nothing is written to disk; the store is kept in memory,
+    under the same byte cap, for the bills loaded by this process.
+    """
+    global _store, _store_key
+    key = str(index_db_path(STORE_NAME, STORE_SCHEMA_VERSION)) if cache_enabled() else ":memory:"
+    if _store is not None and _store_key == key:
+        return _store
+    if _store is not None:
+        _store.conn.close()
+    conn, location = open_index_db(STORE_NAME, STORE_SCHEMA_VERSION)
+    _store, _store_key = BillTextStore(conn, location), key
+    return _store
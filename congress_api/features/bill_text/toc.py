@@ -0,0 +1,143 @@
+"""Precomputed table of contents for one parsed bill, served at any depth."""
+
+from __future__ import annotations
+
+from .hierarchy import BillHierarchy
+from .models import TocNode
+from .parser import node_kind_for
+
+
+TOC_NODE_CAP = 500
+
+# Section-level unit types (real addressable sections) as opposed to the
+# sub-section chunk types (SS/PARA/SUBPARAGRAPH/CLAUSE) produced by subdivision.
+# Only the former should drive "sections hidden below this depth"; advertising
+# a deeper depth just to expose byte-split chunks would be navigation noise.
+_SECTION_TYPES = {"S", "PRE", "RC", "U"}
+
+
+def section_prefix(section_id: str) -> str | None:
+    """The section-level id a unit stands for, or None if it is sub-section noise.
+
+    Classify from the id, not the emitted leaf. A section that exceeds
+    MAX_UNIT_BYTES with no structural subdivision is emitted ONLY as
+    `.../S:101/CHUNK:n` units -- no plain `.../S:101` unit exists -- so the section
+    component is the SECOND-to-last, and keying off the leaf (`CHUNK`) hides the
+    section from the completeness check entirely. Strip a trailing byte-cut
+    `/CHUNK:n`, then keep the id only when what remains is itself section-level. A
+    subdivision unit (`.../SS:a`, `.../PARA:3`) or a byte chunk of one
+    (`.../SS:a/CHUNK:n`) collapses to a non-section leaf and returns None -- it is
+    navigation noise, never a "hidden section" worth advertising a deeper depth for.
+    """
+    components = section_id.split("/")
+    if len(components) > 1 and components[-1].split(":", 1)[0] == "CHUNK":
+        components = components[:-1]
+    if components[-1].split(":", 1)[0] not in _SECTION_TYPES:
+        return None
+    return "/".join(components)
+
+
+class BillToc:
+    """The full TOC tree of one bill, built once, with per-depth node counts.
+
+    get_bill_toc used to rebuild the tree from every unit for each candidate depth
+    while searching for the deepest tree under the node cap, then again at depth 5 to
+    phrase the hidden-section note, and re-derived section depths twice more. Here
+    every node's fields, the node count at each depth and the section depths are
+    computed in one pass, so choosing a depth is a lookup and serving it
+    materialises only the nodes returned.
+
+    The tree is built from each unit's ACTUAL section_id components, never
+    reconstructed as `ancestor_path + leaf`. That holds only while ancestor_path
+    covers every component but the last, and it does not for a byte-split chunk:
+    `byte_split_unit` carries the PARENT's ancestor_path onto the chunk while
+    appending `/CHUNK:{n}` to the parent's id, so the section component sits in
+    neither. Reconstruction silently dropped it and emitted `D:D/T:XLVII/CHUNK:2`
+    for a unit whose real id is `D:D/T:XLVII/S:4701/CHUNK:2` -- 28 such ids on
+    s1071, every one of them referring to nothing, rejected by get_bill_section and
+    missing from subtree_bytes (so they also reported size 0). Same failure as F5 --
+    the TOC handing out ids it invented -- via a second cause. The id is
+    authoritative; ancestor_path supplies headers only.
+
+    A built TOC holds ids, fields and counts but no Unit, so the service keeps it with
+    the resident parse (bill_text.columnar) and later calls reuse it.
+    """
+
+    def __init__(self, hierarchy: BillHierarchy, subtree_bytes: dict[str, int]):
+        prefixes = hierarchy.prefixes()
+        self._children: dict[str, list[str]] = {sid: hierarchy.children(sid) for sid in ["", *prefixes]}
+        self._fields: dict[str, dict] = {}
+        # _depth_counts[d] = number of nodes whose id has exactly d components.
+        self._depth_counts: list[int] = [0]
+        for sid in prefixes:
+            # Each node takes its fields from the unit that first reaches it, which
+            # is the unit that used to create it while walking the units in order.
+            unit = hierarchy.first_unit(sid)
+            components = unit.section_id.split("/")
+            idx = sid.count("/")
+            typ, _, enum = components[idx].partition(":")
+            # Headers come from ancestor_path where it reaches; past its end the
+            # remaining components belong to this unit (its own node, and any
+            # chunk of it, which carries the parent header as a breadcrumb).
+            header = unit.ancestor_path[idx].header if idx < len(unit.ancestor_path) else unit.header
+            self._fields[sid] = {
+                "section_id": sid,
+                "node_kind": node_kind_for(sid),
+                "type": typ,
+                "enum": enum,
+                "header": header,
+                "byte_length": unit.byte_length if idx == len(components) - 1 else 0,
+                # Size-per-branch: sum of own bytes at-or-under this prefix,
+                # so a consumer sees which division/title is worth descending
+                # into (spec §9 -- highest-value place for the field).
+                "subtree_byte_length": subtree_bytes.get(sid, 0),
+            }
+            while len(self._depth_counts) <= idx + 1:
+                self._depth_counts.append(0)
+            self._depth_counts[idx + 1] += 1
+        # Distinct section-level ids -> depth (component count), deduped by prefix so
+        # a byte-split section counts once, not once per CHUNK. Depth comes from the
+        # id, which matches ancestor-path depth for a plain section and stays correct
+        # for a chunk that inherits the section's (not the chunk's) ancestor_path.
+        self.section_depths: dict[str, int] = {}
+        for section_id in hierarchy.section_ids:
+            prefix = section_prefix(section_id)
+            if prefix is not None:
+                self.section_depths[prefix] = len(prefix.split("/"))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size, counted against the resident budget while it is kept."""
+        return 200 * (len(self._fields) + len(self.section_depths))
+
+    def node_count(self, depth: int) -> int:
+        """Nodes in the tree cut at `depth`."""
+        return sum(self._depth_counts[1 : depth + 1])
+
+    def max_section_depth(self) -> int:
+        return max(self.section_depths.values(), default=1)
+
+    def hidden_section_count(self, shown_depth: int) -> int:
+        return sum(1 for depth in self.section_depths.values() if depth > shown_depth)
+
+    def deepest_within_cap(self, depth: int) -> int | None:
+        """The deepest depth at or below `depth` whose tree fits the node cap."""
+        for candidate in range(depth, 0, -1):
+            if self.node_count(candidate) <= TOC_NODE_CAP:
+                return candidate
+        return None
+
+    def view(self, depth: int, max_roots: int | None = None) -> list[TocNode]:
+        """The tree cut at `depth`, optionally keeping only the first `max_roots` roots."""
+        roots = self._children[""]
+        if max_roots is not None:
+            roots = roots[:max_roots]
+        return [self._node(sid, 1, depth) for sid in roots]
+
+    def _node(self, sid: str, level: int, depth: int) -> TocNode:
+        children = (
+            [self._node(child, level + 1, depth) for child in self._children[sid]]
+            if level < depth
+            else []
+        )
+        return TocNode(**self._fields[sid], children=children)
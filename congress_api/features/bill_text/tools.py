@@ -5,6 +5,7 @@ from __future__ import annotations
 import functools
 import logging
 import re
+import sqlite3
 import time
 from typing import Any, Iterable
 
@@ -12,24 +13,49 @@ from mcp.server.mcpserver import Context
 
 from ...mcp_app import mcp
 from . import trace
+from .citations import require_citation
 from .client import BillTextError, govinfo_details_url
-from .index import fts_literal, has_token, normalized_query, sqlite_supports_fts5
+from .cursors import MAX_RANKED, SearchCursor, encode_cursor, follow_cursor, keep_cursor
+from .diff import SegmentDelta, UnitChange, diff_units
+from .hierarchy import BillHierarchy
+from .index import (
+    CONTEXT_ORDER,
+    QueryDiagnosis,
+    RankedHit,
+    fts_literal,
+    has_token,
+    normalized_query,
+    sqlite_supports_fts5,
+)
 from .models import (
+    AmendingSection,
     AncestorNode,
+    BatchSection,
+    BatchSectionResult,
     BillSectionResponse,
+    BillSectionsResponse,
     BillTocResponse,
+    BillVersionSide,
     CacheStatus,
+    CorpusHit,
+    DiffBillVersionsResponse,
     ErrorEnvelope,
     ErrorPayload,
+    FindAmendingSectionsResponse,
     QueryDiagnostic,
+    SearchBillCorpusResponse,
     SearchBillTextResponse,
     SearchHit,
     SectionChild,
+    SectionDiff,
+    SegmentChange,
     Timing,
     TocNode,
 )
 from .parser import Unit, collapse_ws, node_kind_for, render_segments
 from .service import LoadedBillText, load_bill_text
+from .store import get_bill_text_store
+from .toc import TOC_NODE_CAP, BillToc
 
 
 logger = logging.getLogger(__name__)
@@ -95,7 +121,6 @@ def _unexpected(tool: str, exc: Exception) -> dict[str, Any]:
 def _capability_error() -> dict[str, Any] | None:
     if sqlite_supports_fts5():
         return None
-    import sqlite3
     import sys
 
     return _error(
@@ -118,14 +143,16 @@ def _envelope(loaded: LoadedBillText) -> dict[str, Any]:
     return {
         "package_id": loaded.resolved.package_id,
         "version": loaded.resolved.version,
-        "version_resolution": "fresh",
+        "version_resolution": loaded.resolved.version_resolution,
         "version_resolved_at": loaded.resolved.version_resolved_at,
         # version_resolution_note is intentionally omitted here: each tool passes
         # it explicitly so it can merge in the input-clamp note.
         "source_format": "bill_dtd",
         "last_modified": loaded.resolved.last_modified,
         "govinfo_url": govinfo_details_url(loaded.resolved.package_id),
-        "cache": CacheStatus(index_hit=False, version_hit=False).model_dump(),
+        "cache": CacheStatus(
+            index_hit=loaded.index_hit, version_hit=loaded.resolved.version_resolution != "fresh"
+        ).model_dump(),
         "sections_indexed": loaded.parsed.sections_indexed,
         "chunks_indexed": len(loaded.parsed.units),
         "struck_text_note": _struck_text_note(loaded),
@@ -174,15 +201,16 @@ def _normalize_queries(queries: list[str]) -> tuple[list[str], dict[str, str], l
     return normalized, display, notes
 
 
-def _query_diagnostic(index, normalized: str, shown: str) -> QueryDiagnostic:
+def _query_diagnostic(diagnosis: QueryDiagnosis, shown: str) -> QueryDiagnostic:
     # `shown` is the caller's own phrasing, not the normalized form: a diagnostic the
     # caller cannot match back to what they typed is one more thing to decode.
-    diagnosis = index.diagnose(normalized)
     return QueryDiagnostic(
         query=shown,
         terms=diagnosis.terms,
         absent_terms=diagnosis.absent,
         verdict=diagnosis.verdict,
+        near_terms=diagnosis.near_terms or None,
+        matching_phrases=diagnosis.matching_phrases or None,
     )
 
 
@@ -225,6 +253,7 @@ async def search_bill_text(
     queries: list[str],
     version: str | None = None,
     max_hits: int = 10,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     Full-text search of a bill's statutory text (bill text / legislative text), parsed from
@@ -245,7 +274,9 @@ async def search_bill_text(
     this contiguous phrase -- rephrase, do not conclude the bill is silent. verdict "absent_term"
     means absent_terms appear nowhere in the bill, so no rephrasing of them will help. terms shows
     the stemmed tokens actually searched ("Force" -> "forc"), which is where a phrase stops
-    meaning what you typed.
+    meaning what you typed. near_terms offers bill terms spelled like each absent one (a typo, or
+    "cyber" where the bill says "cybersecurity"), and matching_phrases the longest runs of your
+    words the bill does contain -- retry with those rather than a fresh guess.
 
     Knowing a provision as codified law does NOT establish where it sits in THIS bill. Division,
     title, and section numbers are properties of this document, and these tools are the only
@@ -261,6 +292,12 @@ async def search_bill_text(
     distinguishes three-of-three from three-of-four. Treat it as citations found, not citations
     present; use is_amendatory and match_contexts to identify amendatory text, and read the
     section to enumerate its targets. max_hits is clamped to 1-50.
+
+    total_hits counts every ranked section, not just this page; ranking_truncated means a query
+    matched more sections than the ranking keeps (1000 per query), so narrow the phrasing to
+    reach the rest. When more remain, next_cursor is set: call again with the same bill and queries plus cursor=next_cursor for the next
+    max_hits of the same ranking, without re-running the search. Cursors expire after ten
+    minutes unused (error cursor_expired); re-run without cursor then.
     """
     capability_error = _capability_error()
     if capability_error:
@@ -269,9 +306,16 @@ async def search_bill_text(
         started = time.perf_counter()
         max_hits, note = _clamp(max_hits, 1, 50)
         normalized, display, _ = _normalize_queries(queries)
+        if cursor is not None:
+            cursor_id, kept, offset = follow_cursor(cursor)
+            if (kept.congress, kept.bill_type, kept.number, kept.version, kept.queries) != (
+                congress, bill_type.lower(), number, version, tuple(normalized)
+            ):
+                raise ValueError("cursor belongs to a different search; pass the bill, version and queries it came from.")
+            return _search_page(kept, cursor_id, offset, max_hits, note, started, search_ms=0.0)
         loaded = await load_bill_text(ctx, congress, bill_type, number, version)
         search_start = time.perf_counter()
-        ranked = loaded.index.search(normalized, max_hits)
+        outcome = loaded.index.rank(normalized, max_hits, depth=MAX_RANKED)
         search_ms = round((time.perf_counter() - search_start) * 1000, 1)
         # F10: diagnose every query that matched nothing -- which covers the all-zero
         # response and the individually-dead query in an otherwise successful call,
@@ -280,46 +324,261 @@ async def search_bill_text(
         # already truncated to max_hits, so a query whose only hits were outranked out
         # of the window would be diagnosed as zero-hit and told (falsely) its terms are
         # present but mis-phrased -- a query that in fact matched a section.
+        diagnoses = loaded.index.diagnose_many(outcome.unmatched) if outcome.unmatched else {}
         diagnostics = [
-            _query_diagnostic(loaded.index, item, display[item])
+            _query_diagnostic(diagnoses[item], display[item])
             for item in normalized
-            if not loaded.index.query_matches(item)
+            if item in diagnoses
         ]
-        response = SearchBillTextResponse(
-            **_envelope(loaded),
+        kept = SearchCursor(
+            package_id=loaded.resolved.package_id,
+            congress=congress,
+            bill_type=bill_type.lower(),
+            number=number,
+            version=version,
+            queries=tuple(normalized),
+            ranked=outcome.ranked,
+            truncated=outcome.truncated,
+            subtree_bytes=[
+                loaded.parsed.subtree_bytes.get(entry.unit.section_id, entry.unit.byte_length)
+                for entry in outcome.ranked
+            ],
+            display=display,
+            envelope=_envelope(loaded),
             version_resolution_note=loaded.resolved.version_resolution_note,
-            request_note=_merge_notes(note),
-            timing=_timing(loaded, started, search_ms=search_ms),
+            query_diagnostics=diagnostics or None,
             chunks_searched=len(loaded.parsed.units),
+        )
+        # Only a ranking with a second page is kept for cursors to follow.
+        cursor_id = keep_cursor(kept) if len(outcome.ranked) > max_hits else None
+        return _search_page(
+            kept, cursor_id, 0, max_hits, note, started,
+            search_ms=search_ms, timing=loaded.timing, hits=outcome.hits,
+        )
+    except BillTextError as exc:
+        return _error(exc.code, exc.message, exc.detail, exc.remediation)
+    except ValueError as exc:
+        return _error("invalid_request", str(exc), None, "Adjust the input and retry.")
+    except Exception as exc:
+        return _unexpected("search_bill_text", exc)
+
+
+def _search_page(
+    kept: SearchCursor,
+    cursor_id: str | None,
+    offset: int,
+    max_hits: int,
+    note: str | None,
+    started: float,
+    *,
+    search_ms: float,
+    timing: dict[str, float] | None = None,
+    hits: list[RankedHit] | None = None,
+) -> dict[str, Any]:
+    """One page of a kept ranking; `hits` are the page's entries when rank already cut them."""
+    end = offset + max_hits
+    if hits is None:
+        hits = [entry.hit() for entry in kept.ranked[offset:end]]
+    timing = timing or {"fetch_ms": 0.0, "parse_ms": 0.0, "index_ms": 0.0}
+    response = SearchBillTextResponse(
+        **kept.envelope,
+        version_resolution_note=kept.version_resolution_note,
+        request_note=_merge_notes(note),
+        timing=Timing(**timing, search_ms=search_ms, total_ms=round((time.perf_counter() - started) * 1000, 1)),
+        chunks_searched=kept.chunks_searched,
+        queries_used=[kept.display[item] for item in kept.queries],
+        query_diagnostics=kept.query_diagnostics,
+        hits=[
+            SearchHit(
+                section_id=hit.unit.section_id,
+                node_kind=node_kind_for(hit.unit.section_id),
+                ancestor_path=hit.unit.ancestor_path,
+                header=hit.unit.header,
+                snippet=hit.snippet,
+                match_contexts=hit.match_contexts,
+                matched_queries=[kept.display[item] for item in hit.matched_queries],
+                is_amendatory=hit.unit.is_amendatory,
+                amends=hit.unit.amends,
+                score=round(hit.score, 6),
+                byte_length=hit.unit.byte_length,
+                subtree_byte_length=kept.subtree_bytes[offset + position],
+            )
+            for position, hit in enumerate(hits)
+        ],
+        total_hits=len(kept.ranked),
+        ranking_truncated=kept.truncated,
+        next_cursor=encode_cursor(cursor_id, end) if cursor_id and end < len(kept.ranked) else None,
+    )
+    return response.model_dump()
+
+
+@mcp.tool(
+    "search_bill_corpus",
+    title="Search the text of every locally cached bill (GovInfo)",
+)
+@_debug_logged
+async def search_bill_corpus(
+    ctx: Context,
+    *,
+    queries: list[str] | None = None,
+    amends: str | None = None,
+    congress: int | None = None,
+    bill_type: str | None = None,
+    version: str | None = None,
+    max_hits: int = 20,
+) -> dict[str, Any]:
+    """
+    Cross-bill full-text search: which bills mention a phrase, or amend a citation, answered
+    from one shared index over every bill package in the local bill-text cache, without loading
+    any bill. Returns ranked (package_id, section_id, snippet) hits.
+
+    The corpus is only the packages already cached -- each bill version that search_bill_text,
+    get_bill_section or get_bill_toc has loaded on this machine -- never all of Congress.
+    packages_indexed says how many; zero hits over a small corpus is NOT evidence that no bill
+    says it. Load a bill with one of the per-bill tools to add it to the corpus.
+
+    queries match exactly as in search_bill_text: literal phrases with stemming, several fused
+    into one ranking, with matched_queries naming which phrasing hit. amends restricts to sections
+    whose amends list holds that citation ("10 U.S.C. 2302", "10 USC 2302(b)", "Pub. L.
+    117-263"; subsections match their section); with amends and no queries, every such section
+    is returned -- find_amending_sections is the dedicated lookup for that case. congress,
+    bill_type and version filter by package. At least one of queries or amends is required.
+    max_hits is clamped to 1-100.
+    """
+    capability_error = _capability_error()
+    if capability_error:
+        return capability_error
+    try:
+        max_hits, note = _clamp(max_hits, 1, 100)
+        amends = require_citation(amends).cite if amends else None
+        normalized, display = [], {}
+        if queries:
+            normalized, display, _ = _normalize_queries(queries)
+        elif not amends:
+            raise ValueError("At least one of queries or amends is required.")
+        store = get_bill_text_store()
+        matches = store.search(
+            normalized, max_hits, congress=congress, bill_type=bill_type, version=version, amends=amends
+        )
+        packages = store.package_count()
+        response = SearchBillCorpusResponse(
+            packages_indexed=packages,
+            coverage_note=_corpus_coverage_note(packages),
+            request_note=_merge_notes(note),
             queries_used=[display[item] for item in normalized],
-            query_diagnostics=diagnostics or None,
+            amends=amends,
             hits=[
-                SearchHit(
-                    section_id=hit.unit.section_id,
-                    node_kind=node_kind_for(hit.unit.section_id),
-                    ancestor_path=hit.unit.ancestor_path,
-                    header=hit.unit.header,
-                    snippet=hit.snippet,
-                    match_contexts=hit.match_contexts,
-                    matched_queries=[display[item] for item in hit.matched_queries],
-                    is_amendatory=hit.unit.is_amendatory,
-                    amends=hit.unit.amends,
-                    score=round(hit.score, 6),
-                    byte_length=hit.unit.byte_length,
-                    subtree_byte_length=loaded.parsed.subtree_bytes.get(
-                        hit.unit.section_id, hit.unit.byte_length
-                    ),
+                CorpusHit(
+                    package_id=match.package_id,
+                    congress=match.congress,
+                    bill_type=match.bill_type,
+                    number=match.number,
+                    version=match.version,
+                    section_id=match.section_id,
+                    header=match.header,
+                    snippet=match.snippet,
+                    matched_queries=[display[item] for item in match.matched_queries],
+                    is_amendatory=match.is_amendatory,
+                    amends=match.amends,
+                    score=round(match.score, 6),
                 )
-                for hit in ranked
+                for match in matches
             ],
         )
         return response.model_dump()
-    except BillTextError as exc:
-        return _error(exc.code, exc.message, exc.detail, exc.remediation)
     except ValueError as exc:
         return _error("invalid_request", str(exc), None, "Adjust the input and retry.")
+    except sqlite3.Error as exc:
+        return _corpus_unavailable(exc)
     except Exception as exc:
-        return _unexpected("search_bill_text", exc)
+        return _unexpected("search_bill_corpus", exc)
+
+
+@mcp.tool(
+    "find_amending_sections",
+    title="Find cached bill sections that amend a U.S. Code section or Public Law",
+)
+@_debug_logged
+async def find_amending_sections(
+    ctx: Context,
+    *,
+    citation: str,
+    congress: int | None = None,
+    bill_type: str | None = None,
+    version: str | None = None,
+    max_hits: int = 50,
+) -> dict[str, Any]:
+    """
+    Reverse citation lookup: which bill sections amend a given statute. Answers "what pending
+    text touches 10 U.S.C. 2302" from an index of every amends citation in the cached bill
+    packages, without loading or searching any bill.
+
+    citation is a U.S. Code section ("10 U.S.C. 2302", "10 USC § 2302", "section 2302 of title
+    10, United States Code"), a Public Law ("P.L. 117-263", "Pub. L. No. 117-263") or a Statutes
+    at Large page ("136 Stat. 2395"). A section citation also finds amendments to its
+    subsections; each result's cite is the target as that section wrote it.
+
+    Coverage is the cached packages only (packages_indexed), and within them the same limits
+    as amends: no named Acts (including the IRC by bare section number) and no chapter- or
+    title-level amendments. An empty result is not evidence that no bill amends the citation.
+    congress, bill_type and version filter by package. max_hits is clamped to 1-200.
+    """
+    capability_error = _capability_error()
+    if capability_error:
+        return capability_error
+    try:
+        max_hits, note = _clamp(max_hits, 1, 200)
+        parsed = require_citation(citation)
+        store = get_bill_text_store()
+        matches, total = store.amending(
+            parsed.cite, max_hits, congress=congress, bill_type=bill_type, version=version
+        )
+        packages = store.package_count()
+        response = FindAmendingSectionsResponse(
+            citation=parsed.cite,
+            kind=parsed.kind,
+            packages_indexed=packages,
+            coverage_note=_corpus_coverage_note(packages),
+            request_note=_merge_notes(note),
+            total_sections=total,
+            sections=[
+                AmendingSection(
+                    package_id=match.package_id,
+                    congress=match.congress,
+                    bill_type=match.bill_type,
+                    number=match.number,
+                    version=match.version,
+                    section_id=match.section_id,
+                    header=match.header,
+                    is_amendatory=match.is_amendatory,
+                    cite=match.cite,
+                )
+                for match in matches
+            ],
+        )
+        return response.model_dump()
+    except ValueError as exc:
+        return _error("invalid_request", str(exc), None, "Adjust the input and retry.")
+    except sqlite3.Error as exc:
+        return _corpus_unavailable(exc)
+    except Exception as exc:
+        return _unexpected("find_amending_sections", exc)
+
+
+def _corpus_coverage_note(packages: int) -> str:
+    return (
+        f"Searched {packages} cached bill package(s), not every bill in Congress; "
+        "bills enter the corpus when a per-bill tool loads them."
+    )
+
+
+def _corpus_unavailable(exc: sqlite3.Error) -> dict[str, Any]:
+    return _error(
+        "corpus_unavailable",
+        f"The bill-text corpus index could not be read: {exc}",
+        None,
+        "Retry; if it persists, run `congressmcp cache clear --yes` to rebuild it.",
+    )
 
 
 def _aggregate_disclosure(units: Iterable[Unit]) -> tuple[bool, list[dict[str, str]]]:
@@ -397,104 +656,228 @@ async def get_bill_section(
         started = time.perf_counter()
         max_bytes, note = _clamp(max_bytes, 1_000, 100_000)
         loaded = await load_bill_text(ctx, congress, bill_type, number, version)
-        unit_or_error = _resolve_unit(loaded.parsed.units, section_id)
-        if isinstance(unit_or_error, dict):
-            # F5: before reporting section_not_found, try resolving the id as a
-            # structural container. Only section_not_found falls through --
-            # ambiguous_section_id is a real answer (§5 forbids guessing) and must
-            # not be swallowed here.
-            if unit_or_error["error"]["code"] != "section_not_found":
-                return unit_or_error
-            container = _resolve_container(
-                loaded.parsed.units, _normalize_requested_id(section_id.strip())
-            )
-            if container is None:
-                return unit_or_error
-            return _container_response(loaded, container, started, note, max_bytes)
-        unit = unit_or_error
-        # Preserve document order via child_ids (a subdivided parent lists its
-        # leaves in order); the units list is also in that order, but keying makes
-        # it explicit.
-        child_by_id = {child.section_id: child for child in loaded.parsed.units}
-        children = [child_by_id[cid] for cid in unit.child_ids if cid in child_by_id]
-        subtree = loaded.parsed.subtree_bytes
-        subtree_len = subtree.get(unit.section_id, unit.byte_length)
-        # Render at serialization: quoted spans are wrapped in delimiters here, not
-        # in storage (spec §6). byte machinery (byte_length / subtree / byte_split)
-        # stays on the clean display_text; only the returned `text` is rendered.
-        own_rendered = render_segments(unit.segments)
-        if children and subtree_len <= max_bytes:
-            # Subdivided but the whole section fits: assemble it at read time. The
-            # parent unit stores only its own header+intro (its byte_length is that
-            # intro, e.g. 73 B), so §5's "parent fits max_bytes -> return whole
-            # section" is served by concatenating the children here rather than
-            # reading a single parent field (spec §9).
-            full = "\n\n".join(
-                part
-                for part in (own_rendered, *(render_segments(c.segments) for c in children))
-                if part
+        return _section_response(loaded, section_id, max_bytes, started, note)
+    except BillTextError as exc:
+        return _error(exc.code, exc.message, exc.detail, exc.remediation)
+    except Exception as exc:
+        return _unexpected("get_bill_section", exc)
+
+
+def _section_response(
+    loaded: LoadedBillText, section_id: str, max_bytes: int, started: float, note: str | None
+) -> dict[str, Any]:
+    """get_bill_section's response for one id of a loaded bill, or its error envelope."""
+    unit_or_error = _resolve_unit(loaded.hierarchy, section_id)
+    if isinstance(unit_or_error, dict):
+        # F5: before reporting section_not_found, try resolving the id as a
+        # structural container. Only section_not_found falls through --
+        # ambiguous_section_id is a real answer (§5 forbids guessing) and must
+        # not be swallowed here.
+        if unit_or_error["error"]["code"] != "section_not_found":
+            return unit_or_error
+        container = _resolve_container(
+            loaded.hierarchy, _normalize_requested_id(section_id.strip())
+        )
+        if container is None:
+            return unit_or_error
+        return _container_response(loaded, container, started, note, max_bytes)
+    unit = unit_or_error
+    # Preserve document order via child_ids (a subdivided parent lists its
+    # leaves in order); the units list is also in that order, but keying makes
+    # it explicit.
+    child_by_id = loaded.hierarchy.by_id
+    children = [child_by_id[cid] for cid in unit.child_ids if cid in child_by_id]
+    subtree = loaded.parsed.subtree_bytes
+    subtree_len = subtree.get(unit.section_id, unit.byte_length)
+    # Render at serialization: quoted spans are wrapped in delimiters here, not
+    # in storage (spec §6). byte machinery (byte_length / subtree / byte_split)
+    # stays on the clean display_text; only the returned `text` is rendered.
+    own_rendered = render_segments(unit.segments)
+    if children and subtree_len <= max_bytes:
+        # Subdivided but the whole section fits: assemble it at read time. The
+        # parent unit stores only its own header+intro (its byte_length is that
+        # intro, e.g. 73 B), so §5's "parent fits max_bytes -> return whole
+        # section" is served by concatenating the children here rather than
+        # reading a single parent field (spec §9).
+        full = "\n\n".join(
+            part
+            for part in (own_rendered, *(render_segments(c.segments) for c in children))
+            if part
+        )
+        text = _limit_utf8(full, max_bytes)
+        truncated = len(full.encode("utf-8")) > max_bytes
+        included_units = [unit, *children]
+    elif children:
+        # Subdivided and too large to inline: own header + intro plus child
+        # descriptors so the caller can fetch a specific chunk. Never silently
+        # return only the first chunk (spec §5).
+        text = _limit_utf8(own_rendered, max_bytes)
+        truncated = True
+        included_units = [unit]
+    else:
+        # Leaf: its own text, truncated only if that alone exceeds max_bytes.
+        text = _limit_utf8(own_rendered, max_bytes)
+        truncated = len(own_rendered.encode("utf-8")) > max_bytes
+        included_units = [unit]
+    # F33: the disclosure describes the text actually returned -- aggregated over
+    # the included units on an assembled response, the unit's own on a
+    # descriptor-only or leaf response. Carried, never recomputed.
+    is_amendatory, amends = _aggregate_disclosure(included_units)
+    child_payload = (
+        [
+            SectionChild(
+                section_id=child.section_id,
+                node_kind=node_kind_for(child.section_id),
+                header=child.header,
+                byte_length=child.byte_length,
+                subtree_byte_length=subtree.get(child.section_id, child.byte_length),
             )
-            text = _limit_utf8(full, max_bytes)
-            truncated = len(full.encode("utf-8")) > max_bytes
-            included_units = [unit, *children]
-        elif children:
-            # Subdivided and too large to inline: own header + intro plus child
-            # descriptors so the caller can fetch a specific chunk. Never silently
-            # return only the first chunk (spec §5).
-            text = _limit_utf8(own_rendered, max_bytes)
-            truncated = True
-            included_units = [unit]
-        else:
-            # Leaf: its own text, truncated only if that alone exceeds max_bytes.
-            text = _limit_utf8(own_rendered, max_bytes)
-            truncated = len(own_rendered.encode("utf-8")) > max_bytes
-            included_units = [unit]
-        # F33: the disclosure describes the text actually returned -- aggregated over
-        # the included units on an assembled response, the unit's own on a
-        # descriptor-only or leaf response. Carried, never recomputed.
-        is_amendatory, amends = _aggregate_disclosure(included_units)
-        child_payload = (
-            [
-                SectionChild(
-                    section_id=child.section_id,
-                    node_kind=node_kind_for(child.section_id),
-                    header=child.header,
-                    byte_length=child.byte_length,
-                    subtree_byte_length=subtree.get(child.section_id, child.byte_length),
-                )
-                for child in children
-            ]
-            if children
+            for child in children
+        ]
+        if children
+        else None
+    )
+    return BillSectionResponse(
+        **_envelope(loaded),
+        version_resolution_note=loaded.resolved.version_resolution_note,
+        request_note=_merge_notes(note),
+        timing=_timing(loaded, started),
+        section_id=unit.section_id,
+        node_kind=node_kind_for(unit.section_id),
+        ancestor_path=unit.ancestor_path,
+        header=unit.header,
+        text=text,
+        is_amendatory=is_amendatory,
+        amends=amends,
+        # byte_length is the unit's OWN clean text size (spec §9), NOT the
+        # rendered/concatenated payload: rendering adds ~2 bytes per quoted span
+        # and concatenation inflates it, which made section disagree with search
+        # on the same node and made subtree_byte_length read *smaller* than
+        # byte_length on quoted leaves. Reporting the clean own size restores
+        # `subtree_byte_length >= byte_length` and cross-tool agreement; the
+        # returned `text` is still rendered and bounded by max_bytes.
+        byte_length=unit.byte_length,
+        subtree_byte_length=subtree_len,
+        truncated=truncated,
+        children=child_payload,
+    ).model_dump()
+
+
+# Ids per get_bill_sections call: the search_bill_text hits an agent reads next,
+# with room to spare.
+MAX_BATCH_SECTIONS = 20
+
+
+@mcp.tool(
+    "get_bill_sections",
+    title="Retrieve several sections of one bill in a single call (GovInfo)",
+)
+@_debug_logged
+async def get_bill_sections(
+    ctx: Context,
+    *,
+    congress: int,
+    bill_type: str,
+    number: int,
+    section_ids: list[str],
+    version: str | None = None,
+    max_bytes: int = 50_000,
+) -> dict[str, Any]:
+    """
+    Retrieve up to 20 sections or chunks of one bill in a single call -- typically the top
+    search_bill_text hits -- instead of one get_bill_section call each. The bill is resolved and
+    loaded once; each id resolves exactly as in get_bill_section, and each result carries the same
+    section fields (text, is_amendatory, amends, truncated, children) with the same meaning.
+
+    max_bytes is ONE budget for the whole response, measured as UTF-8 bytes of the returned text
+    fields and clamped to 1,000-100,000. It is split fairly: sections smaller than an even share
+    get all they need, and what they leave is divided evenly among the larger ones, so one huge
+    section cannot starve the rest. allocated_bytes reports each id's share; a section that did
+    not fit its share is truncated (or returned as heading plus child descriptors) exactly as
+    get_bill_section would return it with that max_bytes.
+
+    An id that does not resolve (section_not_found, ambiguous_section_id) is reported in that
+    entry's error and does not fail the other ids. Repeated ids are returned once.
+    """
+    capability_error = _capability_error()
+    if capability_error:
+        return capability_error
+    try:
+        started = time.perf_counter()
+        max_bytes, note = _clamp(max_bytes, 1_000, 100_000)
+        requested = list(dict.fromkeys(section_ids))
+        if not requested:
+            raise ValueError("section_ids must name at least one section.")
+        if len(requested) > MAX_BATCH_SECTIONS:
+            raise ValueError(f"len(section_ids) must be {MAX_BATCH_SECTIONS} or fewer.")
+        duplicate_note = (
+            f"{len(section_ids) - len(requested)} repeated section_id(s) were returned once."
+            if len(requested) < len(section_ids)
             else None
         )
-        return BillSectionResponse(
+        loaded = await load_bill_text(ctx, congress, bill_type, number, version)
+
+        # First pass with the whole budget per id: what each section needs in full.
+        # Only the ids whose fair share is smaller are rendered again.
+        full = [_section_response(loaded, section_id, max_bytes, started, None) for section_id in requested]
+        demands = [_section_demand(response, max_bytes) for response in full]
+        shares = _fair_shares(demands, max_bytes)
+        results = []
+        returned = 0
+        for section_id, response, demand, share in zip(requested, full, demands, shares):
+            if "error" in response:
+                results.append(
+                    BatchSectionResult(requested_id=section_id, allocated_bytes=0, error=response["error"])
+                )
+                continue
+            if share < demand:
+                response = _section_response(loaded, section_id, share, started, None)
+            returned += len(response["text"].encode("utf-8"))
+            results.append(
+                BatchSectionResult(
+                    requested_id=section_id,
+                    allocated_bytes=share,
+                    section=BatchSection(**{key: response[key] for key in BatchSection.model_fields}),
+                )
+            )
+        return BillSectionsResponse(
             **_envelope(loaded),
             version_resolution_note=loaded.resolved.version_resolution_note,
-            request_note=_merge_notes(note),
+            request_note=_merge_notes(note, duplicate_note),
             timing=_timing(loaded, started),
-            section_id=unit.section_id,
-            node_kind=node_kind_for(unit.section_id),
-            ancestor_path=unit.ancestor_path,
-            header=unit.header,
-            text=text,
-            is_amendatory=is_amendatory,
-            amends=amends,
-            # byte_length is the unit's OWN clean text size (spec §9), NOT the
-            # rendered/concatenated payload: rendering adds ~2 bytes per quoted span
-            # and concatenation inflates it, which made section disagree with search
-            # on the same node and made subtree_byte_length read *smaller* than
-            # byte_length on quoted leaves. Reporting the clean own size restores
-            # `subtree_byte_length >= byte_length` and cross-tool agreement; the
-            # returned `text` is still rendered and bounded by max_bytes.
-            byte_length=unit.byte_length,
-            subtree_byte_length=subtree_len,
-            truncated=truncated,
-            children=child_payload,
+            max_bytes=max_bytes,
+            bytes_returned=returned,
+            sections=results,
         ).model_dump()
     except BillTextError as exc:
         return _error(exc.code, exc.message, exc.detail, exc.remediation)
+    except ValueError as exc:
+        return _error("invalid_request", str(exc), None, "Adjust the input and retry.")
     except Exception as exc:
-        return _unexpected("get_bill_section", exc)
+        return _unexpected("get_bill_sections", exc)
+
+
+def _section_demand(response: dict[str, Any], ceiling: int) -> int:
+    """Bytes a section needs to come back whole, capped at `ceiling`; 0 for an error."""
+    if "error" in response:
+        return 0
+    if response["truncated"]:
+        return ceiling
+    # subtree_byte_length is the threshold for assembling a subdivided section or
+    # container; the rendered text can be a little larger (quote delimiters).
+    return min(ceiling, max(len(response["text"].encode("utf-8")), response["subtree_byte_length"]))
+
+
+def _fair_shares(demands: list[int], budget: int) -> list[int]:
+    """Max-min fair split of `budget`: smallest demands are met in full, and what
+    they leave is divided evenly among the larger ones."""
+    shares = [0] * len(demands)
+    remaining = budget
+    order = sorted(range(len(demands)), key=lambda index: demands[index])
+    for position, index in enumerate(order):
+        shares[index] = min(demands[index], remaining // (len(order) - position))
+        remaining -= shares[index]
+    return shares
 
 
 @mcp.tool(
@@ -532,17 +915,13 @@ async def get_bill_toc(
         started = time.perf_counter()
         depth, note = _clamp(depth, 1, 5)
         loaded = await load_bill_text(ctx, congress, bill_type, number, version)
-        toc, node_capped, actual_depth, list_truncated = _toc_nodes(
-            loaded.parsed.units, depth, loaded.parsed.subtree_bytes
-        )
+        toc, node_capped, actual_depth, list_truncated = _toc_nodes(loaded.toc, depth)
         # A node showing children:[] at the depth boundary is indistinguishable
         # from a genuinely empty one, so a consumer reads "this subtitle has no
         # sections" and stops. Detect sections that nest below the returned depth
         # and disclose them rather than letting toc_truncated=false assert
         # completeness that isn't there.
-        hidden_note = _hidden_section_note(
-            loaded.parsed.units, actual_depth, depth, loaded.parsed.subtree_bytes
-        )
+        hidden_note = _hidden_section_note(loaded.toc, actual_depth, depth)
         notes: list[str] = []
         if note:
             notes.append(note)
@@ -580,6 +959,147 @@ async def get_bill_toc(
         return _unexpected("get_bill_toc", exc)
 
 
+@mcp.tool(
+    "diff_bill_versions",
+    title="What changed between two text versions of a bill (GovInfo)",
+)
+@_debug_logged
+async def diff_bill_versions(
+    ctx: Context,
+    *,
+    congress: int,
+    bill_type: str,
+    number: int,
+    from_version: str,
+    to_version: str,
+    max_bytes: int = 25_000,
+    max_sections: int = 100,
+) -> dict[str, Any]:
+    """
+    Section-by-section diff of two text versions of one bill (e.g. "ih" -> "rh", "rh" -> "eh",
+    "eh" -> "enr"), returning ONLY the sections that changed -- use this instead of reading the
+    same section in both versions to answer "what changed in the reported version".
+
+    Sections are aligned by section_id; a section whose id exists in only one version is paired
+    with its counterpart by identical text, else by a near-identical header, and reported as
+    "renumbered". Each changed section lists segment-level changes (insert / delete / replace),
+    rendered like get_bill_section text. Unchanged sections are counted, never returned.
+
+    max_bytes (clamped to 1,000-100,000) bounds the segment text returned; past it, changed
+    sections are still listed with segments null -- read those with get_bill_section on each
+    version. max_sections (clamped to 1-500) bounds the list; total_changes gives the full count.
+    """
+    capability_error = _capability_error()
+    if capability_error:
+        return capability_error
+    try:
+        started = time.perf_counter()
+        max_bytes, bytes_note = _clamp(max_bytes, 1_000, 100_000)
+        max_sections, sections_note = _clamp(max_sections, 1, 500)
+        from_version, to_version = from_version.strip().lower(), to_version.strip().lower()
+        if from_version == to_version:
+            raise ValueError("from_version and to_version must name two different versions.")
+        old = await load_bill_text(ctx, congress, bill_type, number, from_version)
+        new = await load_bill_text(ctx, congress, bill_type, number, to_version)
+        diff_start = time.perf_counter()
+        result = diff_units(old.parsed.units, new.parsed.units, old.unit_hashes, new.unit_hashes)
+        changes, remaining = [], max_bytes
+        for change in result.changes[:max_sections]:
+            section, remaining = _section_diff(change, remaining)
+            changes.append(section)
+        diff_ms = round((time.perf_counter() - diff_start) * 1000, 1)
+        budget_note = None
+        if any(section.segments is None for section in changes):
+            budget_note = (
+                f"Segment text stopped at max_bytes={max_bytes}; sections with segments null "
+                "changed too -- read them with get_bill_section on each version."
+            )
+        response = DiffBillVersionsResponse(
+            from_version=_version_side(old),
+            to_version=_version_side(new),
+            request_note=_merge_notes(bytes_note, sections_note, budget_note),
+            sections_compared=result.compared,
+            sections_unchanged=result.unchanged,
+            total_changes=len(result.changes),
+            changes_truncated=len(result.changes) > max_sections,
+            changes=changes,
+            timing=Timing(
+                **{key: round(old.timing[key] + new.timing[key], 1) for key in old.timing},
+                search_ms=diff_ms,
+                total_ms=round((time.perf_counter() - started) * 1000, 1),
+            ),
+        )
+        return response.model_dump()
+    except BillTextError as exc:
+        return _error(exc.code, exc.message, exc.detail, exc.remediation)
+    except ValueError as exc:
+        return _error("invalid_request", str(exc), None, "Adjust the input and retry.")
+    except Exception as exc:
+        return _unexpected("diff_bill_versions", exc)
+
+
+def _version_side(loaded: LoadedBillText) -> BillVersionSide:
+    envelope = _envelope(loaded)
+    return BillVersionSide(
+        package_id=envelope["package_id"],
+        version=envelope["version"],
+        version_resolution=envelope["version_resolution"],
+        version_resolved_at=envelope["version_resolved_at"],
+        version_resolution_note=loaded.resolved.version_resolution_note,
+        last_modified=envelope["last_modified"],
+        govinfo_url=envelope["govinfo_url"],
+        cache=envelope["cache"],
+    )
+
+
+def _section_diff(change: UnitChange, remaining: int) -> tuple[SectionDiff, int]:
+    """One changed unit, with its segment changes while `remaining` bytes last.
+
+    Once the budget is spent every later section is listed without segments, rather
+    than a smaller section slipping in after a larger one was cut: the cut-off is one
+    point in document order, which is what the note tells the caller.
+    """
+    unit = change.after or change.before
+    if change.status == "added":
+        deltas = [SegmentDelta("insert", [], change.after.segments)]
+    elif change.status == "removed":
+        deltas = [SegmentDelta("delete", change.before.segments, [])]
+    else:
+        deltas = change.segments
+    segments: list[SegmentChange] | None = None
+    if remaining >= 0:
+        segments = []
+        for delta in deltas:
+            before = render_segments(delta.before) if delta.before else None
+            after = render_segments(delta.after) if delta.after else None
+            remaining -= len((before or "").encode("utf-8")) + len((after or "").encode("utf-8"))
+            if remaining < 0:
+                segments = None
+                break
+            contexts = {segment.context for segment in [*delta.before, *delta.after]}
+            segments.append(
+                SegmentChange(
+                    op=delta.op,
+                    before=before,
+                    after=after,
+                    contexts=sorted(contexts, key=CONTEXT_ORDER.__getitem__),
+                )
+            )
+    header_changed = (
+        change.before is not None and change.after is not None and change.before.header != change.after.header
+    )
+    return SectionDiff(
+        status=change.status,
+        section_id=unit.section_id,
+        from_section_id=change.before.section_id if change.status == "renumbered" else None,
+        node_kind=node_kind_for(unit.section_id),
+        header=unit.header,
+        from_header=change.before.header if header_changed else None,
+        text_changed=change.text_changed,
+        segments=segments,
+    ), remaining
+
+
 def _container_response(
     loaded: LoadedBillText, container: _Container, started: float, note: str | None, max_bytes: int
 ) -> dict[str, Any]:
@@ -588,7 +1108,7 @@ def _container_response(
     descriptors with truncated=true. Never silently return only the first child."""
     subtree = loaded.parsed.subtree_bytes
     subtree_len = subtree.get(container.section_id, 0)
-    children = _container_children(container, loaded.parsed.units, subtree)
+    children = _container_children(container, loaded.hierarchy, subtree)
     if subtree_len <= max_bytes:
         full = "\n\n".join(
             part
@@ -653,10 +1173,9 @@ class _Container:
         self.descendants = descendants
 
 
-def _resolve_container(units: list[Unit], requested: str) -> _Container | None:
+def _resolve_container(hierarchy: BillHierarchy, requested: str) -> _Container | None:
     """Build a container view for `requested` if any unit sits beneath it."""
-    prefix = f"{requested}/"
-    descendants = [unit for unit in units if unit.section_id.startswith(prefix)]
+    descendants = hierarchy.descendants(requested)
     if not descendants:
         return None
     depth = len(requested.split("/"))
@@ -678,19 +1197,14 @@ def _resolve_container(units: list[Unit], requested: str) -> _Container | None:
     return _Container(requested, anchor.ancestor_path[: depth - 1], node, descendants)
 
 
-def _container_children(container: _Container, units: list[Unit], subtree: dict[str, int]) -> list[SectionChild]:
+def _container_children(
+    container: _Container, hierarchy: BillHierarchy, subtree: dict[str, int]
+) -> list[SectionChild]:
     """Immediate children of a container, in document order: emitted units where the
     next level down is a real unit, nested containers otherwise."""
-    by_id = {unit.section_id: unit for unit in units}
-    depth = len(container.section_id.split("/"))
-    seen: list[str] = []
-    for unit in container.descendants:
-        child_id = "/".join(unit.section_id.split("/")[: depth + 1])
-        if child_id not in seen:
-            seen.append(child_id)
     children = []
-    for child_id in seen:
-        child = by_id.get(child_id)
+    for child_id in hierarchy.children(container.section_id):
+        child = hierarchy.by_id.get(child_id)
         if child is not None:
             children.append(
                 SectionChild(
@@ -702,7 +1216,7 @@ def _container_children(container: _Container, units: list[Unit], subtree: dict[
                 )
             )
             continue
-        nested = _resolve_container(units, child_id)
+        nested = _resolve_container(hierarchy, child_id)
         children.append(
             SectionChild(
                 section_id=child_id,
@@ -741,13 +1255,11 @@ def _normalize_requested_id(requested: str) -> str:
     return "/".join(parts)
 
 
-def _resolve_unit(units: list[Unit], requested: str) -> Unit | dict[str, Any]:
+def _resolve_unit(hierarchy: BillHierarchy, requested: str) -> Unit | dict[str, Any]:
     requested = _normalize_requested_id(requested.strip())
-    by_id = {unit.section_id: unit for unit in units}
-    if requested in by_id:
-        return by_id[requested]
-    bare = requested.removeprefix("S:")
-    matches = [unit for unit in units if unit.section_id.split("/")[-1] == f"S:{bare}" or unit.section_id.split("/")[-1] == bare]
+    if requested in hierarchy.by_id:
+        return hierarchy.by_id[requested]
+    matches = hierarchy.bare_matches(requested.removeprefix("S:"))
     if len(matches) == 1:
         return matches[0]
     if len(matches) > 1:
@@ -767,10 +1279,8 @@ def _limit_utf8(text: str, max_bytes: int) -> str:
     return encoded[:max_bytes].decode("utf-8", errors="ignore")
 
 
-def _toc_nodes(
-    units: list[Unit], depth: int, subtree_bytes: dict[str, int]
-) -> tuple[list[TocNode], bool, int, bool]:
-    """Build the deepest tree the 500-node cap allows, at or below `depth`.
+def _toc_nodes(toc: BillToc, depth: int) -> tuple[list[TocNode], bool, int, bool]:
+    """Serve the deepest tree the 500-node cap allows, at or below `depth`.
 
     Returns (nodes, node_capped, actual_depth, list_truncated). The cap degrades in two
     distinguishable ways and F11 turns on telling them apart: it can serve a SHALLOWER
@@ -780,129 +1290,13 @@ def _toc_nodes(
     overridden" from "top-level nodes were dropped", and the second case reported a
     depth reduction that had not happened.
     """
-    for actual_depth in range(depth, 0, -1):
-        nodes = _build_toc(units, actual_depth, subtree_bytes)
-        count = _count_toc(nodes)
-        if count <= 500:
-            return nodes, depth != actual_depth, actual_depth, False
-    return _build_toc(units, 1, subtree_bytes)[:500], depth != 1, 1, True
-
-
-def _build_toc(units: list[Unit], depth: int, subtree_bytes: dict[str, int]) -> list[TocNode]:
-    """Build the TOC tree from each unit's ACTUAL section_id components.
-
-    The id must never be reconstructed as `ancestor_path + leaf`. That holds only
-    while ancestor_path covers every component but the last, and it does not for a
-    byte-split chunk: `byte_split_unit` carries the PARENT's ancestor_path onto the
-    chunk while appending `/CHUNK:{n}` to the parent's id, so the section component
-    sits in neither. Reconstruction silently dropped it and emitted
-    `D:D/T:XLVII/CHUNK:2` for a unit whose real id is `D:D/T:XLVII/S:4701/CHUNK:2`
-    -- 28 such ids on s1071, every one of them referring to nothing, rejected by
-    get_bill_section and missing from subtree_bytes (so they also reported size 0).
-    Same failure as F5 -- the TOC handing out ids it invented -- via a second cause.
-    The id is authoritative; ancestor_path supplies headers only.
-    """
-    roots: list[TocNode] = []
-    node_map: dict[str, TocNode] = {}
-    for unit in units:
-        components = unit.section_id.split("/")
-        parent = None
-        for idx, component in enumerate(components[:depth]):
-            sid = "/".join(components[: idx + 1])
-            if sid not in node_map:
-                typ, _, enum = component.partition(":")
-                # Headers come from ancestor_path where it reaches; past its end the
-                # remaining components belong to this unit (its own node, and any
-                # chunk of it, which carries the parent header as a breadcrumb).
-                header = (
-                    unit.ancestor_path[idx].header
-                    if idx < len(unit.ancestor_path)
-                    else unit.header
-                )
-                toc_node = TocNode(
-                    section_id=sid,
-                    node_kind=node_kind_for(sid),
-                    type=typ,
-                    enum=enum,
-                    header=header,
-                    byte_length=unit.byte_length if idx == len(components) - 1 else 0,
-                    # Size-per-branch: sum of own bytes at-or-under this prefix,
-                    # so a consumer sees which division/title is worth descending
-                    # into (spec §9 -- highest-value place for the field).
-                    subtree_byte_length=subtree_bytes.get(sid, 0),
-                )
-                node_map[sid] = toc_node
-                if parent is None:
-                    roots.append(toc_node)
-                else:
-                    parent.children.append(toc_node)
-            parent = node_map[sid]
-    return roots
-
-
-def _count_toc(nodes: list[TocNode]) -> int:
-    total = 0
-    stack = list(nodes)
-    while stack:
-        node = stack.pop()
-        total += 1
-        stack.extend(node.children)
-    return total
-
-
-# Section-level unit types (real addressable sections) as opposed to the
-# sub-section chunk types (SS/PARA/SUBPARAGRAPH/CLAUSE) produced by subdivision.
-# Only the former should drive "sections hidden below this depth"; advertising
-# a deeper depth just to expose byte-split chunks would be navigation noise.
-_SECTION_TYPES = {"S", "PRE", "RC", "U"}
-
-
-def _section_prefix(section_id: str) -> str | None:
-    """The section-level id a unit stands for, or None if it is sub-section noise.
-
-    Classify from the id, not the emitted leaf. A section that exceeds
-    MAX_UNIT_BYTES with no structural subdivision is emitted ONLY as
-    `.../S:101/CHUNK:n` units -- no plain `.../S:101` unit exists -- so the section
-    component is the SECOND-to-last, and keying off the leaf (`CHUNK`) hides the
-    section from the completeness check entirely. Strip a trailing byte-cut
-    `/CHUNK:n`, then keep the id only when what remains is itself section-level. A
-    subdivision unit (`.../SS:a`, `.../PARA:3`) or a byte chunk of one
-    (`.../SS:a/CHUNK:n`) collapses to a non-section leaf and returns None -- it is
-    navigation noise, never a "hidden section" worth advertising a deeper depth for.
-    """
-    components = section_id.split("/")
-    if len(components) > 1 and components[-1].split(":", 1)[0] == "CHUNK":
-        components = components[:-1]
-    if components[-1].split(":", 1)[0] not in _SECTION_TYPES:
-        return None
-    return "/".join(components)
-
-
-def _section_depths(units: list[Unit]) -> dict[str, int]:
-    """Distinct section-level ids -> depth (component count), deduped by prefix so a
-    byte-split section counts once, not once per CHUNK. Depth comes from the id, which
-    matches ancestor-path depth for a plain section and stays correct for a chunk that
-    inherits the section's (not the chunk's) ancestor_path."""
-    depths: dict[str, int] = {}
-    for unit in units:
-        prefix = _section_prefix(unit.section_id)
-        if prefix is not None:
-            depths[prefix] = len(prefix.split("/"))
-    return depths
-
-
-def _max_section_depth(units: list[Unit]) -> int:
-    depths = _section_depths(units).values()
-    return max(depths) if depths else 1
-
-
-def _hidden_section_count(units: list[Unit], shown_depth: int) -> int:
-    return sum(1 for depth in _section_depths(units).values() if depth > shown_depth)
+    actual_depth = toc.deepest_within_cap(depth)
+    if actual_depth is not None:
+        return toc.view(actual_depth), depth != actual_depth, actual_depth, False
+    return toc.view(1, max_roots=TOC_NODE_CAP), depth != 1, 1, True
 
 
-def _hidden_section_note(
-    units: list[Unit], actual_depth: int, requested_depth: int, subtree_bytes: dict[str, int]
-) -> str | None:
+def _hidden_section_note(toc: BillToc, actual_depth: int, requested_depth: int) -> str | None:
     """Disclose sections that nest below the returned depth, with advice that is
     actually actionable.
 
@@ -912,13 +1306,13 @@ def _hidden_section_note(
     just made). So promise a depth only when the cap can serve it; otherwise the honest
     remedy is search_bill_text or narrowing to a subtree.
     """
-    hidden = _hidden_section_count(units, actual_depth)
+    hidden = toc.hidden_section_count(actual_depth)
     if not hidden:
         return None
-    required = _max_section_depth(units)
+    required = toc.max_section_depth()
     # servable = the deepest depth the node cap actually permits (== actual_depth when
     # the caller already asked for the ceiling, else re-derived at the ceiling).
-    servable = actual_depth if requested_depth >= 5 else _toc_nodes(units, 5, subtree_bytes)[2]
+    servable = actual_depth if requested_depth >= 5 else (toc.deepest_within_cap(5) or 1)
     if required <= servable:
         return (
             f"{hidden} section(s) nest below the returned depth {actual_depth} and are "
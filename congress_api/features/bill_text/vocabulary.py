@@ -0,0 +1,101 @@
+"""A bill's term vocabulary, for suggesting near misses to zero-hit queries.
+
+The zero-hit diagnostic (F10) says which query terms the bill lacks; this says what
+the bill has instead. BillVocabulary is read from the index's own seg_vocab -- the
+stemmed terms the search matches against, with how many times each occurs -- and
+indexes them two ways:
+
+* sorted, so the terms an absent one is the start of are one bisect away
+  ("cyber" finds "cybersecur");
+* by character trigram, so terms spelled like the absent one ("icebrak" for
+  "icebreak") are scored by Dice similarity over shared trigrams without comparing
+  against the whole vocabulary.
+
+Suggestions are stemmed terms, the same form QueryDiagnosis.terms reports. Numbers
+get none: a citation one digit away is a different citation, not a typo.
+
+Building the trigram postings costs more than the rest of the diagnostic, and a
+caller that got zero hits usually retries against the same bill, so vocabularies
+are built on the first diagnosis a package needs and kept for the few packages
+diagnosed most recently.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict
+
+# Suggestions per absent term; more is noise to a caller choosing one to retry with.
+NEAR_TERMS = 3
+# Dice similarity over trigrams below which a term is not offered as a near miss.
+MIN_SIMILARITY = 0.6
+# Terms shorter than this have too few trigrams for similarity to mean anything.
+_MIN_TERM_LENGTH = 3
+# At most this many prefix completions are scored; a short prefix can have thousands.
+_MAX_COMPLETIONS = 50
+MAX_CACHED_VOCABULARIES = 8
+
+_vocabularies: OrderedDict[tuple[str, str | None], BillVocabulary] = OrderedDict()
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class BillVocabulary:
+    """Term frequencies of one bill's index, with prefix and trigram lookup."""
+
+    def __init__(self, counts: dict[str, int]):
+        self.counts = counts
+        self.terms = sorted(counts)
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for position, term in enumerate(self.terms):
+            grams = _trigrams(term)
+            self._gram_counts.append(len(grams))
+            if not term.isdigit():
+                for gram in grams:
+                    self._postings[gram].append(position)
+
+    @classmethod
+    def from_index(cls, conn: sqlite3.Connection) -> BillVocabulary:
+        """Read an index's seg_vocab: every stemmed term and its occurrence count."""
+        return cls({term: count for term, count in conn.execute("SELECT term, cnt FROM seg_vocab")})
+
+    def near(self, term: str, limit: int = NEAR_TERMS) -> list[str]:
+        """Bill terms most like ``term``, most similar then most frequent first."""
+        if len(term) < _MIN_TERM_LENGTH or term.isdigit():
+            return []
+        grams = _trigrams(term)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scored = {
+            position: 2 * count / (len(grams) + self._gram_counts[position])
+            for position, count in shared.items()
+        }
+        start = bisect_left(self.terms, term)
+        for position in range(start, min(start + _MAX_COMPLETIONS, len(self.terms))):
+            if not self.terms[position].startswith(term):
+                break
+            # A completion is offered even when its extra letters dilute the score.
+            scored[position] = max(scored.get(position, 0.0), MIN_SIMILARITY)
+        ranked = sorted(
+            (position for position, similarity in scored.items() if similarity >= MIN_SIMILARITY),
+            key=lambda position: (-scored[position], -self.counts[self.terms[position]], self.terms[position]),
+        )
+        return [self.terms[position] for position in ranked if self.terms[position] != term][:limit]
+
+
+def bill_vocabulary(package_id: str, last_modified: str | None, conn: sqlite3.Connection) -> BillVocabulary:
+    """The package's vocabulary, built from ``conn``'s seg_vocab on first use."""
+    key = (package_id, last_modified)
+    vocabulary = _vocabularies.get(key)
+    if vocabulary is None:
+        vocabulary = _vocabularies[key] = BillVocabulary.from_index(conn)
+        while len(_vocabularies) > MAX_CACHED_VOCABULARIES:
+            _vocabularies.popitem(last=False)
+    _vocabularies.move_to_end(key)
+    return vocabulary
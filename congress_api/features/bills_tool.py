@@ -143,6 +143,7 @@ async def bills(
         sort: updateDate+desc (newest first) or updateDate+asc
         fromDateTime/toDateTime: Date range (YYYY-MM-DDTHH:MM:SSZ)
         version: Text version for content operations
+        chunk_number/chunk_size: get_bill_content paging (1-based chunk; 1000-50000 bytes per chunk)
         
     Returns:
         Formatted results specific to requested operation
@@ -13,6 +13,8 @@ from mcp.server.mcpserver import Context
 from .helpers import fetch_bill_data, build_bill_endpoint, validate_api_parameters
 from .processors import BillsDataProcessor
 from .formatters import BillsFormatter
+from ...bill_text.client import BillTextError
+from ...bill_text.service import load_bill_content
 
 # Import existing reliability framework
 from ....core.validators import ParameterValidator
@@ -704,19 +706,84 @@ async def get_bill_content(
     congress: int,
     bill_type: str,
     bill_number: int,
+    version: Optional[str] = None,
     chunk_number: Optional[int] = None,
     chunk_size: int = 5000
 ) -> str:
-    """Get content for a specific bill with chunking support."""
+    """
+    Get a bill's full text, one byte-bounded chunk at a time.
+
+    The text comes from the bill-text pipeline: the package is fetched and parsed
+    once, then every chunk is a slice of the same rendered text, so a client can
+    page through a whole bill (chunk 1, 2, ... N) without it being re-fetched.
+
+    Args:
+        ctx: Context for API requests
+        congress: Congress number
+        bill_type: Bill type (hr, s, hjres, ...)
+        bill_number: Bill number
+        version: Text version code (e.g. 'ih', 'enr'); latest available when omitted
+        chunk_number: Chunk to return (1-based, default: 1)
+        chunk_size: Maximum bytes of bill text per chunk (1000-50000, default: 5000)
+
+    Returns:
+        The requested chunk with its position in the bill, or an error message
+    """
+    if chunk_number is None:
+        chunk_number = 1
+    if not isinstance(chunk_number, int) or chunk_number < 1:
+        return format_error_response(CommonErrors.invalid_parameter(
+            "chunk_number",
+            chunk_number,
+            "Chunk number must be a positive integer (1-based)"
+        ))
+    if not isinstance(chunk_size, int) or chunk_size < 1000 or chunk_size > 50000:
+        return format_error_response(CommonErrors.invalid_parameter(
+            "chunk_size",
+            chunk_size,
+            "Chunk size must be between 1000 and 50000 bytes"
+        ))
+
     try:
-        # Real content-chunking (fetching a specific `version`'s full text and
-        # paging it via chunk_number/chunk_size) isn't implemented yet, so this
-        # delegates to get_bill_text_versions and ignores chunk_number/chunk_size
-        # entirely. `version` isn't even accepted here (schema/impl audit
-        # allowlist: scripts/audit_tool_schemas.py) -- accepting it and then
-        # ignoring it would be worse than the current hard rejection. Follow-up:
-        # implement real chunked content fetching and wire all three through.
-        return await get_bill_text_versions(ctx, congress, bill_type, bill_number)
+        try:
+            resolved, content = await load_bill_content(ctx, congress, bill_type, bill_number, version)
+        except BillTextError as e:
+            return format_error_response(CommonErrors.general_error(
+                e.message,
+                [e.remediation] if e.remediation else None,
+                error_code=e.code.upper()
+            ))
+
+        total_chunks = content.total_chunks(chunk_size)
+        if chunk_number > total_chunks:
+            return format_error_response(CommonErrors.invalid_parameter(
+                "chunk_number",
+                chunk_number,
+                f"Invalid chunk number. {content.package_id} has {total_chunks} chunk(s) of up to {chunk_size} bytes each"
+            ))
+
+        start, end = content.chunk_span(chunk_number, chunk_size)
+        first_section, last_section = content.sections_in(start, end)
+        result = [
+            f"# {bill_type.upper()} {bill_number} - {congress}th Congress",
+            f"**Version:** {resolved.version} ({content.package_id})",
+            f"**Chunk:** {chunk_number} of {total_chunks} (bytes {start + 1:,}-{end:,} of {content.total_bytes:,})",
+        ]
+        if first_section:
+            sections = first_section if first_section == last_section else f"{first_section} through {last_section}"
+            result.append(f"**Sections:** {sections}")
+        if resolved.version_resolution_note:
+            result.append(f"**Note:** {resolved.version_resolution_note}")
+        result.extend(["", "## Bill Text", "", content.chunk(chunk_number, chunk_size)])
+
+        if chunk_number < total_chunks:
+            result.extend([
+                "",
+                f"📄 **Note**: This is chunk {chunk_number} of {total_chunks}. Use `chunk_number={chunk_number + 1}` "
+                f"with `version=\"{resolved.version}\"` and the same `chunk_size` to get the next chunk."
+            ])
+
+        return "\n".join(result)
 
     except CongressionalAPIError as e:
         return format_error_response(e.error_response)
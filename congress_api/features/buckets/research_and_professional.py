@@ -148,7 +148,8 @@ async def research_and_professional(
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
     # CRS report parameters
-    report_number: Optional[str] = None
+    report_number: Optional[str] = None,
+    offset: Optional[int] = None
 ) -> ResearchProfessionalResponse:
     """
     Congressional Research and Professional - Access CRS reports and enhanced Congress analytics.
@@ -163,7 +164,7 @@ async def research_and_professional(
     • get_congress_statistics - Statistical analysis across Congresses
     • get_legislative_analysis - Advanced legislative trend analysis
 
-    Key params: operation, congress, keywords, report_number, start_year, end_year
+    Key params: operation, congress, keywords, report_number, start_year, end_year, offset (CRS result paging)
     Returns professional-grade research data with enhanced analytics and historical insights.
     """
     try:
@@ -178,7 +179,8 @@ async def research_and_professional(
             'keywords': keywords,
             'start_year': start_year,
             'end_year': end_year,
-            'report_number': report_number
+            'report_number': report_number,
+            'offset': offset
         }.items():
             if param_value is not None:
                 operation_kwargs[param_name] = param_value
@@ -0,0 +1,364 @@
+"""Persistent FTS5 index over Congressional Research Service report metadata.
+
+``/crsreport`` pages the catalogue newest-first and accepts only format/offset/limit,
+so filtering one API page can never reach an older report. This module mirrors the
+list metadata (and, whenever a report is looked up by number, its summary, topics
+and authors) into a local SQLite FTS5 table, and serves ranked keyword search over
+everything mirrored so far.
+
+Freshness is incremental. A sync walks the list from offset 0 and stops at the
+first page that brings nothing new or changed -- the catalogue is ordered by
+recency, so everything past that point is already mirrored. A walk that runs out of
+pages before reaching that point stores where it stopped, and the next sync resumes
+there once it has caught up with the head. The historical backfill is resumable
+too: each sync continues from the stored offset for a bounded number of pages, so
+no single tool call pays for the whole catalogue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..core.local_cache import cache_enabled, fts_match_expression, index_db_path, open_index_db
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "crs_reports"
+SCHEMA_VERSION = 1
+PAGE_SIZE = 250
+SYNC_TTL_ENV = "CONGRESSMCP_CRS_SYNC_TTL"
+DEFAULT_SYNC_TTL_SECONDS = 6 * 3600
+# Per-call page budgets. The head walk almost always stops after its first page;
+# the backfill budget bounds how long a cold index can hold up one search.
+HEAD_PAGE_BUDGET = 4
+BACKFILL_PAGE_BUDGET = 8
+
+# bm25 column weights, in FTS column order: title, summary, topics, authors.
+_BM25_WEIGHTS = (10.0, 2.0, 4.0, 1.0)
+
+FetchPage = Callable[[int, int], Awaitable[Dict[str, Any]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    status TEXT,
+    content_type TEXT,
+    publish_date TEXT,
+    update_date TEXT,
+    version INTEGER,
+    url TEXT,
+    summary TEXT NOT NULL DEFAULT '',
+    topics TEXT NOT NULL DEFAULT '',
+    authors TEXT NOT NULL DEFAULT ''
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+    title, summary, topics, authors,
+    content='reports', content_rowid='rowid',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS reports_ai AFTER INSERT ON reports BEGIN
+    INSERT INTO reports_fts(rowid, title, summary, topics, authors)
+    VALUES (new.rowid, new.title, new.summary, new.topics, new.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_ad AFTER DELETE ON reports BEGIN
+    INSERT INTO reports_fts(reports_fts, rowid, title, summary, topics, authors)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.topics, old.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_au AFTER UPDATE ON reports BEGIN
+    INSERT INTO reports_fts(reports_fts, rowid, title, summary, topics, authors)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.topics, old.authors);
+    INSERT INTO reports_fts(rowid, title, summary, topics, authors)
+    VALUES (new.rowid, new.title, new.summary, new.topics, new.authors);
+END;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_LIST_FIELDS = ("title", "status", "content_type", "publish_date", "update_date", "version", "url")
+
+
+@dataclass(frozen=True)
+class CRSSearchPage:
+    reports: List[Dict[str, Any]]
+    total: int
+    offset: int
+    any_term: bool
+    indexed: int
+    complete: bool
+
+
+def sync_ttl_seconds() -> int:
+    try:
+        return max(0, int(os.getenv(SYNC_TTL_ENV, str(DEFAULT_SYNC_TTL_SECONDS))))
+    except ValueError:
+        return DEFAULT_SYNC_TTL_SECONDS
+
+
+def _list_row(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    report_id = str(item.get("id") or "").strip()
+    if not report_id:
+        return None
+    return {
+        "id": report_id,
+        "title": item.get("title") or "",
+        "status": item.get("status"),
+        "content_type": item.get("contentType"),
+        "publish_date": item.get("publishDate"),
+        "update_date": item.get("updateDate"),
+        "version": item.get("version"),
+        "url": item.get("url"),
+    }
+
+
+def _joined(entries: Any, key: str) -> str:
+    if not isinstance(entries, list):
+        return ""
+    return "; ".join(str(e.get(key)) for e in entries if isinstance(e, dict) and e.get(key))
+
+
+class CRSReportIndex:
+    def __init__(self, conn: sqlite3.Connection, location: str):
+        self.conn = conn
+        self.location = location
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    # --- meta -------------------------------------------------------------
+
+    def _meta(self, key: str, default: str = "") -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self.conn.execute(
+            "INSERT INTO meta(key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+    @property
+    def last_synced_at(self) -> float:
+        return float(self._meta("last_synced_at", "0") or 0)
+
+    @property
+    def backfill_offset(self) -> int:
+        return int(self._meta("backfill_offset", "0") or 0)
+
+    @property
+    def head_offset(self) -> int:
+        """Where a head walk that ran out of budget stopped; 0 when none is pending."""
+        return int(self._meta("head_offset", "0") or 0)
+
+    @property
+    def complete(self) -> bool:
+        return self._meta("complete") == "1"
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.last_synced_at >= sync_ttl_seconds()
+
+    # --- writes -----------------------------------------------------------
+
+    def upsert_list_items(self, items: List[Dict[str, Any]]) -> int:
+        """Mirror one ``/crsreport`` list page; returns how many rows were new or changed."""
+        changed = 0
+        for item in items:
+            row = _list_row(item) if isinstance(item, dict) else None
+            if row is None:
+                continue
+            current = self.conn.execute(
+                "SELECT update_date, version FROM reports WHERE id = ?", (row["id"],)
+            ).fetchone()
+            if current is None:
+                self.conn.execute(
+                    f"INSERT INTO reports(id, {', '.join(_LIST_FIELDS)}) VALUES (?{', ?' * len(_LIST_FIELDS)})",
+                    (row["id"], *(row[f] for f in _LIST_FIELDS)),
+                )
+                changed += 1
+            elif (current[0], current[1]) != (row["update_date"], row["version"]):
+                self.conn.execute(
+                    f"UPDATE reports SET {', '.join(f'{f} = ?' for f in _LIST_FIELDS)} WHERE id = ?",
+                    (*(row[f] for f in _LIST_FIELDS), row["id"]),
+                )
+                changed += 1
+        self.conn.commit()
+        return changed
+
+    def upsert_detail(self, report: Dict[str, Any]) -> None:
+        """Fold a ``/crsreport/{id}`` detail payload in: the only source of summary, topics, authors."""
+        row = _list_row(report)
+        if row is None:
+            return
+        self.upsert_list_items([report])
+        self.conn.execute(
+            "UPDATE reports SET summary = ?, topics = ?, authors = ? WHERE id = ?",
+            (
+                report.get("summary") or "",
+                _joined(report.get("topics"), "topic"),
+                _joined(report.get("authors"), "author"),
+                row["id"],
+            ),
+        )
+        self.conn.commit()
+
+    # --- sync -------------------------------------------------------------
+
+    async def sync(self, fetch_page: FetchPage) -> None:
+        """Catch up with the head of the catalogue, then advance the backfill."""
+        pending = self.head_offset
+        offset, inserted, caught_up = await self._walk_head(fetch_page, 0)
+        if pending:
+            if caught_up:
+                # New reports only ever land at the head, so the ones an earlier walk
+                # did not reach now start `inserted` rows further down.
+                offset, _, caught_up = await self._walk_head(fetch_page, pending + inserted)
+            else:
+                # This walk fell short too, behind an unknown number of new reports, so
+                # the earlier gap can no longer be located: the backfill re-reads from it.
+                backfill = pending if self.complete else min(self.backfill_offset, pending)
+                self._set_meta("complete", "0")
+                self._set_meta("backfill_offset", backfill)
+        gap = 0 if caught_up else offset
+
+        if not self.complete:
+            # New reports only ever land at the head, which shifts older rows to higher
+            # offsets; resuming from the stored offset can therefore re-read rows (the
+            # upsert is idempotent) but never skip them.
+            backfill = max(self.backfill_offset, offset)
+            if backfill == offset:
+                # The backfill picks up exactly where the head walk stopped.
+                gap = 0
+            for _ in range(BACKFILL_PAGE_BUDGET):
+                items = await _page_items(fetch_page, backfill)
+                self.upsert_list_items(items)
+                if len(items) < PAGE_SIZE:
+                    self._set_meta("complete", "1")
+                    break
+                backfill += PAGE_SIZE
+            self._set_meta("backfill_offset", backfill)
+
+        self._set_meta("head_offset", gap)
+        self._set_meta("last_synced_at", time.time())
+        self.conn.commit()
+
+    async def _walk_head(self, fetch_page: FetchPage, offset: int) -> Tuple[int, int, bool]:
+        """Walk newest-first from ``offset`` until a page brings nothing new or changed.
+
+        Returns the offset the walk stopped at, how many reports it added, and whether
+        it reached mirrored rows (or the end of the catalogue) within HEAD_PAGE_BUDGET.
+        """
+        before = self.count()
+        for _ in range(HEAD_PAGE_BUDGET):
+            items = await _page_items(fetch_page, offset)
+            changed = self.upsert_list_items(items)
+            if len(items) < PAGE_SIZE:
+                # The walk reached the end of the catalogue: nothing left to backfill.
+                self._set_meta("complete", "1")
+                return offset, self.count() - before, True
+            if changed == 0:
+                return offset, self.count() - before, True
+            offset += PAGE_SIZE
+        return offset, self.count() - before, False
+
+    # --- reads ------------------------------------------------------------
+
+    def search(self, keywords: str, limit: int, offset: int = 0) -> CRSSearchPage:
+        """bm25-ranked reports matching every keyword; falls back to any keyword."""
+        page = self._search(keywords, limit, offset, any_term=False)
+        if page.total == 0:
+            page = self._search(keywords, limit, offset, any_term=True)
+        return page
+
+    def _search(self, keywords: str, limit: int, offset: int, *, any_term: bool) -> CRSSearchPage:
+        indexed, complete = self.count(), self.complete
+        expression = fts_match_expression(keywords, any_term=any_term)
+        if expression is None:
+            return CRSSearchPage([], 0, offset, any_term, indexed, complete)
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM reports_fts WHERE reports_fts MATCH ?", (expression,)
+        ).fetchone()[0]
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        rows = self.conn.execute(
+            f"""
+            SELECT r.id, r.title, r.status, r.content_type, r.publish_date, r.update_date,
+                   r.version, r.url, r.topics, r.authors
+            FROM reports_fts
+            JOIN reports r ON r.rowid = reports_fts.rowid
+            WHERE reports_fts MATCH ?
+            ORDER BY bm25(reports_fts, {weights}), r.update_date DESC
+            LIMIT ? OFFSET ?
+            """,
+            (expression, limit, offset),
+        ).fetchall()
+        reports = []
+        for row in rows:
+            report = {
+                "id": row[0],
+                "title": row[1],
+                "status": row[2],
+                "contentType": row[3],
+                "publishDate": row[4],
+                "updateDate": row[5],
+                "version": row[6],
+                "url": row[7],
+            }
+            reports.append({k: v for k, v in report.items() if v is not None})
+        return CRSSearchPage(reports, total, offset, any_term, indexed, complete)
+
+
+async def _page_items(fetch_page: FetchPage, offset: int) -> List[Dict[str, Any]]:
+    data = await fetch_page(offset, PAGE_SIZE)
+    if not isinstance(data, dict) or "error" in data:
+        raise CRSIndexSyncError(json.dumps(data.get("error")) if isinstance(data, dict) else "invalid CRS list page")
+    items = data.get("CRSReports") or []
+    return [item for item in items if isinstance(item, dict)]
+
+
+class CRSIndexSyncError(Exception):
+    """The CRS list endpoint returned an error payload instead of a page."""
+
+
+_index: Optional[CRSReportIndex] = None
+_index_key: Optional[str] = None
+_lock = asyncio.Lock()
+
+
+def get_crs_index() -> CRSReportIndex:
+    """Process-wide index, reopened if the cache location changed (tests, env reload)."""
+    global _index, _index_key
+    key = str(index_db_path(INDEX_NAME, SCHEMA_VERSION)) if cache_enabled() else ":memory:"
+    if _index is not None and _index_key == key:
+        return _index
+    if _index is not None:
+        _index.conn.close()
+    conn, location = open_index_db(INDEX_NAME, SCHEMA_VERSION)
+    _index, _index_key = CRSReportIndex(conn, location), key
+    return _index
+
+
+async def ensure_synced(fetch_page: FetchPage) -> CRSReportIndex:
+    """Return the index, syncing first when it is older than the sync TTL.
+
+    A failed sync is logged and the mirror served as-is: stale results beat none.
+    An index that has never synced re-raises, since there is nothing to serve.
+    """
+    index = get_crs_index()
+    async with _lock:
+        if index.is_stale():
+            try:
+                await index.sync(fetch_page)
+            except Exception as exc:
+                if index.count() == 0:
+                    raise
+                logger.warning(f"CRS index sync failed; serving {index.count()} mirrored reports: {exc}")
+    return index
@@ -1,5 +1,6 @@
 # congress_api/features/crs_reports.py
 import logging
+import sqlite3
 from typing import Dict, List, Any, Optional
 from mcp.server.mcpserver import Context
 from ..mcp_app import mcp
@@ -8,6 +9,8 @@ from ..core.validators import ParameterValidator
 from ..core.api_wrapper import DefensiveAPIWrapper
 from ..core.exceptions import CommonErrors, format_error_response, CongressionalAPIError
 from ..core.response_utils import ResponseProcessor
+from ..core.local_cache import sqlite_supports_fts5
+from .crs_index import CRSIndexSyncError, CRSSearchPage, ensure_synced, get_crs_index
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -145,6 +148,23 @@ def format_crs_reports_list(data: Dict[str, Any]) -> str:
     
     return "\n\n".join(formatted_reports)
 
+def format_crs_search_page(keywords: str, page: CRSSearchPage) -> str:
+    """Formats one page of ranked results from the local CRS index."""
+    first, last = page.offset + 1, page.offset + len(page.reports)
+    lines = [f"Search Results - CRS Reports matching '{keywords}' (results {first}-{last} of {page.total}):"]
+    if page.any_term:
+        lines.append("No report matched every keyword; showing reports that match any of them.")
+    if not page.complete:
+        lines.append(
+            f"Note: the local CRS index has mirrored {page.indexed} reports so far; older reports are "
+            "added as the catalogue backfill continues on later searches."
+        )
+    lines.append("")
+    lines.append("\n\n".join(format_crs_report_item(report) for report in page.reports))
+    if last < page.total:
+        lines.append(f"\nMore results available: repeat the search with offset={last}.")
+    return "\n".join(lines)
+
 # --- MCP Resources (Static/Reference Data Only) ---
 
 # @require_paid_access
@@ -199,18 +219,24 @@ async def search_crs_reports(
     ctx: Context,
     keywords: Optional[str] = None,
     report_number: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    offset: int = 0
 ) -> str:
     """
     Search for CRS reports based on keywords or report number.
     
+    Keyword searches run against a local full-text index of the whole CRS catalogue
+    (titles, plus summaries, topics and authors of reports fetched by number), ranked
+    by relevance; the index catches up with new reports incrementally.
+    
     Args:
         keywords: Optional keywords to search for in report titles and content.
         report_number: Optional specific report number to search for.
         limit: Maximum number of results to return (default: 10).
+        offset: Number of ranked results to skip, for pagination (default: 0).
     """
     try:
-        logger.debug(f"Searching for CRS reports with keywords: {keywords}, report_number: {report_number}, limit: {limit}")
+        logger.debug(f"Searching for CRS reports with keywords: {keywords}, report_number: {report_number}, limit: {limit}, offset: {offset}")
         
         # Parameter validation
         validator = ParameterValidator()
@@ -224,6 +250,9 @@ async def search_crs_reports(
         sanitized_limit = limit_validation.sanitized_value
         if sanitized_limit != limit:
             logger.info(f"Limit auto-corrected from {limit} to {sanitized_limit}")
+
+        if offset is None or offset < 0:
+            return format_error_response(CommonErrors.invalid_parameter("offset", "Offset must be zero or a positive integer"))
         
         # Validate report number if provided
         if report_number:
@@ -249,6 +278,14 @@ async def search_crs_reports(
             # Check if there was an error in the response
             if isinstance(data, dict) and 'error' in data:
                 return format_error_response(CommonErrors.data_not_found(f"CRS report '{report_number}' not found"))
+
+            # The detail payload is the only source of summary, topics and authors;
+            # fold it into the local index so later keyword searches can match them.
+            if sqlite_supports_fts5() and isinstance(data, dict) and isinstance(data.get('CRSReport'), dict):
+                try:
+                    get_crs_index().upsert_detail(data['CRSReport'])
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not index CRS report {report_number}: {e}")
             
             # Format the response
             return format_crs_report_detail(data)
@@ -256,61 +293,89 @@ async def search_crs_reports(
         # If no keywords provided, guide user
         if not keywords:
             return format_error_response(CommonErrors.invalid_parameter("keywords", "Please provide either 'keywords' for searching recent reports or 'report_number' for a specific report (e.g., 'R47175')"))
-        
-        # Option B: Keyword Search - search larger batch of recent reports
-        search_limit = min(250, max(sanitized_limit * 5, 50))  # Search more than requested to improve filtering
-        params = {
-            'format': 'json',
-            'limit': search_limit
-        }
-        
-        logger.debug(f"Searching CRS reports with keywords '{keywords}' (search_limit: {search_limit}, return_limit: {sanitized_limit})")
-        
-        # Make the API request to get recent reports
-        data = await safe_crs_reports_request(
-            endpoint="/crsreport",
-            params=params,
-            ctx=ctx
-        )
-        
-        # Check if there was an error in the response
-        if isinstance(data, dict) and 'error' in data:
-            return format_error_response(CommonErrors.api_server_error(f"Error retrieving CRS reports: {data['error']}"))
-        
-        # Filter results by keywords and apply limit
-        if 'CRSReports' in data and data['CRSReports']:
-            filtered_reports = []
-            keywords_lower = keywords.lower()
-            
-            for report in data['CRSReports']:
-                title = report.get('title', '').lower()
-                if keywords_lower in title:
-                    filtered_reports.append(report)
-                    if len(filtered_reports) >= sanitized_limit:
-                        break
-            
-            if filtered_reports:
-                # Apply response deduplication
-                deduplicated_reports = ResponseProcessor.deduplicate_results(
-                    filtered_reports, 
-                    key_fields=['id']
-                )
-                
-                logger.debug(f"Found {len(filtered_reports)} matching reports (after deduplication: {len(deduplicated_reports)})")
-                
-                # Format the filtered results
-                formatted_reports = []
-                for report in deduplicated_reports:
-                    formatted_reports.append(format_crs_report_item(report))
-                
-                return f"Search Results - CRS Reports matching '{keywords}':\n\n" + "\n\n".join(formatted_reports)
-            else:
-                return format_error_response(CommonErrors.data_not_found(f"No CRS reports found matching keywords: '{keywords}'"))
-        else:
+
+        if not sqlite_supports_fts5():
+            return await _search_recent_titles(ctx, keywords, sanitized_limit)
+
+        # Option B: Keyword Search over the local index of the whole catalogue
+        async def fetch_page(page_offset: int, page_limit: int) -> Dict[str, Any]:
+            return await safe_crs_reports_request(
+                endpoint="/crsreport",
+                params={'format': 'json', 'offset': page_offset, 'limit': page_limit},
+                ctx=ctx
+            )
+
+        try:
+            index = await ensure_synced(fetch_page)
+        except CRSIndexSyncError as e:
+            return format_error_response(CommonErrors.api_server_error(f"Error retrieving CRS reports: {e}"))
+
+        if index.count() == 0:
             return format_error_response(CommonErrors.data_not_found("No CRS reports available"))
+
+        page = index.search(keywords, sanitized_limit, offset)
+        logger.debug(f"CRS index search '{keywords}': {page.total} matches, returning {len(page.reports)} from offset {offset}")
+        if not page.reports:
+            if page.total:
+                return format_error_response(CommonErrors.invalid_parameter("offset", f"Offset {offset} is past the last of {page.total} matching reports"))
+            return format_error_response(CommonErrors.data_not_found(f"No CRS reports found matching keywords: '{keywords}'"))
+        return format_crs_search_page(keywords, page)
             
     except CongressionalAPIError as e:
         return format_error_response(e.error_response)
     except Exception as e:
         logger.error(f"Exception in search_crs_reports: {str(e)}")
         return format_error_response(CommonErrors.general_error(f"Error searching CRS reports: {str(e)}"))
+
+async def _search_recent_titles(ctx: Context, keywords: str, sanitized_limit: int) -> str:
+    """Title substring filter over the latest reports, for SQLite builds without FTS5."""
+    search_limit = min(250, max(sanitized_limit * 5, 50))  # Search more than requested to improve filtering
+    params = {
+        'format': 'json',
+        'limit': search_limit
+    }
+    
+    logger.debug(f"Searching CRS reports with keywords '{keywords}' (search_limit: {search_limit}, return_limit: {sanitized_limit})")
+    
+    # Make the API request to get recent reports
+    data = await safe_crs_reports_request(
+        endpoint="/crsreport",
+        params=params,
+        ctx=ctx
+    )
+    
+    # Check if there was an error in the response
+    if isinstance(data, dict) and 'error' in data:
+        return format_error_response(CommonErrors.api_server_error(f"Error retrieving CRS reports: {data['error']}"))
+    
+    # Filter results by keywords and apply limit
+    if 'CRSReports' in data and data['CRSReports']:
+        filtered_reports = []
+        keywords_lower = keywords.lower()
+        
+        for report in data['CRSReports']:
+            title = report.get('title', '').lower()
+            if keywords_lower in title:
+                filtered_reports.append(report)
+                if len(filtered_reports) >= sanitized_limit:
+                    break
+        
+        if filtered_reports:
+            # Apply response deduplication
+            deduplicated_reports = ResponseProcessor.deduplicate_results(
+                filtered_reports, 
+                key_fields=['id']
+            )
+            
+            logger.debug(f"Found {len(filtered_reports)} matching reports (after deduplication: {len(deduplicated_reports)})")
+            
+            # Format the filtered results
+            formatted_reports = []
+            for report in deduplicated_reports:
+                formatted_reports.append(format_crs_report_item(report))
+            
+            return f"Search Results - CRS Reports matching '{keywords}':\n\n" + "\n\n".join(formatted_reports)
+        else:
+            return format_error_response(CommonErrors.data_not_found(f"No CRS reports found matching keywords: '{keywords}'"))
+    else:
+        return format_error_response(CommonErrors.data_not_found("No CRS reports available"))
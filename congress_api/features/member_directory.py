@@ -0,0 +1,361 @@
+"""In-memory member directory snapshot behind ``search_members``.
+
+Name, party and chamber are not API filters, so every such search used to page a
+whole ``/member/congress/{n}`` list (up to 2,000 rows, three Congresses for a name
+search) and filter it. The directory instead keeps each Congress's list in memory
+for a refresh interval and indexes it once -- bioguide id to record, plus posting
+sets by state, district, party, chamber and Congress, and a trigram index over
+normalised names -- so repeated searches resolve locally without API calls.
+
+Name matching is typo-tolerant. Names are casefolded with diacritics removed and
+common nicknames mapped to their formal given name ("Chuck" -> "charles") on both
+sides, then each member is scored in one pass: 1.0 for a normalised substring or
+an every-token match, otherwise the mean per-token similarity (prefix, one or two
+transpositions/edits, trigram overlap). Members below ``FUZZY_THRESHOLD`` drop out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.member_terms import latest_term_of
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL_ENV = "CONGRESSMCP_MEMBER_DIRECTORY_TTL"
+DEFAULT_SNAPSHOT_TTL_SECONDS = 12 * 3600
+
+LoadCongress = Callable[[int], Awaitable[Dict[str, Any]]]
+
+# Member list rows carry the full state name; searches are by postal code.
+STATE_CODES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "florida": "FL", "georgia": "GA",
+    "hawaii": "HI", "idaho": "ID", "illinois": "IL", "indiana": "IN", "iowa": "IA",
+    "kansas": "KS", "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD",
+    "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS", "missouri": "MO",
+    "montana": "MT", "nebraska": "NE", "nevada": "NV", "new hampshire": "NH", "new jersey": "NJ",
+    "new mexico": "NM", "new york": "NY", "north carolina": "NC", "north dakota": "ND", "ohio": "OH",
+    "oklahoma": "OK", "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
+    "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT",
+    "virginia": "VA", "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+    "district of columbia": "DC", "puerto rico": "PR", "guam": "GU", "american samoa": "AS",
+    "virgin islands": "VI", "northern mariana islands": "MP",
+}
+
+# Nickname -> formal given name, applied to query and member names alike, so either
+# form on either side meets in the middle.
+NICKNAMES = {
+    "abe": "abraham", "al": "albert", "alex": "alexander", "andy": "andrew", "ben": "benjamin",
+    "bernie": "bernard", "bill": "william", "billy": "william", "bob": "robert", "bobby": "robert",
+    "brad": "bradley", "charlie": "charles", "chris": "christopher", "chuck": "charles",
+    "dan": "daniel", "danny": "daniel", "dave": "david", "dick": "richard", "don": "donald",
+    "doug": "douglas", "ed": "edward", "eddie": "edward", "fred": "frederick", "greg": "gregory",
+    "jack": "john", "jake": "jacob", "jeff": "jeffrey", "jerry": "gerald", "jim": "james",
+    "jimmy": "james", "joe": "joseph", "johnny": "john", "jon": "jonathan", "josh": "joshua",
+    "ken": "kenneth", "kenny": "kenneth", "larry": "lawrence", "liz": "elizabeth", "maggie": "margaret",
+    "matt": "matthew", "mike": "michael", "nick": "nicholas",
+    "pat": "patrick", "pete": "peter", "phil": "philip", "ron": "ronald", "sam": "samuel",
+    "steve": "stephen", "ted": "edward", "tim": "timothy", "tom": "thomas", "tommy": "thomas",
+    "tony": "anthony", "vince": "vincent", "will": "william",
+}
+
+FUZZY_THRESHOLD = 0.75
+
+_PARTIES = {"democratic": "D", "d": "D", "republican": "R", "r": "R", "independent": "I", "i": "I"}
+
+
+def snapshot_ttl_seconds() -> int:
+    try:
+        return max(0, int(os.getenv(SNAPSHOT_TTL_ENV, str(DEFAULT_SNAPSHOT_TTL_SECONDS))))
+    except ValueError:
+        return DEFAULT_SNAPSHOT_TTL_SECONDS
+
+
+def normalize_name(text: str) -> str:
+    """Casefold, strip diacritics, drop apostrophes/periods and turn hyphens into spaces."""
+    decomposed = unicodedata.normalize("NFKD", str(text or ""))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    stripped = re.sub(r"['\u2019.]", "", stripped).replace("-", " ")
+    return re.sub(r"\s+", " ", stripped).strip()
+
+
+def name_tokens(normalized: str) -> List[str]:
+    return [NICKNAMES.get(token, token) for token in re.findall(r"[^\W_]+", normalized)]
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def token_trigrams(token: str) -> Set[str]:
+    # Padded, so even a two-letter token and a token's first/last letters count.
+    return trigrams(f"  {token} ")
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance (adjacent transposition = 1), capped at ``limit + 1``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def token_similarity(query: str, candidate: str) -> float:
+    if query == candidate:
+        return 1.0
+    if len(query) >= 3 and candidate.startswith(query):
+        return 0.9
+    if len(query) >= 4:
+        limit = 2 if len(query) >= 8 else 1
+        distance = edit_distance(query, candidate, limit)
+        if distance <= limit:
+            return 0.9 - 0.1 * distance
+    q, c = token_trigrams(query), token_trigrams(candidate)
+    return len(q & c) / len(q | c)
+
+
+def member_names(member: Dict[str, Any]) -> List[str]:
+    """Every name rendering of a member record, normalised."""
+    names = []
+    for field in ("directOrderName", "invertedOrderName"):
+        if member.get(field):
+            names.append(member[field])
+    name = member.get("name")
+    if isinstance(name, str):
+        names.append(name)
+    elif isinstance(name, dict):
+        first, last = name.get("firstName", ""), name.get("lastName", "")
+        if first and last:
+            names += [f"{first} {last}", f"{last}, {first}"]
+        names += [n for n in (first, last) if n]
+    return list(dict.fromkeys(normalize_name(n) for n in names if n))
+
+
+def member_party(member: Dict[str, Any]) -> str:
+    party = ""
+    history = member.get("partyHistory")
+    if isinstance(history, list) and history and isinstance(history[0], dict):
+        party = history[0].get("partyAbbreviation", "")
+    elif "partyName" in member:
+        party = member["partyName"]
+    elif "party" in member:
+        party = member["party"]
+    return _PARTIES.get(str(party or "").lower(), str(party or ""))
+
+
+def member_state_code(member: Dict[str, Any]) -> str:
+    state = str(member.get("state") or "").strip()
+    if len(state) == 2:
+        return state.upper()
+    return STATE_CODES.get(state.lower(), "")
+
+
+class MemberDirectory:
+    def __init__(self):
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.loaded_at: Dict[int, float] = {}
+        self._rows_by_congress: Dict[int, List[Dict[str, Any]]] = {}
+        self.by_congress: Dict[int, List[str]] = {}
+        self.by_state: Dict[str, Set[str]] = {}
+        self.by_district: Dict[tuple, Set[str]] = {}
+        self.by_party: Dict[str, Set[str]] = {}
+        self.by_chamber: Dict[str, Set[str]] = {}
+        self.current: Set[str] = set()
+        self.names: Dict[str, List[str]] = {}
+        self.tokens: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def from_members(cls, members: Iterable[Dict[str, Any]], congress: int = 0) -> "MemberDirectory":
+        """A one-off directory over an already-fetched list (no snapshot, no refresh)."""
+        directory = cls()
+        directory.replace_congress(congress, list(members))
+        return directory
+
+    def is_fresh(self, congress: int, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        loaded = self.loaded_at.get(congress)
+        return loaded is not None and now - loaded < snapshot_ttl_seconds()
+
+    def replace_congress(self, congress: int, members: List[Dict[str, Any]]) -> None:
+        self._rows_by_congress[congress] = [m for m in members if isinstance(m, dict) and m.get("bioguideId")]
+        self.loaded_at[congress] = time.time()
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        records: Dict[str, Dict[str, Any]] = {}
+        by_congress: Dict[int, List[str]] = {}
+        by_state: Dict[str, Set[str]] = defaultdict(set)
+        by_district: Dict[tuple, Set[str]] = defaultdict(set)
+        by_party: Dict[str, Set[str]] = defaultdict(set)
+        by_chamber: Dict[str, Set[str]] = defaultdict(set)
+        current: Set[str] = set()
+        names: Dict[str, List[str]] = {}
+        tokens: Dict[str, Set[str]] = {}
+        grams: Dict[str, Set[str]] = defaultdict(set)
+
+        # Oldest Congress first, so the newest copy of a member's record wins.
+        for congress in sorted(self._rows_by_congress):
+            ids = []
+            for member in self._rows_by_congress[congress]:
+                bioguide = member["bioguideId"]
+                ids.append(bioguide)
+                records[bioguide] = member
+            by_congress[congress] = list(dict.fromkeys(ids))
+
+        for bioguide, member in records.items():
+            state = member_state_code(member)
+            if state:
+                by_state[state].add(bioguide)
+                if member.get("district") is not None:
+                    by_district[(state, str(member["district"]))].add(bioguide)
+            by_party[member_party(member)].add(bioguide)
+            term = latest_term_of(member.get("terms"))
+            if term:
+                chamber = str(term.get("chamber", "")).lower()
+                by_chamber["senate" if chamber.startswith("senate") else "house"].add(bioguide)
+                if term.get("endYear") in (None, "", "Present"):
+                    current.add(bioguide)
+            names[bioguide] = member_names(member)
+            tokens[bioguide] = {token for name in names[bioguide] for token in name_tokens(name)}
+            for token in tokens[bioguide]:
+                for gram in token_trigrams(token):
+                    grams[gram].add(bioguide)
+
+        self.records, self.by_congress = records, by_congress
+        self.by_state, self.by_district = dict(by_state), dict(by_district)
+        self.by_party, self.by_chamber = dict(by_party), dict(by_chamber)
+        self.current, self.names, self.tokens, self._trigrams = current, names, tokens, dict(grams)
+
+    def name_matches(self, name: str) -> Dict[str, float]:
+        """Members whose name matches ``name``, scored in (FUZZY_THRESHOLD, 1.0]."""
+        query = normalize_name(name)
+        wanted = name_tokens(query)
+        if not wanted:
+            return {}
+        candidates: Set[str] = set()
+        for token in wanted:
+            for gram in token_trigrams(token):
+                candidates |= self._trigrams.get(gram, set())
+
+        scores: Dict[str, float] = {}
+        for bioguide in candidates:
+            if any(query in rendering for rendering in self.names[bioguide]):
+                scores[bioguide] = 1.0
+                continue
+            have = self.tokens[bioguide]
+            score = sum(max(token_similarity(t, h) for h in have) for t in wanted) / len(wanted)
+            if score >= FUZZY_THRESHOLD:
+                scores[bioguide] = score
+        return scores
+
+    def query(
+        self,
+        congresses: List[int],
+        state: Optional[str] = None,
+        district: Optional[int] = None,
+        party: Optional[str] = None,
+        chamber: Optional[str] = None,
+        current_only: bool = False,
+        name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Members of any of ``congresses`` passing every filter.
+
+        In list order (newest Congress first), or best name match first when a
+        name is given.
+        """
+        return self.query_scored(
+            congresses, state=state, district=district, party=party,
+            chamber=chamber, current_only=current_only, name=name,
+        )[0]
+
+    def query_scored(
+        self,
+        congresses: List[int],
+        state: Optional[str] = None,
+        district: Optional[int] = None,
+        party: Optional[str] = None,
+        chamber: Optional[str] = None,
+        current_only: bool = False,
+        name: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """``query``, plus the name score of every member matched (empty without a name)."""
+        ordered: List[str] = []
+        for congress in congresses:
+            ordered.extend(self.by_congress.get(congress, []))
+        ordered = list(dict.fromkeys(ordered))
+
+        filters: List[Set[str]] = []
+        if state:
+            filters.append(self.by_state.get(state, set()))
+        if state and district is not None:
+            filters.append(self.by_district.get((state, str(district)), set()))
+        if party:
+            filters.append(self.by_party.get(party, set()))
+        if chamber:
+            filters.append(self.by_chamber.get(chamber, set()))
+        if current_only:
+            filters.append(self.current)
+        scores: Dict[str, float] = {}
+        if name:
+            scores = self.name_matches(name)
+            filters.append(set(scores))
+        filters.sort(key=len)
+        matched = [b for b in ordered if all(b in f for f in filters)]
+        if scores:
+            # sorted() is stable: equal scores keep list order.
+            matched.sort(key=lambda b: -scores[b])
+        return [self.records[b] for b in matched], {b: scores[b] for b in matched if b in scores}
+
+
+_directory = MemberDirectory()
+# One lock per Congress: a cold load of one Congress must not hold up searches of another.
+_locks: Dict[int, asyncio.Lock] = {}
+
+
+def get_member_directory() -> MemberDirectory:
+    return _directory
+
+
+async def ensure_congress(congress: int, load: LoadCongress) -> MemberDirectory:
+    """Load (or refresh) one Congress's snapshot. Load errors propagate to the caller.
+
+    A fresh snapshot is served without locking, and so is a stale one while another
+    search is already refreshing it; only a Congress with no snapshot waits for its load.
+    """
+    if _directory.is_fresh(congress):
+        return _directory
+    lock = _locks.setdefault(congress, asyncio.Lock())
+    if lock.locked() and congress in _directory.loaded_at:
+        return _directory
+    async with lock:
+        if not _directory.is_fresh(congress):
+            data = await load(congress)
+            if "error" in data:
+                raise MemberDirectoryLoadError(str(data["error"]))
+            _directory.replace_congress(congress, data.get("members", []))
+            logger.info(f"Member directory: loaded {len(_directory.by_congress.get(congress, []))} members of Congress {congress}")
+    return _directory
+
+
+class MemberDirectoryLoadError(Exception):
+    """A Congress's member list came back as an error payload."""
@@ -5,8 +5,10 @@ from ..mcp_app import mcp
 from ..core.validators import ParameterValidator
 from ..core.api_wrapper import DefensiveAPIWrapper, safe_congressional_request
 from ..core.congress_dates import current_congress
+from ..core.member_terms import latest_term_of
 from ..core.exceptions import CommonErrors, format_error_response, CongressionalAPIError
 from ..core.response_utils import ResponseProcessor
+from .member_directory import MemberDirectory, MemberDirectoryLoadError, ensure_congress
 import logging
 
 logger = logging.getLogger(__name__)
@@ -540,7 +542,7 @@ async def search_members(
     Search for members of Congress based on various criteria.
     
     Args:
-        name: Optional name to search for
+        name: Optional name to search for (tolerates typos, diacritics and common nicknames)
         state: Optional state abbreviation (e.g., 'CA', 'TX')
         party: Optional party affiliation ('D', 'R', 'I')
         chamber: Optional chamber ('house' or 'senate')
@@ -607,180 +609,76 @@ async def search_members(
                     "district", district, "District must be a positive integer (e.g., 1, 2, 10)"
                 ))
         
-        # Build search parameters
-        params = {"limit": limit}
-        if current_member:
-            params["currentMember"] = "true"
-        
-        # Determine the best API endpoint based on provided parameters.
-        # Prefer the congress-scoped endpoints when a congress is given; the
-        # bare /member/{state} endpoint ignores congress entirely.
-        endpoint = "/member"
-        if congress and state and district:
-            endpoint = f"/member/congress/{congress}/{state}/{district}"
-        elif congress and state:
-            endpoint = f"/member/congress/{congress}/{state}"
-        elif state and district:
-            endpoint = f"/member/{state}/{district}"
-        elif state:
-            endpoint = f"/member/{state}"
-        elif congress:
-            endpoint = f"/member/congress/{congress}"
-
-        # chamber / party / name are filtered client-side, so a single page of
-        # `limit` rows is not enough -- the matches may sit on a later page
-        # (e.g. a state's senators after its representatives).
-        needs_all_pages = any([name, chamber, party])
+        if congress or current_member or name:
+            # Resolve locally against the member directory snapshot: one paged load
+            # per Congress per refresh interval instead of per search.
+            async def load(search_congress: int) -> Dict[str, Any]:
+                return await get_all_members_paginated(ctx, f"/member/congress/{search_congress}", {})
 
-        # For name-only searches, we need comprehensive data across congresses
-        # Use pagination to get all members
-        if name and not any([state, congress, district, chamber, party]):
-            # Progressive search strategy: current congress first, then previous
             newest = current_congress()
-            congress_search_order = [newest, newest - 1, newest - 2]
-            
-            all_members = []
+            if congress:
+                congress_search_order = [congress]
+            elif name:
+                # Progressive search strategy: current congress first, then previous
+                congress_search_order = [newest, newest - 1, newest - 2]
+            else:
+                congress_search_order = [newest]
+
+            searched = []
+            available = 0
+            filtered_members = []
+            exact_name = True
             for search_congress in congress_search_order:
                 try:
-                    congress_members = await get_all_members_paginated(
-                        ctx, f"/member/congress/{search_congress}", params
-                    )
+                    directory = await ensure_congress(search_congress, load)
                 except CongressionalAPIError:
+                    if len(congress_search_order) == 1:
+                        raise
                     continue  # Skip this congress if error, try next
-                if "error" in congress_members:
-                    continue  # Skip this congress if error, try next
-                
-                members_list = congress_members.get("members", [])
-                if members_list:
-                    all_members.extend(members_list)
-                
-                # Early termination if we find matches
+                except MemberDirectoryLoadError as e:
+                    if len(congress_search_order) == 1:
+                        return format_error_response(CommonErrors.api_server_error(f"Error searching members: {e}"))
+                    continue
+                searched.append(search_congress)
+                available = sum(len(directory.by_congress.get(c, [])) for c in searched)
+                filtered_members, scores = directory.query_scored(
+                    searched, state=state, district=district, party=party,
+                    chamber=chamber, current_only=current_member, name=name
+                )
                 if name:
-                    # Quick check if any member might match the name
-                    potential_matches = []
-                    search_name = name.lower().strip()
-                    for member in members_list:
-                        member_names = []
-                        if "directOrderName" in member and member["directOrderName"]:
-                            member_names.append(member["directOrderName"].lower())
-                        if "invertedOrderName" in member and member["invertedOrderName"]:
-                            member_names.append(member["invertedOrderName"].lower())
-                        if isinstance(member.get("name"), str):
-                            member_names.append(member["name"].lower())
-                        
-                        if any(search_name in member_name for member_name in member_names):
-                            potential_matches.append(member)
-                    
-                    if potential_matches:
-                        # Found matches in this congress, no need to search further back
-                        break
-            
-            # Use the aggregated data
-            data = {"members": all_members}
-        elif needs_all_pages:
-            data = await get_all_members_paginated(ctx, endpoint, params)
+                    exact_name = 1.0 in scores.values()
+                if filtered_members and exact_name:
+                    # Found matches in this congress, no need to search further back
+                    break
         else:
-            # Use single endpoint request for other cases
-            data = await safe_congressional_request(endpoint, ctx, params, endpoint_type='members')
-        
-        if "error" in data:
-            return format_error_response(CommonErrors.api_server_error(f"Error searching members: {data['error']}"))
-        
-        members = data.get("members", [])
-        if not members:
+            # Former members outside any snapshot Congress: ask the API directly.
+            params = {"limit": limit}
+            endpoint = "/member"
+            if state and district:
+                endpoint = f"/member/{state}/{district}"
+            elif state:
+                endpoint = f"/member/{state}"
+
+            # chamber / party are filtered client-side, so a single page of `limit`
+            # rows is not enough -- the matches may sit on a later page.
+            if chamber or party:
+                data = await get_all_members_paginated(ctx, endpoint, params)
+            else:
+                data = await safe_congressional_request(endpoint, ctx, params, endpoint_type='members')
+
+            if "error" in data:
+                return format_error_response(CommonErrors.api_server_error(f"Error searching members: {data['error']}"))
+
+            members = data.get("members", [])
+            available = len(members)
+            filtered_members = MemberDirectory.from_members(members).query(
+                [0], party=party, chamber=chamber
+            )
+            exact_name = True
+
+        if not available:
             return "No members found matching the specified criteria."
         
-        # Debug: Log the first few members and their name fields
-        if name and len(members) > 0:
-            logger.info(f"DEBUG: Searching for name '{name}' in {len(members)} members")
-            for i, member in enumerate(members[:3]):  # Log first 3 members
-                name_fields = {
-                    "directOrderName": member.get("directOrderName"),
-                    "invertedOrderName": member.get("invertedOrderName"),
-                    "name": member.get("name"),
-                    "bioguideId": member.get("bioguideId")
-                }
-                logger.info(f"DEBUG: Member {i+1} name fields: {name_fields}")
-        
-        # Apply client-side filtering for parameters not supported by the API endpoint
-        filtered_members = []
-        
-        for member in members:
-            # Filter by name if provided
-            if name:
-                member_names = []
-                
-                # Collect all possible name representations
-                if "directOrderName" in member and member["directOrderName"]:
-                    member_names.append(member["directOrderName"].lower())
-                if "invertedOrderName" in member and member["invertedOrderName"]:
-                    member_names.append(member["invertedOrderName"].lower())
-                if isinstance(member.get("name"), str):
-                    member_names.append(member["name"].lower())
-                elif isinstance(member.get("name"), dict):
-                    name_dict = member["name"]
-                    first = name_dict.get("firstName", "")
-                    last = name_dict.get("lastName", "")
-                    if first and last:
-                        member_names.append(f"{first} {last}".lower())
-                        member_names.append(f"{last}, {first}".lower())
-                    if first:
-                        member_names.append(first.lower())
-                    if last:
-                        member_names.append(last.lower())
-                
-                # Check if the search name matches any of the member name representations
-                search_name = name.lower().strip()
-                name_match = any(search_name in member_name for member_name in member_names)
-                
-                # Debug: Log the name matching attempt
-                bioguide_id = member.get("bioguideId", "unknown")
-                logger.info(f"DEBUG: Matching '{search_name}' against {member_names} (bioguideId: {bioguide_id}): {name_match}")
-                
-                if not name_match:
-                    continue
-            
-            # Filter by party if provided
-            if party:
-                member_party = ""
-                if "partyHistory" in member and isinstance(member["partyHistory"], list) and member["partyHistory"]:
-                    party_history = member["partyHistory"][0]
-                    if isinstance(party_history, dict):
-                        member_party = party_history.get("partyAbbreviation", "")
-                elif "partyName" in member:
-                    member_party = member["partyName"]
-                elif "party" in member:
-                    member_party = member["party"]
-                
-                # Normalize member party for comparison
-                if member_party.lower() in ["democratic", "d"]:
-                    member_party = "D"
-                elif member_party.lower() in ["republican", "r"]:
-                    member_party = "R"
-                elif member_party.lower() in ["independent", "i"]:
-                    member_party = "I"
-                
-                if party != member_party:
-                    continue
-            
-            # Filter by chamber if provided
-            if chamber:
-                member_chamber = ""
-                latest_term = latest_term_of(member.get("terms"))
-                if latest_term:
-                    member_chamber = latest_term.get("chamber", "").lower()
-                # API values are "House of Representatives" / "Senate"
-                if not member_chamber.startswith(chamber):
-                    continue
-            
-            filtered_members.append(member)
-        
-        # Process and deduplicate results
-        filtered_members = response_processor.deduplicate_results(
-            filtered_members, 
-            key_fields=["bioguideId"]
-        )
-        
         # Apply limit to filtered results
         if len(filtered_members) > limit:
             filtered_members = filtered_members[:limit]
@@ -790,6 +688,9 @@ async def search_members(
         
         # Format results
         result = ["# Member Search Results"]
+        if name and not exact_name:
+            # Say so explicitly, so near-misses are not mistaken for the person asked for.
+            result.append(f"No exact name match for '{name}'; closest matches by spelling shown, best first.")
         result.append(f"Found {len(filtered_members)} members:")
         
         for member in filtered_members:
@@ -984,29 +885,6 @@ async def get_all_members_paginated(ctx: Context, endpoint: str, base_params: Di
         logger.error(f"Error in get_all_members_paginated: {str(e)}")
         return {"error": f"Pagination error: {str(e)}"}
 
-def latest_term_of(terms):
-    """Return the member's most recent term.
-
-    The API lists terms oldest-first, but don't rely on order: pick the term
-    with the greatest startYear (an open endYear wins ties).
-    """
-    if isinstance(terms, dict) and "item" in terms:
-        terms = terms["item"]
-    if not isinstance(terms, list) or not terms:
-        return None
-    dict_terms = [t for t in terms if isinstance(t, dict)]
-    if not dict_terms:
-        return None
-
-    def _key(t):
-        start = t.get("startYear")
-        start = int(start) if str(start).isdigit() else -1
-        open_ended = 1 if t.get("endYear") in (None, "", "Present") else 0
-        return (start, open_ended)
-
-    return max(dict_terms, key=_key)
-
-
 # Formatting helpers
 def format_member_summary(member: Dict[str, Any]) -> str:
     """Format a member into a readable summary."""
@@ -10,9 +10,11 @@ from ..core.client_handler import make_api_request
 from ..core.api_wrapper import safe_congressional_request
 from ..core.validators import ParameterValidator
 from datetime import datetime, timedelta, timezone
-from ..core.congress_dates import congress_start_date, iso_utc
+from ..core.congress_dates import congress_start_date, current_congress, iso_utc
 from ..core.exceptions import CommonErrors, format_error_response, CongressionalAPIError
 from ..core.response_utils import SummariesProcessor, clean_summaries_response
+from ..core.local_cache import sqlite_supports_fts5
+from .summaries_index import Coverage, SummariesIndexSyncError, SummaryHit, ensure_synced, sync_window_end
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -91,6 +93,30 @@ def format_summaries_list(summaries: List[Dict[str, Any]], title: str) -> str:
     
     return "\n".join(result)
 
+def format_summary_hits(hits: List[SummaryHit], title: str, total: int, coverage: Coverage) -> str:
+    """Format ranked summary-index hits, each with the snippet that matched."""
+    result = [f"# {title}\n"]
+    result.append(f"**Found {total} summaries** (showing {len(hits)}, ranked by relevance)\n")
+    if not coverage.caught_up:
+        result.append(f"_Local summary index for the {coverage.congress}th Congress is still backfilling "
+                      f"({coverage.indexed} summaries so far); later searches extend it._\n")
+
+    for i, hit in enumerate(hits, 1):
+        summary = hit.summary
+        bill = summary.get("bill", {})
+        result.append(f"## {i}. {str(bill.get('type', 'Unknown')).upper()} {bill.get('number', 'Unknown')} "
+                      f"({bill.get('congress', 'Unknown')}th Congress)")
+        result.append(f"**Title:** {bill.get('title', 'Untitled')}")
+        result.append(f"**Action:** {summary.get('actionDesc', 'Unknown action')} on {summary.get('actionDate', 'Unknown date')}")
+        if hit.snippet:
+            result.append(f"**Match:** {hit.snippet}")
+        bill_url = bill.get("url", "")
+        if bill_url:
+            result.append(f"\n[View Bill Details]({bill_url})")
+        result.append("")
+
+    return "\n".join(result)
+
 # Resources
 @mcp.resource("congress://summaries/latest")
 async def get_latest_summaries() -> str:
@@ -493,6 +519,10 @@ async def search_summaries(
         sort: Sort order (default: "updateDate+desc")
         fromDateTime: Optional start date for filtering (format: YYYY-MM-DDT00:00:00Z)
         toDateTime: Optional end date for filtering (format: YYYY-MM-DDT00:00:00Z)
+
+    With keywords, the search runs against a local full-text index of summary text
+    for the requested Congress (the current one by default) and ranks matches with
+    snippets; fromDateTime/toDateTime then bound the summary's action date.
     """
     logger.info(f"Searching for summaries with keywords: {keywords}")
     
@@ -538,6 +568,9 @@ async def search_summaries(
                     CommonErrors.invalid_parameter("toDateTime", toDateTime, date_validation.error_message, date_validation.suggestions)
                 )
         
+        if keywords and sqlite_supports_fts5():
+            return await _search_summaries_index(ctx, keywords, congress, bill_type, limit, fromDateTime, toDateTime)
+
         # Build API request parameters
         params = {
             # Increase the limit to get more results for filtering
@@ -614,6 +647,43 @@ async def search_summaries(
             CommonErrors.api_server_error("/summaries", str(e))
         )
 
+async def _search_summaries_index(
+    ctx: Context,
+    keywords: str,
+    congress: Optional[int],
+    bill_type: Optional[str],
+    limit: int,
+    fromDateTime: Optional[str],
+    toDateTime: Optional[str]
+) -> str:
+    """Keyword search over the local summaries index, advancing its mirror first."""
+    scope = congress if congress is not None else current_congress()
+
+    async def fetch_page(page_congress: int, since: str, offset: int, page_limit: int) -> Dict[str, Any]:
+        params = {
+            "fromDateTime": since,
+            "toDateTime": sync_window_end(),
+            "sort": "updateDate+asc",
+            "offset": offset,
+            "limit": page_limit
+        }
+        return await safe_congressional_request(f"/summaries/{page_congress}", ctx, params, endpoint_type='summaries')
+
+    try:
+        index = await ensure_synced(scope, fetch_page)
+    except SummariesIndexSyncError as e:
+        return format_error_response(CommonErrors.api_server_error(f"/summaries/{scope}", str(e)))
+
+    hits, total = index.search(
+        keywords, limit, congress=congress, bill_type=bill_type,
+        from_action_date=fromDateTime, to_action_date=toDateTime
+    )
+    if not hits:
+        return f"No summaries found matching '{keywords}'."
+
+    logger.info(f"Found {total} summaries matching '{keywords}' in the local index")
+    return format_summary_hits(hits, f"Bill Summaries Matching '{keywords}'", total, index.coverage(scope))
+
 
 # @require_paid_access
 async def get_bill_summaries(
@@ -0,0 +1,298 @@
+"""Persistent FTS5 index over CRS bill summary text.
+
+``/summaries`` has no keyword search, and fetching a date window then filtering
+it ties recall to how recently a summary was touched. This module mirrors summary
+text per Congress into a local SQLite FTS5 table, with congress, bill type and
+action date stored as filter columns, and serves bm25-ranked search with
+snippets from it.
+
+Each Congress is mirrored by walking ``/summaries/{congress}`` in ascending
+``updateDate`` order from a stored cursor. The same walk is the backfill (while
+the cursor trails the present) and the incremental refresh (once it has caught
+up), so neither ever re-reads the catalogue: a refresh asks only for summaries
+updated at or after the newest one already held.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..core.congress_dates import congress_start_date, iso_utc
+from ..core.local_cache import cache_enabled, fts_match_expression, index_db_path, open_index_db
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "summaries"
+SCHEMA_VERSION = 1
+PAGE_SIZE = 250
+PAGE_BUDGET = 8
+SYNC_TTL_ENV = "CONGRESSMCP_SUMMARIES_SYNC_TTL"
+DEFAULT_SYNC_TTL_SECONDS = 3600
+
+# bm25 column weights, in FTS column order: title, text.
+_BM25_WEIGHTS = (4.0, 1.0)
+
+FetchPage = Callable[[int, str, int, int], Awaitable[Dict[str, Any]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    rowid INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    congress INTEGER,
+    bill_type TEXT,
+    bill_number TEXT,
+    action_date TEXT,
+    update_date TEXT,
+    title TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL DEFAULT '',
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summaries_filters ON summaries(congress, bill_type, action_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS summaries_fts USING fts5(
+    title, text,
+    content='summaries', content_rowid='rowid',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS summaries_ai AFTER INSERT ON summaries BEGIN
+    INSERT INTO summaries_fts(rowid, title, text) VALUES (new.rowid, new.title, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS summaries_ad AFTER DELETE ON summaries BEGIN
+    INSERT INTO summaries_fts(summaries_fts, rowid, title, text) VALUES ('delete', old.rowid, old.title, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS summaries_au AFTER UPDATE ON summaries BEGIN
+    INSERT INTO summaries_fts(summaries_fts, rowid, title, text) VALUES ('delete', old.rowid, old.title, old.text);
+    INSERT INTO summaries_fts(rowid, title, text) VALUES (new.rowid, new.title, new.text);
+END;
+CREATE TABLE IF NOT EXISTS coverage (
+    congress INTEGER PRIMARY KEY,
+    cursor TEXT NOT NULL,
+    skip INTEGER NOT NULL DEFAULT 0,
+    caught_up_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@dataclass(frozen=True)
+class SummaryHit:
+    summary: Dict[str, Any]
+    snippet: str
+
+
+@dataclass(frozen=True)
+class Coverage:
+    congress: int
+    indexed: int
+    caught_up: bool
+
+
+def sync_ttl_seconds() -> int:
+    try:
+        return max(0, int(os.getenv(SYNC_TTL_ENV, str(DEFAULT_SYNC_TTL_SECONDS))))
+    except ValueError:
+        return DEFAULT_SYNC_TTL_SECONDS
+
+
+def plain_text(markup: str) -> str:
+    return re.sub(r"\s+", " ", html.unescape(_TAG_RE.sub(" ", markup or ""))).strip()
+
+
+def summary_key(summary: Dict[str, Any]) -> Optional[str]:
+    bill = summary.get("bill") or {}
+    if not bill.get("congress") or not bill.get("type") or not bill.get("number"):
+        return None
+    version = summary.get("versionCode") or summary.get("actionDate") or ""
+    return f"{bill['congress']}-{str(bill['type']).lower()}-{bill['number']}-{version}"
+
+
+class SummariesIndex:
+    def __init__(self, conn: sqlite3.Connection, location: str):
+        self.conn = conn
+        self.location = location
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    # --- coverage -----------------------------------------------------------
+
+    def _coverage_row(self, congress: int) -> Tuple[str, int, float]:
+        row = self.conn.execute(
+            "SELECT cursor, skip, caught_up_at FROM coverage WHERE congress = ?", (congress,)
+        ).fetchone()
+        if row is None:
+            return iso_utc(congress_start_date(congress)), 0, 0.0
+        return row[0], row[1], row[2]
+
+    def coverage(self, congress: int) -> Coverage:
+        indexed = self.conn.execute("SELECT COUNT(*) FROM summaries WHERE congress = ?", (congress,)).fetchone()[0]
+        return Coverage(congress, indexed, self._coverage_row(congress)[2] > 0)
+
+    def is_stale(self, congress: int, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        caught_up_at = self._coverage_row(congress)[2]
+        # A Congress still backfilling is always "stale": every search advances it.
+        return caught_up_at == 0 or now - caught_up_at >= sync_ttl_seconds()
+
+    # --- writes -------------------------------------------------------------
+
+    def upsert(self, summaries: List[Dict[str, Any]]) -> None:
+        for summary in summaries:
+            key = summary_key(summary) if isinstance(summary, dict) else None
+            if key is None:
+                continue
+            bill = summary.get("bill") or {}
+            values = (
+                int(bill["congress"]),
+                str(bill["type"]).lower(),
+                str(bill["number"]),
+                (summary.get("actionDate") or "")[:10],
+                summary.get("updateDate") or "",
+                bill.get("title") or "",
+                plain_text(summary.get("text") or ""),
+                json.dumps(summary),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO summaries(key, congress, bill_type, bill_number, action_date, update_date, title, text, raw)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    congress = excluded.congress, bill_type = excluded.bill_type,
+                    bill_number = excluded.bill_number, action_date = excluded.action_date,
+                    update_date = excluded.update_date, title = excluded.title,
+                    text = excluded.text, raw = excluded.raw
+                WHERE excluded.update_date >= summaries.update_date
+                """,
+                (key, *values),
+            )
+
+    async def sync(self, congress: int, fetch_page: FetchPage) -> None:
+        """Advance one Congress's cursor by up to PAGE_BUDGET pages."""
+        cursor, skip, _ = self._coverage_row(congress)
+        # Caught up only if this sync reaches a short page: one that spends its whole
+        # budget has found the cursor behind upstream again, so coverage must say so.
+        caught_up_at = 0.0
+        for _ in range(PAGE_BUDGET):
+            data = await fetch_page(congress, cursor, skip, PAGE_SIZE)
+            if not isinstance(data, dict) or "error" in data:
+                raise SummariesIndexSyncError(str(data.get("error")) if isinstance(data, dict) else "invalid page")
+            rows = [row for row in data.get("summaries") or [] if isinstance(row, dict)]
+            self.upsert(rows)
+            # Keyset paging on updateDate. ``fromDateTime`` is inclusive, so the next
+            # request starts AT the newest timestamp seen and skips the rows already
+            # read with that exact timestamp; a burst of identical timestamps larger
+            # than a page advances by offset instead of looping on one cursor.
+            stamps = [r.get("updateDate") for r in rows if r.get("updateDate")]
+            if stamps:
+                newest = max(stamps)
+                ties = sum(1 for s in stamps if s == newest)
+                skip = skip + ties if newest == cursor else ties
+                cursor = newest
+            if len(rows) < PAGE_SIZE:
+                caught_up_at = time.time()
+                break
+        self.conn.execute(
+            """
+            INSERT INTO coverage(congress, cursor, skip, caught_up_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(congress) DO UPDATE SET
+                cursor = excluded.cursor, skip = excluded.skip, caught_up_at = excluded.caught_up_at
+            """,
+            (congress, cursor, skip, caught_up_at),
+        )
+        self.conn.commit()
+
+    # --- reads --------------------------------------------------------------
+
+    def search(
+        self,
+        keywords: str,
+        limit: int,
+        congress: Optional[int] = None,
+        bill_type: Optional[str] = None,
+        from_action_date: Optional[str] = None,
+        to_action_date: Optional[str] = None,
+    ) -> Tuple[List[SummaryHit], int]:
+        """bm25-ranked summaries matching every keyword, with the total match count."""
+        expression = fts_match_expression(keywords)
+        if expression is None:
+            return [], 0
+        clauses, params = ["summaries_fts MATCH ?"], [expression]
+        if congress is not None:
+            clauses.append("s.congress = ?")
+            params.append(congress)
+        if bill_type:
+            clauses.append("s.bill_type = ?")
+            params.append(bill_type.lower())
+        if from_action_date:
+            clauses.append("s.action_date >= ?")
+            params.append(from_action_date[:10])
+        if to_action_date:
+            clauses.append("s.action_date <= ?")
+            params.append(to_action_date[:10])
+        where = " AND ".join(clauses)
+        join = "FROM summaries_fts JOIN summaries s ON s.rowid = summaries_fts.rowid"
+        total = self.conn.execute(f"SELECT COUNT(*) {join} WHERE {where}", params).fetchone()[0]
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        rows = self.conn.execute(
+            f"""
+            SELECT s.raw, snippet(summaries_fts, 1, '**', '**', ' … ', 24)
+            {join} WHERE {where}
+            ORDER BY bm25(summaries_fts, {weights}), s.action_date DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        ).fetchall()
+        return [SummaryHit(json.loads(raw), snippet) for raw, snippet in rows], total
+
+
+class SummariesIndexSyncError(Exception):
+    """The summaries endpoint returned an error payload instead of a page."""
+
+
+def sync_window_end() -> str:
+    return iso_utc((datetime.now(timezone.utc) + timedelta(days=1)).date())
+
+
+_index: Optional[SummariesIndex] = None
+_index_key: Optional[str] = None
+_lock = asyncio.Lock()
+
+
+def get_summaries_index() -> SummariesIndex:
+    """Process-wide index, reopened if the cache location changed (tests, env reload)."""
+    global _index, _index_key
+    key = str(index_db_path(INDEX_NAME, SCHEMA_VERSION)) if cache_enabled() else ":memory:"
+    if _index is not None and _index_key == key:
+        return _index
+    if _index is not None:
+        _index.conn.close()
+    conn, location = open_index_db(INDEX_NAME, SCHEMA_VERSION)
+    _index, _index_key = SummariesIndex(conn, location), key
+    return _index
+
+
+async def ensure_synced(congress: int, fetch_page: FetchPage) -> SummariesIndex:
+    """Return the index after advancing ``congress`` if it is backfilling or stale.
+
+    A failed sync is logged and the mirror served as-is; a Congress with nothing
+    mirrored yet re-raises, since there is nothing to serve.
+    """
+    index = get_summaries_index()
+    async with _lock:
+        if index.is_stale(congress):
+            try:
+                await index.sync(congress, fetch_page)
+            except Exception as exc:
+                if index.coverage(congress).indexed == 0:
+                    raise
+                logger.warning(f"Summaries index sync for Congress {congress} failed; serving local copy: {exc}")
+    return index
@@ -8,6 +8,7 @@ from ..core.api_wrapper import safe_congressional_request
 from ..core.validators import ParameterValidator
 from ..core.exceptions import CommonErrors, format_error_response, CongressionalAPIError
 from ..core.response_utils import TreatiesProcessor, clean_treaties_response
+from .treaty_index import TreatyIndexSyncError, ensure_synced, get_treaty_index
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -334,6 +335,9 @@ async def get_treaty_detail(ctx: Context, congress: int, treaty_number: int) ->
                 resource_type="treaty",
                 identifier=f"{congress}/{treaty_number}")
             return format_error_response(error_response)
+
+        # List rows carry no titles; let the local search index learn them here.
+        get_treaty_index().fold_in_detail(treaty_data)
         
         # Extract treaty data and format
         return format_treaty_detail(treaty_data)
@@ -369,6 +373,9 @@ async def get_treaty_detail_with_suffix(ctx: Context, congress: int, treaty_numb
                 resource_type="treaty",
                 identifier=f"{congress}/{treaty_number}/{treaty_suffix}")
             return format_error_response(error_response)
+
+        # List rows carry no titles; let the local search index learn them here.
+        get_treaty_index().fold_in_detail(treaty_data)
         
         # Extract treaty data and format
         return format_treaty_detail(treaty_data)
@@ -734,79 +741,24 @@ async def search_treaties(
                 )
                 return format_error_response(error_response)
 
-        # Set up parameters for the API request
-        params = {
-            'format': 'json',
-            'limit': limit
-        }
+        # Answer from the local copy of the catalogue: the API cannot search topics or
+        # titles, and filtering one page of it loses every match past that page.
+        async def fetch_page(offset: int, page_limit: int, since: Optional[str]) -> Dict[str, Any]:
+            params = {'format': 'json', 'offset': offset, 'limit': page_limit}
+            if since:
+                params['fromDateTime'] = since
+            return await make_api_request(endpoint="/treaty", params=params, ctx=ctx)
 
-        # Add optional parameters if provided
-        if fromDateTime:
-            params['fromDateTime'] = fromDateTime
+        try:
+            index = await ensure_synced(fetch_page)
+        except TreatyIndexSyncError as e:
+            return f"Error searching for treaties: {e}"
+
+        matches = index.search(topic=topic, congress=congress, from_datetime=fromDateTime, to_datetime=toDateTime)
+        if topic and not matches:
+            return f"No treaties found matching topic: {topic}"
+        data = {'treaties': matches[:limit]}
 
-        if toDateTime:
-            params['toDateTime'] = toDateTime
-        
-        # Determine the endpoint based on whether a congress is provided
-        endpoint = "/treaty"
-        if congress:
-            endpoint = f"/treaty/{congress}"
-        
-        # Make the API request
-        data = await make_api_request(
-            endpoint=endpoint,
-            params=params,
-            ctx=ctx
-        )
-        
-        # Check if there was an error in the response
-        if isinstance(data, dict) and 'error' in data:
-            return f"Error searching for treaties: {data['error']}"
-        
-        # If topic is provided, filter the results client-side
-        if topic and 'treaties' in data and data['treaties']:
-            filtered_treaties = []
-            topic_words = [word.lower() for word in topic.split()]
-            
-            for treaty in data['treaties']:
-                # Get the topic and title fields for searching
-                treaty_topic = treaty.get('topic', '').lower()
-                
-                # Get titles if available
-                treaty_titles = []
-                if 'titles' in treaty and treaty['titles']:
-                    for title_obj in treaty['titles']:
-                        if 'title' in title_obj:
-                            treaty_titles.append(title_obj['title'].lower())
-                
-                # Check if any word in the search topic matches the treaty topic
-                match_found = False
-                
-                # Check in topic field
-                for word in topic_words:
-                    if word in treaty_topic:
-                        match_found = True
-                        break
-                
-                # If no match in topic, check in titles
-                if not match_found and treaty_titles:
-                    for title in treaty_titles:
-                        for word in topic_words:
-                            if word in title:
-                                match_found = True
-                                break
-                        if match_found:
-                            break
-                
-                if match_found:
-                    filtered_treaties.append(treaty)
-            
-            # Replace the original treaties with the filtered ones
-            if filtered_treaties:
-                data['treaties'] = filtered_treaties
-            else:
-                return f"No treaties found matching topic: {topic}"
-        
         # Format the response
         return format_treaties_list(data)
     
@@ -0,0 +1,301 @@
+"""Local copy of the treaty catalogue with an in-memory inverted index.
+
+The treaty corpus is a few thousand records, small enough to hold whole. The
+first search walks ``/treaty`` once and saves the records under the cache
+directory; later refreshes request only rows whose ``updateDate`` is at or past
+the newest one already held. Searches never touch the network beyond that
+refresh: topic and title words are looked up in a token -> treaty posting map and
+ranked by weighted IDF, so recall no longer depends on which rows the API
+happened to return first.
+
+Treaty list rows carry ``topic`` but not ``titles``; titles enter the index when a
+treaty's detail record is fetched (``fold_in_detail``) and are kept across refreshes.
+A fold-in re-indexes only that treaty, and its write to disk is batched: the copy is
+saved at most every SAVE_INTERVAL_SECONDS by fold-ins, and by every refresh.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..core.local_cache import cache_enabled, index_file_path
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "treaties"
+SCHEMA_VERSION = 1
+PAGE_SIZE = 250
+MAX_PAGES_PER_SYNC = 40
+SYNC_TTL_ENV = "CONGRESSMCP_TREATY_SYNC_TTL"
+DEFAULT_SYNC_TTL_SECONDS = 6 * 3600
+# Titles learned from detail fetches are written at most this often; a fold-in that
+# is not yet saved is written by the next one past the interval or the next refresh.
+SAVE_INTERVAL_SECONDS = 60
+
+# A query word found in the treaty's topic outweighs one found only in a title.
+_FIELD_WEIGHTS = {"topic": 3.0, "title": 1.0}
+
+FetchPage = Callable[[int, int, Optional[str]], Awaitable[Dict[str, Any]]]
+
+
+def sync_ttl_seconds() -> int:
+    try:
+        return max(0, int(os.getenv(SYNC_TTL_ENV, str(DEFAULT_SYNC_TTL_SECONDS))))
+    except ValueError:
+        return DEFAULT_SYNC_TTL_SECONDS
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.casefold() for token in re.findall(r"\w+", text or "")]
+
+
+def normalize_datetime(value: Any) -> str:
+    """``YYYY-MM-DD`` or ``YYYY-MM-DDTHH:MM:SSZ`` -> the latter, for lexical comparison."""
+    text = str(value or "").strip()
+    if len(text) == 10:
+        return f"{text}T00:00:00Z"
+    return text
+
+
+def treaty_key(treaty: Dict[str, Any]) -> str:
+    return f"{treaty.get('congressReceived', '')}-{treaty.get('number', '')}{treaty.get('suffix') or ''}"
+
+
+def _titles(treaty: Dict[str, Any]) -> List[str]:
+    titles = treaty.get("titles") or []
+    if not isinstance(titles, list):
+        return []
+    return [t["title"] for t in titles if isinstance(t, dict) and t.get("title")]
+
+
+def _token_weights(treaty: Dict[str, Any]) -> Dict[str, float]:
+    """Each token of the treaty's topic and titles, at the weight of its best field."""
+    weights: Dict[str, float] = {}
+    fields = [("topic", treaty.get("topic") or "")] + [("title", t) for t in _titles(treaty)]
+    for field, text in fields:
+        weight = _FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            if weights.get(token, 0.0) < weight:
+                weights[token] = weight
+    return weights
+
+
+class TreatyIndex:
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.treaties: Dict[str, Dict[str, Any]] = {}
+        self.synced_at = 0.0
+        self.high_water = ""
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        # treaty key -> the tokens it is posted under, so one treaty can be re-indexed.
+        self._indexed: Dict[str, Dict[str, float]] = {}
+        self._saved_at = 0.0
+        if path:
+            self._load()
+
+    # --- persistence --------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                state = json.load(fh)
+        except (OSError, ValueError):
+            return
+        self.treaties = {treaty_key(t): t for t in state.get("treaties", []) if isinstance(t, dict)}
+        self.synced_at = float(state.get("synced_at", 0))
+        self.high_water = state.get("high_water", "")
+        self._rebuild()
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        state = {"synced_at": self.synced_at, "high_water": self.high_water, "treaties": list(self.treaties.values())}
+        tmp = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(state, fh)
+            os.replace(tmp, self.path)
+            self._saved_at = time.time()
+        except OSError as exc:
+            logger.warning(f"Could not persist treaty index to {self.path}: {exc}")
+
+    # --- index --------------------------------------------------------------
+
+    def _rebuild(self) -> None:
+        postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._indexed = {}
+        for key, treaty in self.treaties.items():
+            weights = self._indexed[key] = _token_weights(treaty)
+            for token, weight in weights.items():
+                postings[token][key] = weight
+        self._postings = dict(postings)
+        self._vocabulary = sorted(self._postings)
+
+    def _reindex(self, key: str) -> None:
+        """Replace one treaty's postings, leaving every other treaty's as they are."""
+        for token in self._indexed.pop(key, {}):
+            keys = self._postings[token]
+            keys.pop(key, None)
+            if not keys:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        weights = self._indexed[key] = _token_weights(self.treaties[key])
+        for token, weight in weights.items():
+            if token not in self._postings:
+                self._postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            self._postings[token][key] = weight
+
+    def merge(self, rows: List[Dict[str, Any]]) -> int:
+        changed = 0
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            key = treaty_key(row)
+            current = self.treaties.get(key)
+            if current is not None and current.get("updateDate") == row.get("updateDate"):
+                continue
+            merged = dict(row)
+            if current is not None and "titles" not in merged and "titles" in current:
+                merged["titles"] = current["titles"]
+            self.treaties[key] = merged
+            self.high_water = max(self.high_water, normalize_datetime(row.get("updateDate")))
+            changed += 1
+        return changed
+
+    def fold_in_detail(self, record: Dict[str, Any]) -> None:
+        """Add a detail record's titles to the index (list rows do not carry them)."""
+        key = treaty_key(record)
+        titles = _titles(record)
+        if not titles or key not in self.treaties or _titles(self.treaties[key]) == titles:
+            return
+        self.treaties[key] = {**self.treaties[key], "titles": record["titles"]}
+        self._reindex(key)
+        if time.time() - self._saved_at >= SAVE_INTERVAL_SECONDS:
+            self._save()
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return not self.treaties or now - self.synced_at >= sync_ttl_seconds()
+
+    async def sync(self, fetch_page: FetchPage) -> None:
+        since = self.high_water or None
+        offset = 0
+        for _ in range(MAX_PAGES_PER_SYNC):
+            data = await fetch_page(offset, PAGE_SIZE, since)
+            if not isinstance(data, dict) or "error" in data:
+                raise TreatyIndexSyncError(str(data.get("error")) if isinstance(data, dict) else "invalid page")
+            rows = [row for row in data.get("treaties") or [] if isinstance(row, dict)]
+            self.merge(rows)
+            if len(rows) < PAGE_SIZE:
+                break
+            offset += PAGE_SIZE
+        self.synced_at = time.time()
+        self._rebuild()
+        self._save()
+
+    # --- search -------------------------------------------------------------
+
+    def _expand(self, term: str) -> List[str]:
+        # A query word matches index words it prefixes ("maritim" -> "maritime"), which
+        # keeps the recall of the substring filter this replaces for stems and plurals.
+        start = bisect.bisect_left(self._vocabulary, term)
+        out = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            out.append(token)
+        return out
+
+    def search(
+        self,
+        topic: Optional[str] = None,
+        congress: Optional[int] = None,
+        from_datetime: Optional[str] = None,
+        to_datetime: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Treaties passing the filters; ranked by topic/title relevance when a topic is given."""
+        def admitted(treaty: Dict[str, Any]) -> bool:
+            if congress and congress not in (treaty.get("congressReceived"), treaty.get("congressConsidered")):
+                return False
+            updated = normalize_datetime(treaty.get("updateDate"))
+            if from_datetime and updated < normalize_datetime(from_datetime):
+                return False
+            if to_datetime and updated > normalize_datetime(to_datetime):
+                return False
+            return True
+
+        def recency(key: str) -> str:
+            return normalize_datetime(self.treaties[key].get("updateDate"))
+
+        terms = list(dict.fromkeys(tokenize(topic or "")))
+        if not terms:
+            keys = [k for k, t in self.treaties.items() if admitted(t)]
+            keys.sort(key=recency, reverse=True)
+            return [self.treaties[k] for k in keys]
+
+        total = len(self.treaties) or 1
+        scores: Dict[str, float] = defaultdict(float)
+        for term in terms:
+            best: Dict[str, float] = {}
+            for token in self._expand(term):
+                for key, weight in self._postings[token].items():
+                    best[key] = max(best.get(key, 0.0), weight)
+            if not best:
+                continue
+            idf = math.log(1 + total / len(best))
+            for key, weight in best.items():
+                scores[key] += weight * idf
+
+        ranked: List[Tuple[float, str, str]] = [
+            (score, recency(key), key) for key, score in scores.items() if admitted(self.treaties[key])
+        ]
+        ranked.sort(reverse=True)
+        return [self.treaties[key] for _, _, key in ranked]
+
+
+class TreatyIndexSyncError(Exception):
+    """The treaty list endpoint returned an error payload instead of a page."""
+
+
+_index: Optional[TreatyIndex] = None
+_index_key: Optional[str] = None
+_lock = asyncio.Lock()
+
+
+def get_treaty_index() -> TreatyIndex:
+    """Process-wide index, reloaded if the cache location changed (tests, env reload)."""
+    global _index, _index_key
+    key = str(index_file_path(INDEX_NAME, SCHEMA_VERSION, ".json")) if cache_enabled() else ""
+    if _index is None or _index_key != key:
+        _index, _index_key = TreatyIndex(key or None), key
+    return _index
+
+
+async def ensure_synced(fetch_page: FetchPage) -> TreatyIndex:
+    """Return the index, refreshing first when older than the sync TTL.
+
+    A failed refresh is logged and the local copy served as-is; an index that
+    has never been populated re-raises, since there is nothing to serve.
+    """
+    index = get_treaty_index()
+    async with _lock:
+        if index.is_stale():
+            try:
+                await index.sync(fetch_page)
+            except Exception as exc:
+                if not index.treaties:
+                    raise
+                logger.warning(f"Treaty index refresh failed; serving {len(index.treaties)} local treaties: {exc}")
+    return index
@@ -1,5 +1,6 @@
 # mcp_server.py - Pure MCP server with tool registrations only
 import os
+from contextlib import asynccontextmanager
 
 from mcp.server.mcpserver import MCPServer
 from .core.client_handler import app_lifespan
@@ -14,16 +15,28 @@ def _bill_text_only() -> bool:
     return os.getenv("CONGRESSMCP_BILL_TEXT_ONLY", "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+@asynccontextmanager
+async def _lifespan(server: MCPServer):
+    # The API client first, then the bill-text watchlist prewarm job (a no-op unless
+    # CONGRESSMCP_WATCHLIST is set), which needs that client to resolve versions.
+    async with app_lifespan(server) as context:
+        from .features.bill_text.prewarm import watchlist_job
+
+        async with watchlist_job():
+            yield context
+
+
 mcp = MCPServer(
     "Congress MCP",
     instructions=(
         "Bill-text retrieval and search only: search_bill_text, get_bill_section, "
-        "get_bill_toc. Pass congress + bill_type (e.g. 's', 'hr') + number; version "
-        "resolution and GovInfo fetch are automatic."
+        "get_bill_sections, get_bill_toc and diff_bill_versions, plus search_bill_corpus and "
+        "find_amending_sections across every cached bill. Pass congress + bill_type "
+        "(e.g. 's', 'hr') + number; version resolution and GovInfo fetch are automatic."
         if _bill_text_only()
         else "Access 91+ congressional data tools via the Congress.gov API"
     ),
-    lifespan=app_lifespan,
+    lifespan=_lifespan,
 )
 
 def initialize_mcp_features():
@@ -31,7 +44,7 @@ def initialize_mcp_features():
     # Importing a feature module triggers its @mcp.tool() decorator registration.
     # ruff: noqa: F401
     if _bill_text_only():
-        from .features import bill_text  # noqa: F401 -- the three bill-text tools only
+        from .features import bill_text  # noqa: F401 -- the bill-text tools only
         return
 
     from .features import (  # noqa: F401
@@ -48,15 +48,9 @@ Usage
                                                      # EXTRA/DROPPED finding
                                                      # is not in the allowlist
 
-Known, deliberately-unfixed exception
+Known, deliberately-unfixed exceptions
 --------------------------------------
-bills/get_bill_content's `version` (EXTRA) and `chunk_number`/`chunk_size`
-(UNUSED) are excluded from the failing set via ALLOWLIST below. Content
-chunking isn't implemented yet -- get_bill_content currently delegates to
-get_bill_text_versions and ignores all three params. Accepting `version` and
-silently ignoring it would be worse than the current hard rejection, so it's
-left alone pending the real chunking implementation. See the comment on
-get_bill_content in congress_api/features/buckets/bills/api.py.
+Listed in ALLOWLIST below, each with a comment saying why it is left alone.
 """
 from __future__ import annotations
 
@@ -84,14 +78,6 @@ IGNORED_PARAMS = {"ctx", "self"}
 # exceptions -- not bugs to fix, just not yet implemented. Keep this list
 # small and each entry commented with why.
 ALLOWLIST: Set[Tuple[str, str, str]] = {
-    # version: get_bill_content doesn't do real content-chunking yet; it
-    # delegates to get_bill_text_versions and has no use for a specific
-    # version. Accepting the param and ignoring it would be worse than
-    # rejecting it outright. See congress_api/features/buckets/bills/api.py.
-    ("bills", "get_bill_content", "version"),          # EXTRA
-    ("bills", "get_bill_content", "chunk_number"),      # UNUSED
-    ("bills", "get_bill_content", "chunk_size"),        # UNUSED
-
     # most_recent: get_committee_nominations keeps the same signature as its
     # sibling committee tools (get_committee_bills/reports/communications),
     # but the Senate nominations endpoint is already newest-first, so there's
@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    # Local search indexes persist under the user cache directory; no test may read
+    # a developer's real cache or leave files behind in it.
+    monkeypatch.setenv("CONGRESSMCP_CACHE_DIR", str(tmp_path / "congressmcp-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_member_directory(monkeypatch):
+    # The member directory is a process-wide snapshot; each test starts empty so a
+    # snapshot loaded by one test's mocks cannot answer another's searches.
+    from congress_api.features import member_directory
+
+    monkeypatch.setattr(member_directory, "_directory", member_directory.MemberDirectory())
+    monkeypatch.setattr(member_directory, "_locks", {})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_bill_content(monkeypatch):
+    # Parsed and rendered bill text is held in memory by package id; each test's fake
+    # packages must not be served to another test that reuses the id with other bytes.
+    from collections import OrderedDict
+
+    from congress_api.features.bill_text import columnar, content, cursors, vocabulary
+
+    monkeypatch.setattr(content, "_rendered", OrderedDict())
+    monkeypatch.setattr(columnar, "_resident", OrderedDict())
+    monkeypatch.setattr(cursors, "_cursors", OrderedDict())
+    monkeypatch.setattr(vocabulary, "_vocabularies", OrderedDict())
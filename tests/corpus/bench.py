@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""Parser / index benchmark over the extended corpus. Offline; no credentials.
+
+    BILL_TEXT_CORPUS_CACHE=... python -m tests.corpus.bench --save bench.json
+    BILL_TEXT_CORPUS_CACHE=... python -m tests.corpus.bench --baseline bench.json
+
+measure.py, v20.py and v22.py judge the parser on correctness; this script judges it
+on cost, over the same pinned bytes. Per manifest package it reports:
+
+  parse_ms / index_ms   median of --repeat runs of parse_bill_xml and BillTextIndex
+                        (the two stages load_bill_text times as parse_ms / index_ms);
+  amends_ms             median time to read is_amendatory and amends off every unit,
+                        the citation extraction the index and responses pay for;
+  units / segments      what was produced, so a speed-up that parses less is visible;
+  rss_base_kb / rss_peak_kb
+                        peak resident set of a child process that parses and indexes
+                        ONLY this package, and the same process's RSS before it read
+                        the file. ru_maxrss is a process-lifetime high-water mark, so
+                        measuring several packages in one process would report the
+                        largest so far, not this one -- hence one child per package;
+  search p50/p95/max    latency of BillTextIndex.rank over QUERIES, each query run
+                        --search-repeat times on its own.
+
+--baseline compares against a previous --save and flags any timing or memory figure
+more than --tolerance (default 25%) worse, exiting 1 if one is. Counts are compared
+exactly but only reported: a parser change is allowed to change what it emits, and
+the report says so beside the timings it explains. Timings are wall-clock on a shared
+machine; compare runs from the same host, and re-run before believing a small delta.
+
+HYGIENE (spec §10), as in the other corpus scripts: a manifest package absent from the
+cache, a sha256 that disagrees with the manifest, or a package that produced no units
+FAILS the run -- an empty measurement must never read as a fast one.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent.parent))
+
+from congress_api.features.bill_text.index import BillTextIndex  # noqa: E402
+from congress_api.features.bill_text.parser import parse_bill_xml  # noqa: E402
+
+MANIFEST = json.loads((HERE / "manifest.json").read_text())
+
+# Fixed so runs are comparable: a mix of common single terms, multi-word phrases and
+# amendatory boilerplate, the shapes search_bill_text is actually called with. Changing
+# this list invalidates saved baselines' search figures; the baseline records the list
+# and the comparison refuses to diff search latency across different lists.
+QUERIES = (
+    "appropriations",
+    "fiscal year",
+    "Secretary shall",
+    "report to Congress",
+    "is amended by striking",
+    "United States Code",
+    "grant program",
+    "tax credit",
+    "not later than 180 days after the date of enactment",
+    "Comptroller General",
+)
+MAX_HITS = 10
+
+# Lower is better for every one of these; they are the figures --tolerance applies to.
+TIMED = ("parse_ms", "index_ms", "amends_ms", "search_p50_ms", "search_p95_ms", "rss_peak_kb")
+COUNTED = ("units", "segments", "bytes")
+
+
+def cache_dir() -> Path:
+    default = HERE.parent.parent / MANIFEST["cache_default"]
+    return Path(os.getenv(MANIFEST["cache_env"], str(default)))
+
+
+def _rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile; exact on the samples, no interpolation."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure_package(raw: bytes, package_id: str, version: str, *,
+                    repeat: int = 3, search_repeat: int = 20) -> dict:
+    """Time parse, index and search for one package's bytes. Memory is the caller's."""
+    parse_runs, index_runs, amends_runs = [], [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        parsed = parse_bill_xml(raw, package_id, version, None)
+        t1 = time.perf_counter()
+        index = BillTextIndex(parsed)
+        t2 = time.perf_counter()
+        parse_runs.append((t1 - t0) * 1000)
+        index_runs.append((t2 - t1) * 1000)
+        t0 = time.perf_counter()
+        for unit in parsed.units:
+            unit.is_amendatory, unit.amends
+        amends_runs.append((time.perf_counter() - t0) * 1000)
+
+    latencies = []
+    for query in QUERIES:
+        for _ in range(search_repeat):
+            t0 = time.perf_counter()
+            index.rank([query], MAX_HITS)
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    return {
+        "package_id": package_id,
+        "bytes": len(raw),
+        "units": len(parsed.units),
+        "segments": sum(len(unit.segments) for unit in parsed.units),
+        "parse_ms": round(statistics.median(parse_runs), 2),
+        "index_ms": round(statistics.median(index_runs), 2),
+        "amends_ms": round(statistics.median(amends_runs), 2),
+        "search_p50_ms": round(percentile(latencies, 50), 3),
+        "search_p95_ms": round(percentile(latencies, 95), 3),
+        "search_max_ms": round(max(latencies), 3),
+    }
+
+
+def _child(package_id: str, version: str, repeat: int, search_repeat: int) -> int:
+    """Measure one package in this (fresh) process and print its row as JSON."""
+    base = _rss_kb()
+    raw = (cache_dir() / f"{package_id}.xml").read_bytes()
+    row = measure_package(raw, package_id, version, repeat=repeat, search_repeat=search_repeat)
+    row["rss_base_kb"] = base
+    row["rss_peak_kb"] = _rss_kb()
+    print(json.dumps(row))
+    return 0
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> tuple[list[str], list[str]]:
+    """Diff two runs package by package. Returns (report lines, regressions)."""
+    lines: list[str] = []
+    regressions: list[str] = []
+    same_queries = current.get("queries") == baseline.get("queries")
+    if not same_queries:
+        lines.append("  query set differs from the baseline's: search latency not compared")
+    before = {row["package_id"]: row for row in baseline["packages"]}
+    for row in current["packages"]:
+        pkg = row["package_id"]
+        old = before.get(pkg)
+        if old is None:
+            lines.append(f"  {pkg:<24} not in baseline")
+            continue
+        for key in TIMED:
+            if key.startswith("search_") and not same_queries:
+                continue
+            if key not in old or not old[key]:
+                continue
+            ratio = row[key] / old[key]
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  <- REGRESSION"
+                regressions.append(f"{pkg} {key} {old[key]} -> {row[key]}")
+            elif ratio < 1 - tolerance:
+                flag = "  <- improved"
+            lines.append(f"  {pkg:<24} {key:<14} {old[key]:>10} -> {row[key]:>10}  x{ratio:.2f}{flag}")
+        for key in COUNTED:
+            if old.get(key) != row[key]:
+                lines.append(f"  {pkg:<24} {key:<14} {old.get(key)} -> {row[key]}  (output changed)")
+    missing = sorted(set(before) - {row["package_id"] for row in current["packages"]})
+    for pkg in missing:
+        lines.append(f"  {pkg:<24} in baseline, not measured this run")
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--save", type=Path, help="write this run's results to a JSON file")
+    ap.add_argument("--baseline", type=Path, help="compare against a previous --save")
+    ap.add_argument("--tolerance", type=float, default=0.25,
+                    help="fractional slowdown/growth counted as a regression (default 0.25)")
+    ap.add_argument("--repeat", type=int, default=3, help="parse+index runs per package (median)")
+    ap.add_argument("--search-repeat", type=int, default=20, help="runs per query per package")
+    ap.add_argument("--package", action="append", help="limit to these package_ids")
+    ap.add_argument("--child", nargs=2, metavar=("PACKAGE_ID", "VERSION"), help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        return _child(*args.child, args.repeat, args.search_repeat)
+
+    cache = cache_dir()
+    entries = MANIFEST["packages"]
+    if args.package:
+        entries = [e for e in entries if e["package_id"] in set(args.package)]
+    print(f"cache      : {cache}")
+    print(f"packages   : {len(entries)} of {len(MANIFEST['packages'])} in the manifest")
+    if not entries:
+        print("FAIL: no packages selected")
+        return 1
+
+    missing = [e["package_id"] for e in entries if not (cache / f"{e['package_id']}.xml").exists()]
+    if missing:
+        print(f"FAIL: {len(missing)} manifest package(s) absent from the cache: {missing}")
+        print("      run `python -m tests.corpus.fetch_corpus` first.")
+        return 1
+
+    rows = []
+    print(f"\n  {'package':<24} {'units':>6} {'segs':>7} {'parse_ms':>9} {'index_ms':>9} "
+          f"{'amends_ms':>9} {'peak_MB':>8} {'p50_ms':>7} {'p95_ms':>7}")
+    for e in entries:
+        pkg = e["package_id"]
+        digest = hashlib.sha256((cache / f"{pkg}.xml").read_bytes()).hexdigest()
+        if digest != e["sha256"]:
+            print(f"FAIL: {pkg}: cached sha256 {digest[:16]}… != manifest {e['sha256'][:16]}…")
+            return 1
+        proc = subprocess.run(
+            [sys.executable, "-m", "tests.corpus.bench", "--child", pkg, e["version"],
+             "--repeat", str(args.repeat), "--search-repeat", str(args.search_repeat)],
+            cwd=HERE.parent.parent, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"FAIL: {pkg}: measurement process exited {proc.returncode}\n{proc.stderr}")
+            return 1
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        if not row["units"]:
+            print(f"FAIL: {pkg}: parsed to zero units")
+            return 1
+        rows.append(row)
+        print(f"  {pkg:<24} {row['units']:>6,} {row['segments']:>7,} {row['parse_ms']:>9.1f} "
+              f"{row['index_ms']:>9.1f} {row['amends_ms']:>9.1f} {row['rss_peak_kb'] / 1024:>8.1f} "
+              f"{row['search_p50_ms']:>7.3f} {row['search_p95_ms']:>7.3f}")
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "queries": list(QUERIES),
+        "repeat": args.repeat,
+        "search_repeat": args.search_repeat,
+        "packages": rows,
+    }
+    totals = {key: round(sum(row[key] for row in rows), 1) for key in ("parse_ms", "index_ms")}
+    print(f"\n  total parse_ms {totals['parse_ms']:,}   index_ms {totals['index_ms']:,}   "
+          f"max peak {max(row['rss_peak_kb'] for row in rows) / 1024:.1f} MB")
+
+    if args.save:
+        args.save.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\n  saved      : {args.save}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        lines, regressions = compare(result, baseline, args.tolerance)
+        print(f"\nvs baseline {args.baseline} (tolerance {args.tolerance:.0%})")
+        for line in lines:
+            print(line)
+        if regressions:
+            print(f"\nFAIL: {len(regressions)} figure(s) regressed beyond tolerance")
+            return 1
+        print("\n  no regression beyond tolerance")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
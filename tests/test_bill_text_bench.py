@@ -0,0 +1,59 @@
+"""Guards for the corpus benchmark harness (tests/corpus/bench.py).
+
+The harness only runs against the fetched corpus, so these check its two pieces that
+can silently lie without it: the per-package measurement must count what the parser
+produced, and the baseline comparison must flag a regression and stay quiet on noise.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests.corpus.bench import compare, measure_package, percentile, QUERIES  # noqa: E402
+from congress_api.features.bill_text.parser import parse_bill_xml  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "bill_text_trimmed.xml"
+
+
+def _run(**figures):
+    row = {
+        "package_id": "BILLS-119hr1enr", "bytes": 1000, "units": 10, "segments": 40,
+        "parse_ms": 100.0, "index_ms": 50.0, "search_p50_ms": 1.0, "search_p95_ms": 2.0,
+        "rss_peak_kb": 100_000,
+    }
+    row.update(figures)
+    return {"queries": list(QUERIES), "packages": [row]}
+
+
+def test_measure_package_counts_what_the_parser_produced():
+    raw = FIXTURE.read_bytes()
+    parsed = parse_bill_xml(raw, "BILLS-119hr1ih", "ih", None)
+    row = measure_package(raw, "BILLS-119hr1ih", "ih", repeat=1, search_repeat=1)
+
+    assert (row["units"], row["segments"], row["bytes"]) == (
+        len(parsed.units), sum(len(u.segments) for u in parsed.units), len(raw),
+    )
+    assert row["units"] > 0
+    assert 0 <= row["search_p50_ms"] <= row["search_p95_ms"] <= row["search_max_ms"]
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(n) for n in range(1, 21)]
+    assert (percentile(samples, 50), percentile(samples, 95), percentile(samples, 100)) == (10.0, 19.0, 20.0)
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_compare_flags_regressions_beyond_tolerance_only():
+    baseline = _run()
+    lines, regressions = compare(_run(parse_ms=110.0, index_ms=80.0, units=11), baseline, 0.25)
+    assert regressions == ["BILLS-119hr1enr index_ms 50.0 -> 80.0"]
+    assert any("units" in line and "output changed" in line for line in lines)
+
+    # A different query set makes search latency incomparable, not a regression.
+    other = _run(search_p95_ms=20.0)
+    other["queries"] = ["something else"]
+    lines, regressions = compare(other, baseline, 0.25)
+    assert regressions == []
+    assert "search latency not compared" in lines[0]
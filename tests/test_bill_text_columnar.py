@@ -0,0 +1,178 @@
+"""
+Tests for the columnar in-memory form of a parsed bill: it must materialise units
+identical to the parse it was built from, pickle as flat buffers, and serve warm
+loads (and their TOC) without reading the store, within its byte budget.
+"""
+import pickle
+from pathlib import Path
+
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text import columnar
+from congress_api.features.bill_text.client import TextVersion
+from congress_api.features.bill_text.columnar import ColumnarBill, ColumnarUnits, keep_resident, resident_bill
+from congress_api.features.bill_text.hierarchy import BillHierarchy
+from congress_api.features.bill_text.index import BillTextIndex
+from congress_api.features.bill_text.parser import parse_bill_xml
+from congress_api.features.bill_text.service import load_bill_text
+from congress_api.features.bill_text.store import BillTextStore
+from congress_api.features.bill_text.toc import BillToc
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _parse(package_id="BILLS-119s1071enr", name="bill_text_trimmed.xml"):
+    return parse_bill_xml((FIXTURES / name).read_bytes(), package_id, "enr", "2025-12-19T03:11:48Z")
+
+
+@pytest.mark.parametrize("name", ["bill_text_trimmed.xml", "hres_preamble_trimmed.xml", "hres_trimmed.xml"])
+def test_columnar_bill_materialises_the_parse_it_was_built_from(name):
+    parsed = _parse(name=name)
+    bill = ColumnarBill(parsed)
+
+    assert len(bill) == len(parsed.units)
+    assert list(bill.units()) == parsed.units
+    assert bill.unit(len(bill) - 1) == parsed.units[-1]
+    rebuilt = bill.to_parsed()
+    assert (rebuilt.units, rebuilt.subtree_bytes, rebuilt.quotes_seen) == (
+        parsed.units, parsed.subtree_bytes, parsed.quotes_seen,
+    )
+    # Segment text lives in one buffer; contexts are byte codes, not strings per segment.
+    assert bill.text == "".join(segment.text for unit in parsed.units for segment in unit.segments)
+    assert bill.segment_context.typecode == "B"
+    # Units sharing ancestors share one interned path.
+    assert len(bill.paths) == len({tuple(node.model_dump_json() for node in u.ancestor_path) for u in parsed.units})
+
+    assert list(pickle.loads(pickle.dumps(bill)).units()) == parsed.units
+
+
+def test_resident_bills_stay_within_the_byte_budget(monkeypatch):
+    first, second = _parse("BILLS-119s1071enr"), _parse("BILLS-119s1071es")
+    budget = ColumnarBill(first).nbytes + ColumnarBill(second).nbytes
+    monkeypatch.setenv(columnar.RESIDENT_BYTES_ENV, str(budget))
+
+    keep_resident(first)
+    keep_resident(second)
+    assert resident_bill(first.package_id) is not None   # now the most recently used
+    keep_resident(_parse("BILLS-119s1071rs"))
+    assert [resident_bill(p) is not None for p in ("BILLS-119s1071enr", "BILLS-119s1071es")] == [True, False]
+
+    monkeypatch.setenv(columnar.RESIDENT_BYTES_ENV, "0")
+    keep_resident(_parse("BILLS-119s1071is"))
+    assert resident_bill("BILLS-119s1071is") is None
+
+
+@pytest.mark.asyncio
+async def test_warm_load_is_served_from_the_resident_bill_without_reading_the_store(monkeypatch):
+    loads = []
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    real_load = BillTextStore.load
+
+    def counting_load(self, package_id):
+        loads.append(package_id)
+        return real_load(self, package_id)
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    monkeypatch.setattr(BillTextStore, "load", counting_load)
+
+    first = await load_bill_text(None, 119, "s", 1071, None)
+    second = await load_bill_text(None, 119, "s", 1071, None)
+    assert loads == ["BILLS-119s1071enr"]   # the cold miss only
+    assert (first.index_hit, second.index_hit) == (False, True)
+    assert second.parsed.units == first.parsed.units
+    assert second.parsed.units[0] is not first.parsed.units[0]
+
+    # Evicted from memory, the next load falls back to the store.
+    monkeypatch.setattr(columnar, "_resident", type(columnar._resident)())
+    third = await load_bill_text(None, 119, "s", 1071, None)
+    assert loads == ["BILLS-119s1071enr"] * 2
+    assert third.parsed.units == first.parsed.units
+
+
+@pytest.mark.asyncio
+async def test_warm_loads_reuse_the_toc_kept_with_the_resident_bill(monkeypatch):
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+
+    first = await load_bill_text(None, 119, "s", 1071, None)
+    resident = resident_bill(first.parsed.package_id)
+    before = resident.nbytes
+    toc = first.toc
+    assert resident.toc is toc
+    assert resident.nbytes == before + toc.nbytes
+
+    second = await load_bill_text(None, 119, "s", 1071, None)
+    assert second.toc is toc
+    assert second.toc.view(5) == first.toc.view(5)
+
+
+def test_keeping_a_toc_evicts_to_stay_within_the_byte_budget(monkeypatch):
+    first, second = _parse("BILLS-119s1071enr"), _parse("BILLS-119s1071es")
+    budget = ColumnarBill(first).nbytes + ColumnarBill(second).nbytes
+    monkeypatch.setenv(columnar.RESIDENT_BYTES_ENV, str(budget))
+    keep_resident(first)
+    keep_resident(second)
+
+    bill = resident_bill(second.package_id)
+    bill.keep_toc(BillToc(BillHierarchy(second.units), second.subtree_bytes))
+    assert resident_bill(first.package_id) is None   # least recently used, evicted
+    assert sum(held.nbytes for held in columnar._resident.values()) <= budget
+
+
+def test_resident_view_indexes_from_the_columns_and_builds_only_units_read():
+    parsed = _parse()
+    bill = ColumnarBill(parsed)
+    view = bill.view()
+    assert isinstance(view.units, ColumnarUnits)
+
+    def rows(index):
+        return [tuple(row) for row in index.conn.execute("SELECT * FROM units ORDER BY id")] + [
+            tuple(row) for row in index.conn.execute("SELECT * FROM segments ORDER BY id")
+        ]
+
+    assert rows(BillTextIndex(view)) == rows(BillTextIndex(parsed))
+    hierarchy = BillHierarchy(view.units)
+    assert view.units._built == {}
+
+    ordinal = len(parsed.units) // 2
+    target = parsed.units[ordinal].section_id
+    assert hierarchy.by_id[target] == parsed.units[ordinal]
+    assert list(view.units._built) == [ordinal]
+    assert hierarchy.by_id[target] is view.units[ordinal]
+
+
+@pytest.mark.asyncio
+async def test_loaded_bill_toc_is_kept_within_the_resident_budget(monkeypatch):
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="es", date="2025-10-09", type_label="Engrossed in Senate"),
+                TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    budget = ColumnarBill(_parse("BILLS-119s1071es")).nbytes + ColumnarBill(_parse("BILLS-119s1071enr")).nbytes
+    monkeypatch.setenv(columnar.RESIDENT_BYTES_ENV, str(budget))
+
+    await load_bill_text(None, 119, "s", 1071, "es")
+    loaded = await load_bill_text(None, 119, "s", 1071, "enr")
+    toc = loaded.toc
+    assert resident_bill("BILLS-119s1071enr").toc is toc
+    assert resident_bill("BILLS-119s1071es") is None
+    assert sum(held.nbytes for held in columnar._resident.values()) <= budget
@@ -0,0 +1,116 @@
+"""
+Tests for bills(operation="get_bill_content"): a bill's rendered text paged in
+byte-bounded chunks from the cached parse, without re-fetching it per chunk.
+"""
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text.client import TextVersion
+from congress_api.features.bill_text.content import BillContent
+from congress_api.features.bill_text.parser import AncestorNode, ParsedBill, Segment, Unit, parse_bill_xml
+from congress_api.features.bill_text.store import BillTextStore
+from congress_api.features.buckets.bills import get_bill_content
+
+
+def _bill_xml(sections: int) -> bytes:
+    body = "".join(
+        f"<section><enum>{n}</enum><header>Program {n}</header>"
+        f"<text>The Secretary shall carry out program {n} for each fiscal year. {'Funds are authorized. ' * 8}</text>"
+        "</section>"
+        for n in range(1, sections + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><bill><legis-body><title><enum>I</enum>'
+        f"<header>Programs</header>{body}</title></legis-body></bill>"
+    ).encode("utf-8")
+
+
+def _parsed(units):
+    return ParsedBill(
+        package_id="BILLS-119hr1ih", version="ih", last_modified=None, units=units,
+        sections_indexed=len(units), quotes_seen=set(),
+    )
+
+
+def _unit(section_id, division, text):
+    path = [
+        AncestorNode(type="D", enum=division, header=f"Division {division}"),
+        AncestorNode(type="T", enum="I", header="General Provisions"),
+    ]
+    return Unit(section_id, path, None, [Segment("operative", text)])
+
+
+def test_content_renders_each_heading_once_and_chunks_cover_the_text_exactly():
+    # Multi-byte text so a careless cut would split a UTF-8 sequence.
+    prose = " ".join(f"§{n} — provisión número {n}." for n in range(400))
+    content = BillContent.from_parsed(_parsed([
+        _unit("D:A/T:I/S:1", "A", prose),
+        _unit("D:A/T:I/S:2", "A", prose),
+        _unit("D:B/T:I/S:1", "B", "Short."),
+    ]))
+    text = content.data.decode("utf-8")
+    assert text.count("Division A") == 1 and text.count("General Provisions") == 2
+
+    offsets = content.offsets(1000)
+    assert offsets[0] == 0 and offsets[-1] == content.total_bytes
+    assert content.offsets(1000) is offsets   # computed once per chunk size
+    # ...for the last couple of sizes only: varying chunk_size does not grow the memo.
+    for size in range(2000, 12000, 1000):
+        content.offsets(size)
+    assert content.offsets(11000) is content.offsets(11000) and len(content._offsets) == 2
+    chunks = [content.chunk(n, 1000) for n in range(1, content.total_chunks(1000) + 1)]
+    assert "".join(chunks) == text
+    assert all(len(chunk.encode("utf-8")) <= 1000 for chunk in chunks)
+    # Cuts land after a space or line break, not mid-word.
+    assert all(chunk.endswith((" ", "\n")) for chunk in chunks[:-1])
+
+    last = content.total_chunks(1000)
+    assert content.sections_in(*content.chunk_span(last, 1000))[1] == "D:B/T:I/S:1"
+    assert content.sections_in(*content.chunk_span(1, 1000)) == ("D:A/T:I/S:1", "D:A/T:I/S:1")
+    with pytest.raises(IndexError):
+        content.chunk_span(last + 1, 1000)
+
+
+@pytest.mark.asyncio
+async def test_get_bill_content_pages_the_cached_parse_without_refetching(monkeypatch):
+    fetched, loads = [], []
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        fetched.append(package_id)
+        return "2025-12-19T03:11:48Z", _bill_xml(40)
+
+    real_load = BillTextStore.load
+
+    def counting_load(self, package_id):
+        loads.append(package_id)
+        return real_load(self, package_id)
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    monkeypatch.setattr(BillTextStore, "load", counting_load)
+
+    first = await get_bill_content(None, 119, "s", 1071, chunk_size=1000)
+    assert "**Version:** enr (BILLS-119s1071enr)" in first
+    assert "**Chunk:** 1 of " in first and "Use `chunk_number=2`" in first
+    assert fetched == ["BILLS-119s1071enr"]
+
+    total = int(first.split("**Chunk:** 1 of ")[1].split(" ")[0])
+    pages = [first] + [
+        await get_bill_content(None, 119, "s", 1071, version="enr", chunk_number=n, chunk_size=1000)
+        for n in range(2, total + 1)
+    ]
+    assert fetched == ["BILLS-119s1071enr"]
+    assert loads == ["BILLS-119s1071enr"]   # the miss before the fetch; pages come from memory
+    assert "Use `chunk_number=" not in pages[-1]
+
+    parsed = parse_bill_xml(_bill_xml(40), "BILLS-119s1071enr", "enr", None)
+    body = "".join(page.split("## Bill Text\n\n", 1)[1].split("\n\n📄", 1)[0] for page in pages)
+    assert body == BillContent.from_parsed(parsed).data.decode("utf-8")
+
+    beyond = await get_bill_content(None, 119, "s", 1071, chunk_number=total + 1, chunk_size=1000)
+    assert f"has {total} chunk(s)" in beyond
+    too_small = await get_bill_content(None, 119, "s", 1071, chunk_size=10)
+    assert "between 1000 and 50000 bytes" in too_small
@@ -60,10 +60,12 @@ def audit(xml_bytes: bytes, pkg: str, version: str):
     subdivided: list[ET.Element] = []
     captured: dict[str, ET.Element] = {}
     state = {"in_intro": False}
-    orig_from, orig_seg, orig_intro = P.ET.fromstring, P.extract_segments, P.extract_own_segments
+    orig_from, orig_seg, orig_intro = P.parse_xml_tree, P.extract_segments, P.extract_own_segments
 
-    def cap_fromstring(data, *a, **k):
-        r = orig_from(data, *a, **k)
+    def cap_fromstring(data, backend=None):
+        # Always the stdlib tree: identity instrumentation needs element objects that
+        # persist, and lxml hands out fresh proxies. Backend parity is its own test.
+        r = orig_from(data, "stdlib")
         captured["root"] = r
         return r
 
@@ -83,11 +85,11 @@ def audit(xml_bytes: bytes, pkg: str, version: str):
         finally:
             state["in_intro"] = False
 
-    P.ET.fromstring, P.extract_segments, P.extract_own_segments = cap_fromstring, wrap_seg, wrap_intro
+    P.parse_xml_tree, P.extract_segments, P.extract_own_segments = cap_fromstring, wrap_seg, wrap_intro
     try:
         parsed = P.parse_bill_xml(xml_bytes, pkg, version, None)
     finally:
-        P.ET.fromstring, P.extract_segments, P.extract_own_segments = orig_from, orig_seg, orig_intro
+        P.parse_xml_tree, P.extract_segments, P.extract_own_segments = orig_from, orig_seg, orig_intro
 
     root = captured["root"]
     parent = {c: par for par in root.iter() for c in par}
@@ -264,6 +266,26 @@ def test_corpus_invariants(entry, path):
     )
 
 
+@pytest.mark.skipif(not _AVAILABLE, reason="extended corpus not fetched (see tests/corpus/fetch_corpus.py)")
+@pytest.mark.parametrize("entry,path", _AVAILABLE, ids=[e["package_id"] for e, _ in _AVAILABLE])
+def test_corpus_parses_identically_under_both_xml_backends(entry, path):
+    pytest.importorskip("lxml")
+    data = path.read_bytes()
+    stdlib, fast = [
+        _parse_with(backend, data, entry["package_id"], entry["version"]) for backend in ("stdlib", "lxml")
+    ]
+    assert fast == stdlib, f"{entry['package_id']}: lxml and stdlib parses differ"
+
+
+def _parse_with(backend: str, data: bytes, pkg: str, version: str):
+    orig = P.xml_backend
+    P.xml_backend = lambda: backend
+    try:
+        return P.parse_bill_xml(data, pkg, version, None)
+    finally:
+        P.xml_backend = orig
+
+
 @pytest.mark.skipif(
     not any(e["version"] in {"rh", "rs"} for e, _ in _AVAILABLE),
     reason="no reported (rh/rs) package in the fetched corpus",
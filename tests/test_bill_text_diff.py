@@ -0,0 +1,143 @@
+"""
+Tests for diff_bill_versions: two versions of one bill aligned by section_id (then
+by identical text, then by header), with only the changed sections returned.
+"""
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text import tools
+from congress_api.features.bill_text.client import TextVersion
+from congress_api.features.bill_text.diff import diff_units
+from congress_api.features.bill_text.parser import parse_bill_xml
+from congress_api.features.bill_text.service import LoadedBillText
+
+
+def _bill(*sections):
+    body = "".join(
+        f"<section><enum>{enum}</enum><header>{header}</header><text>{text}</text></section>"
+        for enum, header, text in sections
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><bill><legis-body>{body}</legis-body></bill>'.encode()
+
+
+INTRODUCED = _bill(
+    ("1", "Short title", "This Act may be cited as the Cutter Act."),
+    ("2", "Procurement", "The Commandant may acquire 2 polar security cutters."),
+    ("3", "Reports", "The Commandant shall report annually on icebreaking."),
+    ("4", "Sunset", "This Act expires in 2030."),
+    ("7", "Authorization of appropriations", "There is authorized $10,000,000."),
+)
+REPORTED = _bill(
+    ("1", "Short title", "This Act may be cited as the Cutter Act."),
+    ("2", "Procurement", "The Commandant shall acquire 3 polar security cutters."),
+    ("5", "Reports", "The Commandant shall report annually on icebreaking."),
+    ("6", "Homeports", "The Commandant shall select a homeport in Alaska."),
+    ("8", "Authorizations of appropriations", "There is authorized $20,000,000."),
+)
+
+
+def _loaded(xml, version):
+    parsed = parse_bill_xml(xml, f"BILLS-119hr9{version}", version)
+    return LoadedBillText(resolved=None, parsed=parsed, index=None)
+
+
+def test_units_align_by_id_then_content_then_header_and_unchanged_are_skipped():
+    old, new = _loaded(INTRODUCED, "ih"), _loaded(REPORTED, "rh")
+    result = diff_units(old.parsed.units, new.parsed.units, old.unit_hashes, new.unit_hashes)
+
+    summary = [
+        (c.status, c.before and c.before.section_id, c.after and c.after.section_id, c.text_changed)
+        for c in result.changes
+    ]
+    assert summary == [
+        ("modified", "S:2", "S:2", True),
+        ("renumbered", "S:3", "S:5", False),   # identical text under a new id
+        ("added", None, "S:6", True),
+        ("renumbered", "S:7", "S:8", True),    # near-identical header, new text
+        ("removed", "S:4", None, True),
+    ]
+    assert (result.compared, result.unchanged) == (6, 1)
+    # Only the changed segment is reported, not the whole section.
+    [delta] = result.changes[0].segments
+    assert delta.op == "replace"
+    assert [segment.text for segment in delta.after] == ["The Commandant shall acquire 3 polar security cutters."]
+    assert result.changes[1].segments == []
+
+
+def test_text_moving_into_quoted_material_is_a_change():
+    # The same words, now inserted language rather than the bill's own: display text
+    # is identical, but the unit hash must see the context as diff_segments does.
+    old = _loaded(_bill(("1", "Purpose", "Section 5 is amended by inserting cutter fleet.")), "ih")
+    new = _loaded(_bill(("1", "Purpose", "Section 5 is amended by inserting <quote>cutter fleet</quote>.")), "rh")
+    assert old.parsed.units[0].display_text == new.parsed.units[0].display_text
+
+    result = diff_units(old.parsed.units, new.parsed.units, old.unit_hashes, new.unit_hashes)
+    [change] = result.changes
+    assert (change.status, change.text_changed, result.unchanged) == ("modified", True, 0)
+    assert [s.context for delta in change.segments for s in delta.after] == ["operative", "quoted", "operative"]
+
+
+@pytest.fixture
+def two_versions(monkeypatch):
+    documents = {"BILLS-119hr9ih": INTRODUCED, "BILLS-119hr9rh": REPORTED}
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [
+            TextVersion(code="ih", date="2025-01-03", type_label="Introduced in House"),
+            TextVersion(code="rh", date="2025-06-01", type_label="Reported in House"),
+        ]
+
+    async def fake_fetch(package_id):
+        return "2025-06-01T00:00:00Z", documents[package_id]
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+
+
+@pytest.mark.asyncio
+async def test_diff_tool_returns_only_changed_sections(two_versions):
+    res = await tools.diff_bill_versions(
+        None, congress=119, bill_type="hr", number=9, from_version="ih", to_version="RH"
+    )
+    assert (res["from_version"]["package_id"], res["to_version"]["package_id"]) == ("BILLS-119hr9ih", "BILLS-119hr9rh")
+    assert (res["sections_compared"], res["sections_unchanged"], res["total_changes"]) == (6, 1, 5)
+    assert not res["changes_truncated"] and res["request_note"] is None
+
+    by_id = {change["section_id"]: change for change in res["changes"]}
+    assert "S:1" not in by_id
+    assert by_id["S:2"]["segments"] == [{
+        "op": "replace",
+        "before": "The Commandant may acquire 2 polar security cutters.",
+        "after": "The Commandant shall acquire 3 polar security cutters.",
+        "contexts": ["operative"],
+    }]
+    assert (by_id["S:5"]["status"], by_id["S:5"]["from_section_id"]) == ("renumbered", "S:3")
+    assert by_id["S:8"]["from_header"] == "Authorization of appropriations"
+    assert by_id["S:4"]["status"] == "removed" and by_id["S:4"]["segments"][0]["op"] == "delete"
+
+
+@pytest.mark.asyncio
+async def test_diff_tool_lists_changes_past_the_byte_budget_without_segments(two_versions):
+    res = await tools.diff_bill_versions(
+        None, congress=119, bill_type="hr", number=9, from_version="ih", to_version="rh",
+        max_bytes=0, max_sections=2,
+    )
+    assert res["total_changes"] == 5 and res["changes_truncated"]
+    assert len(res["changes"]) == 2
+    # Clamped to 1,000 bytes, which still covers the first two small changes.
+    assert all(change["segments"] is not None for change in res["changes"])
+    assert "clamped to 1000" in res["request_note"]
+
+    # Once the budget is spent the section is still listed, just without segments,
+    # and so is every section after it.
+    old, new = _loaded(INTRODUCED, "ih"), _loaded(REPORTED, "rh")
+    changes = diff_units(old.parsed.units, new.parsed.units, old.unit_hashes, new.unit_hashes).changes
+    first, remaining = tools._section_diff(changes[0], 60)
+    second, remaining = tools._section_diff(changes[2], remaining)
+    assert first.segments is None and second.segments is None
+    assert second.section_id == "S:6" and second.status == "added"
+
+    res = await tools.diff_bill_versions(
+        None, congress=119, bill_type="hr", number=9, from_version="ih", to_version="ih",
+    )
+    assert res["error"]["code"] == "invalid_request"
@@ -0,0 +1,152 @@
+"""
+Tests for stored bill pages: each stored package's rendered text in one memory-mapped
+file with a table of unit block spans, sliced directly by content reads.
+"""
+from pathlib import Path
+
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text import content as content_mod
+from congress_api.features.bill_text import columnar
+from congress_api.features.bill_text import pages as pages_mod
+from congress_api.features.bill_text import store as store_mod
+from congress_api.features.bill_text import tools
+from congress_api.features.bill_text.client import TextVersion
+from congress_api.features.bill_text.content import BillContent, render_bill
+from congress_api.features.bill_text.pages import open_pages, pages_path, write_pages
+from congress_api.features.bill_text.parser import parse_bill_xml
+from congress_api.features.bill_text.service import load_bill_content, load_bill_text
+from congress_api.features.bill_text.store import BillTextStore
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _parse(package_id="BILLS-119s1071enr", name="bill_text_trimmed.xml"):
+    return parse_bill_xml((FIXTURES / name).read_bytes(), package_id, "enr", "2025-12-19T03:11:48Z")
+
+
+def test_page_file_holds_the_bill_exactly_as_rendered(tmp_path, monkeypatch):
+    parsed = _parse()
+    path = write_pages(tmp_path, parsed)
+    pages = open_pages(tmp_path, parsed.package_id)
+
+    assert (pages.version, pages.last_modified) == ("enr", "2025-12-19T03:11:48Z")
+    data, spans = render_bill(parsed)
+    assert pages.data[:pages.size] == data
+    assert pages.spans == spans
+    assert [span[0] for span in spans] == [unit.section_id for unit in parsed.units]
+    assert BillContent.from_pages(pages).chunk(1, 50_000) == BillContent.from_parsed(parsed).data.decode("utf-8")
+
+    # A file from another renderer version reads as absent, never as stale text.
+    monkeypatch.setattr(pages_mod, "PAGES_FORMAT", pages_mod.PAGES_FORMAT + 1)
+    assert open_pages(tmp_path, parsed.package_id) is None
+    monkeypatch.undo()
+
+    # A truncated or foreign file reads as absent, never as wrong text.
+    path.write_bytes(path.read_bytes()[:-3])
+    assert open_pages(tmp_path, parsed.package_id) is None
+    assert open_pages(tmp_path, "BILLS-119hr1ih") is None
+
+
+def test_store_writes_and_removes_page_files(monkeypatch):
+    store = store_mod.get_bill_text_store()
+    parsed = _parse()
+    store.save(parsed)
+    path = pages_path(store.pages_dir, parsed.package_id)
+    assert path.exists()
+    assert store.pages(parsed.package_id).spans == render_bill(parsed)[1]
+
+    # A missing page file is absent on read; nothing is rebuilt on that path.
+    store._pages.pop(parsed.package_id).data.close()
+    path.unlink()
+    assert store.pages(parsed.package_id) is None and not path.exists()
+    assert store.pages("BILLS-119hr9999ih") is None
+    stored = store.stored_bytes()
+    store.save_pages(parsed)
+
+    # Page files are not counted against the cap, but go with their package.
+    assert path.exists() and store.stored_bytes() == stored
+    monkeypatch.setenv("CONGRESSMCP_CACHE_MAX_BYTES", str(stored - 1))
+    store.save(_parse("BILLS-119s1071es"))
+    assert store.package_ids() == {"BILLS-119s1071es"}
+    assert not path.exists()
+
+
+def test_store_closes_mappings_it_evicts_or_deletes():
+    store = store_mod.get_bill_text_store()
+    parsed = _parse()
+    store.save(parsed)
+    mapped = store.pages(parsed.package_id).data
+    content_mod.remember_content(BillContent.from_pages(store.pages(parsed.package_id)))
+    for n in range(store_mod._OPEN_PAGES):
+        other = _parse(f"BILLS-119s{n}enr")
+        store.save(other)
+        store.pages(other.package_id)
+    assert mapped.closed and parsed.package_id not in store._pages
+    # Chunked content sharing the closed mapping is dropped, not read from it.
+    assert content_mod.cached_content(parsed.package_id) is None
+
+    mapped = store.pages(parsed.package_id).data
+    store._delete(parsed.package_id)
+    assert mapped.closed and not pages_path(store.pages_dir, parsed.package_id).exists()
+
+
+@pytest.mark.asyncio
+async def test_content_reads_from_the_page_file_without_loading_the_parse(monkeypatch):
+    loads = []
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    real_load = BillTextStore.load
+
+    def counting_load(self, package_id):
+        loads.append(package_id)
+        return real_load(self, package_id)
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    monkeypatch.setattr(BillTextStore, "load", counting_load)
+
+    loaded = await load_bill_text(None, 119, "s", 1071, None)
+    # As if a fresh worker: nothing of the bill in this process's memory.
+    content_mod._rendered.clear()
+    columnar._resident.clear()
+    loads.clear()
+
+    resolved, content = await load_bill_content(None, 119, "s", 1071, None)
+    assert loads == []
+    assert resolved.package_id == "BILLS-119s1071enr"
+    assert content.data is store_mod.get_bill_text_store().pages(resolved.package_id).data
+    assert content.chunk(1, 50_000) == BillContent.from_parsed(loaded.parsed).data.decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_content_read_rewrites_a_missing_page_file(monkeypatch):
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    loaded = await load_bill_text(None, 119, "s", 1071, None)
+    store = store_mod.get_bill_text_store()
+    path = pages_path(store.pages_dir, loaded.resolved.package_id)
+    path.unlink()
+    content_mod._rendered.clear()
+
+    # Section reads render from the parse and leave the page file alone ...
+    section = await tools.get_bill_section(None, congress=119, bill_type="s", number=1071,
+                                           section_id=loaded.parsed.units[-1].section_id)
+    assert section["text"] and not path.exists()
+    # ... the whole-bill content read, which renders everything anyway, rewrites it.
+    _, content = await load_bill_content(None, 119, "s", 1071, None)
+    assert path.exists()
+    assert store.pages(loaded.resolved.package_id).data[:content.total_bytes] == render_bill(loaded.parsed)[0]
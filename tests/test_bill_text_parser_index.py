@@ -17,21 +17,28 @@ from congress_api.features.bill_text.client import (
     _category_note,
     _xml_url_from_summary,
 )
+from congress_api.features.bill_text.hierarchy import BillHierarchy
 from congress_api.features.bill_text.models import AncestorNode
 from congress_api.features.bill_text.parser import (
+    AMENDATORY_RE,
+    AMENDS_PL_RE,
+    AMENDS_RE,
+    AMENDS_STAT_RE,
+    AMENDS_USC_RE,
     MAX_UNIT_BYTES,
     SUBDIV_CODE,
     Segment,
     Unit,
+    _is_provenance_cite,
+    _normalize_section_dash,
     byte_split_unit,
     node_kind_for,
     parse_bill_xml,
     render_segments,
 )
+from congress_api.features.bill_text.toc import BillToc
 from congress_api.features.bill_text.tools import (
-    _hidden_section_count,
     _hidden_section_note,
-    _max_section_depth,
     _resolve_unit,
     _toc_nodes,
 )
@@ -44,6 +51,10 @@ def parse_fixture(name):
     return parse_bill_xml((FIXTURES / name).read_bytes(), "BILLS-119s1071enr", "enr", "2025-12-19T03:11:48Z")
 
 
+def toc_for(parsed):
+    return BillToc(BillHierarchy(parsed.units), parsed.subtree_bytes)
+
+
 def test_parser_skips_toc_and_preserves_quoted_contexts():
     parsed = parse_fixture("bill_text_trimmed.xml")
     index = BillTextIndex(parsed)
@@ -60,18 +71,40 @@ def test_parser_skips_toc_and_preserves_quoted_contexts():
     assert first.unit.amends == [{"kind": "usc", "cite": "14 U.S.C. 5601"}]
 
 
+@pytest.mark.parametrize("name", sorted(path.name for path in FIXTURES.glob("*.xml")))
+def test_lxml_backend_parses_fixtures_identically(name, monkeypatch):
+    pytest.importorskip("lxml")
+    from congress_api.features.bill_text import parser
+
+    raw = (FIXTURES / name).read_bytes()
+    assert parser.xml_backend() == "lxml"
+    fast = parse_bill_xml(raw, "BILLS-119s1071enr", "enr")
+    monkeypatch.setenv(parser.XML_BACKEND_ENV, "stdlib")
+    assert parser.xml_backend() == "stdlib"
+    assert fast == parse_bill_xml(raw, "BILLS-119s1071enr", "enr")
+
+
+def test_lxml_backend_drops_comments_and_processing_instructions():
+    pytest.importorskip("lxml")
+    from congress_api.features.bill_text.parser import parse_xml_tree
+
+    raw = b"<bill><?xml-stylesheet href='x'?><legis-body><!-- c --><section><text>A</text></section></legis-body></bill>"
+    fast, stdlib = parse_xml_tree(raw, "lxml"), parse_xml_tree(raw, "stdlib")
+    assert [child.tag for child in fast[0]] == [child.tag for child in stdlib[0]] == ["section"]
+
+
 def test_resolution_body_gets_synthetic_units():
     parsed = parse_fixture("hres_trimmed.xml")
     assert parsed.sections_indexed > 0
     ids = [unit.section_id for unit in parsed.units]
     assert "PRE:1" in ids
     assert "RC:1" in ids
-    assert _resolve_unit(parsed.units, "PRE:1").section_id == "PRE:1"
+    assert _resolve_unit(BillHierarchy(parsed.units), "PRE:1").section_id == "PRE:1"
 
 
 def test_bare_duplicate_section_id_errors_with_matches():
     parsed = parse_fixture("bill_text_trimmed.xml")
-    result = _resolve_unit(parsed.units, "101")
+    result = _resolve_unit(BillHierarchy(parsed.units), "101")
     assert result["error"]["code"] == "ambiguous_section_id"
     assert "D:A/T:I/S:101" in result["error"]["detail"]["matches"]
     assert "D:B/T:I/S:101" in result["error"]["detail"]["matches"]
@@ -114,7 +147,7 @@ def test_rrf_dedupes_duplicate_queries():
 
 def test_toc_depth_and_node_cap_shape():
     parsed = parse_fixture("bill_text_trimmed.xml")
-    toc, truncated, depth, _ = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
+    toc, truncated, depth, _ = _toc_nodes(toc_for(parsed), 2)
     assert depth == 2
     assert not truncated  # node cap is a separate concern from depth-limiting
     assert toc[0].section_id == "D:A"
@@ -140,12 +173,12 @@ def test_toc_flags_sections_hidden_below_returned_depth():
     )
     parsed = parse_bill_xml(xml, "BILLS-119s1071enr", "enr", None)
     # The two sections under T:I/ST:A sit at depth 3; T:II/S:201 sits at depth 2.
-    assert _max_section_depth(parsed.units) == 3
-    _, node_capped, actual, _ = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
+    assert toc_for(parsed).max_section_depth() == 3
+    _, node_capped, actual, _ = _toc_nodes(toc_for(parsed), 2)
     assert not node_capped  # nothing was cut by the node cap
-    assert _hidden_section_count(parsed.units, actual) == 2  # the two ST:A sections
+    assert toc_for(parsed).hidden_section_count(actual) == 2  # the two ST:A sections
     # Requesting the required depth reveals everything; nothing hidden.
-    assert _hidden_section_count(parsed.units, 3) == 0
+    assert toc_for(parsed).hidden_section_count(3) == 0
 
 
 def test_hidden_section_count_sees_byte_split_sections_below_depth():
@@ -167,12 +200,12 @@ def test_hidden_section_count_sees_byte_split_sections_below_depth():
     # Only CHUNK units exist for S:101; there is no plain `.../S:101` unit.
     ids = [u.section_id for u in parsed.units]
     assert ids and all(i.endswith(("/CHUNK:1", "/CHUNK:2", "/CHUNK:3")) for i in ids)
-    assert _max_section_depth(parsed.units) == 3  # the section sits at depth 3, not 1
-    _, node_capped, actual, _ = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
+    assert toc_for(parsed).max_section_depth() == 3  # the section sits at depth 3, not 1
+    _, node_capped, actual, _ = _toc_nodes(toc_for(parsed), 2)
     assert not node_capped
-    assert _hidden_section_count(parsed.units, actual) == 1  # one section, deduped
-    assert _hidden_section_count(parsed.units, 3) == 0  # revealed at its own depth
-    assert _hidden_section_note(parsed.units, actual, 2, parsed.subtree_bytes) is not None
+    assert toc_for(parsed).hidden_section_count(actual) == 1  # one section, deduped
+    assert toc_for(parsed).hidden_section_count(3) == 0  # revealed at its own depth
+    assert _hidden_section_note(toc_for(parsed), actual, 2) is not None
 
 
 def test_subdivided_parent_own_segments_are_byte_bounded():
@@ -228,9 +261,9 @@ def test_hidden_section_count_excludes_subsection_byte_chunks():
     ids = [u.section_id for u in parsed.units]
     assert "T:I/ST:A/S:101" in ids  # the subdivided parent is a real section
     assert any(i.startswith("T:I/ST:A/S:101/SS:a/CHUNK:") for i in ids)  # noise present
-    assert _max_section_depth(parsed.units) == 3  # S:101 at depth 3; SS/CHUNK excluded
-    _, _, actual, _ = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
-    assert _hidden_section_count(parsed.units, actual) == 1  # just S:101, not its chunks
+    assert toc_for(parsed).max_section_depth() == 3  # S:101 at depth 3; SS/CHUNK excluded
+    _, _, actual, _ = _toc_nodes(toc_for(parsed), 2)
+    assert toc_for(parsed).hidden_section_count(actual) == 1  # just S:101, not its chunks
 
 
 def test_oversized_leaf_byte_fallback_uses_chunk_ids():
@@ -264,7 +297,7 @@ def test_trailing_text_after_last_subdivision_is_captured():
         b"</section></legis-body></bill>"
     )
     parsed = parse_bill_xml(xml, "BILLS-119hr1ih", "ih", None)
-    parent = _resolve_unit(parsed.units, "S:101")
+    parent = _resolve_unit(BillHierarchy(parsed.units), "S:101")
     own = " ".join(seg.text for seg in parent.segments)
     assert "INTRO MATTER HERE" in own
     assert "TRAILING CLOSING TEXT THAT MATTERS" in own
@@ -335,7 +368,7 @@ def test_preamble_whereas_become_addressable_pre_units():
     assert ["PRE:1", "PRE:2", "PRE:3"] == [i for i in ids if i.startswith("PRE:")]
     assert "S:1" in ids
     assert parsed.sections_indexed >= 4  # 3 whereas + 1 section
-    assert _resolve_unit(parsed.units, "PRE:2").section_id == "PRE:2"
+    assert _resolve_unit(BillHierarchy(parsed.units), "PRE:2").section_id == "PRE:2"
     index = BillTextIndex(parsed)
     hits = index.search([normalized_query("coastal infrastructure")], 10)
     assert hits and hits[0].unit.section_id == "PRE:2"
@@ -771,6 +804,58 @@ def test_a5_is_amendatory_verb_set_is_superset_of_the_gate():
         assert u.amends == [{"kind": "public_law", "cite": "P.L. 119-38"}], verb
 
 
+def _amends_one_pass_per_form(unit):
+    # The pre-fusion extraction: one finditer per citation form, each gated on the
+    # per-segment verb check. Unit.amends must reproduce it exactly.
+    operative = [s.text for s in unit.segments if s.context == "operative"]
+    if not any(AMENDATORY_RE.search(text) for text in operative):
+        return []
+    text = "\n\n".join(operative)
+    found = set()
+    for m in AMENDS_RE.finditer(text):
+        if not _is_provenance_cite(text, m.start()):
+            found.add(("usc", f"{m.group(2)} U.S.C. {m.group(1)}"))
+    for m in AMENDS_USC_RE.finditer(text):
+        if not _is_provenance_cite(text, m.start()):
+            found.add(("usc", f"{m.group(1)} U.S.C. {_normalize_section_dash(m.group(2))}"))
+    spans = []
+    for m in AMENDS_PL_RE.finditer(text):
+        if not _is_provenance_cite(text, m.start()):
+            found.add(("public_law", f"P.L. {m.group(1)}-{m.group(2)}"))
+            spans.append(m.span())
+    for m in AMENDS_STAT_RE.finditer(text):
+        if any(a <= m.start() < b for a, b in spans) or _is_provenance_cite(text, m.start()):
+            continue
+        found.add(("public_law", f"{m.group(1)} Stat. {m.group(2)}"))
+    return [{"kind": k, "cite": c} for k, c in sorted(found)]
+
+
+@pytest.mark.parametrize("segments", [
+    # Stat absorbed by a P.L. match, and a standalone Stat after it.
+    [("operative", "Section 2 of Public Law 119-38 (139 Stat. 656) is amended; and 130 Stat. 12 is amended.")],
+    # A provenance-skipped P.L. leaves its Stat cite to be judged on its own.
+    [("operative", "Section 5 of the Act (Public Law 109-234), as amended by Public Law 118-159; 138 Stat. 1894) is amended.")],
+    # Longhand and shorthand for one target, a repeal, and an en-dash suffix.
+    [("operative", "Section 823 of title 21, United States Code (21 U.S.C. 823) is amended; 42 U.S.C. 1395w\u20134 is repealed.")],
+    # The verb split across two operative segments is not a verb; the cite stays out.
+    [("operative", "Section 2 of Public Law 119-38 is"), ("operative", "amended by the following.")],
+    [("operative", "Section 2 of Public Law 119-38 is"), ("quoted", "x"), ("operative", "further amended.")],
+    # Verb only in a quoted segment; cites in an operative one.
+    [("operative", "Section 5601 of title 14, United States Code,"), ("quoted", "is amended")],
+    [("operative", "Section 5601 of title 14, United States Code, is amended by redesignating 7 U.S.C. 2012 is amended.")],
+])
+def test_fused_amends_scan_matches_the_per_form_passes(segments):
+    unit = Unit("S:1", [], None, [Segment(context, text) for context, text in segments])
+    assert unit.amends == _amends_one_pass_per_form(unit)
+
+
+def test_fused_amends_scan_matches_the_per_form_passes_on_fixtures():
+    units = [unit for path in sorted(FIXTURES.glob("*.xml")) for unit in parse_fixture(path.name).units]
+    assert any(unit.amends for unit in units)
+    for unit in units:
+        assert unit.amends == _amends_one_pass_per_form(unit), unit.section_id
+
+
 def test_v18_is_amendatory_is_verb_only_quote_alone_does_not_fire():
     # V18: the quote branch is dropped. A quoted segment with no amendatory verb -- an
     # appropriations account heading, a short title, a defined term -- is NOT amendatory.
@@ -1370,7 +1455,7 @@ def test_f5_toc_ids_come_from_the_unit_id_not_ancestor_path_plus_leaf():
         header="Section header",
         segments=[Segment("operative", "body text")],
     )
-    nodes = _toc_nodes([chunk], 5, {})[0]
+    nodes = _toc_nodes(BillToc(BillHierarchy([chunk]), {}), 5)[0]
     ids = []
     stack = list(nodes)
     while stack:
@@ -1396,7 +1481,7 @@ def test_f5_ambiguous_bare_enum_is_not_swallowed_by_container_resolution():
         b"</legis-body></bill>"
     )
     parsed = parse_bill_xml(xml, "BILLS-119s1071enr", "enr", None)
-    result = _resolve_unit(parsed.units, "101")
+    result = _resolve_unit(BillHierarchy(parsed.units), "101")
     assert isinstance(result, dict) and result["error"]["code"] == "ambiguous_section_id"
 
 
@@ -1771,8 +1856,8 @@ def test_subdivide_disambiguates_colliding_subsection_enums():
     # The source enum is "1832." and F2 strips the trailing heading terminator, so the
     # id is S:1832 -- the # suffix still disambiguates the two real "(e)" subsections.
     assert "S:1832/SS:(e)" in ids and "S:1832/SS:(e)#2" in ids
-    first = _resolve_unit(parsed.units, "S:1832/SS:(e)")
-    second = _resolve_unit(parsed.units, "S:1832/SS:(e)#2")
+    first = _resolve_unit(BillHierarchy(parsed.units), "S:1832/SS:(e)")
+    second = _resolve_unit(BillHierarchy(parsed.units), "S:1832/SS:(e)#2")
     assert not isinstance(first, dict) and not isinstance(second, dict)
     assert first.header == "first e" and second.header == "second e"   # both reachable, distinct
     parent = next(u for u in parsed.units if u.section_id == "S:1832")
@@ -1962,7 +2047,7 @@ def test_f4_struck_sections_are_excluded_and_disclosed():
     assert not any("#" in i for i in ids)          # no V8 collision suffix masking the duplication
     assert parsed.sections_indexed == 1
     assert parsed.struck_sections_excluded == 1
-    unit = _resolve_unit(parsed.units, "1")
+    unit = _resolve_unit(BillHierarchy(parsed.units), "1")
     assert "Substitute text about cutters." in unit.display_text
     assert "icebreakers" not in unit.display_text   # struck text is gone, not merely flagged
     # Struck text must not be searchable either -- it is not in the bill as reported.
@@ -2103,7 +2188,7 @@ def test_f2_trailing_period_is_stripped_from_ids_and_accepted_on_input():
     # Both spellings resolve: the bare enum a citation uses, and the "SEC. 804."
     # typography a model copies out of the statutory text.
     for requested in ("804", "804.", "S:804", "S:804."):
-        unit = _resolve_unit(parsed.units, requested)
+        unit = _resolve_unit(BillHierarchy(parsed.units), requested)
         assert not isinstance(unit, dict), f"{requested!r} failed to resolve: {unit}"
         assert unit.header == "Alpha"
 
@@ -2121,7 +2206,7 @@ def test_f2_ambiguous_bare_enum_still_errors_rather_than_guessing():
     )
     parsed = parse_bill_xml(xml, "BILLS-119s1071enr", "enr", None)
     for requested in ("804", "804."):
-        result = _resolve_unit(parsed.units, requested)
+        result = _resolve_unit(BillHierarchy(parsed.units), requested)
         assert isinstance(result, dict)
         assert result["error"]["code"] == "ambiguous_section_id"
         assert sorted(result["error"]["detail"]["matches"]) == ["D:A/S:804", "D:B/S:804"]
@@ -2135,11 +2220,11 @@ def test_synthetic_pre_rc_units_resolve_and_navigate():
     ids = [u.section_id for u in parsed.units]
     assert "PRE:1" in ids and "RC:1" in ids
     for sid in ("PRE:1", "RC:1"):
-        unit = _resolve_unit(parsed.units, sid)
+        unit = _resolve_unit(BillHierarchy(parsed.units), sid)
         assert not isinstance(unit, dict), f"{sid} failed to resolve: {unit}"
         assert unit.section_id == sid
         assert node_kind_for(sid) == "synthetic"
-    root_ids = [n.section_id for n in _toc_nodes(parsed.units, 5, parsed.subtree_bytes)[0]]
+    root_ids = [n.section_id for n in _toc_nodes(toc_for(parsed), 5)[0]]
     assert "PRE:1" in root_ids and "RC:1" in root_ids
 
 
@@ -2374,6 +2459,36 @@ def test_zero_hit_diagnostic_absence_test_runs_against_the_search_index():
     assert "icebreak" in missing.terms       # the real one still reported, not absent
 
 
+def test_zero_hit_diagnostic_suggests_near_terms_and_the_phrases_that_do_match(monkeypatch):
+    from congress_api.features.bill_text import vocabulary
+
+    parsed = parse_fixture("bill_text_trimmed.xml")
+    index = BillTextIndex(parsed)
+
+    # A misspelling gets the bill's own spelling, stemmed as terms are.
+    typo = index.diagnose(normalized_query("polar securty cutter"))
+    assert typo.absent == ["securti"] and typo.near_terms == {"securti": ["secur"]}
+    # Nothing is offered for a term with no near miss, nor for a number.
+    assert index.diagnose(normalized_query("zzqqxx")).near_terms == {}
+    assert vocabulary.BillVocabulary({"2302": 4}).near("2303") == []
+
+    # A phrasing miss names the longest runs of the query the bill does contain.
+    phrasing = index.diagnose(normalized_query("icebreaker polar security"))
+    assert phrasing.matching_phrases == ["polar security"]
+    mixed = index.diagnose(normalized_query("Amended by striking forces"))
+    assert mixed.matching_phrases == ["amended by striking"]
+
+    # The vocabulary is built once per package, not per diagnosis or per index.
+    built = []
+    real = vocabulary.BillVocabulary.from_index
+    monkeypatch.setattr(vocabulary.BillVocabulary, "from_index",
+                        classmethod(lambda cls, conn: built.append(1) or real(conn)))
+    monkeypatch.setattr(vocabulary, "_vocabularies", type(vocabulary._vocabularies)())
+    BillTextIndex(parsed).diagnose(normalized_query("icebraker"))
+    assert BillTextIndex(parsed).diagnose(normalized_query("icebraker")).near_terms == {"icebrak": ["icebreak"]}
+    assert built == [1]
+
+
 @pytest.mark.asyncio
 async def test_search_response_diagnoses_only_the_queries_that_died(monkeypatch):
     import congress_api.features.bill_text.tools as tools_mod
@@ -2431,6 +2546,70 @@ def test_query_matches_ignores_ranking_and_the_max_hits_cap():
     assert "S:9" not in [h.unit.section_id for h in ranked]
 
 
+def test_batched_ranking_uses_constant_statements_and_agrees_with_per_query_probes():
+    # One statement ranks every query; the zero-hit set and the diagnoses come out of
+    # the same pass, so statement count must not grow with the number of queries.
+    parsed = parse_fixture("bill_text_trimmed.xml")
+    index = BillTextIndex(parsed)
+    # The suggestion vocabulary is read once per package, on its first diagnosis.
+    index.diagnose("zzqqxx")
+    statements = []
+
+    class CountingConnection:
+        def __init__(self, conn):
+            self._conn = conn
+
+        def execute(self, *args):
+            statements.append(args[0])
+            return self._conn.execute(*args)
+
+        def executemany(self, *args):
+            statements.append(args[0])
+            return self._conn.executemany(*args)
+
+    index.conn = CountingConnection(index.conn)
+
+    def run(queries):
+        statements.clear()
+        outcome = index.rank([normalized_query(q) for q in queries], 10)
+        index.diagnose_many(outcome.unmatched)
+        return outcome, len(statements)
+
+    few, few_count = run(["icebreaker", "cryptocurrency"])
+    many, many_count = run(["icebreaker", "cryptocurrency", "polar security cutter", "coast guard",
+                            "zzqqxx", "amended by striking", "icebreaker polar security", "vessel"])
+    index.conn = index.conn._conn
+    assert few_count == many_count
+    assert few.unmatched == ["cryptocurrency"]
+    for query in many.unmatched + [h for hit in many.hits for h in hit.matched_queries]:
+        assert index.query_matches(query) is (query not in many.unmatched)
+    batched = index.diagnose_many(many.unmatched)
+    assert batched == {query: index.diagnose(query) for query in many.unmatched}
+
+
+def test_ranking_is_truncated_when_any_query_overflows_its_cap():
+    # "beta" matches six sections, "alpha" four of the same ones. With a cap of four,
+    # beta's overflow is units alpha already made candidates (or re-admits), so no
+    # unit goes missing from the fused ranking -- but beta's own ranks were cut.
+    secs = b"".join(
+        b"<section><enum>%d</enum><header>Long %d</header><text>alpha beta and more words here</text></section>"
+        % (n, n)
+        for n in range(1, 5)
+    )
+    secs += b"".join(
+        b"<section><enum>%d</enum><header>Short %d</header><text>beta</text></section>" % (n, n)
+        for n in range(5, 7)
+    )
+    parsed = parse_bill_xml(b"<bill><legis-body>" + secs + b"</legis-body></bill>", "BILLS-119hr1ih", "ih", None)
+    index = BillTextIndex(parsed)
+    for queries in (["alpha", "beta"], ["beta", "alpha"]):
+        outcome = index.rank(queries, 10, depth=4)
+        assert len(outcome.ranked) == 6
+        assert outcome.truncated is True
+    assert index.rank(["alpha", "beta"], 10, depth=6).truncated is False
+    assert index.rank(["alpha"], 10, depth=4).truncated is False
+
+
 @pytest.mark.asyncio
 async def test_matched_query_outranked_by_max_hits_is_not_diagnosed(monkeypatch):
     # Regression: query_diagnostics was derived from the truncated result list, so a
@@ -2484,9 +2663,9 @@ def test_toc_depth_reduced_is_false_when_the_depth_was_honored():
     # has been -- so a caller reading it alone cannot distinguish this from a request
     # that was silently overridden. depth_reduced must separate them.
     parsed = parse_bill_xml(_deep_bill_xml(2, 2, 2), "BILLS-119s1071enr", "enr", None)
-    toc, capped, actual, list_truncated = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
+    toc, capped, actual, list_truncated = _toc_nodes(toc_for(parsed), 2)
     assert actual == 2 and not capped and not list_truncated
-    assert _hidden_section_note(parsed.units, actual, 2, parsed.subtree_bytes) is not None
+    assert _hidden_section_note(toc_for(parsed), actual, 2) is not None
 
 
 def test_toc_depth_reduced_fires_only_on_an_actual_reduction():
@@ -2495,7 +2674,7 @@ def test_toc_depth_reduced_fires_only_on_an_actual_reduction():
     # response -- reporting only the served depth is what forced a consumer to diff
     # its own request to notice, and neither cell did.
     parsed = parse_bill_xml(_deep_bill_xml(2, 10, 30), "BILLS-119s1071enr", "enr", None)
-    _, capped, actual, list_truncated = _toc_nodes(parsed.units, 5, parsed.subtree_bytes)
+    _, capped, actual, list_truncated = _toc_nodes(toc_for(parsed), 5)
     assert capped is True and actual < 5 and not list_truncated
 
 
@@ -2506,7 +2685,7 @@ def test_toc_node_cap_at_depth_one_is_a_cut_list_not_a_depth_reduction():
     # The two degradations are different losses and need different signals -- and the
     # cut list was previously disclosed by nothing at all.
     parsed = parse_bill_xml(_deep_bill_xml(600, 1, 1), "BILLS-119s1071enr", "enr", None)
-    _, capped, actual, list_truncated = _toc_nodes(parsed.units, 1, parsed.subtree_bytes)
+    _, capped, actual, list_truncated = _toc_nodes(toc_for(parsed), 1)
     assert actual == 1                 # the requested depth was honored...
     assert capped is False             # ...so this is NOT a depth reduction
     assert list_truncated is True      # ...it is a truncated list
@@ -2565,9 +2744,9 @@ def test_toc_hidden_advice_promises_depth_only_when_servable():
     # V5 gap 2: when the depth ARGUMENT is what hides sections and the full tree still
     # fits under the node cap, advise the reachable depth.
     parsed = parse_bill_xml(_deep_bill_xml(2, 2, 2), "BILLS-119s1071enr", "enr", None)  # tiny, 8 sections
-    toc, capped, actual, _ = _toc_nodes(parsed.units, 2, parsed.subtree_bytes)
+    toc, capped, actual, _ = _toc_nodes(toc_for(parsed), 2)
     assert not capped and actual == 2
-    note = _hidden_section_note(parsed.units, actual, 2, parsed.subtree_bytes)
+    note = _hidden_section_note(toc_for(parsed), actual, 2)
     assert note and "call with depth=3" in note  # depth 3 is servable, so promise it
 
 
@@ -2576,11 +2755,11 @@ def test_toc_hidden_advice_does_not_recommend_a_depth_the_node_cap_blocks():
     # sections, advising "call with depth=N" is circular -- that call re-caps to the same
     # tree. 2*10*30 = 600 sections exceed 500 at depth 3, forcing degradation to depth 2.
     parsed = parse_bill_xml(_deep_bill_xml(2, 10, 30), "BILLS-119s1071enr", "enr", None)
-    toc, capped, actual, _ = _toc_nodes(parsed.units, 5, parsed.subtree_bytes)
+    toc, capped, actual, _ = _toc_nodes(toc_for(parsed), 5)
     assert capped and actual < 3  # the cap forced a depth shallower than the sections
-    note = _hidden_section_note(parsed.units, actual, 5, parsed.subtree_bytes)
+    note = _hidden_section_note(toc_for(parsed), actual, 5)
     assert note is not None
-    required = _max_section_depth(parsed.units)
+    required = toc_for(parsed).max_section_depth()
     assert f"call with depth={required}" not in note   # would be circular
     assert "search_bill_text" in note and "deepest listable depth" in note
 
@@ -2634,3 +2813,50 @@ async def test_keyless_401_from_govinfo_search_raises_api_key_missing(monkeypatc
     with pytest.raises(BillTextError) as exc:
         await govinfo_search_versions(119, "hres", 463)
     assert exc.value.code == "govinfo_key_rejected"
+
+
+def test_hierarchy_agrees_with_scanning_every_unit():
+    # The precomputed tree must answer exactly what the per-call scans it replaced
+    # derived: prefix descendants, first-appearance children, and bare-enum matches,
+    # all in document order.
+    parsed = parse_fixture("bill_text_trimmed.xml")
+    hierarchy = BillHierarchy(parsed.units)
+    prefixes = {
+        "/".join(unit.section_id.split("/")[:depth])
+        for unit in parsed.units
+        for depth in range(1, len(unit.section_id.split("/")) + 1)
+    }
+    for prefix in prefixes:
+        scanned = [u for u in parsed.units if u.section_id.startswith(f"{prefix}/")]
+        assert hierarchy.descendants(prefix) == scanned
+        depth = len(prefix.split("/"))
+        expected_children = list(dict.fromkeys(
+            "/".join(u.section_id.split("/")[: depth + 1]) for u in scanned
+        ))
+        assert hierarchy.children(prefix) == expected_children
+    assert hierarchy.children() == list(dict.fromkeys(u.section_id.split("/")[0] for u in parsed.units))
+    for unit in parsed.units:
+        leaf = unit.section_id.split("/")[-1]
+        bare = leaf.removeprefix("S:")
+        expected = [u for u in parsed.units if u.section_id.split("/")[-1] in (f"S:{bare}", bare)]
+        assert hierarchy.bare_matches(bare) == expected
+
+
+def test_toc_views_are_truncations_of_one_precomputed_tree():
+    parsed = parse_fixture("bill_text_trimmed.xml")
+    toc = BillToc(BillHierarchy(parsed.units), parsed.subtree_bytes)
+    full = toc.view(5)
+
+    def cut(nodes, depth):
+        return [
+            node.model_copy(update={"children": cut(node.children, depth - 1) if depth > 1 else []})
+            for node in nodes
+        ]
+
+    def count(nodes):
+        return sum(1 + count(node.children) for node in nodes)
+
+    for depth in range(1, 6):
+        assert toc.view(depth) == cut(full, depth)
+        assert toc.node_count(depth) == count(toc.view(depth))
+    assert [node.section_id for node in toc.view(2, max_roots=1)] == [full[0].section_id]
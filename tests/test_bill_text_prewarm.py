@@ -0,0 +1,130 @@
+"""
+Tests for prewarming the bill-text cache from a watchlist: each watched bill is
+resolved, fetched and parsed into the store so an interactive call is an index hit,
+and every pass re-asks for the version list so a new text version is picked up.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text import prewarm
+from congress_api.features.bill_text.client import BillTextError, TextVersion
+from congress_api.features.bill_text.prewarm import WatchedBill, in_prewarm_window, parse_watchlist
+from congress_api.features.bill_text.service import load_bill_text
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_watchlist_lines_parse_to_bills_and_malformed_lines_are_refused():
+    bills = parse_watchlist(
+        """
+        # FY2025 appropriations
+        118 hr 4366
+        118 H.R. 4366          # duplicate, different spelling
+        119 s 1071 enr
+        118 hjres 100
+        """
+    )
+    assert bills == [
+        WatchedBill(118, "hr", 4366),
+        WatchedBill(119, "s", 1071, "enr"),
+        WatchedBill(118, "hjres", 100),
+    ]
+    with pytest.raises(ValueError, match="line 2"):
+        parse_watchlist("118 hr 1\nhr 4366\n")
+    with pytest.raises(ValueError, match="unknown bill type"):
+        parse_watchlist("118 bill 1")
+
+
+@pytest.mark.parametrize(
+    "hour, spec, allowed",
+    [
+        (14, None, True),
+        (2, "1-5", True),
+        (5, "1-5", False),
+        (23, "22-4", True),
+        (3, "22-4", True),
+        (12, "22-4", False),
+        (12, "nightly", True),     # malformed: logged, never blocks the job
+    ],
+)
+def test_prewarm_window_is_end_exclusive_and_wraps_midnight(hour, spec, allowed):
+    assert in_prewarm_window(hour, spec) is allowed
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fetches_once_rechecks_versions_and_limits_concurrency(monkeypatch):
+    listed = {1071: [TextVersion(code="is", date="2025-03-01", type_label="Introduced in Senate")]}
+    version_calls, fetched = [], []
+    in_flight = peak = 0
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        version_calls.append(number)
+        if number not in listed:
+            raise BillTextError("bill_not_found", f"No such bill {number}.")
+        return list(listed[number])
+
+    async def fake_fetch(package_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        fetched.append(package_id)
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    for number in (1, 2, 3):
+        listed[number] = [TextVersion(code="is", date="2025-03-01", type_label="Introduced in Senate")]
+    bills = [WatchedBill(119, "s", number) for number in (1071, 1, 2, 3, 9999)]
+
+    results = await prewarm.prewarm_bills(bills, concurrency=2)
+    assert [result.bill for result in results] == bills
+    assert [result.state for result in results] == ["fetched"] * 4 + [None]
+    assert results[-1].error.startswith("bill_not_found")
+    assert peak == 2
+
+    # Interactive calls now hit the warm store and the cached version list.
+    loaded = await load_bill_text(None, 119, "s", 1071, None)
+    assert (loaded.index_hit, loaded.resolved.version_resolution) == (True, "cached")
+
+    # The next pass asks congress.gov again even though the stored list is fresh,
+    # and fetches only the version that appeared since.
+    listed[1071].append(TextVersion(code="rs", date="2025-06-01", type_label="Reported in Senate"))
+    version_calls.clear()
+    fetched.clear()
+    results = await prewarm.prewarm_bills(bills[:2], concurrency=2)
+    assert sorted(version_calls) == [1, 1071]
+    assert fetched == ["BILLS-119s1071rs"]
+    assert [(result.package_id, result.state) for result in results] == [
+        ("BILLS-119s1071rs", "fetched"),
+        ("BILLS-119s1is", "cached"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_watchlist_job_runs_only_when_configured(monkeypatch, tmp_path):
+    monkeypatch.delenv(prewarm.WATCHLIST_ENV, raising=False)
+    async with prewarm.watchlist_job() as task:
+        assert task is None
+
+    passes = []
+
+    async def fake_prewarm_bills(bills, concurrency=None):
+        passes.append(bills)
+        return []
+
+    watchlist = tmp_path / "watchlist.txt"
+    watchlist.write_text("119 s 1071\n")
+    monkeypatch.setenv(prewarm.WATCHLIST_ENV, str(watchlist))
+    monkeypatch.delenv(prewarm.PREWARM_HOURS_ENV, raising=False)
+    monkeypatch.setattr(prewarm, "prewarm_bills", fake_prewarm_bills)
+    async with prewarm.watchlist_job() as task:
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert passes == [[WatchedBill(119, "s", 1071)]]
+    assert task.cancelled()
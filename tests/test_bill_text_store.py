@@ -0,0 +1,355 @@
+"""
+Tests for the persistent bill-text cache and the cross-bill corpus behind
+search_bill_corpus.
+
+A parsed package is stored once and read back instead of re-downloaded and
+re-parsed. Segment text and corpus documents are content-addressed, so versions of
+one bill share storage and a shared section is tokenised once; cross-bill
+questions are answered from the corpus without loading a bill.
+"""
+from pathlib import Path
+
+import pytest
+
+from congress_api.features.bill_text import client as client_mod
+from congress_api.features.bill_text import store as store_mod
+from congress_api.features.bill_text import tools
+from congress_api.features.bill_text.client import TextVersion
+from congress_api.features.bill_text.index import BillTextIndex, normalized_query
+from congress_api.features.bill_text.parser import Segment, parse_bill_xml
+from congress_api.features.bill_text.service import load_bill_text
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _parse(package_id, version, name="bill_text_trimmed.xml"):
+    return parse_bill_xml((FIXTURES / name).read_bytes(), package_id, version, "2025-12-19T03:11:48Z")
+
+
+def test_stored_package_round_trips_to_an_identical_parse():
+    parsed = _parse("BILLS-119s1071enr", "enr")
+    store = store_mod.get_bill_text_store()
+    store.save(parsed)
+
+    loaded = store.load("BILLS-119s1071enr")
+    assert loaded is not None
+    assert loaded.units == parsed.units
+    assert loaded.subtree_bytes == parsed.subtree_bytes
+    assert loaded.quotes_seen == parsed.quotes_seen
+    assert (loaded.sections_indexed, loaded.struck_sections_excluded, loaded.last_modified) == (
+        parsed.sections_indexed, parsed.struck_sections_excluded, parsed.last_modified,
+    )
+    # The per-bill index built from the stored parse ranks exactly as the original.
+    query = [normalized_query("icebreaker")]
+    assert [hit.unit.section_id for hit in BillTextIndex(loaded).search(query, 10)] == [
+        hit.unit.section_id for hit in BillTextIndex(parsed).search(query, 10)
+    ]
+    assert store.load("BILLS-119hr9999ih") is None
+
+
+def test_corpus_search_ranks_across_packages_and_filters_by_package_fields():
+    store = store_mod.get_bill_text_store()
+    store.save(_parse("BILLS-119s1071enr", "enr"))
+    store.save(_parse("BILLS-118hres100ih", "ih", "hres_trimmed.xml"))
+    store.save(_parse("BILLS-118hr200ih", "ih"))
+
+    hits = store.search([normalized_query("polar security cutter")], 10)
+    assert {hit.package_id for hit in hits} == {"BILLS-119s1071enr", "BILLS-118hr200ih"}
+    assert all(hit.section_id == "D:A/T:I/S:101" for hit in hits)
+    assert hits[0].matched_queries == ["polar security cutter"]
+    assert "polar security cutter" in hits[0].snippet.lower()
+
+    filtered = store.search([normalized_query("polar security cutter")], 10, congress=119, bill_type="S")
+    assert [(hit.package_id, hit.congress, hit.bill_type, hit.number, hit.version) for hit in filtered] == [
+        ("BILLS-119s1071enr", 119, "s", 1071, "enr")
+    ]
+    assert store.search([normalized_query("polar security cutter")], 10, version="eh") == []
+
+
+def test_corpus_amends_index_answers_without_a_text_query():
+    store = store_mod.get_bill_text_store()
+    store.save(_parse("BILLS-119s1071enr", "enr"))
+    store.save(_parse("BILLS-118hr200ih", "ih"))
+
+    # Citation match is whitespace- and case-insensitive.
+    hits = store.search([], 10, amends="14  u.s.c. 5601")
+    assert [hit.package_id for hit in hits] == ["BILLS-119s1071enr", "BILLS-118hr200ih"]
+    assert all(hit.amends == [{"kind": "usc", "cite": "14 U.S.C. 5601"}] for hit in hits)
+    assert all(hit.is_amendatory for hit in hits)
+
+    # A text query narrowed by amends keeps only sections that amend the target.
+    assert store.search([normalized_query("port infrastructure")], 10)
+    assert store.search([normalized_query("port infrastructure")], 10, amends="14 U.S.C. 5601") == []
+    assert store.search([], 10, amends="10 U.S.C. 2302") == []
+
+
+def _counts(store):
+    return {
+        table: store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("texts", "docs", "docs_fts")
+    }
+
+
+def test_versions_of_one_bill_share_stored_text_and_corpus_documents():
+    store = store_mod.get_bill_text_store()
+    store.save(_parse("BILLS-119s1071es", "es"))
+    before = _counts(store)
+
+    # A later version whose text is identical adds no text and tokenises nothing.
+    store.save(_parse("BILLS-119s1071enr", "enr"))
+    assert _counts(store) == before
+    assert store.load("BILLS-119s1071enr").units == store.load("BILLS-119s1071es").units
+
+    # A version with one changed section stores exactly that section's new text.
+    parsed = _parse("BILLS-119s1071eah", "eah")
+    unit = next(unit for unit in parsed.units if unit.segments)
+    unit.segments[0] = Segment(unit.segments[0].context, "A wholly new sentence.", unit.segments[0].inline)
+    store.save(parsed)
+    after = _counts(store)
+    assert after["texts"] == before["texts"] + 1
+    # The changed section is one new document -- plus any ancestor whose text
+    # includes it -- never a re-index of the whole bill.
+    assert 1 <= after["docs"] - before["docs"] < len(parsed.units)
+    assert after["docs_fts"] == after["docs"]
+    hits = store.search([normalized_query("wholly new sentence")], 10)
+    assert [(hit.package_id, hit.section_id) for hit in hits] == [("BILLS-119s1071eah", unit.section_id)]
+
+    # Removing a package keeps text another version still references.
+    store.remove(["BILLS-119s1071es", "BILLS-119s1071enr"])
+    assert store.load("BILLS-119s1071eah").units == parsed.units
+    assert _counts(store)["texts"] == after["texts"] - 1
+
+
+def test_eviction_drops_least_recently_read_packages_and_their_text(monkeypatch):
+    store = store_mod.get_bill_text_store()
+    store.save(_parse("BILLS-118hr200ih", "ih"))
+    store.save(parse_bill_xml(_AMENDING_XML, "BILLS-119hr5000ih", "ih"))
+    store.save(_parse("BILLS-119s1071enr", "enr"))
+    store.load("BILLS-118hr200ih")
+    texts = _counts(store)["texts"]
+
+    assert store.evict() == []
+    # Over the cap, packages go least recently read first, never the one being kept.
+    monkeypatch.setenv("CONGRESSMCP_CACHE_MAX_BYTES", "1")
+    assert store.evict(keep="BILLS-119s1071enr") == ["BILLS-119hr5000ih", "BILLS-118hr200ih"]
+    assert store.package_ids() == {"BILLS-119s1071enr"}
+    assert store.search([], 10, amends="10 U.S.C. 2302") == []
+    # Text unique to an evicted package goes with it; shared text stays.
+    assert 0 < _counts(store)["texts"] < texts
+    assert store.load("BILLS-119s1071enr").units == _parse("BILLS-119s1071enr", "enr").units
+
+
+@pytest.mark.asyncio
+async def test_second_load_is_served_from_the_store_without_fetching(monkeypatch):
+    fetched = []
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill")]
+
+    async def fake_fetch(package_id):
+        fetched.append(package_id)
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+
+    first = await load_bill_text(None, 119, "s", 1071, None)
+    second = await load_bill_text(None, 119, "s", 1071, None)
+    assert fetched == ["BILLS-119s1071enr"]
+    assert (first.index_hit, second.index_hit) == (False, True)
+    assert second.parsed.units == first.parsed.units
+    assert second.resolved.last_modified == first.resolved.last_modified
+    assert tools._envelope(second)["cache"]["index_hit"] is True
+
+    # Loading a bill is what adds it to the corpus the tool searches.
+    res = await tools.search_bill_corpus(None, queries=["polar security cutter"], congress=119)
+    assert res["packages_indexed"] == 1
+    assert [(hit["package_id"], hit["section_id"]) for hit in res["hits"]] == [
+        ("BILLS-119s1071enr", "D:A/T:I/S:101")
+    ]
+    assert res["hits"][0]["amends"] == [{"kind": "usc", "cite": "14 U.S.C. 5601"}]
+
+
+@pytest.mark.asyncio
+async def test_search_bill_corpus_requires_queries_or_amends():
+    res = await tools.search_bill_corpus(None)
+    assert res["error"]["code"] == "invalid_request"
+
+    res = await tools.search_bill_corpus(None, amends="14 U.S.C. 5601", max_hits=500)
+    assert res["hits"] == [] and res["packages_indexed"] == 0
+    assert "clamped to 100" in res["request_note"]
+
+
+_AMENDING_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<bill><legis-body>
+  <section><enum>1</enum><header>Procurement</header>
+    <text>Section 2302(b) of title 10, United States Code, is amended by striking <quote>may</quote>.</text>
+  </section>
+  <section><enum>2</enum><header>Definitions</header>
+    <text>Section 2302 of title 10, United States Code, is amended by adding at the end the following.</text>
+  </section>
+  <section><enum>3</enum><header>Conforming amendment</header>
+    <text>Section 5 of the James M. Inhofe Act (Public Law 117&#8211;263) is amended by striking <quote>2023</quote>.</text>
+  </section>
+  <section><enum>4</enum><header>Cross-reference</header>
+    <text>In this Act, the term acquisition has the meaning given in section 2302 of title 10, United States Code.</text>
+  </section>
+</legis-body></bill>
+"""
+
+
+@pytest.mark.parametrize(
+    "spelling, canonical",
+    [
+        ("10 U.S.C. 2302", "10 U.S.C. 2302"),
+        ("10 USC § 2302(b)(1)", "10 U.S.C. 2302"),
+        ("section 2302 of title 10, United States Code", "10 U.S.C. 2302"),
+        ("Pub. L. No. 117–263", "P.L. 117-263"),
+        ("42 U.S.C. 1395w–4", "42 U.S.C. 1395w-4"),
+        ("136 Stat. 2395", "136 Stat. 2395"),
+    ],
+)
+def test_citation_spellings_normalise_to_one_target(spelling, canonical):
+    from congress_api.features.bill_text.citations import parse_citation
+
+    assert parse_citation(spelling).cite == canonical
+    assert parse_citation(spelling).key == parse_citation(canonical).key
+
+
+@pytest.mark.asyncio
+async def test_find_amending_sections_is_an_indexed_reverse_lookup():
+    store = store_mod.get_bill_text_store()
+    store.save(parse_bill_xml(_AMENDING_XML, "BILLS-119hr5000ih", "ih"))
+    store.save(parse_bill_xml(_AMENDING_XML, "BILLS-118s20es", "es"))
+
+    res = await tools.find_amending_sections(None, citation="10 USC 2302")
+    assert (res["citation"], res["kind"], res["total_sections"]) == ("10 U.S.C. 2302", "usc", 4)
+    # Newest Congress first; subsection amendments match the section; a bare
+    # cross-reference (section 4) is not an amendment and is not indexed.
+    assert [(row["package_id"], row["section_id"], row["cite"]) for row in res["sections"]] == [
+        ("BILLS-119hr5000ih", "S:1", "10 U.S.C. 2302(b)"),
+        ("BILLS-119hr5000ih", "S:2", "10 U.S.C. 2302"),
+        ("BILLS-118s20es", "S:1", "10 U.S.C. 2302(b)"),
+        ("BILLS-118s20es", "S:2", "10 U.S.C. 2302"),
+    ]
+    assert all(row["is_amendatory"] for row in res["sections"])
+
+    res = await tools.find_amending_sections(None, citation="Public Law 117-263", congress=118, max_hits=0)
+    assert res["total_sections"] == 1 and res["sections"][0]["section_id"] == "S:3"
+    assert "clamped" in res["request_note"]
+
+    res = await tools.find_amending_sections(None, citation="the Inhofe Act")
+    assert res["error"]["code"] == "invalid_request"
+
+
+@pytest.mark.asyncio
+async def test_version_list_is_reused_within_its_ttl_and_refreshed_for_an_unlisted_version(monkeypatch):
+    listed = [TextVersion(code="is", date="2025-03-01", type_label="Introduced in Senate")]
+    calls = []
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        calls.append(number)
+        return list(listed)
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+
+    first = await load_bill_text(None, 119, "s", 1071, None)
+    second = await load_bill_text(None, 119, "S", 1071, None)
+    assert calls == [1071]
+    assert (first.resolved.version_resolution, second.resolved.version_resolution) == ("fresh", "cached")
+    assert second.resolved.version_resolved_at == first.resolved.version_resolved_at
+    assert tools._envelope(second)["cache"] == {"index_hit": True, "version_hit": True}
+    assert tools._envelope(second)["version_resolution"] == "cached"
+
+    # A version the stored list does not have means the list is stale: ask again.
+    listed.append(TextVersion(code="rs", date="2025-06-01", type_label="Reported in Senate"))
+    third = await load_bill_text(None, 119, "s", 1071, "rs")
+    assert calls == [1071, 1071]
+    assert (third.resolved.package_id, third.resolved.version_resolution) == ("BILLS-119s1071rs", "fresh")
+
+    # An expired list is enumerated again, and with a TTL of 0 it is not stored.
+    monkeypatch.setenv("CONGRESSMCP_VERSION_TTL", "0")
+    store = store_mod.get_bill_text_store()
+    store.conn.execute("UPDATE resolutions SET expires_at = 0")
+    for _ in range(2):
+        assert (await load_bill_text(None, 119, "s", 1071, None)).resolved.version_resolution == "fresh"
+    assert len(calls) == 4
+
+
+@pytest.mark.parametrize(
+    "codes, ttl",
+    [
+        (["ih"], 21_600),
+        (["ih", "rh"], 21_600),
+        (["ih", "eh"], 86_400),
+        (["ih", "eh", "enr"], 30 * 86_400),
+        (["ath"], 30 * 86_400),
+        (["ih", "zz"], 21_600),
+    ],
+)
+def test_version_list_ttl_follows_the_latest_stage(codes, ttl):
+    versions = [TextVersion(code=code, date="2025-01-01", type_label="") for code in codes]
+    assert client_mod.version_list_ttl(versions) == ttl
+
+
+@pytest.mark.asyncio
+async def test_upstream_outage_serves_the_cached_package_and_says_so(monkeypatch):
+    import httpx
+
+    from congress_api.features.bill_text.client import BillTextError
+
+    async def fake_versions(ctx, congress, bill_type, number):
+        return [
+            TextVersion(code="es", date="2025-09-01", type_label="Engrossed in Senate"),
+            TextVersion(code="enr", date="2025-12-18", type_label="Enrolled Bill"),
+        ]
+
+    async def fake_fetch(package_id):
+        return "2025-12-19T03:11:48Z", (FIXTURES / "bill_text_trimmed.xml").read_bytes()
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", fake_versions)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", fake_fetch)
+    first = await load_bill_text(None, 119, "s", 1071, "es")
+
+    async def congress_down(*args):
+        raise BillTextError("congress_unavailable", "down")
+
+    async def govinfo_down(*args, **kwargs):
+        raise httpx.ConnectError("down")
+
+    monkeypatch.setattr(client_mod, "congress_text_versions", congress_down)
+    monkeypatch.setattr(client_mod, "govinfo_search_versions", govinfo_down)
+    monkeypatch.setattr(client_mod, "fetch_govinfo_package", govinfo_down)
+    store = store_mod.get_bill_text_store()
+    store.conn.execute("UPDATE resolutions SET expires_at = 0")
+
+    # The latest listed version (enr) was never loaded, so the cached es is served,
+    # with the version list's age and the uncached version disclosed.
+    offline = await load_bill_text(None, 119, "s", 1071, None)
+    assert (offline.resolved.package_id, offline.resolved.version_resolution) == ("BILLS-119s1071es", "cached_offline")
+    assert offline.resolved.version_resolved_at == first.resolved.version_resolved_at
+    assert "unreachable" in offline.resolved.version_resolution_note
+    assert "['enr']" in offline.resolved.version_resolution_note
+    envelope = tools._envelope(offline)
+    assert envelope["version_resolution"] == "cached_offline"
+    assert envelope["cache"] == {"index_hit": True, "version_hit": True}
+
+    # A listed version that is not cached is unreachable, not nonexistent.
+    res = await tools.get_bill_toc(None, congress=119, bill_type="s", number=1071, version="enr")
+    assert res["error"]["code"] == "congress_unavailable"
+    assert res["error"]["detail"] == {"cached_versions": ["es"]}
+
+    # Without a stored list the stored packages alone are enough.
+    store.conn.execute("DELETE FROM resolutions")
+    res = await tools.get_bill_toc(None, congress=119, bill_type="s", number=1071)
+    assert (res["package_id"], res["version_resolution"]) == ("BILLS-119s1071es", "cached_offline")
+
+    # A bill with nothing cached still reports the outage.
+    monkeypatch.setattr(client_mod, "govinfo_search_versions", congress_down)
+    res = await tools.get_bill_toc(None, congress=119, bill_type="hr", number=1)
+    assert res["error"]["code"] == "congress_unavailable"
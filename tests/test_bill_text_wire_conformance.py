@@ -37,7 +37,7 @@ from unittest.mock import patch
 import pytest
 
 import congress_api.features.bill_text.tools as tools
-from congress_api.features.bill_text import trace
+from congress_api.features.bill_text import cursors, trace
 from congress_api.features.bill_text.client import ResolvedBillText
 from congress_api.features.bill_text.index import BillTextIndex
 from congress_api.features.bill_text.parser import parse_bill_xml
@@ -101,6 +101,75 @@ def test_search_populates_hits_and_counts_cohere():
     assert all(isinstance(h, dict) and h.get("section_id") for h in res["hits"])
 
 
+def test_search_cursor_pages_one_ranking_without_reloading():
+    queries = ["section", "the"]
+    whole = _call(tools.search_bill_text, congress=119, bill_type="s", number=1071,
+                  queries=queries, max_hits=50)
+    assert whole["next_cursor"] is None and whole["total_hits"] == len(whole["hits"]) > 2
+
+    loads = []
+
+    async def counting_load(ctx, congress, bill_type, number, version):
+        loads.append(number)
+        return LOADED
+
+    pages, cursor = [], None
+    with patch.object(tools, "load_bill_text", new=counting_load):
+        while True:
+            res = asyncio.run(tools.search_bill_text(_Ctx(), congress=119, bill_type="S", number=1071,
+                                                     queries=queries, max_hits=1, cursor=cursor))
+            assert res["total_hits"] == whole["total_hits"]
+            pages.extend(res["hits"])
+            cursor = res["next_cursor"]
+            if cursor is None:
+                break
+        # Only the first page searched; the rest are slices of its ranking.
+        assert loads == [1071]
+        assert pages == whole["hits"]
+
+        first = asyncio.run(tools.search_bill_text(_Ctx(), congress=119, bill_type="s", number=1071,
+                                                   queries=queries, max_hits=1))
+        other = asyncio.run(tools.search_bill_text(_Ctx(), congress=119, bill_type="s", number=1071,
+                                                   queries=["section"], cursor=first["next_cursor"]))
+        assert other["error"]["code"] == "invalid_request"
+        garbled = asyncio.run(tools.search_bill_text(_Ctx(), congress=119, bill_type="s", number=1071,
+                                                     queries=queries, cursor="not-a-cursor"))
+        assert garbled["error"]["code"] == "invalid_request"
+        cursors.clear_cursors()
+        expired = asyncio.run(tools.search_bill_text(_Ctx(), congress=119, bill_type="s", number=1071,
+                                                     queries=queries, cursor=first["next_cursor"]))
+        assert expired["error"]["code"] == "cursor_expired"
+
+
+def test_search_cursor_reaches_matches_past_the_first_page_window(monkeypatch):
+    # 120 sections match, more than the 50-candidate window one page of 10 ranks from:
+    # paging must reach all of them, and say so when its own cap cuts the ranking.
+    body = b"".join(
+        b"<section><enum>%d</enum><header>Duty %d</header><text>The Secretary shall act.</text></section>"
+        % (n, n)
+        for n in range(1, 121)
+    )
+    loaded = _loaded(b"<bill><legis-body>" + body + b"</legis-body></bill>")
+
+    def page_through(max_hits):
+        seen, cursor = [], None
+        while True:
+            res = _call(tools.search_bill_text, congress=119, bill_type="s", number=1071,
+                        queries=["secretary"], max_hits=max_hits, cursor=cursor, loaded=loaded)
+            seen.extend(hit["section_id"] for hit in res["hits"])
+            cursor = res["next_cursor"]
+            if cursor is None:
+                return res, seen
+
+    last, seen = page_through(10)
+    assert last["total_hits"] == 120 and last["ranking_truncated"] is False
+    assert len(seen) == len(set(seen)) == 120
+
+    monkeypatch.setattr(tools, "MAX_RANKED", 100)
+    last, seen = page_through(50)
+    assert last["total_hits"] == len(seen) == 100 and last["ranking_truncated"] is True
+
+
 # --------------------------------------------------------------------------- #
 # get_bill_section
 # --------------------------------------------------------------------------- #
@@ -285,6 +354,55 @@ def test_f33_chunk_only_prefix_resolves_through_container_path_and_aggregates():
     assert res["is_amendatory"] is True
 
 
+# --------------------------------------------------------------------------- #
+# get_bill_sections
+# --------------------------------------------------------------------------- #
+def test_batch_sections_match_single_reads_and_report_bad_ids_per_entry():
+    toc = _call(tools.get_bill_toc, congress=119, bill_type="s", number=1071, depth=5)
+    container = toc["toc"][0]["section_id"]
+    ids = [_SECTION_ID, container, "S:9999", _SECTION_ID]
+    res = _call(tools.get_bill_sections, congress=119, bill_type="s", number=1071,
+                section_ids=ids, max_bytes=100_000)
+    assert res["package_id"] == PKG and res["chunks_indexed"] == len(LOADED.parsed.units)
+    assert [entry["requested_id"] for entry in res["sections"]] == [_SECTION_ID, container, "S:9999"]
+    assert "1 repeated section_id" in res["request_note"]
+
+    # With budget to spare every section is exactly what get_bill_section returns.
+    for entry in res["sections"][:2]:
+        single = _call(tools.get_bill_section, congress=119, bill_type="s", number=1071,
+                       section_id=entry["requested_id"], max_bytes=100_000)
+        assert entry["error"] is None
+        assert entry["section"] == {key: single[key] for key in entry["section"]}
+    missing = res["sections"][2]
+    assert missing["section"] is None and missing["error"]["code"] == "section_not_found"
+    assert res["bytes_returned"] == sum(
+        len(entry["section"]["text"].encode("utf-8")) for entry in res["sections"][:2]
+    )
+
+
+def test_batch_budget_is_shared_fairly_and_never_exceeded():
+    sections = [("1", "Findings", "Congress finds. " * 300), ("2", "Short", "Brief."), ("3", "Long", "Shall. " * 300)]
+    body = "".join(
+        f"<section><enum>{enum}</enum><header>{header}</header><text>{text}</text></section>"
+        for enum, header, text in sections
+    )
+    loaded = _loaded(f'<?xml version="1.0"?><bill><legis-body>{body}</legis-body></bill>'.encode())
+    res = _call(tools.get_bill_sections, congress=119, bill_type="s", number=1071,
+                section_ids=["S:1", "S:2", "S:3"], max_bytes=1_000, loaded=loaded)
+    first, short, last = res["sections"]
+    # The short section gets all it needs; the two long ones split what is left.
+    assert not short["section"]["truncated"]
+    assert short["allocated_bytes"] == len(short["section"]["text"].encode("utf-8"))
+    assert first["allocated_bytes"] + last["allocated_bytes"] == 1_000 - short["allocated_bytes"]
+    assert abs(first["allocated_bytes"] - last["allocated_bytes"]) <= 1
+    assert first["section"]["truncated"] and last["section"]["truncated"]
+    assert res["bytes_returned"] <= 1_000
+
+    assert tools._fair_shares([100, 5_000, 10_000, 0], 3_000) == [100, 1_450, 1_450, 0]
+    res = _call(tools.get_bill_sections, congress=119, bill_type="s", number=1071, section_ids=[])
+    assert res["error"]["code"] == "invalid_request"
+
+
 # --------------------------------------------------------------------------- #
 # get_bill_toc
 # --------------------------------------------------------------------------- #
@@ -600,7 +718,18 @@ def test_f15_log_redaction_never_breaks_logging(monkeypatch):
     assert record.getMessage() == "still logged"
 
 
-@pytest.mark.parametrize("fn", [tools.search_bill_text, tools.get_bill_section, tools.get_bill_toc])
+@pytest.mark.parametrize(
+    "fn",
+    [
+        tools.search_bill_text,
+        tools.get_bill_section,
+        tools.get_bill_sections,
+        tools.get_bill_toc,
+        tools.diff_bill_versions,
+        tools.search_bill_corpus,
+        tools.find_amending_sections,
+    ],
+)
 def test_new_tools_params_are_keyword_only(fn):
     # Freeze-now: every param except ctx is keyword-only, so argument ORDER can never
     # ossify into a contract callers depend on (a reorder would otherwise be breaking).
@@ -639,8 +768,8 @@ def test_bill_text_only_env_parsing(monkeypatch):
         assert srv._bill_text_only() is False
 
 
-def test_bill_text_only_isolation_registers_just_the_three():
-    # The three tools are self-sufficient (version resolution + GovInfo fetch are
+def test_bill_text_only_isolation_registers_just_the_bill_text_tools():
+    # The bill-text tools are self-sufficient (version resolution + GovInfo fetch are
     # internal), so CONGRESSMCP_BILL_TEXT_ONLY yields a standalone bill-text server.
     # Run in a fresh interpreter: tool registration accumulates on the module singleton,
     # so isolation can only be asserted from a clean process.
@@ -666,4 +795,8 @@ def test_bill_text_only_isolation_registers_just_the_three():
         env={**os.environ, "CONGRESSMCP_BILL_TEXT_ONLY": "1"},
     )
     line = next((l for l in result.stdout.splitlines() if l.startswith("TOOLS:")), None)
-    assert line == "TOOLS:get_bill_section,get_bill_toc,search_bill_text", result.stdout + result.stderr
+    expected = (
+        "diff_bill_versions,find_amending_sections,get_bill_section,get_bill_sections,get_bill_toc,"
+        "search_bill_corpus,search_bill_text"
+    )
+    assert line == f"TOOLS:{expected}", result.stdout + result.stderr
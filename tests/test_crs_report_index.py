@@ -0,0 +1,145 @@
+"""
+Mocked tests for the local CRS report index behind search_crs_reports.
+
+The /crsreport list is newest-first and unsearchable, so keyword search runs
+against a persistent FTS5 mirror. These tests assert offline that the mirror
+reaches past the first API page, ranks non-contiguous multi-word matches, pages
+results, and refreshes incrementally instead of re-walking the catalogue.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from unittest.mock import patch
+
+from congress_api.features import crs_index, crs_reports
+
+
+class FakeContext:
+    pass
+
+
+def _report(i, title, update="2025-01-01T00:00:00Z"):
+    return {"id": f"R{i:05d}", "title": title, "status": "Active", "contentType": "Reports",
+            "publishDate": "2025-01-01T00:00:00Z", "updateDate": update, "version": 1,
+            "url": f"https://api.congress.gov/v3/crsreport/R{i:05d}"}
+
+
+def _catalogue(n):
+    # Newest first, like the API. Only the OLDEST report mentions wildfire.
+    rows = [_report(i, f"Appropriations Overview part {i}") for i in range(n, 1, -1)]
+    rows.append(_report(1, "Federal Wildfire Management: Funding and Suppression Policy"))
+    return rows
+
+
+def _request_factory(catalogue, calls):
+    async def _request(endpoint, params, ctx):
+        calls.append((endpoint, dict(params or {})))
+        offset, limit = params.get("offset", 0), params.get("limit", 250)
+        return {"CRSReports": catalogue[offset:offset + limit]}
+    return _request
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_reaches_past_first_page_and_ranks_non_contiguous_terms():
+    calls = []
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request_factory(_catalogue(600), calls)):
+        out = await crs_reports.search_crs_reports(FakeContext(), keywords="wildfire suppression")
+
+    assert "R00001" in out
+    assert "results 1-1 of 1" in out
+    offsets = [params["offset"] for _, params in calls]
+    assert offsets == [0, 250, 500]
+
+
+@pytest.mark.asyncio
+async def test_pagination_offsets_through_ranked_results():
+    calls = []
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request_factory(_catalogue(30), calls)):
+        first = await crs_reports.search_crs_reports(FakeContext(), keywords="appropriations", limit=10)
+        second = await crs_reports.search_crs_reports(FakeContext(), keywords="appropriations", limit=10, offset=10)
+
+    assert "results 1-10 of 29" in first
+    assert "offset=10" in first
+    assert "results 11-20 of 29" in second
+    # The second search is served from the mirror: no further list fetches.
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_stops_at_first_unchanged_page(monkeypatch):
+    catalogue = _catalogue(600)
+    calls = []
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request_factory(catalogue, calls)):
+        await crs_reports.search_crs_reports(FakeContext(), keywords="wildfire")
+        monkeypatch.setenv(crs_index.SYNC_TTL_ENV, "0")
+        catalogue.insert(0, _report(9999, "Drought Resilience and Western Water Supply"))
+        calls.clear()
+        out = await crs_reports.search_crs_reports(FakeContext(), keywords="drought water")
+
+    assert "R09999" in out
+    # Head page had one new row, second page had none: the walk stops there.
+    assert [params["offset"] for _, params in calls] == [0, 250]
+
+
+@pytest.mark.asyncio
+async def test_head_walk_that_runs_out_of_budget_resumes_on_next_sync(monkeypatch):
+    catalogue = _catalogue(1200)
+    calls = []
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request_factory(catalogue, calls)):
+        await crs_reports.search_crs_reports(FakeContext(), keywords="wildfire")
+        monkeypatch.setenv(crs_index.SYNC_TTL_ENV, "0")
+        # More new reports than one head walk's page budget covers; the oldest is the drought one.
+        burst = [_report(i, f"Budget Process Update {i}") for i in range(6099, 5000, -1)]
+        burst.append(_report(5000, "Drought Resilience and Western Water Supply"))
+        catalogue[:0] = burst
+        calls.clear()
+        missed = await crs_reports.search_crs_reports(FakeContext(), keywords="drought water")
+        assert [params["offset"] for _, params in calls] == [0, 250, 500, 750]
+        assert "R05000" not in missed
+
+        catalogue.insert(0, _report(9999, "Tariff Authority Overview"))
+        calls.clear()
+        out = await crs_reports.search_crs_reports(FakeContext(), keywords="drought water")
+
+    assert "R05000" in out
+    # The head catches up after one page, then the earlier walk resumes one row further
+    # down (the new report pushed it) and stops at the first page of mirrored rows.
+    assert [params["offset"] for _, params in calls] == [0, 250, 1001, 1251]
+    assert crs_index.get_crs_index().head_offset == 0
+
+
+@pytest.mark.asyncio
+async def test_detail_lookup_indexes_summary_and_topics():
+    detail = {"CRSReport": {**_report(7, "Overview of Selected Programs"),
+                            "summary": "Discusses pipeline safety inspections.",
+                            "topics": [{"topic": "Energy Infrastructure"}],
+                            "authors": [{"author": "Jane Analyst"}]}}
+
+    async def _request(endpoint, params, ctx):
+        if endpoint == "/crsreport/R00007":
+            return detail
+        return {"CRSReports": [_report(8, "Unrelated Title")]}
+
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request):
+        await crs_reports.search_crs_reports(FakeContext(), report_number="R00007")
+        out = await crs_reports.search_crs_reports(FakeContext(), keywords="pipeline inspections")
+
+    assert "R00007" in out
+
+
+@pytest.mark.asyncio
+async def test_any_term_fallback_is_disclosed():
+    with patch.object(crs_reports, "safe_crs_reports_request", new=_request_factory(_catalogue(5), [])):
+        out = await crs_reports.search_crs_reports(FakeContext(), keywords="wildfire zebra")
+
+    assert "R00001" in out
+    assert "match any of them" in out
+
+
+@pytest.mark.asyncio
+async def test_negative_offset_rejected():
+    out = await crs_reports.search_crs_reports(FakeContext(), keywords="x", offset=-1)
+    assert "offset" in out.lower()
@@ -0,0 +1,152 @@
+"""
+Offline tests for the member directory snapshot behind search_members.
+
+The directory indexes each Congress's member list once (state, district, party,
+chamber, current membership, name trigrams) so searches resolve locally. These
+tests assert the indexes agree with the per-record filters they replace and
+that a snapshot is reused until its refresh interval passes.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from congress_api.features import member_directory
+from congress_api.features.member_directory import MemberDirectory
+
+
+def _member(bioguide, first, last, state, party, chamber, district=None, end=None):
+    record = {
+        "bioguideId": bioguide,
+        "name": f"{last}, {first}",
+        "directOrderName": f"{first} {last}",
+        "invertedOrderName": f"{last}, {first}",
+        "state": state,
+        "partyName": party,
+        "terms": {"item": [{"chamber": chamber, "startYear": 2019, "endYear": end}]},
+    }
+    if district is not None:
+        record["district"] = district
+    return record
+
+
+MEMBERS = [
+    _member("O000172", "Alexandria", "Ocasio-Cortez", "New York", "Democratic", "House of Representatives", 14),
+    _member("S000148", "Charles", "Schumer", "New York", "Democratic", "Senate"),
+    _member("S001176", "Steve", "Scalise", "Louisiana", "Republican", "House of Representatives", 1),
+    _member("S000033", "Bernard", "Sanders", "Vermont", "Independent", "Senate"),
+    _member("X000001", "Former", "Member", "Ohio", "Republican", "House of Representatives", 3, end=2021),
+]
+
+
+def _ids(rows):
+    return [row["bioguideId"] for row in rows]
+
+
+def test_filter_indexes():
+    directory = MemberDirectory.from_members(MEMBERS, congress=119)
+
+    assert _ids(directory.query([119], state="NY")) == ["O000172", "S000148"]
+    assert _ids(directory.query([119], state="NY", district=14)) == ["O000172"]
+    assert _ids(directory.query([119], party="I")) == ["S000033"]
+    assert _ids(directory.query([119], chamber="senate", party="D")) == ["S000148"]
+    assert "X000001" not in _ids(directory.query([119], current_only=True))
+
+
+def test_name_index_matches_substrings_of_every_rendering():
+    directory = MemberDirectory.from_members(MEMBERS, congress=119)
+
+    assert _ids(directory.query([119], name="ocasio")) == ["O000172"]
+    assert _ids(directory.query([119], name="Schumer, Ch")) == ["S000148"]
+    assert set(_ids(directory.query([119], name="s"))) >= {"S000148", "S001176", "S000033"}
+    assert directory.query([119], name="nobody") == []
+    # The scores come back with the matches, only for the members matched.
+    members, scores = directory.query_scored([119], name="ocasio", state="NY")
+    assert _ids(members) == ["O000172"] and scores == {"O000172": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reused_until_refresh_interval(monkeypatch):
+    loads = []
+
+    async def load(congress):
+        loads.append(congress)
+        return {"members": MEMBERS}
+
+    await member_directory.ensure_congress(119, load)
+    await member_directory.ensure_congress(119, load)
+    assert loads == [119]
+
+    monkeypatch.setenv(member_directory.SNAPSHOT_TTL_ENV, "0")
+    await member_directory.ensure_congress(119, load)
+    assert loads == [119, 119]
+
+
+def test_fuzzy_name_matching_ranks_typos_nicknames_and_diacritics():
+    members = MEMBERS + [_member("D000001", "José", "Díaz", "Florida", "Republican", "House of Representatives", 7)]
+    directory = MemberDirectory.from_members(members, congress=119)
+
+    assert _ids(directory.query([119], name="Chuck Schumer")) == ["S000148"]
+    assert _ids(directory.query([119], name="bernie sanders")) == ["S000033"]
+    assert _ids(directory.query([119], name="jose diaz")) == ["D000001"]
+    assert _ids(directory.query([119], name="Shcumer"))[0] == "S000148"
+    assert _ids(directory.query([119], name="Scalice"))[0] == "S001176"
+    assert directory.query([119], name="Zzyzx") == []
+
+
+def test_exact_match_outranks_fuzzy_match():
+    directory = MemberDirectory.from_members(MEMBERS, congress=119)
+    scores = directory.name_matches("sanders")
+    assert scores["S000033"] == 1.0
+    assert all(score < 1.0 for bioguide, score in scores.items() if bioguide != "S000033")
+
+
+@pytest.mark.asyncio
+async def test_search_members_discloses_fuzzy_only_results():
+    from unittest.mock import patch
+    from congress_api.features import members as mod
+
+    async def fake_paginated(_ctx, endpoint, _params):
+        return {"members": MEMBERS}
+
+    with patch.object(mod, "get_all_members_paginated", fake_paginated), \
+            patch.object(mod, "current_congress", lambda: 119):
+        exact = await mod.search_members(None, name="Schumer")
+        fuzzy = await mod.search_members(None, name="Shumer")
+
+    assert "Schumer" in exact and "No exact name match" not in exact
+    assert "Schumer" in fuzzy and "No exact name match for 'Shumer'" in fuzzy
+
+
+@pytest.mark.asyncio
+async def test_cold_load_of_one_congress_does_not_block_another(monkeypatch):
+    import asyncio
+
+    release = asyncio.Event()
+    loads = []
+
+    async def load(congress):
+        loads.append(congress)
+        if len(loads) > 1:
+            await release.wait()
+        return {"members": MEMBERS}
+
+    await member_directory.ensure_congress(119, load)
+    slow = asyncio.create_task(member_directory.ensure_congress(118, load))
+    await asyncio.sleep(0)
+    assert loads == [119, 118]
+
+    # Another Congress, and a stale snapshot already being refreshed, are served at once.
+    directory = await asyncio.wait_for(member_directory.ensure_congress(119, load), 1)
+    assert directory.by_congress[119]
+    monkeypatch.setenv(member_directory.SNAPSHOT_TTL_ENV, "0")
+    refresh = asyncio.create_task(member_directory.ensure_congress(119, load))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(member_directory.ensure_congress(119, load), 1)
+
+    release.set()
+    await slow
+    await refresh
+    assert loads == [119, 118, 119]
@@ -105,8 +105,9 @@ async def test_search_summaries_browse_without_congress_uses_recent_window():
 async def test_search_members_state_chamber_uses_congress_endpoint_and_pages():
     """NY has 28 current members; the senators sit past the first page of 20.
 
-    With a client-side chamber filter the search must paginate the
-    congress-scoped state endpoint, not take one page of /member/NY.
+    With a client-side chamber filter the search must see the whole Congress,
+    not one page of /member/NY: it pages the congress-scoped member list into
+    the directory snapshot and filters state and chamber there.
     """
     from congress_api.features import members as mod
     reps = [_member(f"R{i:06d}", f"Rep{i}", [("House of Representatives", 2025, None)])
@@ -123,7 +124,7 @@ async def test_search_members_state_chamber_uses_congress_endpoint_and_pages():
             FakeContext(), state="NY", chamber="senate", congress=119)
     endpoint = mock.call_args.args[0]
     params = mock.call_args.args[2]
-    assert endpoint == "/member/congress/119/NY"
+    assert endpoint == "/member/congress/119"
     assert params["limit"] == 250 and params["offset"] == 0   # paginated
     assert "Schumer" in out and "Gillibrand" in out
     assert "Rep0" not in out
@@ -131,17 +132,33 @@ async def test_search_members_state_chamber_uses_congress_endpoint_and_pages():
 
 @pytest.mark.asyncio
 async def test_search_members_state_without_filters_is_single_request():
+    """Former members are outside every snapshot, so that search still asks the
+    API -- one page, no client-side filter."""
     from congress_api.features import members as mod
     mock = AsyncMock(return_value={"members": [
         _member("A000001", "Alpha", [("House of Representatives", 2025, None)])]})
     with patch.object(mod, "safe_congressional_request", mock):
-        await mod.search_members(FakeContext(), state="VT", limit=5)
+        await mod.search_members(FakeContext(), state="VT", limit=5, current_member=False)
     endpoint = mock.call_args.args[0]
     params = mock.call_args.args[2]
     assert endpoint == "/member/VT"
     assert params["limit"] == 5 and "offset" not in params
 
 
+@pytest.mark.asyncio
+async def test_search_members_current_state_answered_from_snapshot():
+    from congress_api.features import members as mod
+    vt = _member("S000033", "Sanders", [("Senate", 2007, None)], state="Vermont")
+    mock = AsyncMock(return_value={"members": [vt]})
+    with patch.object(mod, "safe_congressional_request", mock), \
+            patch.object(mod, "current_congress", lambda: 119):
+        first = await mod.search_members(FakeContext(), state="VT", limit=5)
+        second = await mod.search_members(FakeContext(), state="VT", chamber="senate")
+    assert "Sanders" in first and "Sanders" in second
+    assert mock.call_count == 1          # the second search never left the snapshot
+    assert mock.call_args.args[0] == "/member/congress/119"
+
+
 @pytest.mark.asyncio
 async def test_search_members_name_search_starts_at_current_congress():
     from congress_api.features import members as mod
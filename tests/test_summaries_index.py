@@ -0,0 +1,120 @@
+"""
+Mocked tests for the local summaries index behind keyword search_summaries.
+
+Keyword searches rank over a persistent FTS5 mirror of summary text instead of
+filtering one date window. These tests assert offline that old summaries are
+found, results carry snippets and honour the filter columns, and that refreshes
+resume from the stored updateDate cursor rather than re-reading the Congress.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from unittest.mock import patch
+
+from congress_api.features import summaries, summaries_index
+
+
+class FakeContext:
+    pass
+
+
+def _summary(number, text, bill_type="HR", action="2023-03-01", update="2023-03-02T00:00:00Z", congress=118):
+    return {"actionDate": action, "actionDesc": "Introduced in House", "updateDate": update, "versionCode": "00",
+            "text": f"<p><strong>Bill {number}</strong></p><p>{text}</p>",
+            "bill": {"congress": congress, "type": bill_type, "number": str(number),
+                     "title": f"Act number {number}", "url": f"https://api.congress.gov/v3/bill/{congress}/hr/{number}"}}
+
+
+def _request_factory(rows, calls):
+    async def _request(endpoint, ctx, params=None, endpoint_type=None):
+        calls.append((endpoint, dict(params or {})))
+        since = params["fromDateTime"]
+        window = sorted((r for r in rows if r["updateDate"] >= since), key=lambda r: r["updateDate"])
+        offset, limit = params["offset"], params["limit"]
+        return {"summaries": window[offset:offset + limit]}
+    return _request
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_ranks_across_congress_with_snippets():
+    rows = [_summary(n, "Routine appropriations text.", update=f"2023-{1 + n % 12:02d}-01T00:00:00Z")
+            for n in range(1, 300)]
+    rows.append(_summary(900, "Establishes a grant program for rural broadband deployment.",
+                         update="2023-01-05T00:00:00Z"))
+    calls = []
+    with patch.object(summaries, "safe_congressional_request", new=_request_factory(rows, calls)):
+        out = await summaries.search_summaries(FakeContext(), keywords="broadband rural", congress=118)
+
+    assert "HR 900" in out
+    assert "**broadband**" in out
+    assert all(endpoint == "/summaries/118" for endpoint, _ in calls)
+    assert calls[0][1]["sort"] == "updateDate+asc"
+
+
+@pytest.mark.asyncio
+async def test_filter_columns_apply():
+    rows = [_summary(1, "Water infrastructure grants.", action="2023-02-01"),
+            _summary(2, "Water infrastructure grants.", bill_type="S", action="2023-08-01")]
+    with patch.object(summaries, "safe_congressional_request", new=_request_factory(rows, [])):
+        by_type = await summaries.search_summaries(FakeContext(), keywords="water", congress=118, bill_type="s")
+        by_date = await summaries.search_summaries(FakeContext(), keywords="water", congress=118,
+                                                   fromDateTime="2023-01-01T00:00:00Z",
+                                                   toDateTime="2023-03-01T00:00:00Z")
+
+    assert "S 2" in by_type and "HR 1" not in by_type
+    assert "HR 1" in by_date and "S 2" not in by_date
+
+
+@pytest.mark.asyncio
+async def test_refresh_resumes_from_cursor(monkeypatch):
+    rows = [_summary(1, "Veterans health care.", update="2023-05-01T00:00:00Z")]
+    calls = []
+    with patch.object(summaries, "safe_congressional_request", new=_request_factory(rows, calls)):
+        await summaries.search_summaries(FakeContext(), keywords="veterans", congress=118)
+        monkeypatch.setenv(summaries_index.SYNC_TTL_ENV, "0")
+        rows.append(_summary(2, "Veterans housing.", update="2023-06-01T00:00:00Z"))
+        calls.clear()
+        out = await summaries.search_summaries(FakeContext(), keywords="veterans housing", congress=118)
+
+    assert "HR 2" in out
+    _, params = calls[0]
+    assert params["fromDateTime"] == "2023-05-01T00:00:00Z"
+    assert params["offset"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tied_update_dates_page_by_offset():
+    index = summaries_index.get_summaries_index()
+    rows = [_summary(n, "Tied.", update="2023-05-01T00:00:00Z") for n in range(1, 600)]
+    calls = []
+    await index.sync(118, lambda c, since, offset, limit: _request_factory(rows, calls)(
+        f"/summaries/{c}", None, {"fromDateTime": since, "offset": offset, "limit": limit}))
+
+    assert [params["offset"] for _, params in calls] == [0, 250, 500]
+    assert index.coverage(118).indexed == 599
+    assert index.coverage(118).caught_up
+
+
+@pytest.mark.asyncio
+async def test_sync_cut_off_by_page_budget_is_not_caught_up(monkeypatch):
+    index = summaries_index.get_summaries_index()
+    rows = [_summary(n, "Early.", update="2023-05-01T00:00:00Z") for n in range(1, 10)]
+    fetch = lambda c, since, offset, limit: _request_factory(rows, [])(
+        f"/summaries/{c}", None, {"fromDateTime": since, "offset": offset, "limit": limit})
+    await index.sync(118, fetch)
+    assert index.coverage(118).caught_up
+
+    # More new summaries than one sync's page budget reads.
+    monkeypatch.setattr(summaries_index, "PAGE_BUDGET", 2)
+    rows.extend(_summary(n, "Late.", update=f"2023-06-01T00:{n // 60 % 60:02d}:{n % 60:02d}Z")
+                for n in range(10, 10 + 3 * summaries_index.PAGE_SIZE))
+    await index.sync(118, fetch)
+    assert not index.coverage(118).caught_up
+    assert index.is_stale(118)
+
+    await index.sync(118, fetch)
+    assert index.coverage(118).caught_up
+    assert index.coverage(118).indexed == len(rows)
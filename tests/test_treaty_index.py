@@ -0,0 +1,124 @@
+"""
+Mocked tests for the local treaty index behind search_treaties.
+
+The treaty catalogue is small, so search_treaties keeps a full local copy with
+an inverted index over topics and titles, refreshed by updateDate. These tests
+assert offline that matches beyond the first API page are found, that topic
+matches outrank title matches, and that a refresh only asks for changed rows.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from unittest.mock import patch
+
+from congress_api.features import treaties, treaty_index
+
+
+class FakeContext:
+    pass
+
+
+def _treaty(number, topic, congress=110, update="2020-01-01T00:00:00Z"):
+    return {"congressReceived": congress, "congressConsidered": congress, "number": number, "suffix": "",
+            "topic": topic, "transmittedDate": "2008-01-01T00:00:00Z", "updateDate": update,
+            "url": f"https://api.congress.gov/v3/treaty/{congress}/{number}"}
+
+
+def _request_factory(catalogue, calls):
+    async def _request(endpoint, ctx, params=None):
+        calls.append(dict(params or {}))
+        since = params.get("fromDateTime")
+        rows = [t for t in catalogue if not since or t["updateDate"] >= since]
+        offset, limit = params.get("offset", 0), params.get("limit", 250)
+        return {"treaties": rows[offset:offset + limit]}
+    return _request
+
+
+def _catalogue():
+    rows = [_treaty(n, "Taxation", update="2019-01-01T00:00:00Z") for n in range(1, 400)]
+    rows.append(_treaty(400, "Maritime Boundaries", congress=105))
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_topic_match_beyond_first_page_is_found():
+    calls = []
+    with patch.object(treaties, "make_api_request", new=_request_factory(_catalogue(), calls)):
+        out = await treaties.search_treaties(FakeContext(), topic="maritime")
+
+    assert "Treaty Number: 400" in out
+    assert [c["offset"] for c in calls] == [0, 250]
+
+
+@pytest.mark.asyncio
+async def test_congress_filter_applies_to_local_copy():
+    with patch.object(treaties, "make_api_request", new=_request_factory(_catalogue(), [])):
+        out = await treaties.search_treaties(FakeContext(), topic="boundaries", congress=110)
+
+    assert out == "No treaties found matching topic: boundaries"
+
+
+def test_topic_match_outranks_title_match():
+    index = treaty_index.TreatyIndex(None)
+    index.merge([_treaty(1, "Extradition"), _treaty(2, "Maritime Boundaries")])
+    index.treaties["110-1"]["titles"] = [{"title": "Treaty on Maritime Extradition"}]
+    index._rebuild()
+
+    ranked = index.search(topic="maritime")
+    assert [t["number"] for t in ranked] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_refresh_requests_only_rows_updated_since_high_water(monkeypatch):
+    catalogue = _catalogue()
+    calls = []
+    with patch.object(treaties, "make_api_request", new=_request_factory(catalogue, calls)):
+        await treaties.search_treaties(FakeContext(), topic="maritime")
+        monkeypatch.setenv(treaty_index.SYNC_TTL_ENV, "0")
+        catalogue.append(_treaty(401, "Maritime Safety", update="2024-06-01T00:00:00Z"))
+        calls.clear()
+        out = await treaties.search_treaties(FakeContext(), topic="maritime")
+
+    assert "Treaty Number: 401" in out
+    assert calls == [{"format": "json", "offset": 0, "limit": 250, "fromDateTime": "2020-01-01T00:00:00Z"}]
+
+
+def test_local_copy_persists_across_processes():
+    index = treaty_index.get_treaty_index()
+    index.merge([_treaty(1, "Maritime Boundaries")])
+    index.synced_at = time.time()
+    index._rebuild()
+    index._save()
+
+    reloaded = treaty_index.TreatyIndex(index.path)
+    assert [t["number"] for t in reloaded.search(topic="maritime")] == [1]
+
+
+def test_detail_fold_in_reindexes_one_treaty_and_batches_writes(monkeypatch):
+    index = treaty_index.TreatyIndex(None)
+    index.merge([_treaty(1, "Extradition"), _treaty(2, "Taxation")])
+    index._rebuild()
+    saves = []
+    monkeypatch.setattr(index, "_save", lambda: saves.append(time.time()))
+    index._saved_at = time.time()
+
+    detail = {**_treaty(1, "Extradition"), "titles": [{"title": "Treaty on Maritime Extradition"}]}
+    index.fold_in_detail(detail)
+    assert [t["number"] for t in index.search(topic="maritime")] == [1]
+    assert index._vocabulary == sorted(index._postings)
+    assert saves == []   # within the save interval: the write is deferred
+
+    index.fold_in_detail({**detail, "titles": [{"title": "Treaty on Mutual Legal Assistance"}]})
+    assert index.search(topic="maritime") == []
+    assert [t["number"] for t in index.search(topic="assistance")] == [1]
+    assert "maritime" not in index._postings
+
+    index._saved_at = 0.0
+    index.fold_in_detail({**detail, "titles": [{"title": "Treaty on Mutual Legal Assistance"}]})
+    assert saves == []   # titles unchanged: nothing to write
+    index.fold_in_detail(detail)
+    assert len(saves) == 1